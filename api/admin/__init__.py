@@ -20,3 +20,4 @@ from .admin_policy import *  # noqa: F403
 from .admin_seo import *  # noqa: F403
 from .admin_service import *  # noqa: F403
 from .admin_accounting import *  # noqa: F403
+from .admin_tasks import *  # noqa: F403
@@ -19,6 +19,7 @@ from django.utils.safestring import mark_safe
 
 from api.admin.base_admin import BaseModelAdmin
 from api.models.models_course import Course, CourseModule
+from api.models.models_progress import CourseProgress
 from api.models.models_module import (
     Assignment,
     AssignmentSubmission,
@@ -696,23 +697,34 @@ class AssignmentSubmissionAdmin(BaseModelAdmin):
     late_status.short_description = "Timing"
     late_status.admin_order_field = "is_late"
 
+    @staticmethod
+    def _progress_pairs(queryset):
+        return list(queryset.values_list("student_id", "assignment__module__course_id"))
+
     def grade_as_pending(self, request, queryset):
         """Mark as pending review."""
+        pairs = self._progress_pairs(queryset)
         updated = queryset.update(status="pending")
+        # update() sends no signals, so refresh the affected progress counters
+        CourseProgress.rebuild_for(pairs)
         self.message_user(request, f"{updated} submissions marked as pending.")
 
     grade_as_pending.short_description = "Mark as pending"
 
     def grade_as_graded(self, request, queryset):
         """Mark as graded."""
+        pairs = self._progress_pairs(queryset)
         updated = queryset.update(status="graded", graded_by=request.user, graded_at=timezone.now())
+        CourseProgress.rebuild_for(pairs)
         self.message_user(request, f"{updated} submissions marked as graded.")
 
     grade_as_graded.short_description = "Mark as graded"
 
     def mark_for_resubmission(self, request, queryset):
         """Mark for resubmission."""
+        pairs = self._progress_pairs(queryset)
         updated = queryset.update(status="resubmit", graded_by=request.user, graded_at=timezone.now())
+        CourseProgress.rebuild_for(pairs)
         self.message_user(request, f"{updated} submissions marked for resubmission.")
 
     mark_for_resubmission.short_description = "Mark for resubmission"
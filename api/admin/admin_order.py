@@ -10,7 +10,14 @@ from django.utils import timezone
 from django.utils.html import format_html
 
 from api.admin.base_admin import BaseModelAdmin
-from api.models.models_order import Enrollment, Order, OrderInstallment, OrderItem, PaymentTransaction
+from api.models.models_order import (
+    Enrollment,
+    Order,
+    OrderInstallment,
+    OrderItem,
+    PaymentTransaction,
+    PaymentWebhookEvent,
+)
 
 # ========== Inline for OrderInstallments ==========
 
@@ -666,7 +673,12 @@ class EnrollmentAdmin(BaseModelAdmin):
 
     def deactivate_enrollment(self, request, queryset):
         """Deactivate selected enrollments."""
-        count = queryset.update(is_active=False)
+        count = 0
+        # Save each row so batch counters, dashboard metrics and cached study plans follow
+        for enrollment in queryset.filter(is_active=True):
+            enrollment.is_active = False
+            enrollment.save(update_fields=["is_active", "updated_at"])
+            count += 1
 
         self.message_user(request, f"{count} enrollment(s) deactivated.")
 
@@ -962,3 +974,29 @@ class PaymentTransactionAdmin(admin.ModelAdmin):
         self.message_user(request, f"Reprocess completed: {processed} settled, {errors} errors")
 
     reprocess_transaction.short_description = "Re-run processing (idempotent)"
+
+
+@admin.register(PaymentWebhookEvent)
+class PaymentWebhookEventAdmin(admin.ModelAdmin):
+    list_display = ("tran_id", "val_id", "amount", "gateway_status", "status", "result", "created_at", "processed_at")
+    list_filter = ("status", "gateway_status", "created_at")
+    search_fields = ("tran_id", "val_id")
+    readonly_fields = [field.name for field in PaymentWebhookEvent._meta.fields]
+    ordering = ("-created_at",)
+    actions = ["reprocess_events"]
+
+    def has_add_permission(self, request):
+        return False  # Events are recorded by the webhook endpoint only
+
+    @admin.action(description="Queue selected events for processing again")
+    def reprocess_events(self, request, queryset):
+        from api.utils.payment_webhooks import process_payment_webhook
+        from api.utils.tasks import enqueue
+
+        count = 0
+        for event in queryset.exclude(status=PaymentWebhookEvent.Status.PROCESSED):
+            event.status = PaymentWebhookEvent.Status.RECEIVED
+            event.save(update_fields=["status", "updated_at"])
+            enqueue(process_payment_webhook, event_id=str(event.pk))
+            count += 1
+        self.message_user(request, f"{count} event(s) queued.")
@@ -320,32 +320,45 @@ class StudentAssignmentSubmissionAdmin(BaseAdmin):
 
     is_late_display.short_description = "Timing"
 
+    @staticmethod
+    def _progress_pairs(queryset):
+        return list(queryset.values_list("student_id", "assignment__module__course_id"))
+
     def approve_submissions(self, request, queryset):
         """Bulk approve submissions."""
-        updated = queryset.filter(status="pending").update(
+        pending = queryset.filter(status="pending")
+        pairs = self._progress_pairs(pending)
+        updated = pending.update(
             status="approved",
             graded_by=request.user,
         )
+        # update() sends no signals, so refresh the affected progress counters
+        CourseProgress.rebuild_for(pairs)
         self.message_user(request, f"{updated} submissions approved.")
 
     approve_submissions.short_description = "Approve selected submissions"
 
     def reject_submissions(self, request, queryset):
         """Bulk reject submissions."""
-        updated = queryset.filter(status="pending").update(
+        pending = queryset.filter(status="pending")
+        pairs = self._progress_pairs(pending)
+        updated = pending.update(
             status="rejected",
             graded_by=request.user,
         )
+        CourseProgress.rebuild_for(pairs)
         self.message_user(request, f"{updated} submissions rejected.")
 
     reject_submissions.short_description = "Reject selected submissions"
 
     def mark_for_resubmission(self, request, queryset):
         """Mark submissions for resubmission."""
+        pairs = self._progress_pairs(queryset)
         updated = queryset.update(
             status="resubmit",
             graded_by=request.user,
         )
+        CourseProgress.rebuild_for(pairs)
         self.message_user(request, f"{updated} submissions marked for resubmission.")
 
     mark_for_resubmission.short_description = "Mark for resubmission"
@@ -402,7 +415,10 @@ class StudentModuleProgressAdmin(BaseAdmin):
 
     def mark_as_incomplete(self, request, queryset):
         """Bulk mark modules as incomplete."""
+        pairs = list(queryset.values_list("student_id", "module__course_id"))
         updated = queryset.update(is_completed=False, completed_at=None)
+        # update() sends no signals, so refresh the affected progress counters
+        CourseProgress.rebuild_for(pairs)
         self.message_user(request, f"{updated} modules marked as incomplete.")
 
     mark_as_incomplete.short_description = "Mark as incomplete"
@@ -519,10 +535,9 @@ class CourseProgressAdmin(BaseAdmin):
     get_progress_breakdown.short_description = "Breakdown"
 
     def recalculate_progress(self, request, queryset):
-        """Recalculate progress for selected courses."""
-        for progress in queryset:
-            progress.calculate_completion()
-        self.message_user(request, f"Progress recalculated for {queryset.count()} students.")
+        """Recalculate progress for selected courses (set-based rebuild)."""
+        updated = CourseProgress.rebuild(queryset)
+        self.message_user(request, f"Progress recalculated for {updated} students.")
 
     recalculate_progress.short_description = "Recalculate progress"
 
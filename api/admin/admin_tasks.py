@@ -0,0 +1,58 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from api.models.models_reports import ReportJob
+from api.models.models_tasks import OutboxTask
+
+
+@admin.register(OutboxTask)
+class OutboxTaskAdmin(admin.ModelAdmin):
+    list_display = ("id", "name", "status", "attempts", "max_attempts", "run_after", "finished_at", "created_at")
+    list_filter = ("status", "name", "created_at")
+    search_fields = ("name", "last_error")
+    readonly_fields = (
+        "name",
+        "payload",
+        "attempts",
+        "locked_by",
+        "locked_at",
+        "finished_at",
+        "last_error",
+        "created_at",
+        "updated_at",
+    )
+    actions = ["requeue_tasks"]
+
+    def has_add_permission(self, request):
+        return False  # Tasks are created by the application only
+
+    @admin.action(description="Requeue selected tasks")
+    def requeue_tasks(self, request, queryset):
+        count = queryset.exclude(status=OutboxTask.Status.RUNNING).update(
+            status=OutboxTask.Status.PENDING, attempts=0, run_after=timezone.now(), finished_at=None
+        )
+        self.message_user(request, f"{count} task(s) requeued.")
+
+
+@admin.register(ReportJob)
+class ReportJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "report_type", "status", "requested_by", "created_at", "finished_at")
+    list_filter = ("status", "report_type", "created_at")
+    search_fields = ("id", "report_type", "error")
+    readonly_fields = (
+        "report_type",
+        "params",
+        "params_hash",
+        "status",
+        "requested_by",
+        "file",
+        "filename",
+        "error",
+        "started_at",
+        "finished_at",
+        "created_at",
+        "updated_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
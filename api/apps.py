@@ -15,6 +15,10 @@ class ApiConfig(AppConfig):
     def ready(self):
         import api.cache_invalidation  # Register cache invalidation signals
         import api.signals
+        from api.utils.file_cleanup import register_file_cleanup
+
+        # Connect old-file cleanup only for models that have file fields
+        register_file_cleanup()
 
         # No startup side effects here. If you want to create a default
         # superuser on deployment, run the management command:
@@ -4,13 +4,28 @@ Django signals for automatic cache invalidation.
 Automatically clears relevant caches when models are updated.
 """
 
+from functools import partial
+
+from django.db import transaction
 from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from api.models.models_academy_overview import AcademyOverview
 from api.models.models_blog import Blog, BlogCategory
-from api.models.models_course import Category, Course, CourseDetail
+from api.models.models_course import Category, Course, CourseDetail, CourseModule
 from api.models.models_faq import FAQ
+from api.models.models_module import (
+    Assignment,
+    AssignmentSubmission,
+    CourseResource,
+    LiveClass,
+    LiveClassAttendance,
+    Quiz,
+    QuizAttempt,
+    QuizQuestion,
+    QuizQuestionOption,
+)
+from api.models.models_order import Enrollment
 from api.models.models_pricing import Coupon, CoursePrice
 from api.utils.cache_utils import (
     clear_academy_caches,
@@ -20,6 +35,8 @@ from api.utils.cache_utils import (
     clear_course_detail_cache,
     clear_faq_caches,
 )
+from api.utils.quiz_papers import invalidate_quiz_paper
+from api.utils.study_plan import invalidate_course_study_plans, invalidate_student_study_plans
 
 # ========== Course Cache Invalidation ==========
 
@@ -113,3 +130,69 @@ def invalidate_faq_cache(sender, instance, **kwargs):
 def invalidate_academy_cache(sender, instance, **kwargs):
     """Clear academy overview caches when content is updated."""
     clear_academy_caches()
+
+
+# ========== Quiz Paper Cache Invalidation ==========
+
+
+@receiver([post_save, post_delete], sender=Quiz)
+def invalidate_quiz_paper_on_quiz_change(sender, instance, **kwargs):
+    """Recompile the paper when quiz marks change (points per question)."""
+    invalidate_quiz_paper(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=QuizQuestion)
+def invalidate_quiz_paper_on_question_change(sender, instance, **kwargs):
+    """Recompile the paper when a question is added, edited or removed."""
+    invalidate_quiz_paper(instance.quiz_id)
+
+
+@receiver([post_save, post_delete], sender=QuizQuestionOption)
+def invalidate_quiz_paper_on_option_change(sender, instance, **kwargs):
+    """Recompile the paper when an option is added, edited or removed."""
+    quiz_id = QuizQuestion.objects.filter(pk=instance.question_id).values_list("quiz_id", flat=True).first()
+    if quiz_id:
+        invalidate_quiz_paper(quiz_id)
+
+
+# ========== Study Plan Cache Invalidation ==========
+
+
+@receiver([post_save, post_delete], sender=CourseModule)
+def invalidate_study_plans_on_module_change(sender, instance, using, **kwargs):
+    """Rebuild a course's study plans when a module is added, edited or removed."""
+    # After commit, so a concurrent reader cannot cache the plan from before the change
+    transaction.on_commit(partial(invalidate_course_study_plans, instance.course_id), using=using)
+
+
+@receiver([post_save, post_delete], sender=LiveClass)
+@receiver([post_save, post_delete], sender=Assignment)
+@receiver([post_save, post_delete], sender=Quiz)
+@receiver([post_save, post_delete], sender=CourseResource)
+def invalidate_study_plans_on_content_change(sender, instance, using, **kwargs):
+    """Rebuild a course's study plans when module content changes (counts and totals)."""
+    course_id = CourseModule.objects.filter(pk=instance.module_id).values_list("course_id", flat=True).first()
+    if course_id:
+        transaction.on_commit(partial(invalidate_course_study_plans, course_id), using=using)
+
+
+@receiver([post_save, post_delete], sender=QuizQuestion)
+def invalidate_study_plans_on_question_change(sender, instance, using, **kwargs):
+    """Quizzes are only listed once they have active questions."""
+    course_id = Quiz.objects.filter(pk=instance.quiz_id).values_list("module__course_id", flat=True).first()
+    if course_id:
+        transaction.on_commit(partial(invalidate_course_study_plans, course_id), using=using)
+
+
+@receiver([post_save, post_delete], sender=LiveClassAttendance)
+@receiver([post_save, post_delete], sender=AssignmentSubmission)
+@receiver([post_save, post_delete], sender=QuizAttempt)
+def invalidate_study_plans_on_student_activity(sender, instance, using, **kwargs):
+    """Refresh the student's progress after attendance, submissions and quiz attempts."""
+    transaction.on_commit(partial(invalidate_student_study_plans, instance.student_id), using=using)
+
+
+@receiver([post_save, post_delete], sender=Enrollment)
+def invalidate_study_plans_on_enrollment_change(sender, instance, using, **kwargs):
+    """The enrolled batches decide which content a student sees."""
+    transaction.on_commit(partial(invalidate_student_study_plans, instance.user_id), using=using)
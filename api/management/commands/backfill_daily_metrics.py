@@ -0,0 +1,35 @@
+"""
+Management command to (re)build the DailyMetric rollup behind the admin dashboards.
+
+User, enrollment and order saves keep the rollup current through signals.
+Run this once after deploying the rollup, and periodically (e.g. nightly
+cron) to repair drift from queryset ``update()`` calls, raw SQL and items
+added to already completed orders.
+
+Usage:
+    python manage.py backfill_daily_metrics
+    python manage.py backfill_daily_metrics --days 7
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.utils.metrics_rollup import rebuild
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily dashboard metrics rollup from users, enrollments and orders"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="Only rebuild the last N days (default: everything)")
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        since = timezone.localdate() - timedelta(days=days - 1) if days else None
+
+        written = rebuild(since=since)
+
+        scope = f"since {since}" if since else "for all days"
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} daily metric row(s) {scope}"))
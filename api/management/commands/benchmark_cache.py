@@ -0,0 +1,81 @@
+"""
+Management command to compare cache hit ratios across simulated workers.
+
+Replays the same request stream against two topologies:
+
+- ``local``: every simulated gunicorn worker owns a private LocMem cache
+  (what we get without CACHE_URL).
+- ``shared``: every worker talks to one Redis-protocol server through
+  Django's RedisCache with the JSON serializer (what CACHE_URL gives us).
+  The server is the in-process stand-in from ``api.testing.resp_server``,
+  so no Redis installation is needed.
+
+Usage:
+    python manage.py benchmark_cache
+    python manage.py benchmark_cache --workers 8 --requests 20000 --keys 500
+"""
+
+import random
+import time
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from django.core.management.base import BaseCommand
+
+from api.testing.resp_server import LocalRespServer
+
+
+class Command(BaseCommand):
+    help = "Benchmark response-cache hit ratio for per-worker vs shared cache backends"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="Number of simulated workers")
+        parser.add_argument("--requests", type=int, default=5000, help="Total requests to replay")
+        parser.add_argument("--keys", type=int, default=200, help="Number of distinct cacheable URLs")
+        parser.add_argument("--payload-kb", type=int, default=8, help="Size of each cached payload in KB")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed for the request stream")
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        rng = random.Random(options["seed"])
+
+        # Zipf-like popularity: a few catalog pages receive most of the traffic
+        weights = [1 / (rank + 1) for rank in range(options["keys"])]
+        stream = [
+            (rng.randrange(workers), f"course_list:v1:/api/courses/?page={key}")
+            for key in rng.choices(range(options["keys"]), weights=weights, k=options["requests"])
+        ]
+        payload = {"success": True, "message": "ok", "data": {"results": ["x" * 1024] * options["payload_kb"]}}
+
+        local_caches = [LocMemCache(f"bench-worker-{i}", {"TIMEOUT": 600}) for i in range(workers)]
+        self._report("local", self._replay(stream, local_caches, payload), workers)
+
+        with LocalRespServer() as server:
+            params = {
+                "TIMEOUT": 600,
+                "OPTIONS": {"serializer": "api.utils.cache_serializers.CompressedJSONSerializer"},
+            }
+            shared_caches = [RedisCache(server.url, params) for _ in range(workers)]
+            shared_caches[0].clear()
+            self._report("shared", self._replay(stream, shared_caches, payload), workers)
+
+    def _replay(self, stream, worker_caches, payload):
+        hits = 0
+        started = time.perf_counter()
+        for worker, key in stream:
+            cache = worker_caches[worker]
+            if cache.get(key) is not None:
+                hits += 1
+            else:
+                cache.set(key, payload)
+        elapsed = time.perf_counter() - started
+        return {"requests": len(stream), "hits": hits, "elapsed": elapsed}
+
+    def _report(self, label, result, workers):
+        requests = result["requests"]
+        hits = result["hits"]
+        self.stdout.write(
+            f"{label:>6} | workers={workers} requests={requests} "
+            f"hit_ratio={hits / requests:.1%} recomputes={requests - hits} "
+            f"avg_op={result['elapsed'] / requests * 1e6:.0f}us"
+        )
@@ -0,0 +1,80 @@
+"""
+Management command to benchmark the SSLCommerz client against a local fake gateway.
+
+Runs three scenarios against ``api.testing.fake_sslcommerz``:
+
+- ``fresh``: one new connection per validation (the old module-level
+  ``requests.get`` behaviour).
+- ``pooled``: validations through ``SSLCommerzPayment`` and the shared
+  keep-alive session.
+- ``outage``: every gateway request fails; shows how many requests reach
+  the gateway once the circuit breaker opens.
+
+Usage:
+    python manage.py benchmark_gateway
+    python manage.py benchmark_gateway --calls 500 --threads 8 --latency 0.005
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import requests
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from api.testing.fake_sslcommerz import FakeSSLCommerzServer
+from api.utils import sslcommerz
+
+
+class Command(BaseCommand):
+    help = "Benchmark pooled vs per-call gateway connections and circuit breaker behaviour"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--calls", type=int, default=300, help="Validations per scenario")
+        parser.add_argument("--threads", type=int, default=4, help="Concurrent callers")
+        parser.add_argument("--latency", type=float, default=0.002, help="Fake gateway latency in seconds")
+
+    def handle(self, *args, **options):
+        calls, threads = options["calls"], options["threads"]
+
+        with FakeSSLCommerzServer(latency=options["latency"]) as gateway:
+            gateway.amounts["VAL-BENCH"] = "100.00"
+            with override_settings(SSLCOMMERZ_API_URL=gateway.url, SSLCOMMERZ_RETRY_BACKOFF=0.01):
+                sslcommerz.reset_session()
+                sslcommerz.breaker.reset()
+                client = sslcommerz.SSLCommerzPayment()
+
+                def fresh(_):
+                    response = requests.get(
+                        client.validation_url,
+                        params={"val_id": "VAL-BENCH", "format": "json"},
+                        headers={"Connection": "close"},
+                        timeout=15,
+                    )
+                    return response.json()["status"] == "VALID"
+
+                def pooled(_):
+                    return client.validate_payment("VAL-BENCH", Decimal("100.00"))[0]
+
+                self._run("fresh", fresh, gateway, calls, threads)
+                self._run("pooled", pooled, gateway, calls, threads)
+
+                gateway.always_fail = True
+                self._run("outage", pooled, gateway, calls, threads)
+                self.stdout.write(f"breaker state after outage: {sslcommerz.breaker.state}")
+                self.stdout.write(f"metrics: {sslcommerz.gateway_metrics.snapshot()}")
+
+                sslcommerz.reset_session()
+                sslcommerz.breaker.reset()
+
+    def _run(self, label, func, gateway, calls, threads):
+        gateway.requests = gateway.connections = 0
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            ok = sum(pool.map(func, range(calls)))
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"{label:>6} | calls={calls} ok={ok} gateway_requests={gateway.requests} "
+            f"connections={gateway.connections} throughput={calls / elapsed:.0f}/s"
+        )
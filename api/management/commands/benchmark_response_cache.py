@@ -0,0 +1,121 @@
+"""
+Management command to measure cache_response hit latency per storage mode.
+
+Builds a course-detail sized payload (modules, content sections with tabs,
+benefits, success stories, pricing) and times cache hits end to end,
+including the final JSON render DRF would perform, for:
+
+- ``dict``: the cached dict goes back through api_response + JSONRenderer
+- ``render``: the stored JSON bytes are returned verbatim
+
+Usage:
+    python manage.py benchmark_response_cache
+    python manage.py benchmark_response_cache --iterations 2000 --modules 40
+"""
+
+import statistics
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from api.utils.cache_utils import cache_response
+from api.utils.response_utils import api_response
+
+
+def build_course_detail_payload(modules=20, sections=6, tabs=4):
+    """Return a nested dict shaped like CourseDetailedSerializer output."""
+    text = "Learn by building production-grade projects with mentor feedback. " * 4
+    return {
+        "id": "6f1c2f9e-4d7a-4b8e-9b1e-2f0d8c1a7e55",
+        "title": "Full Stack Web Development",
+        "slug": "full-stack-web-development",
+        "short_description": text,
+        "category": {"id": "c1", "name": "Web Development", "slug": "web-development"},
+        "pricing": {"base_price": "25000.00", "discounted_price": "19999.00", "currency": "BDT", "installments": 3},
+        "detail": {
+            "hero_text": text,
+            "content_sections": [
+                {
+                    "id": f"section-{s}",
+                    "title": f"Section {s}",
+                    "tabs": [
+                        {
+                            "id": f"tab-{s}-{t}",
+                            "name": f"Tab {t}",
+                            "contents": [{"title": f"Item {i}", "description": text, "image": None} for i in range(3)],
+                        }
+                        for t in range(tabs)
+                    ],
+                }
+                for s in range(sections)
+            ],
+            "why_enrol": [{"title": f"Reason {i}", "text": text, "icon": f"/media/icons/{i}.png"} for i in range(6)],
+            "benefits": [{"title": f"Benefit {i}", "text": text} for i in range(8)],
+            "success_stories": [{"name": f"Student {i}", "quote": text, "image": None} for i in range(6)],
+        },
+        "modules": [
+            {"id": f"module-{m}", "title": f"Module {m}", "short_description": text, "order": m, "is_sample": m < 2}
+            for m in range(modules)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = "Benchmark cache_response hit latency for dict vs rendered-bytes storage"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=1000, help="Cache hits to time per mode")
+        parser.add_argument("--modules", type=int, default=20, help="Number of course modules in the payload")
+
+    def handle(self, *args, **options):
+        payload = build_course_detail_payload(modules=options["modules"])
+        body_size = len(JSONRenderer().render({"success": True, "message": "ok", "data": payload}))
+        self.stdout.write(f"payload: {body_size / 1024:.1f} KB rendered JSON")
+
+        request = RequestFactory().get("/api/courses/full-stack-web-development/")
+        request.user = AnonymousUser()
+
+        results = {}
+        for mode in ("dict", "render"):
+
+            class View:
+                @cache_response(timeout=600, key_prefix=f"bench_{mode}", render=(mode == "render"))
+                def retrieve(self, request):
+                    return api_response(True, "Course retrieved successfully", payload)
+
+            cache.clear()
+            view = View()
+            self._render(view.retrieve(request))  # populate
+
+            samples = []
+            for _ in range(options["iterations"]):
+                started = time.perf_counter()
+                response = view.retrieve(request)
+                self._render(response)
+                samples.append(time.perf_counter() - started)
+            results[mode] = samples
+
+        for mode, samples in results.items():
+            samples.sort()
+            self.stdout.write(
+                f"{mode:>6} | mean={statistics.mean(samples) * 1e6:.0f}us "
+                f"p50={samples[len(samples) // 2] * 1e6:.0f}us "
+                f"p99={samples[int(len(samples) * 0.99)] * 1e6:.0f}us"
+            )
+        speedup = statistics.mean(results["dict"]) / statistics.mean(results["render"])
+        self.stdout.write(self.style.SUCCESS(f"rendered-bytes hits are {speedup:.1f}x faster"))
+
+    def _render(self, response):
+        # Mirror what DRF's finalize_response + render do for a JSON client
+        if isinstance(response, Response):
+            response.accepted_renderer = JSONRenderer()
+            response.accepted_media_type = "application/json"
+            response.renderer_context = {}
+            response.render()
+        return response.content
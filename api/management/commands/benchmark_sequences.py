@@ -0,0 +1,120 @@
+"""
+Management command to compare ID generation cost as tables grow.
+
+For each table size it inserts that many throw-away student rows, then
+times the old generator (count rows for the year, then probe with
+``exists()`` until a free ID is found) against ``api.utils.sequences``.
+It then calls the sequence service from several threads at once. Rows and
+counters created by the benchmark are deleted at the end.
+
+Usage:
+    python manage.py benchmark_sequences
+    python manage.py benchmark_sequences --sizes 0 5000 20000 --samples 200 --threads 8
+"""
+
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from api.models.models_accounting import TransactionCounter
+from api.models.models_auth import CustomUser
+from api.utils.sequences import clear_cached_blocks, max_suffix, next_value
+
+BENCH_EMAIL_DOMAIN = "sequence-bench.invalid"
+
+
+class Command(BaseCommand):
+    help = "Benchmark scan-based vs hi-lo sequence ID generation"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[0, 2000, 10000], help="Existing row counts")
+        parser.add_argument("--samples", type=int, default=100, help="IDs generated per measurement")
+        parser.add_argument("--threads", type=int, default=4, help="Concurrent callers for the sequence service")
+
+    def handle(self, *args, **options):
+        year = timezone.now().year
+        self.prefix = f"PB-{year}-"
+        self.key = f"BENCH-PB-{year}"
+        self.year = year
+        created = 0
+
+        try:
+            for size in sorted(options["sizes"]):
+                created += self._grow_to(size, created)
+                legacy = self._time(self._legacy_id, options["samples"])
+                sequence = self._time(self._sequence_id, options["samples"])
+                self.stdout.write(
+                    f"rows={size:>7} | legacy avg={legacy[0]:.2f}ms p95={legacy[1]:.2f}ms | "
+                    f"sequence avg={sequence[0]:.3f}ms p95={sequence[1]:.3f}ms"
+                )
+
+            self._concurrent(options["threads"], options["samples"])
+        finally:
+            CustomUser.objects.filter(email__endswith=f"@{BENCH_EMAIL_DOMAIN}").delete()
+            TransactionCounter.objects.filter(prefix=self.key).delete()
+            clear_cached_blocks()
+
+    def _grow_to(self, size, existing):
+        batch = [
+            CustomUser(
+                email=f"{uuid.uuid4().hex}@{BENCH_EMAIL_DOMAIN}",
+                phone=f"B{uuid.uuid4().int % 10**13:013d}",
+                first_name="Bench",
+                last_name=str(n),
+                role=CustomUser.Role.STUDENT,
+                student_id=f"{self.prefix}{n + 1:06d}",
+            )
+            for n in range(existing, size)
+        ]
+        CustomUser.objects.bulk_create(batch, batch_size=1000)
+        return len(batch)
+
+    def _legacy_id(self):
+        # The generator this service replaced: O(rows) count plus exists() probes
+        counter = (
+            CustomUser.objects.filter(role=CustomUser.Role.STUDENT, date_joined__year=self.year, student_id__isnull=False)
+            .count()
+            + 1
+        )
+        while CustomUser.objects.filter(student_id=f"{self.prefix}{counter:06d}").exists():
+            counter += 1
+        return f"{self.prefix}{counter:06d}"
+
+    def _sequence_id(self):
+        def existing_max():
+            ids = CustomUser.objects.filter(student_id__startswith=self.prefix).values_list("student_id", flat=True)
+            return max_suffix(ids, self.prefix)
+
+        return f"{self.prefix}{next_value('student', self.key, seed=existing_max):06d}"
+
+    def _time(self, func, samples):
+        timings = []
+        for _ in range(samples):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        return statistics.mean(timings), timings[int(len(timings) * 0.95) - 1]
+
+    def _concurrent(self, threads, samples):
+        def worker(_):
+            try:
+                return [self._sequence_id() for _ in range(samples)]
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            issued = [value for chunk in pool.map(worker, range(threads)) for value in chunk]
+        elapsed = time.perf_counter() - started
+
+        duplicates = len(issued) - len(set(issued))
+        self.stdout.write(
+            f"concurrent | threads={threads} ids={len(issued)} duplicates={duplicates} "
+            f"throughput={len(issued) / elapsed:.0f}/s"
+        )
@@ -0,0 +1,52 @@
+"""
+Management command to print response-cache counters.
+
+Shows hit / stale / miss / recompute / lock_wait counts recorded by
+``cache_response`` across all workers sharing the cache.
+
+Usage:
+    python manage.py cache_stats
+    python manage.py cache_stats --prefix course_list --prefix home_categories
+"""
+
+from django.core.management.base import BaseCommand
+
+from api.utils.cache_utils import (
+    CACHE_KEY_BLOG_DETAIL,
+    CACHE_KEY_BLOG_LIST,
+    CACHE_KEY_COURSE_FEATURED,
+    CACHE_KEY_COURSE_LIST,
+    CACHE_KEY_FAQ_LIST,
+    CACHE_KEY_HOME_CATEGORIES,
+    CACHE_STATS_EVENTS,
+    get_cache_stats,
+)
+
+DEFAULT_PREFIXES = [
+    CACHE_KEY_COURSE_LIST,
+    CACHE_KEY_COURSE_FEATURED,
+    CACHE_KEY_HOME_CATEGORIES,
+    CACHE_KEY_BLOG_LIST,
+    CACHE_KEY_BLOG_DETAIL,
+    CACHE_KEY_FAQ_LIST,
+]
+
+
+class Command(BaseCommand):
+    help = "Show cache_response hit/stale/recompute counters"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prefix",
+            action="append",
+            dest="prefixes",
+            help="Cache key prefix to report (repeatable; defaults to all cached endpoints)",
+        )
+
+    def handle(self, *args, **options):
+        prefixes = options.get("prefixes") or DEFAULT_PREFIXES
+        stats = get_cache_stats(*prefixes)
+
+        self.stdout.write(f"{'prefix':<18}" + "".join(f"{event:>11}" for event in CACHE_STATS_EVENTS))
+        for prefix in prefixes:
+            self.stdout.write(f"{prefix:<18}" + "".join(f"{stats[prefix][event]:>11}" for event in CACHE_STATS_EVENTS))
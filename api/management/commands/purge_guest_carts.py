@@ -0,0 +1,39 @@
+"""
+Management command to delete stale session-based guest carts.
+
+New guest carts are kept in a signed cookie and never reach the database,
+but carts created by earlier releases (``user`` is null, keyed by
+``session_key``) are left behind when the visitor never logs in. This
+command removes those older than ``--days`` with one bulk delete.
+
+Usage:
+    python manage.py purge_guest_carts
+    python manage.py purge_guest_carts --days 7 --dry-run
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.models.models_cart import Cart
+
+
+class Command(BaseCommand):
+    help = "Delete guest carts not updated within the given number of days"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=30, help="Delete guest carts idle longer than this")
+        parser.add_argument("--dry-run", action="store_true", help="Report how many carts would be deleted")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        stale = Cart.objects.filter(user__isnull=True, updated_at__lt=cutoff)
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"Would delete {stale.count()} guest cart(s)"))
+            return
+
+        deleted, per_model = stale.delete()
+        carts = per_model.get(Cart._meta.label, 0)
+        self.stdout.write(self.style.SUCCESS(f"Deleted {carts} guest cart(s) ({deleted} rows)"))
@@ -0,0 +1,32 @@
+"""
+Management command to repair drift in CourseBatch.enrolled_students.
+
+Enrollment saves and deletes keep the counter up to date with atomic
+increments. Queryset ``update()`` calls and raw SQL bypass them, so this
+command recounts every batch with a single grouped query and rewrites
+only the counters that differ. Run it periodically (e.g. nightly cron).
+
+Usage:
+    python manage.py reconcile_enrollment_counts
+    python manage.py reconcile_enrollment_counts --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+
+from api.models.models_course import CourseBatch
+
+
+class Command(BaseCommand):
+    help = "Recount enrolled students for every course batch and fix drifted counters"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report drift without writing")
+
+    def handle(self, *args, **options):
+        drifted = CourseBatch.reconcile_enrolled_counts(dry_run=options["dry_run"])
+
+        for batch, stored, actual in drifted:
+            self.stdout.write(f"{batch.pk} ({batch}): {stored} -> {actual}")
+
+        verb = "Would fix" if options["dry_run"] else "Fixed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {len(drifted)} batch counter(s)"))
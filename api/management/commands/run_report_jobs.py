@@ -0,0 +1,95 @@
+"""
+Management command that renders queued report jobs (PDF exports).
+
+ReportLab rendering is CPU bound, so jobs run in a process pool rather than
+threads; request workers only create jobs and serve finished files.
+
+Usage:
+    python manage.py run_report_jobs
+    python manage.py run_report_jobs --processes 4
+    python manage.py run_report_jobs --once              # render queued jobs and exit
+    python manage.py run_report_jobs --processes 0       # render in this process
+    python manage.py run_report_jobs --purge             # delete jobs past REPORT_JOB_RETENTION_HOURS
+"""
+
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+from django.utils import timezone
+
+from api.models.models_reports import ReportJob
+from api.utils.report_jobs import claim_report_jobs, render_report_job
+
+
+def _init_process():
+    # Children started with "spawn"/"forkserver" need their own app registry;
+    # forked children already have one and never inherit an open connection.
+    import django
+
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = "Render queued report jobs in a process pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=2, help="Worker processes (0 renders in this process)")
+        parser.add_argument("--poll-interval", type=float, default=2.0, help="Seconds to sleep when nothing is queued")
+        parser.add_argument("--once", action="store_true", help="Render queued jobs until none are left, then exit")
+        parser.add_argument("--purge", action="store_true", help="Delete jobs (and files) past retention and exit")
+
+    def handle(self, *args, **options):
+        if options["purge"]:
+            cutoff = timezone.now() - timedelta(hours=getattr(settings, "REPORT_JOB_RETENTION_HOURS", 24))
+            count = 0
+            # Delete one by one so file cleanup removes each rendered file
+            for job in ReportJob.objects.filter(created_at__lt=cutoff).iterator():
+                job.delete()
+                count += 1
+            self.stdout.write(self.style.SUCCESS(f"Deleted {count} report job(s)"))
+            return
+
+        self._stopping = False
+        if not options["once"]:
+            signal.signal(signal.SIGTERM, self._stop)
+            signal.signal(signal.SIGINT, self._stop)
+            self.stdout.write(f"Report worker started (processes={options['processes']})")
+
+        processes = options["processes"]
+        pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_process) if processes > 0 else None
+        rendered = failed = 0
+        try:
+            while not self._stopping:
+                if not options["once"]:
+                    close_old_connections()
+                job_ids = claim_report_jobs(max(processes, 1))
+                if not job_ids:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                if pool:
+                    # Never fork while holding a connection: children must open their own
+                    connections.close_all()
+                    statuses = pool.map(render_report_job, job_ids)
+                else:
+                    statuses = map(render_report_job, job_ids)
+
+                for job_status in statuses:
+                    rendered += 1
+                    failed += job_status != ReportJob.Status.DONE
+        finally:
+            if pool:
+                pool.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f"Rendered {rendered} report(s), {failed} failed"))
+
+    def _stop(self, signum, frame):
+        # Finish the jobs in flight, then exit
+        self._stopping = True
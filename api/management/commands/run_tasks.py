@@ -0,0 +1,93 @@
+"""
+Management command that runs queued background tasks (emails etc.).
+
+Claims due rows from the OutboxTask table, executes them on a thread pool,
+retries failures with exponential backoff and dead-letters rows that run
+out of attempts. Run one or more of these next to gunicorn.
+
+Usage:
+    python manage.py run_tasks
+    python manage.py run_tasks --concurrency 8 --batch-size 50
+    python manage.py run_tasks --once              # drain due tasks and exit
+    python manage.py run_tasks --requeue-dead      # retry dead-lettered tasks
+    python manage.py run_tasks --purge-done 7      # delete tasks finished > 7 days ago
+"""
+
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from api.models.models_tasks import OutboxTask
+from api.utils.tasks import claim_tasks, run_task
+
+
+class Command(BaseCommand):
+    help = "Run queued background tasks from the outbox table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=4, help="Tasks executed in parallel")
+        parser.add_argument("--batch-size", type=int, default=20, help="Tasks claimed per poll")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to sleep when the queue is empty")
+        parser.add_argument("--once", action="store_true", help="Process due tasks until none are left, then exit")
+        parser.add_argument("--requeue-dead", action="store_true", help="Move dead tasks back to pending and exit")
+        parser.add_argument("--purge-done", type=int, metavar="DAYS", help="Delete tasks finished more than DAYS ago and exit")
+
+    def handle(self, *args, **options):
+        if options["requeue_dead"]:
+            count = OutboxTask.objects.filter(status=OutboxTask.Status.DEAD).update(
+                status=OutboxTask.Status.PENDING, attempts=0, run_after=timezone.now(), finished_at=None
+            )
+            self.stdout.write(self.style.SUCCESS(f"Requeued {count} dead task(s)"))
+            return
+
+        if options["purge_done"] is not None:
+            cutoff = timezone.now() - timedelta(days=options["purge_done"])
+            count, _ = OutboxTask.objects.filter(status=OutboxTask.Status.DONE, finished_at__lt=cutoff).delete()
+            self.stdout.write(self.style.SUCCESS(f"Deleted {count} finished task(s)"))
+            return
+
+        self._stopping = False
+        if not options["once"]:
+            signal.signal(signal.SIGTERM, self._stop)
+            signal.signal(signal.SIGINT, self._stop)
+            self.stdout.write(f"Task worker started (concurrency={options['concurrency']})")
+
+        # With --concurrency 1 tasks run on this thread (and its connection)
+        pool = ThreadPoolExecutor(max_workers=options["concurrency"]) if options["concurrency"] > 1 else None
+        processed = failed = 0
+        try:
+            while not self._stopping:
+                if not options["once"]:
+                    close_old_connections()
+                batch = claim_tasks(options["batch_size"])
+                if not batch:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                statuses = pool.map(self._run_in_thread, batch) if pool else map(run_task, batch)
+                for status in statuses:
+                    processed += 1
+                    failed += status != OutboxTask.Status.DONE
+        finally:
+            if pool:
+                pool.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} task(s), {failed} failed"))
+
+    def _run_in_thread(self, outbox_task):
+        try:
+            return run_task(outbox_task)
+        finally:
+            # Worker threads each hold their own connection
+            close_old_connections()
+
+    def _stop(self, signum, frame):
+        # Finish the current batch, then exit
+        self._stopping = True
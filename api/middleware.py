@@ -4,6 +4,8 @@ from django.http import JsonResponse
 from django.conf import settings
 from django.utils.deprecation import MiddlewareMixin
 
+from api.utils.user_status import TOKEN_VERSION_CLAIM, get_user_status
+
 
 class RejectDisabledUserMiddleware(MiddlewareMixin):
     """
@@ -34,22 +36,22 @@ class RejectDisabledUserMiddleware(MiddlewareMixin):
 
                     at = AccessToken(token_str)
                     user_id = at.get(getattr(settings, "SIMPLE_JWT", {}).get("USER_ID_CLAIM", "user_id")) or at.get("user_id")
-                    if user_id:
-                        # Import locally to avoid heavier imports at module level
-                        from django.contrib.auth import get_user_model
-
-                        User = get_user_model()
-                        try:
-                            fresh = User.objects.get(pk=user_id)
-                        except User.DoesNotExist:
-                            return JsonResponse({"detail": "User not found."}, status=401)
-
-                        if not fresh.is_active or not getattr(fresh, "is_enabled", True):
-                            return JsonResponse({"detail": "Your account has been disabled."}, status=403)
                 except Exception:
                     # If token invalid/expired or simplejwt not installed, let DRF handle it
                     return None
 
+                if user_id:
+                    # Cached (is_active, is_enabled, token_version); no DB hit on the hot path
+                    status = get_user_status(user_id)
+                    if status is None:
+                        return JsonResponse({"detail": "User not found."}, status=401)
+
+                    if not status.is_active or not status.is_enabled:
+                        return JsonResponse({"detail": "Your account has been disabled."}, status=403)
+
+                    if at.get(TOKEN_VERSION_CLAIM, 0) < status.token_version:
+                        return JsonResponse({"detail": "Token has been revoked."}, status=401)
+
             return None
 
         cache_key = f"{self.CACHE_KEY_PREFIX}{user.pk}"
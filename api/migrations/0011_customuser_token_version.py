@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-16 20:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_alter_income_transaction_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, help_text='Incremented to revoke every JWT issued to this user. Auto-managed by system.'),
+        ),
+    ]
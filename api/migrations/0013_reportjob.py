@@ -0,0 +1,40 @@
+# Generated by Django 5.2.9 on 2026-10-16 20:28
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_outboxtask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportJob',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('report_type', models.CharField(help_text='Registered report name, e.g. students_pdf.', max_length=50)),
+                ('params', models.JSONField(blank=True, default=dict, help_text='Normalized report parameters.')),
+                ('params_hash', models.CharField(help_text='SHA1 of report type + params; identical requests share a job.', max_length=40)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('file', models.FileField(blank=True, null=True, upload_to='reports/')),
+                ('filename', models.CharField(blank=True, help_text='Download file name.', max_length=255)),
+                ('error', models.TextField(blank=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='report_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Report Job',
+                'verbose_name_plural': 'Report Jobs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['params_hash', 'created_at'], name='api_reportj_params__93a3e4_idx'), models.Index(fields=['status', 'created_at'], name='api_reportj_status_27e75d_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.9 on 2026-10-16 20:32
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_reportjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentWebhookEvent',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('val_id', models.CharField(help_text='Gateway validation ID (dedupe key)', max_length=255, unique=True)),
+                ('tran_id', models.CharField(db_index=True, help_text='Order number sent as tran_id', max_length=100)),
+                ('amount', models.CharField(help_text='Amount as reported by the gateway', max_length=50)),
+                ('gateway_status', models.CharField(blank=True, max_length=50)),
+                ('payload', models.JSONField(blank=True, default=dict, help_text='Full IPN body')),
+                ('status', models.CharField(choices=[('received', 'Received'), ('processed', 'Processed'), ('ignored', 'Ignored'), ('invalid', 'Invalid')], db_index=True, default='received', max_length=10)),
+                ('result', models.CharField(blank=True, help_text='Outcome of processing', max_length=255)),
+                ('validation_response', models.JSONField(blank=True, default=dict)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Payment Webhook Event',
+                'verbose_name_plural': 'Payment Webhook Events',
+                'ordering': ['-created_at'],
+                'abstract': False,
+                'indexes': [models.Index(fields=['status', 'created_at'], name='api_payment_status_4e7e6a_idx')],
+            },
+        ),
+    ]
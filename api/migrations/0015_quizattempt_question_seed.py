@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-16 20:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_paymentwebhookevent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizattempt',
+            name='question_seed',
+            field=models.PositiveIntegerField(blank=True, help_text="Seed for this attempt's question order (randomized quizzes only)", null=True),
+        ),
+    ]
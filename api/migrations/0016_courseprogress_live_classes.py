@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-16 21:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_quizattempt_question_seed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='courseprogress',
+            name='live_classes_attended',
+            field=models.PositiveIntegerField(default=0, help_text='Number of live classes attended'),
+        ),
+        migrations.AddField(
+            model_name='courseprogress',
+            name='live_classes_total',
+            field=models.PositiveIntegerField(default=0, help_text='Total number of live classes'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.9 on 2026-10-16 22:11
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_courseprogress_live_classes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyMetric',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='Local calendar day the activity belongs to')),
+                ('metric', models.CharField(choices=[('students', 'Student signups'), ('teachers', 'Teacher signups'), ('enrollments', 'Active enrollments'), ('revenue_method', 'Completed revenue by payment method'), ('revenue_course', 'Completed revenue by course')], max_length=20)),
+                ('dimension', models.CharField(blank=True, default='', help_text='Breakdown key (may be empty)', max_length=64)),
+                ('count', models.IntegerField(default=0)),
+                ('amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+            ],
+            options={
+                'verbose_name': 'Daily Metric',
+                'verbose_name_plural': 'Daily Metrics',
+                'ordering': ['-date', 'metric', 'dimension'],
+                'constraints': [models.UniqueConstraint(fields=('metric', 'date', 'dimension'), name='unique_daily_metric')],
+            },
+        ),
+    ]
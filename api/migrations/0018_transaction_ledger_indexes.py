@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-16 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_dailymetric'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['-date', '-reference_id'], name='expense_ledger_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='income',
+            index=models.Index(fields=['-date', '-transaction_id'], name='income_ledger_idx'),
+        ),
+    ]
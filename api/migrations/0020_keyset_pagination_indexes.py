@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-16 22:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_periodsummary'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignmentsubmission',
+            index=models.Index(fields=['-created_at', '-id'], name='submission_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='custompayment',
+            index=models.Index(fields=['-created_at', '-id'], name='custom_payment_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['role', '-date_joined', '-id'], name='user_role_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['-created_at', '-id'], name='enrollment_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['-created_at', '-id'], name='order_keyset_idx'),
+        ),
+    ]
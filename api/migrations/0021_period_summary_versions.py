@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-16 23:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='periodsummary',
+            name='is_stale',
+            field=models.BooleanField(default=False, help_text='Totals must be recomputed before use'),
+        ),
+        migrations.AddField(
+            model_name='periodsummary',
+            name='version',
+            field=models.PositiveIntegerField(default=0, help_text='Bumped on every invalidation'),
+        ),
+    ]
@@ -8,8 +8,11 @@ from .models_cart import Cart, CartItem, Wishlist
 from .models_course import CourseBatch
 from .models_custom_payment import CustomPayment
 from .models_footer import Footer, LinkGroup, QuickLink, SocialLink
+from .models_metrics import DailyMetric
 from .models_progress import (  # OLD models removed: ModuleAssignment, ModuleQuiz, StudentAssignmentSubmission, StudentQuizAttempt; Use NEW system: Quiz, Assignment, LiveClass from models_module.py
     CourseProgress,
     StudentModuleProgress,
 )
+from .models_reports import ReportJob
+from .models_tasks import OutboxTask
 from .models_accounting import *
\ No newline at end of file
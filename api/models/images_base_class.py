@@ -1,14 +1,16 @@
 from django.core.exceptions import ValidationError
 from django.db import models
 
+from api.utils.file_cleanup import original_file_names
+from api.utils.helper_models import FileTrackingModel
 from api.utils.image_utils import optimize_image
 
 
-class OptimizedImageModel(models.Model):
+class OptimizedImageModel(FileTrackingModel):
     """
     Abstract base class for models with ImageField(s) that need:
     - Automatic optimization (resize + compression)
-    - Old file deletion on update
+    - Old file deletion on update (see api.utils.file_cleanup)
     - Built-in validation
     - Works for admin & API
     """
@@ -91,25 +93,10 @@ class OptimizedImageModel(models.Model):
         # Get the force_insert flag to determine if this is a new instance
         is_new = self.pk is None or kwargs.get("force_insert", False)
 
-        # 1️⃣ Delete old files if changed (only for updates)
-        if not is_new:
-            try:
-                old_instance = self.__class__.objects.get(pk=self.pk)
-                for field_name in self.IMAGE_FIELDS_OPTIMIZATION.keys():
-                    old_file = getattr(old_instance, field_name)
-                    new_file = getattr(self, field_name)
-
-                    # Check if the file has changed
-                    old_name = getattr(old_file, "name", None) if old_file else None
-                    new_name = getattr(new_file, "name", None) if new_file else None
-
-                    if old_name and new_name and old_name != new_name:
-                        # Delete the old file from storage
-                        old_file.delete(save=False)
-            except self.__class__.DoesNotExist:
-                pass
-
-        # 2️⃣ Optimize new images BEFORE saving
+        # Old files are removed after commit by api.utils.file_cleanup
+        original = {} if is_new or self._state.adding else original_file_names(self)
+
+        # 1️⃣ Optimize new images BEFORE saving
         for field_name, options in self.IMAGE_FIELDS_OPTIMIZATION.items():
             image_field = getattr(self, field_name)
 
@@ -125,15 +112,7 @@ class OptimizedImageModel(models.Model):
 
                     # Check 2: Compare with old instance (for updates)
                     if not is_new and not file_changed:
-                        try:
-                            old_instance = self.__class__.objects.get(pk=self.pk)
-                            old_file = getattr(old_instance, field_name)
-                            old_name = getattr(old_file, "name", None) if old_file else None
-                            new_name = getattr(image_field, "name", None)
-
-                            if old_name != new_name:
-                                file_changed = True
-                        except self.__class__.DoesNotExist:
+                        if original.get(field_name) != getattr(image_field, "name", None):
                             file_changed = True
 
                     # Check 3: For brand new instances
@@ -155,5 +134,5 @@ class OptimizedImageModel(models.Model):
 
                     traceback.print_exc()
 
-        # 3️⃣ Save the instance
+        # 2️⃣ Save the instance
         super().save(*args, **kwargs)
@@ -1,8 +1,10 @@
 import uuid
+from decimal import Decimal
+
 from django.db import models, transaction
 from django.utils import timezone
 
-from api.utils.helper_models import TimeStampedModel
+from api.utils.helper_models import FieldTrackingModel, TimeStampedModel
 
 
 # -------------------------------
@@ -38,7 +40,7 @@ class IncomeType(TimeStampedModel):
 # Transaction Counter (NEW - for race condition fix)
 # -------------------------------
 class TransactionCounter(models.Model):
-    """Stores counter for each transaction prefix to avoid race conditions"""
+    """Highest value issued per sequence key (see ``api.utils.sequences``)"""
     prefix = models.CharField(max_length=50, unique=True, db_index=True)
     counter = models.IntegerField(default=0)
 
@@ -52,7 +54,7 @@ class TransactionCounter(models.Model):
 # -------------------------------
 # Income
 # -------------------------------
-class Income(TimeStampedModel):
+class Income(TimeStampedModel, FieldTrackingModel):
     STATUS_CHOICES = [
         ("completed", "Completed"),
         ("pending", "Pending"),
@@ -97,12 +99,17 @@ class Income(TimeStampedModel):
         related_name="recorded_incomes"
     )
 
+    # A date change moves the income out of one accounting period into another
+    tracked_fields = ("date",)
+
     class Meta:
         indexes = [
             models.Index(fields=['-date'], name='income_date_idx'),
             models.Index(fields=['status', 'approval_status'], name='income_status_idx'),
             models.Index(fields=['income_type', '-date'], name='income_type_date_idx'),
             models.Index(fields=['payment_method'], name='income_payment_idx'),
+            # Keyset order of the combined transactions ledger
+            models.Index(fields=['-date', '-transaction_id'], name='income_ledger_idx'),
         ]
         ordering = ['-date', '-created_at']
 
@@ -115,27 +122,17 @@ class Income(TimeStampedModel):
 
     def generate_transaction_id(self):
         """
-        Generate unique transaction ID using counter table to prevent race conditions.
+        Generate unique transaction ID from the sequence service (block size 1, so no gaps).
         Format: PRIME-{PREFIX}-{YEAR}-{COUNTER}
         Example: PRIME-DON-2025-0001
         """
+        from api.utils.sequences import next_value
+
         year = self.date.year if self.date else timezone.now().year
         prefix_code = self.income_type.prefix.upper()
         prefix_key = f"PRIME-{prefix_code}-{year}"
 
-        with transaction.atomic():
-            # Get or create counter for this prefix, with row lock
-            counter_obj, created = TransactionCounter.objects.select_for_update().get_or_create(
-                prefix=prefix_key,
-                defaults={'counter': 0}
-            )
-
-            # Increment counter
-            counter_obj.counter += 1
-            counter_obj.save(update_fields=['counter'])
-
-            # Generate transaction ID
-            return f"{prefix_key}-{str(counter_obj.counter).zfill(4)}"
+        return f"{prefix_key}-{str(next_value('income', prefix_key)).zfill(4)}"
 
     def __str__(self):
         return self.transaction_id
@@ -277,7 +274,7 @@ class ExpensePaymentMethod(TimeStampedModel):
 # ============================================================
 # Expense (TRANSACTION)
 # ============================================================
-class Expense(TimeStampedModel):
+class Expense(TimeStampedModel, FieldTrackingModel):
     STATUS_CHOICES = [
         ("paid", "Paid"),
         ("pending", "Pending"),
@@ -306,6 +303,9 @@ class Expense(TimeStampedModel):
         related_name="recorded_expenses",
     )
 
+    # A date change moves the expense out of one accounting period into another
+    tracked_fields = ("date",)
+
     class Meta:
         ordering = ["-date", "-created_at"]
         indexes = [
@@ -313,6 +313,8 @@ class Expense(TimeStampedModel):
             models.Index(fields=["status"]),
             models.Index(fields=["expense_type"]),
             models.Index(fields=["payment_method"]),
+            # Keyset order of the combined transactions ledger
+            models.Index(fields=["-date", "-reference_id"], name="expense_ledger_idx"),
         ]
 
     def save(self, *args, **kwargs):
@@ -437,3 +439,33 @@ class ExpenseUpdateRequest(TimeStampedModel):
 
     def __str__(self):
         return f"Expense Update Request → {self.expense.reference_id}"
+
+
+# ============================================================
+# Period Summary (CLOSED MONTH TOTALS)
+# ============================================================
+class PeriodSummary(models.Model):
+    """Revenue and expense totals of a closed month, computed once and kept.
+
+    Only months before the current one are stored. A row is marked stale
+    (and its version bumped) when an income or expense dated in its month is
+    saved or deleted, and recomputed on the next read (see
+    ``api.utils.accounting_periods``).
+    """
+
+    year = models.PositiveIntegerField()
+    month = models.PositiveSmallIntegerField()
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+    expenses = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+    is_stale = models.BooleanField(default=False, help_text="Totals must be recomputed before use")
+    version = models.PositiveIntegerField(default=0, help_text="Bumped on every invalidation")
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-year", "-month"]
+        constraints = [
+            models.UniqueConstraint(fields=["year", "month"], name="unique_period_summary"),
+        ]
+
+    def __str__(self):
+        return f"{self.year}-{self.month:02d}: {self.revenue} / {self.expenses}"
@@ -14,7 +14,7 @@ from django.utils.translation import gettext_lazy as _
 from django_ckeditor_5.fields import CKEditor5Field
 
 from api.models.images_base_class import OptimizedImageModel
-from api.utils.helper_models import TimeStampedModel
+from api.utils.helper_models import FieldTrackingModel, TimeStampedModel
 
 # -----------------------------------------------------------
 # Custom Manager
@@ -46,6 +46,8 @@ class CustomUserManager(BaseUserManager):
 
     def _generate_unique_student_id(self, user):
         """Generate a unique student ID in format PA-YYYY-XXX using user's registration year"""
+        from api.utils.sequences import max_suffix, next_value
+
         if not user.date_joined:
             # Fallback to current year if date_joined is somehow not set
             from django.utils import timezone
@@ -56,26 +58,12 @@ class CustomUserManager(BaseUserManager):
 
         prefix = f"PA-{year}-"
 
-        # Count existing students from the same year (exclude current user)
-        existing_count = (
-            CustomUser.objects.filter(role=CustomUser.Role.STUDENT, date_joined__year=year, student_id__isnull=False)
-            .exclude(pk=user.pk)
-            .count()
-        )
-
-        counter = existing_count + 1
+        def existing_max():
+            # Only runs once per year, when its counter row is created
+            ids = CustomUser.objects.filter(student_id__startswith=prefix).values_list("student_id", flat=True)
+            return max_suffix(ids, prefix)
 
-        # Ensure uniqueness
-        max_attempts = 1000  # Prevent infinite loop
-        attempts = 0
-        while attempts < max_attempts:
-            student_id = f"{prefix}{counter:03d}"
-            if not CustomUser.objects.filter(student_id=student_id).exists():
-                return student_id
-            counter += 1
-            attempts += 1
-
-        return f"{prefix}{str(uuid.uuid4())[:8].upper()}"
+        return f"{prefix}{next_value('student', f'PA-{year}', seed=existing_max):03d}"
 
     def create_superuser(self, email, password, **extra_fields):
         """
@@ -102,9 +90,12 @@ class CustomUserManager(BaseUserManager):
 # -----------------------------------------------------------
 
 
-class CustomUser(AbstractBaseUser, PermissionsMixin):
+class CustomUser(AbstractBaseUser, PermissionsMixin, FieldTrackingModel):
     """Custom user model with email authentication and role-based access."""
 
+    # Signup rollup (api.utils.metrics_rollup) reacts to these changing
+    tracked_fields = ("role", "is_enabled")
+
     id = models.UUIDField(
         primary_key=True, default=uuid.uuid4, editable=False, help_text="Unique UUID identifier for this user."
     )
@@ -159,6 +150,10 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
 
     date_joined = models.DateTimeField(auto_now_add=True, help_text="Date and time when the user account was created.")
 
+    token_version = models.PositiveIntegerField(
+        default=0, help_text="Incremented to revoke every JWT issued to this user. Auto-managed by system."
+    )
+
     USERNAME_FIELD = "email"
 
     # Required fields
@@ -169,6 +164,10 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = "Prime Academy User"
         verbose_name_plural = "All Users"
+        indexes = [
+            # Keyset order of the admin student list (KeysetPagination)
+            models.Index(fields=["role", "-date_joined", "-id"], name="user_role_keyset_idx"),
+        ]
 
     def __str__(self):
         return self.first_name + " " + self.last_name
@@ -185,6 +184,12 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         self.save(update_fields=["student_id"])
         return self.student_id
 
+    def revoke_tokens(self):
+        """Invalidate every access/refresh token issued to this user so far."""
+        self.token_version = models.F("token_version") + 1
+        self.save(update_fields=["token_version"])
+        self.refresh_from_db(fields=["token_version"])
+
     @property
     def get_full_name(self):
         return f"{self.first_name} {self.last_name}"
@@ -1,13 +1,13 @@
 """Shopping Cart and Wishlist Models"""
 
 import uuid
-from decimal import Decimal
 
 from django.db import models
 from django.utils import timezone
 
 from api.models.models_auth import CustomUser
 from api.models.models_course import Course
+from api.utils.cart_pricing import CartPricing, invalidate_cart_pricing, load_cart_items, price_cart, unit_price
 from api.utils.helper_models import TimeStampedModel
 
 
@@ -37,16 +37,34 @@ class Cart(TimeStampedModel):
 
     def get_total(self):
         """Calculate total cart amount with discounts"""
-        total = sum(item.get_subtotal() for item in self.items.all())
-        return Decimal(str(total))
+        return CartPricing(load_cart_items(self)).total
 
     def get_item_count(self):
         """Get total number of items"""
         return self.items.count()
 
+    @property
+    def priced_items(self):
+        """Items loaded and priced once per instance by the cart pricing engine."""
+        return price_cart(self).items
+
     def clear(self):
         """Remove all items from cart"""
         self.items.all().delete()
+        invalidate_cart_pricing(self)
+
+    def add_item(self, course, batch=None):
+        """Add a course (and optional batch); returns ``(item, created)``."""
+        invalidate_cart_pricing(self)
+        return CartItem.objects.get_or_create(cart=self, course=course, batch=batch)
+
+    def remove_item(self, item_id):
+        """Delete and return the item with ``item_id``, or ``None`` if it isn't in this cart."""
+        item = self.items.select_related("course").filter(id=item_id).first()
+        if item is not None:
+            item.delete()
+            invalidate_cart_pricing(self)
+        return item
 
     def __str__(self):
         if self.user:
@@ -72,9 +90,7 @@ class CartItem(TimeStampedModel):
 
     def get_subtotal(self):
         """Get price for this course (with discount if applicable)"""
-        if hasattr(self.course, "pricing") and self.course.pricing:
-            return Decimal(str(self.course.pricing.get_discounted_price()))
-        return Decimal("0.00")
+        return unit_price(self.course)
 
     def __str__(self):
         cart_owner = self.cart.user.email if self.cart.user else f"Guest {self.cart.session_key[:8]}"
@@ -1,12 +1,13 @@
 import uuid
 
 from django.db import models
+from django.db.models import Case, Count, F, Value, When
 from django.utils.text import slugify
 
 from django_ckeditor_5.fields import CKEditor5Field
 
 from api.models.images_base_class import OptimizedImageModel
-from api.utils.helper_models import TimeStampedModel
+from api.utils.helper_models import FieldTrackingModel, TimeStampedModel
 
 
 class Category(TimeStampedModel):
@@ -414,9 +415,11 @@ class WhyEnrol(OptimizedImageModel):
 
 
 # Section 5: Modules
-class CourseModule(models.Model):
+class CourseModule(FieldTrackingModel):
     """Individual modules/chapters within a course."""
 
+    tracked_fields = ("course_id", "is_active")
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     course = models.ForeignKey(Course, related_name="modules", on_delete=models.CASCADE)
     title = models.CharField(max_length=200)
@@ -758,11 +761,64 @@ class CourseBatch(TimeStampedModel):
         return f"Batch {self.batch_number}"
 
     def update_enrolled_count(self):
-        """Update enrolled_students count from actual enrollments."""
+        """Recount enrolled_students for this batch from actual enrollments."""
         from api.models.models_order import Enrollment
 
         self.enrolled_students = Enrollment.objects.filter(batch=self, is_active=True).count()
-        self.save(update_fields=["enrolled_students"])
+        CourseBatch.objects.filter(pk=self.pk).update(enrolled_students=self.enrolled_students)
+        if self.enrolled_students >= self.max_students:
+            CourseBatch.objects.filter(pk=self.pk, status="enrollment_open").update(status="upcoming")
+        else:
+            CourseBatch.reopen_freed_batch(self.pk)
+
+    @classmethod
+    def adjust_enrolled_count(cls, batch_id, delta):
+        """Atomically add ``delta`` to a batch's enrolled_students (never below zero)."""
+        if not batch_id or not delta:
+            return
+        batches = cls.objects.filter(pk=batch_id)
+        if delta < 0:
+            batches = batches.filter(enrolled_students__gte=-delta)
+        # An open batch that fills up falls back to "upcoming", as _update_status() would decide
+        filled = When(
+            status="enrollment_open", enrolled_students__gte=F("max_students") - delta, then=Value("upcoming")
+        )
+        updated = batches.update(enrolled_students=F("enrolled_students") + delta, status=Case(filled, default=F("status")))
+        if updated and delta < 0:
+            cls.reopen_freed_batch(batch_id)
+
+    @classmethod
+    def reopen_freed_batch(cls, batch_id):
+        """Re-run the date checks on an "upcoming" batch that has a free seat again."""
+        for batch in cls.objects.filter(pk=batch_id, status="upcoming", enrolled_students__lt=F("max_students")):
+            batch._update_status()
+            if batch.status != "upcoming":
+                cls.objects.filter(pk=batch_id).update(status=batch.status)
+
+    @classmethod
+    def reconcile_enrolled_counts(cls, dry_run=False):
+        """Repair counter drift for every batch with one grouped COUNT.
+
+        Returns a list of ``(batch, stored, actual)`` for the batches that were wrong.
+        """
+        from api.models.models_order import Enrollment
+
+        actual = dict(
+            Enrollment.objects.filter(is_active=True, batch__isnull=False)
+            .values_list("batch")
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+        drifted = []
+        for batch in cls.objects.only("id", "batch_number", "batch_name", "enrolled_students"):
+            count = actual.get(batch.id, 0)
+            if batch.enrolled_students != count:
+                drifted.append((batch, batch.enrolled_students, count))
+                batch.enrolled_students = count
+
+        if drifted and not dry_run:
+            cls.objects.bulk_update([batch for batch, _, _ in drifted], ["enrolled_students"], batch_size=500)
+        return drifted
 
     def __str__(self):
         return self.get_display_name()
@@ -126,6 +126,8 @@ class CustomPayment(TimeStampedModel):
             models.Index(fields=["payment_number"]),
             models.Index(fields=["created_by", "created_at"]),
             models.Index(fields=["status", "created_at"]),
+            # Keyset order of the payments list (KeysetPagination)
+            models.Index(fields=["-created_at", "-id"], name="custom_payment_keyset_idx"),
         ]
 
     def save(self, *args, **kwargs):
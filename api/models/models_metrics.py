@@ -0,0 +1,42 @@
+"""Daily metrics rollup for the admin dashboards.
+
+One ``DailyMetric`` row holds a count and an amount for a metric on a day,
+optionally split by a dimension (course, payment method, enabled state).
+Rows are kept current by signals (see ``api.utils.metrics_rollup``) and
+rebuilt from the base tables by ``manage.py backfill_daily_metrics``, so
+dashboard endpoints read O(days) rows instead of scanning users, orders and
+enrollments.
+"""
+
+from decimal import Decimal
+
+from django.db import models
+
+
+class DailyMetric(models.Model):
+    """Pre-aggregated fact row: ``count`` and ``amount`` of ``metric`` on ``date`` for ``dimension``."""
+
+    class Metric(models.TextChoices):
+        STUDENTS = "students", "Student signups"  # dimension: enabled / disabled
+        TEACHERS = "teachers", "Teacher signups"  # dimension: enabled / disabled
+        ENROLLMENTS = "enrollments", "Active enrollments"  # dimension: course id
+        REVENUE_BY_METHOD = "revenue_method", "Completed revenue by payment method"  # dimension: payment method
+        REVENUE_BY_COURSE = "revenue_course", "Completed revenue by course"  # dimension: course id
+
+    date = models.DateField(help_text="Local calendar day the activity belongs to")
+    metric = models.CharField(max_length=20, choices=Metric.choices)
+    dimension = models.CharField(max_length=64, blank=True, default="", help_text="Breakdown key (may be empty)")
+    count = models.IntegerField(default=0)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+
+    class Meta:
+        verbose_name = "Daily Metric"
+        verbose_name_plural = "Daily Metrics"
+        ordering = ["-date", "metric", "dimension"]
+        constraints = [
+            models.UniqueConstraint(fields=["metric", "date", "dimension"], name="unique_daily_metric"),
+        ]
+
+    def __str__(self):
+        suffix = f" [{self.dimension}]" if self.dimension else ""
+        return f"{self.date} {self.metric}{suffix}: {self.count} / {self.amount}"
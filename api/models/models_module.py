@@ -8,13 +8,15 @@ from django.db import models
 from django_ckeditor_5.fields import CKEditor5Field
 
 from api.models.models_course import CourseBatch, CourseModule
-from api.utils.helper_models import TimeStampedModel
+from api.utils.helper_models import FieldTrackingModel, FileTrackingModel, TimeStampedModel
 
 
 # Live Classes within a module
-class LiveClass(models.Model):
+class LiveClass(FieldTrackingModel):
     """Live classes scheduled for a course module."""
 
+    tracked_fields = ("module_id", "batch_id", "is_active")
+
     STATUS_CHOICES = [
         ("scheduled", "Scheduled"),
         ("ongoing", "Ongoing"),
@@ -88,9 +90,11 @@ class LiveClass(models.Model):
 
 
 # Attendance tracking for live classes
-class LiveClassAttendance(TimeStampedModel):
+class LiveClassAttendance(TimeStampedModel, FieldTrackingModel):
     """Track student attendance for live classes."""
 
+    tracked_fields = ("attended",)
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     live_class = models.ForeignKey(LiveClass, related_name="attendances", on_delete=models.CASCADE)
     student = models.ForeignKey(
@@ -114,9 +118,11 @@ class LiveClassAttendance(TimeStampedModel):
 
 
 # Assignments within a module
-class Assignment(TimeStampedModel):
+class Assignment(TimeStampedModel, FileTrackingModel, FieldTrackingModel):
     """Assignments for students within a course module."""
 
+    tracked_fields = ("module_id", "batch_id", "is_active")
+
     TYPE_CHOICES = [
         ("written", "Written Assignment"),
         ("coding", "Coding Assignment"),
@@ -181,9 +187,11 @@ class Assignment(TimeStampedModel):
 
 
 # Student assignment submissions
-class AssignmentSubmission(TimeStampedModel):
+class AssignmentSubmission(TimeStampedModel, FileTrackingModel, FieldTrackingModel):
     """Student submissions for assignments."""
 
+    tracked_fields = ("status",)
+
     STATUS_CHOICES = [
         ("pending", "Pending Review"),
         ("submitted", "Submitted"),
@@ -240,6 +248,10 @@ class AssignmentSubmission(TimeStampedModel):
         verbose_name_plural = "Assignment Submissions"
         unique_together = ["assignment", "student"]
         ordering = ["-submitted_at"]
+        indexes = [
+            # Keyset order of the submissions list (KeysetPagination)
+            models.Index(fields=["-created_at", "-id"], name="submission_keyset_idx"),
+        ]
 
     def __str__(self):
         return f"{self.student.get_full_name} - {self.assignment.title}"
@@ -249,9 +261,11 @@ class AssignmentSubmission(TimeStampedModel):
 #===========================================
 
 
-class Quiz(TimeStampedModel):
+class Quiz(TimeStampedModel, FieldTrackingModel):
     """Quiz or test for a course module."""
 
+    tracked_fields = ("module_id", "batch_id", "is_active")
+
     DIFFICULTY_CHOICES = [
         ("easy", "Easy"),
         ("medium", "Medium"),
@@ -355,9 +369,11 @@ class QuizQuestionOption(TimeStampedModel):
 
 
 # Student quiz attempts
-class QuizAttempt(TimeStampedModel):
+class QuizAttempt(TimeStampedModel, FieldTrackingModel):
     """Record of a student's quiz attempt."""
 
+    tracked_fields = ("passed",)
+
     STATUS_CHOICES = [
         ("in_progress", "In Progress"),
         ("submitted", "Submitted"),
@@ -388,6 +404,9 @@ class QuizAttempt(TimeStampedModel):
         validators=[MinValueValidator(0), MaxValueValidator(100)],
     )
     passed = models.BooleanField(default=False)
+    question_seed = models.PositiveIntegerField(
+        null=True, blank=True, help_text="Seed for this attempt's question order (randomized quizzes only)"
+    )
 
     class Meta:
         verbose_name = "Quiz Attempt"
@@ -430,7 +449,7 @@ class QuizAnswer(TimeStampedModel):
 # ========== Course Resources/Materials ==========
 
 
-class CourseResource(TimeStampedModel):
+class CourseResource(TimeStampedModel, FileTrackingModel):
     """
     Study materials / resources for a module or live class.
     Batch-isolated, student-safe, and production-ready.
@@ -560,7 +579,7 @@ class CourseResource(TimeStampedModel):
         return "Unknown"
 
 
-class CourseResourceFile(models.Model):
+class CourseResourceFile(FileTrackingModel):
     """
     Individual files attached to a CourseResource.
     Enables multi-file uploads per resource.
@@ -7,15 +7,18 @@ from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import IntegrityError, models, transaction
 from django.db.models import F
 
-from api.utils.helper_models import TimeStampedModel
+from api.utils.helper_models import FieldTrackingModel, TimeStampedModel
 from django.utils import timezone
 from decimal import Decimal
 import uuid
 
 
-class Order(TimeStampedModel):
+class Order(TimeStampedModel, FieldTrackingModel):
     """Main order model for course purchases"""
 
+    # Revenue rollup (api.utils.metrics_rollup) reacts to these changing
+    tracked_fields = ("status", "payment_method", "total_amount")
+
     STATUS_CHOICES = [
         ("pending", "Pending"),
         ("processing", "Processing"),
@@ -144,6 +147,8 @@ class Order(TimeStampedModel):
             models.Index(fields=["order_number"]),
             models.Index(fields=["status", "created_at"]),
             models.Index(fields=["payment_method"]),
+            # Keyset order of the admin order list (KeysetPagination)
+            models.Index(fields=["-created_at", "-id"], name="order_keyset_idx"),
         ]
 
     def save(self, *args, **kwargs):
@@ -157,21 +162,12 @@ class Order(TimeStampedModel):
 
     def _generate_order_number(self):
         """Generate unique order number in format ORD-YYYYMMDD-XXXXX."""
-        import random
-        import string
-
-        from django.utils import timezone
+        from api.utils.sequences import next_value, scramble_base36
 
         date_str = timezone.now().strftime("%Y%m%d")
-        random_str = "".join(random.choices(string.ascii_uppercase + string.digits, k=5))
-        order_number = f"ORD-{date_str}-{random_str}"
-
-        # Ensure uniqueness
-        while Order.objects.filter(order_number=order_number).exists():
-            random_str = "".join(random.choices(string.ascii_uppercase + string.digits, k=5))
-            order_number = f"ORD-{date_str}-{random_str}"
-
-        return order_number
+        sequence = next_value("order", f"ORD-{date_str}")
+        # Per-day sequence, scrambled so order numbers don't reveal sales volume
+        return f"ORD-{date_str}-{scramble_base36(sequence, 5)}"
 
     def get_total_items(self):
         """Get total number of items in order."""
@@ -302,6 +298,42 @@ class PaymentTransaction(models.Model):
         return f"{self.internal_payment_id} - {self.status}"
 
 
+class PaymentWebhookEvent(TimeStampedModel):
+    """Inbox of gateway IPN calls, one row per ``val_id``.
+
+    The webhook endpoint only records the call; validation with the gateway
+    and the order state transition run later in a background task.
+    """
+
+    class Status(models.TextChoices):
+        RECEIVED = "received", "Received"
+        PROCESSED = "processed", "Processed"
+        IGNORED = "ignored", "Ignored"
+        INVALID = "invalid", "Invalid"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    val_id = models.CharField(max_length=255, unique=True, help_text="Gateway validation ID (dedupe key)")
+    tran_id = models.CharField(max_length=100, db_index=True, help_text="Order number sent as tran_id")
+    amount = models.CharField(max_length=50, help_text="Amount as reported by the gateway")
+    gateway_status = models.CharField(max_length=50, blank=True)
+    payload = models.JSONField(default=dict, blank=True, help_text="Full IPN body")
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.RECEIVED, db_index=True)
+    result = models.CharField(max_length=255, blank=True, help_text="Outcome of processing")
+    validation_response = models.JSONField(default=dict, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta(TimeStampedModel.Meta):
+        verbose_name = "Payment Webhook Event"
+        verbose_name_plural = "Payment Webhook Events"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.tran_id} ({self.val_id}) - {self.status}"
+
+
 class OrderInstallment(TimeStampedModel):
     """Track individual installment payments for orders."""
 
@@ -541,7 +573,7 @@ class OrderItem(TimeStampedModel):
         return f"{self.course_title or self.course.title} - Order {self.order.order_number}"
 
 
-class Enrollment(TimeStampedModel):
+class Enrollment(TimeStampedModel, FieldTrackingModel):
     """Track user's purchased courses and progress.
 
     IMPORTANT: Students enroll in CourseBatch (not Course directly).
@@ -549,6 +581,9 @@ class Enrollment(TimeStampedModel):
     but 'batch' is the primary enrollment reference.
     """
 
+    # Enrollment rollup (api.utils.metrics_rollup) reacts to these changing
+    tracked_fields = ("is_active", "course_id")
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(
         "api.CustomUser",
@@ -619,10 +654,21 @@ class Enrollment(TimeStampedModel):
             models.Index(fields=["batch", "is_active"]),
             models.Index(fields=["is_active", "created_at"]),
             models.Index(fields=["course_student_id"]),  # ← ADD INDEX
+            # Keyset order of the admin enrollment list (KeysetPagination)
+            models.Index(fields=["-created_at", "-id"], name="enrollment_keyset_idx"),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        # Remember which batch this row is counted in, so save() only adjusts on change
+        if "is_active" in loaded and "batch_id" in loaded:
+            instance._counted_batch_id = loaded["batch_id"] if loaded["is_active"] else None
+        return instance
+
     def save(self, *args, **kwargs):
-        """Auto-set course from batch and generate course-specific ID."""
+        """Auto-set course from batch, generate course-specific ID and keep batch counters in step."""
 
         # 1. Auto-set course from batch if batch is provided
         if self.batch and not self.course_id:
@@ -632,17 +678,29 @@ class Enrollment(TimeStampedModel):
         if not self.course_student_id and self.course:
             self.course_student_id = self._generate_course_student_id()
 
-        # 3. Save ONCE
-        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not {"is_active", "batch", "batch_id"} & set(update_fields):
+            super().save(*args, **kwargs)
+            return
 
-        # 4. Update batch enrolled count (after save, separate operation)
-        if self.batch_id:
-            from api.models.models_course import CourseBatch
-            try:
-                batch = CourseBatch.objects.get(pk=self.batch_id)
-                batch.update_enrolled_count()
-            except CourseBatch.DoesNotExist:
-                pass
+        if self._state.adding:
+            previous = None
+        elif hasattr(self, "_counted_batch_id"):
+            previous = self._counted_batch_id
+        else:
+            row = Enrollment.objects.filter(pk=self.pk).values("batch_id", "is_active").first()
+            previous = row["batch_id"] if row and row["is_active"] else None
+        current = self.batch_id if self.is_active else None
+
+        # 3. Save and move the enrolled count in one transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if previous != current:
+                from api.models.models_course import CourseBatch
+
+                CourseBatch.adjust_enrolled_count(previous, -1)
+                CourseBatch.adjust_enrolled_count(current, 1)
+        self._counted_batch_id = current
 
     def _generate_course_student_id(self):
         """
@@ -653,6 +711,8 @@ class Enrollment(TimeStampedModel):
         - CSE-2026-0001 (1st student in CSE course in 2026)
         - MATH-2026-0042 (42nd student in MATH course in 2026)
         """
+        from api.utils.sequences import max_suffix, next_value
+
         # Get current year (since object isn't saved yet, created_at doesn't exist)
         year = timezone.now().year
 
@@ -663,34 +723,15 @@ class Enrollment(TimeStampedModel):
         course_prefix = self.course.course_prefix.upper().strip()
         base_prefix = f"{course_prefix}-{year}-"
 
-        # Use database transaction to prevent race conditions
-        with transaction.atomic():
-            # Count existing enrollments for this course in this year
-            existing_count = Enrollment.objects.filter(
-                course_student_id__startswith=base_prefix
-            ).select_for_update().count()
-
-            # Next sequence number
-            new_sequence = existing_count + 1
-            sequence_str = str(new_sequence).zfill(4)
-            course_student_id = f"{base_prefix}{sequence_str}"
-
-            # Safety check: ensure uniqueness
-            retry_count = 0
-            while Enrollment.objects.filter(course_student_id=course_student_id).exists():
-                retry_count += 1
-                new_sequence = existing_count + retry_count + 1
-                sequence_str = str(new_sequence).zfill(3)
-                course_student_id = f"{base_prefix}{sequence_str}"
-
-                # Prevent infinite loop
-                if retry_count > 100:
-                    raise ValueError(
-                        f"Could not generate unique course student ID after 100 attempts. "
-                        f"Base prefix: {base_prefix}"
-                    )
-
-            return course_student_id
+        def existing_max():
+            # Only runs once per course-year, when its counter row is created
+            ids = Enrollment.objects.filter(course_student_id__startswith=base_prefix).values_list(
+                "course_student_id", flat=True
+            )
+            return max_suffix(ids, base_prefix)
+
+        sequence = next_value("enrollment", f"ENR-{course_prefix}-{year}", seed=existing_max)
+        return f"{base_prefix}{str(sequence).zfill(4)}"
 
     def update_last_accessed(self):
         """Update last accessed timestamp."""
@@ -12,9 +12,39 @@ from decimal import Decimal
 
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import Case, Exists, F, Func, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Greatest, Least, Round
+from django.db.models.lookups import Exact, GreaterThan, GreaterThanOrEqual
 from django.utils import timezone
 
-from api.utils.helper_models import TimeStampedModel
+from api.utils.helper_models import FieldTrackingModel, TimeStampedModel
+
+# Submission statuses that count as an approved assignment ("approved" is set by the admin bulk action)
+APPROVED_SUBMISSION_STATUSES = ("graded", "approved")
+
+
+def _count(queryset, field="pk", distinct=False):
+    """Correlated ``COUNT`` subquery over ``queryset`` (0 when no rows match)."""
+    template = "COUNT(DISTINCT %(expressions)s)" if distinct else "COUNT(%(expressions)s)"
+    counted = queryset.order_by().annotate(_n=Func(F(field), template=template, output_field=models.IntegerField()))
+    return Coalesce(Subquery(counted.values("_n")[:1]), 0)
+
+
+def _enrolled_batch(ref):
+    """Batch a progress row is scheduled against: its enrollment's, else the student's active one in the course.
+
+    ``ref`` builds references to the progress row's fields from inside the subquery.
+    """
+    from api.models.models_order import Enrollment
+
+    return Subquery(
+        Enrollment.objects.filter(
+            Q(pk=ref("enrollment_id")) | Q(user=ref("student_id"), course=ref("course_id"), is_active=True)
+        )
+        .order_by("-is_active", "-created_at")
+        .values("batch_id")[:1]
+    )
+
 
 # OLD Models Removed (ModuleQuiz, StudentQuizAttempt, ModuleAssignment, StudentAssignmentSubmission)
 # Use NEW models in models_module.py instead:
@@ -23,12 +53,14 @@ from api.utils.helper_models import TimeStampedModel
 # - LiveClass, LiveClassAttendance
 
 
-class StudentModuleProgress(TimeStampedModel):
+class StudentModuleProgress(TimeStampedModel, FieldTrackingModel):
     """Tracks student progress through individual course modules.
 
     Teachers mark modules as completed after reviewing quizzes and assignments.
     """
 
+    tracked_fields = ("is_completed",)
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     student = models.ForeignKey(
         "api.CustomUser",
@@ -79,19 +111,18 @@ class StudentModuleProgress(TimeStampedModel):
 
     def check_auto_complete(self):
         """Check if module can be auto-completed based on quiz/assignment completion"""
-        # Get all active quizzes and assignments for this module
-        active_quizzes = self.module.quizzes.filter(is_active=True)
-        active_assignments = self.module.assignments.filter(is_active=True)
+        from api.models.models_module import Assignment, AssignmentSubmission, Quiz, QuizAttempt
 
-        # Check if student passed all quizzes
-        for quiz in active_quizzes:
-            if not quiz.attempts.filter(student=self.student, is_passed=True).exists():
-                return False
+        # One anti-join each: any active quiz without a passed attempt / assignment without an approved submission
+        passed = QuizAttempt.objects.filter(quiz=OuterRef("pk"), student_id=self.student_id, passed=True)
+        if Quiz.objects.filter(module_id=self.module_id, is_active=True).exclude(Exists(passed)).exists():
+            return False
 
-        # Check if student completed all assignments
-        for assignment in active_assignments:
-            if not assignment.submissions.filter(student=self.student, status="approved").exists():
-                return False
+        approved = AssignmentSubmission.objects.filter(
+            assignment=OuterRef("pk"), student_id=self.student_id, status__in=APPROVED_SUBMISSION_STATUSES
+        )
+        if Assignment.objects.filter(module_id=self.module_id, is_active=True).exclude(Exists(approved)).exists():
+            return False
 
         # All requirements met
         return True
@@ -136,6 +167,8 @@ class CourseProgress(TimeStampedModel):
     quizzes_total = models.PositiveIntegerField(default=0, help_text="Total number of active quizzes")
     assignments_completed = models.PositiveIntegerField(default=0, help_text="Number of assignments approved")
     assignments_total = models.PositiveIntegerField(default=0, help_text="Total number of active assignments")
+    live_classes_attended = models.PositiveIntegerField(default=0, help_text="Number of live classes attended")
+    live_classes_total = models.PositiveIntegerField(default=0, help_text="Total number of live classes")
     is_completed = models.BooleanField(default=False, help_text="Whether student completed 100% of course")
     completed_at = models.DateTimeField(null=True, blank=True, help_text="When course was completed")
     certificate_issued = models.BooleanField(default=False, help_text="Whether completion certificate was issued")
@@ -157,75 +190,146 @@ class CourseProgress(TimeStampedModel):
     def __str__(self):
         return f"{self.student.email} - {self.course.title} ({self.completion_percentage}%)"
 
-    def calculate_completion(self):
-        """
-        Calculate course completion based on module completion only.
+    # ----- Counters -----
+    #
+    # Counters are kept current by events (see api.signals): a module marked
+    # complete, a first passing quiz attempt, a first approved submission or
+    # an attendance adds an atomic delta to the matching row. ``rebuild()``
+    # recomputes everything for a queryset in a single UPDATE.
 
-        ⚠️ OLD quiz/assignment tracking removed.
-        Use NEW system for quiz/assignment progress:
-        - Quiz model from models_module.py
-        - Assignment model from models_module.py
-        - QuizAttempt and AssignmentSubmission for progress
-        """
-        total_items = 0
-        completed_items = 0
-
-        # Get course modules through CourseDetail
-        try:
-            course_detail = self.course.detail
-            modules = course_detail.modules.filter(is_active=True)
-        except Exception:
-            modules = []
-
-        # 1. Module completion (teacher marks as done)
-        self.modules_total = modules.count()
-        self.modules_completed = StudentModuleProgress.objects.filter(
-            student=self.student, module__in=modules, is_completed=True
-        ).count()
-        total_items += self.modules_total
-        completed_items += self.modules_completed
-
-        # OLD quiz/assignment progress removed - use NEW system
-        self.quizzes_total = 0
-        self.quizzes_passed = 0
-        self.assignments_total = 0
-        self.assignments_completed = 0
-
-        # Calculate percentage
-        if total_items == 0:
-            self.completion_percentage = Decimal("0.00")
-        else:
-            percentage = (completed_items / total_items) * 100
-            self.completion_percentage = Decimal(str(round(percentage, 2)))
-
-        # Check if course is completed
-        was_completed = self.is_completed
-        self.is_completed = self.completion_percentage == Decimal("100.00")
-
-        # Set completion timestamp if just completed
-        if self.is_completed and not was_completed:
-            self.completed_at = timezone.now()
-        elif not self.is_completed:
-            self.completed_at = None
+    @staticmethod
+    def completion_fields(completed=F("modules_completed"), total=F("modules_total")):
+        """Expressions deriving percentage and completion from the module counters.
 
-        self.save()
+        Completion is based on module completion only (teachers mark modules done).
+        ``rebuild()`` passes the counter subqueries so everything lands in one UPDATE.
+        """
+        complete = Q(GreaterThan(total, 0), GreaterThanOrEqual(completed, total))
+        percentage = Round(
+            models.ExpressionWrapper(completed * Value(100.0) / total, output_field=models.FloatField()), 2
+        )
+        return {
+            "completion_percentage": Case(
+                When(Exact(total, 0), then=Value(Decimal("0.00"))),
+                default=Least(percentage, Value(100.0)),
+                output_field=models.DecimalField(max_digits=5, decimal_places=2),
+            ),
+            "is_completed": Case(When(complete, then=Value(True)), default=Value(False)),
+            # Right-hand sides see the old row, so is_completed=False means "just completed"
+            "completed_at": Case(
+                When(complete & Q(is_completed=False), then=Value(timezone.now())),
+                When(complete, then=F("completed_at")),
+                default=Value(None),
+                output_field=models.DateTimeField(),
+            ),
+        }
+
+    @classmethod
+    def adjust_counters(cls, student_id, course_id, batch_id=None, **deltas):
+        """Apply ``deltas`` (e.g. ``quizzes_passed=1``) to one student's progress row.
+
+        ``course_id`` and ``batch_id`` may be subquery expressions so callers
+        need not load them. With ``batch_id`` the row is only touched when the
+        student is in that batch. A missing progress row is left alone.
+        """
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        rows = cls.objects.filter(student_id=student_id, course_id=course_id)
+        if batch_id is not None:
+            rows = rows.filter(Exact(_enrolled_batch(OuterRef), batch_id))
+        rows.update(
+            last_activity_at=timezone.now(),
+            **{name: Greatest(F(name) + delta, 0) for name, delta in deltas.items()},
+        )
+        if "modules_completed" in deltas:
+            rows.update(**cls.completion_fields())
+
+    @classmethod
+    def rebuild(cls, queryset):
+        """Recompute every counter for ``queryset`` with set-based UPDATEs; returns rows updated."""
+        from api.models.models_course import CourseModule
+        from api.models.models_module import (
+            Assignment,
+            AssignmentSubmission,
+            LiveClass,
+            LiveClassAttendance,
+            Quiz,
+            QuizAttempt,
+        )
+
+        student = OuterRef("student_id")
+        course = OuterRef("course_id")
+        # Quizzes, assignments and live classes are scheduled per batch
+        batch = _enrolled_batch(lambda name: OuterRef(OuterRef(name)))
+
+        modules_total = _count(CourseModule.objects.filter(course=course, is_active=True))
+        modules_completed = _count(
+            StudentModuleProgress.objects.filter(
+                student=student, module__course=course, module__is_active=True, is_completed=True
+            )
+        )
+        return queryset.update(
+            modules_total=modules_total,
+            modules_completed=modules_completed,
+            quizzes_total=_count(Quiz.objects.filter(module__course=course, batch_id=batch, is_active=True)),
+            quizzes_passed=_count(
+                QuizAttempt.objects.filter(
+                    student=student, quiz__module__course=course, quiz__batch_id=batch, quiz__is_active=True, passed=True
+                ),
+                "quiz",
+                distinct=True,
+            ),
+            assignments_total=_count(Assignment.objects.filter(module__course=course, batch_id=batch, is_active=True)),
+            assignments_completed=_count(
+                AssignmentSubmission.objects.filter(
+                    student=student,
+                    assignment__module__course=course,
+                    assignment__batch_id=batch,
+                    assignment__is_active=True,
+                    status__in=APPROVED_SUBMISSION_STATUSES,
+                ),
+                "assignment",
+                distinct=True,
+            ),
+            live_classes_total=_count(LiveClass.objects.filter(module__course=course, batch_id=batch, is_active=True)),
+            live_classes_attended=_count(
+                LiveClassAttendance.objects.filter(
+                    student=student,
+                    live_class__module__course=course,
+                    live_class__batch_id=batch,
+                    live_class__is_active=True,
+                    attended=True,
+                )
+            ),
+            **cls.completion_fields(modules_completed, modules_total),
+        )
+
+    @classmethod
+    def rebuild_for(cls, pairs):
+        """Rebuild the rows of ``(student_id, course_id)`` pairs, e.g. after a bulk ``update()`` sent no signals."""
+        condition = Q()
+        for student_id, course_id in set(pairs):
+            condition |= Q(student_id=student_id, course_id=course_id)
+        return cls.rebuild(cls.objects.filter(condition)) if condition else 0
 
+    def calculate_completion(self):
+        """Recalculate this row's counters from scratch and return the completion percentage."""
+        CourseProgress.rebuild(CourseProgress.objects.filter(pk=self.pk))
+        self.refresh_from_db()
         return self.completion_percentage
 
     def get_next_incomplete_module(self):
-        """Get the next incomplete module for this student"""
-        try:
-            course_detail = self.course.detail
-            modules = course_detail.modules.filter(is_active=True).order_by("order")
-        except Exception:
-            return None
-
-        for module in modules:
-            progress, _ = StudentModuleProgress.objects.get_or_create(student=self.student, module=module)
-            if not progress.is_completed:
-                return module
-
-        return None
+        """Get the next incomplete module for this student (single anti-join query)"""
+        from api.models.models_course import CourseModule
+
+        completed = StudentModuleProgress.objects.filter(student_id=self.student_id, module=OuterRef("pk"), is_completed=True)
+        return (
+            CourseModule.objects.filter(course_id=self.course_id, is_active=True)
+            .exclude(Exists(completed))
+            .order_by("order")
+            .first()
+        )
 
     # REMOVED: get_pending_quizzes() used old ModuleQuiz model
     def get_pending_quizzes(self):
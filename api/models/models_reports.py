@@ -0,0 +1,51 @@
+"""Background report generation jobs.
+
+Heavy PDF reports are rendered by the ``run_report_jobs`` worker instead of
+the request thread. Clients create a job, poll its status and download the
+finished file (see ``api/views/views_reports.py``).
+"""
+
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+from api.utils.helper_models import FileTrackingModel, TimeStampedModel
+
+
+class ReportJob(TimeStampedModel, FileTrackingModel):
+    """One requested report and, once rendered, its file."""
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    report_type = models.CharField(max_length=50, help_text="Registered report name, e.g. students_pdf.")
+    params = models.JSONField(default=dict, blank=True, help_text="Normalized report parameters.")
+    params_hash = models.CharField(
+        max_length=40, help_text="SHA1 of report type + params; identical requests share a job."
+    )
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.QUEUED)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="report_jobs"
+    )
+    file = models.FileField(upload_to="reports/", blank=True, null=True)
+    filename = models.CharField(max_length=255, blank=True, help_text="Download file name.")
+    error = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Report Job"
+        verbose_name_plural = "Report Jobs"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["params_hash", "created_at"]),
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.report_type} [{self.status}]"
@@ -0,0 +1,42 @@
+"""Outbox table for background tasks.
+
+Rows are written by ``api.utils.tasks.enqueue`` inside the caller's
+transaction and executed by the ``run_tasks`` management command.
+"""
+
+from django.db import models
+from django.utils import timezone
+
+from api.utils.helper_models import TimeStampedModel
+
+
+class OutboxTask(TimeStampedModel):
+    """A queued call to a function registered with ``@task``."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        DEAD = "dead", "Dead (gave up)"
+
+    name = models.CharField(max_length=200, help_text="Dotted import path of the task function.")
+    payload = models.JSONField(default=dict, blank=True, help_text="Keyword arguments passed to the task.")
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now, help_text="Earliest time the next attempt may run.")
+    locked_by = models.CharField(max_length=64, blank=True, help_text="Worker claim token of the current attempt.")
+    locked_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name = "Outbox Task"
+        verbose_name_plural = "Outbox Tasks"
+        ordering = ["run_after"]
+        indexes = [
+            models.Index(fields=["status", "run_after"]),
+        ]
+
+    def __str__(self):
+        return f"{self.name} [{self.status}]"
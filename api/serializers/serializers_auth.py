@@ -16,6 +16,7 @@ from api.utils.url_utils import build_full_url
 from ..models.models_auth import CustomUser, Profile, Skill
 from ..utils.email_utils import send_system_email
 from ..utils.password_utils import validate_password_strength
+from ..utils.user_status import VersionedRefreshToken
 
 logger = logging.getLogger(__name__)
 
@@ -519,6 +520,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     can import it for the token view.
     """
 
+    token_class = VersionedRefreshToken
+
     @classmethod
     def get_token(cls, user):
         """Return a token with an added 'role' claim for the given user."""
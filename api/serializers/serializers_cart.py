@@ -1,11 +1,15 @@
 """Cart and Wishlist Serializers"""
 
-from decimal import Decimal
-
 from rest_framework import serializers
 
 from api.models.models_cart import Cart, CartItem, Wishlist
 from api.models.models_course import Course
+from api.utils.cart_pricing import CartLine, price_cart
+
+
+def cart_line(item):
+    """Pricing computed by ``price_cart`` for this item, or priced on its own."""
+    return getattr(item, "pricing_line", None) or CartLine(item)
 
 
 class CartItemCourseSerializer(serializers.ModelSerializer):
@@ -81,71 +85,17 @@ class CartItemSerializer(serializers.ModelSerializer):
 
     def get_batch_info(self, obj):
         """Get batch information for this cart item including installment availability"""
-        if obj.batch:
-            # Determine if installment is available for this batch
-            # Batch setting overrides course setting
-            has_installment = False
-            installment_preview = None
-
-            if obj.batch.installment_available is not None:
-                # Batch explicitly sets installment availability
-                if obj.batch.installment_available and obj.batch.installment_count:
-                    has_installment = True
-                    # Calculate installment details for batch
-                    if obj.batch.custom_price:
-                        total_price = obj.batch.custom_price
-                    elif hasattr(obj.course, "pricing") and obj.course.pricing:
-                        total_price = obj.course.pricing.get_discounted_price()
-                    else:
-                        total_price = None
-
-                    if total_price:
-                        per_installment = total_price / obj.batch.installment_count
-                        installment_preview = {
-                            "available": True,
-                            "count": obj.batch.installment_count,
-                            "amount": float(per_installment),
-                            "total": float(total_price),
-                            "description": f"Pay in {obj.batch.installment_count} installments of ৳{per_installment:,.2f}",
-                        }
-            else:
-                # Use course default setting
-                if hasattr(obj.course, "pricing") and obj.course.pricing:
-                    pricing = obj.course.pricing
-                    if pricing.installment_available and pricing.installment_count:
-                        has_installment = True
-                        total_price = obj.batch.custom_price or pricing.get_discounted_price()
-                        per_installment = total_price / pricing.installment_count
-                        installment_preview = {
-                            "available": True,
-                            "count": pricing.installment_count,
-                            "amount": float(per_installment),
-                            "total": float(total_price),
-                            "description": f"Pay in {pricing.installment_count} installments of ৳{per_installment:,.2f}",
-                        }
-
-            return {
-                "id": str(obj.batch.id),
-                "batch_number": obj.batch.batch_number,
-                "batch_name": obj.batch.batch_name,
-                "display_name": obj.batch.get_display_name(),
-                "slug": obj.batch.slug,
-                "start_date": obj.batch.start_date,
-                "end_date": obj.batch.end_date,
-                "has_installment": has_installment,
-                "installment_preview": installment_preview,
-            }
-        return None
+        return cart_line(obj).batch_info()
 
     def get_subtotal(self, obj):
         """Get subtotal for this item"""
-        return str(obj.get_subtotal())
+        return str(cart_line(obj).subtotal)
 
 
 class CartSerializer(serializers.ModelSerializer):
     """Serializer for shopping cart with payment method grouping"""
 
-    items = CartItemSerializer(many=True, read_only=True)
+    items = CartItemSerializer(many=True, read_only=True, source="priced_items")
     installment_preview = serializers.SerializerMethodField()
     total = serializers.SerializerMethodField()
     item_count = serializers.SerializerMethodField()
@@ -167,11 +117,11 @@ class CartSerializer(serializers.ModelSerializer):
 
     def get_total(self, obj):
         """Get cart total"""
-        return str(obj.get_total())
+        return str(price_cart(obj).total)
 
     def get_item_count(self, obj):
         """Get item count"""
-        return obj.get_item_count()
+        return price_cart(obj).item_count
 
     def get_payment_summary(self, obj):
         """Group cart items by payment method for checkout validation.
@@ -179,54 +129,7 @@ class CartSerializer(serializers.ModelSerializer):
         Returns summary of installment vs full payment items to help frontend
         enforce single payment method per checkout.
         """
-        items = obj.items.all()
-        if not items.exists():
-            return {
-                "has_mixed_payment_methods": False,
-                "installment_items": [],
-                "full_payment_items": [],
-                "can_checkout_together": True,
-            }
-
-        installment_items = []
-        full_payment_items = []
-
-        for item in items:
-            item_data = {
-                "item_id": str(item.id),
-                "course_title": item.course.title,
-                "batch_name": item.batch.get_display_name() if item.batch else None,
-                "subtotal": float(item.get_subtotal()),
-            }
-
-            # Check if item has installment
-            has_installment = False
-            if item.batch:
-                if item.batch.installment_available is not None:
-                    has_installment = item.batch.installment_available and item.batch.installment_count
-                elif hasattr(item.course, "pricing") and item.course.pricing:
-                    has_installment = item.course.pricing.installment_available and item.course.pricing.installment_count
-
-            if has_installment:
-                installment_items.append(item_data)
-            else:
-                full_payment_items.append(item_data)
-
-        has_mixed = len(installment_items) > 0 and len(full_payment_items) > 0
-
-        return {
-            "has_mixed_payment_methods": has_mixed,
-            "installment_items_count": len(installment_items),
-            "full_payment_items_count": len(full_payment_items),
-            "installment_items": installment_items,
-            "full_payment_items": full_payment_items,
-            "can_checkout_together": not has_mixed,
-            "message": (
-                "Your cart has courses with different payment methods. Please checkout one payment type at a time."
-                if has_mixed
-                else "All items can be checked out together."
-            ),
-        }
+        return price_cart(obj).payment_summary()
 
     def get_installment_preview(self, obj):
         """Return backend-controlled installment plan from course pricing.
@@ -234,32 +137,7 @@ class CartSerializer(serializers.ModelSerializer):
         Returns the single installment plan configured in the course's pricing,
         not multiple options. This ensures consistency across the entire system.
         """
-        # For carts with multiple items, we'd need different logic
-        # For now, assuming single-course cart (typical for course purchases)
-        items = obj.items.all()
-        if not items.exists():
-            return None
-
-        # Get first item's course pricing
-        first_item = items.first()
-        course = first_item.course
-
-        if not hasattr(course, "pricing") or not course.pricing:
-            return None
-
-        pricing = course.pricing
-
-        # Return backend-controlled installment plan
-        if pricing.installment_available and pricing.installment_count:
-            return {
-                "available": True,
-                "count": pricing.installment_count,
-                "amount": float(pricing.get_installment_amount()),
-                "total": float(pricing.get_discounted_price()),
-                "description": f"Pay in {pricing.installment_count} installments of ৳{pricing.get_installment_amount():,.2f}",
-            }
-
-        return None
+        return price_cart(obj).installment_preview()
 
 
 class AddToCartSerializer(serializers.Serializer):
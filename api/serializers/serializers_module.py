@@ -20,7 +20,6 @@ from api.models.models_module import (
     QuizQuestion,
     QuizQuestionOption,
 )
-from api.models.models_order import Enrollment
 from api.serializers.serializers_helpers import HTMLFieldsMixin
 
 # ========== Live Class Serializers ==========
@@ -274,6 +273,9 @@ class AssignmentStudentSerializer(HTMLFieldsMixin, serializers.ModelSerializer):
     # ---------- helpers ----------
 
     def _submission(self, obj):
+        plan = self.context.get("study_plan")
+        if plan is not None:
+            return plan.submission(obj.id)
         user = self.context["request"].user
         return obj.submissions.filter(student=user).first()
 
@@ -522,6 +524,9 @@ class QuizSerializer(serializers.ModelSerializer):
         return self._attempt_cache[obj.id]
 
     def get_question_count(self, obj):
+        plan = self.context.get("study_plan")
+        if plan is not None:
+            return plan.question_count(obj.id)
         return obj.questions.filter(is_active=True).count()
 
     def get_is_available(self, obj):
@@ -533,6 +538,9 @@ class QuizSerializer(serializers.ModelSerializer):
         return obj.is_active
 
     def get_attempts_used(self, obj):
+        plan = self.context.get("study_plan")
+        if plan is not None:
+            return plan.attempts(obj.id).attempts_used
         return self._student_attempts(obj).filter(status="submitted").count()
 
     def get_can_attempt(self, obj):
@@ -543,6 +551,9 @@ class QuizSerializer(serializers.ModelSerializer):
         return self.get_attempts_used(obj) < obj.max_attempts
 
     def get_best_score(self, obj):
+        plan = self.context.get("study_plan")
+        if plan is not None:
+            return plan.attempts(obj.id).best_score
         attempt = self._student_attempts(obj).filter(status="submitted").order_by("-marks_obtained").first()
         return float(attempt.marks_obtained) if attempt else None
 
@@ -685,8 +696,9 @@ class QuizAnswerSerializer(serializers.ModelSerializer):
         if not obj.attempt.quiz.show_correct_answers:
             return None
 
+        # Filter in Python so prefetched options are reused
         return QuizQuestionOptionSerializer(
-            obj.question.options.filter(is_correct=True),
+            [option for option in obj.question.options.all() if option.is_correct],
             many=True,
             context=self.context,
         ).data
@@ -951,34 +963,26 @@ class CourseModuleStudentStudyPlanSerializer(HTMLFieldsMixin, serializers.ModelS
         read_only_fields = ["id", "slug"]
 
     # =====================================================
-    # 🔒 Enrollment helpers
+    # 🔒 Study plan (batch-filtered content + per-student aggregates)
     # =====================================================
+    #
+    # The view prefetches the module's content for the student's enrolled
+    # batches and passes the cached StudyPlan (api.utils.study_plan) in the
+    # context, so nothing below queries per module or per item.
 
-    def _enrolled_batch_ids(self):
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
-
-        if not user or not user.is_authenticated or user.role != "student":
-            return None
+    def _plan(self):
+        return self.context["study_plan"]
 
-        return Enrollment.objects.filter(
-            user=user,
-            is_active=True,
-        ).values_list("batch_id", flat=True)
+    def _summary(self, obj):
+        return self._plan().module(obj.id)
 
     # =====================================================
     # 📘 ASSIGNMENTS (CRITICAL FIX)
     # =====================================================
 
     def get_assignments(self, obj):
-        qs = obj.module_assignments.filter(is_active=True)
-
-        batch_ids = self._enrolled_batch_ids()
-        if batch_ids is not None:
-            qs = qs.filter(batch_id__in=batch_ids)
-
         return AssignmentStudentSerializer(
-            qs.order_by("order"),
+            obj.module_assignments.all(),
             many=True,
             context=self.context,
         ).data
@@ -988,36 +992,18 @@ class CourseModuleStudentStudyPlanSerializer(HTMLFieldsMixin, serializers.ModelS
     # =====================================================
 
     def get_live_classes(self, obj):
-        request = self.context.get("request")
-        user = request.user if request else None
+        plan = self._plan()
         now = timezone.now()
 
-        qs = obj.live_classes.filter(is_active=True)
-
-        batch_ids = self._enrolled_batch_ids()
-        if batch_ids is not None:
-            qs = qs.filter(batch_id__in=batch_ids)
-
         data = []
 
-        for live_class in qs.order_by("scheduled_date"):
-            attendance = None
-            if user and user.is_authenticated:
-                attendance = live_class.attendances.filter(
-                    student=user
-                ).first()
-
+        for live_class in obj.live_classes.all():
             live_data = LiveClassSerializer(
                 live_class,
                 context=self.context,
             ).data
 
-
-            live_data["is_attended"] = bool(
-                attendance
-                and attendance.attended
-                and live_class.scheduled_date < now
-            )
+            live_data["is_attended"] = plan.attended(live_class.id) and live_class.scheduled_date < now
 
             data.append(live_data)
 
@@ -1028,17 +1014,13 @@ class CourseModuleStudentStudyPlanSerializer(HTMLFieldsMixin, serializers.ModelS
     # =====================================================
 
     def get_quizzes(self, obj):
-        qs = obj.module_quizzes.filter(is_active=True)
-
-        batch_ids = self._enrolled_batch_ids()
-        if batch_ids is not None:
-            qs = qs.filter(batch_id__in=batch_ids)
+        plan = self._plan()
 
         # Only quizzes with active questions
-        qs = qs.filter(questions__is_active=True).distinct()
+        quizzes = [quiz for quiz in obj.module_quizzes.all() if plan.question_count(quiz.id)]
 
         return QuizSerializer(
-            qs,
+            quizzes,
             many=True,
             context=self.context,
         ).data
@@ -1048,14 +1030,8 @@ class CourseModuleStudentStudyPlanSerializer(HTMLFieldsMixin, serializers.ModelS
     # =====================================================
 
     def get_resources(self, obj):
-        qs = obj.resources.filter(is_active=True)
-
-        batch_ids = self._enrolled_batch_ids()
-        if batch_ids is not None:
-            qs = qs.filter(batch_id__in=batch_ids)
-
         return CourseResourceSerializer(
-            qs.order_by("order"),
+            obj.resources.all(),
             many=True,
             context=self.context,
         ).data
@@ -1065,117 +1041,25 @@ class CourseModuleStudentStudyPlanSerializer(HTMLFieldsMixin, serializers.ModelS
     # =====================================================
 
     def get_live_class_count(self, obj):
-        qs = obj.live_classes.filter(is_active=True)
-        batch_ids = self._enrolled_batch_ids()
-        if batch_ids is not None:
-            qs = qs.filter(batch_id__in=batch_ids)
-        return qs.count()
+        return self._summary(obj)["live_class_count"]
 
     def get_assignment_count(self, obj):
-        qs = obj.module_assignments.filter(is_active=True)
-        batch_ids = self._enrolled_batch_ids()
-        if batch_ids is not None:
-            qs = qs.filter(batch_id__in=batch_ids)
-        return qs.count()
+        return self._summary(obj)["assignment_count"]
 
     def get_quiz_count(self, obj):
-        qs = obj.module_quizzes.filter(is_active=True)
-        batch_ids = self._enrolled_batch_ids()
-        if batch_ids is not None:
-            qs = qs.filter(batch_id__in=batch_ids)
-
-        return (
-            qs.filter(questions__is_active=True)
-            .distinct()
-            .count()
-        )
+        return self._summary(obj)["quiz_count"]
 
     def get_resource_count(self, obj):
-        qs = obj.resources.filter(is_active=True)
-        batch_ids = self._enrolled_batch_ids()
-        if batch_ids is not None:
-            qs = qs.filter(batch_id__in=batch_ids)
-        return qs.count()
-
-    def _student(self):
-        request = self.context.get("request")
-        return request.user if request else None
+        return self._summary(obj)["resource_count"]
 
     def get_live_class_progress(self, obj):
-        student = self._student()
-        if not student:
-            return {"completed": 0, "total": 0}
-
-        batch_ids = self._enrolled_batch_ids()
-
-        total = obj.live_classes.filter(
-            is_active=True,
-            batch_id__in=batch_ids
-        ).count()
-
-        completed = LiveClassAttendance.objects.filter(
-            student=student,
-            attended=True,
-            live_class__module=obj,
-            live_class__batch_id__in=batch_ids
-        ).count()
-
-        return {"completed": completed, "total": total}
+        return self._summary(obj)["live_class_progress"]
 
     def get_assignment_progress(self, obj):
-        student = self._student()
-        if not student:
-            return {"completed": 0, "total": 0}
-
-        batch_ids = self._enrolled_batch_ids()
-
-        total = obj.module_assignments.filter(
-            is_active=True,
-            batch_id__in=batch_ids
-        ).count()
-
-        completed = AssignmentSubmission.objects.filter(
-            student=student,
-            assignment__module=obj,
-            assignment__batch_id__in=batch_ids
-        ).count()
-
-        return {"completed": completed, "total": total}
+        return self._summary(obj)["assignment_progress"]
 
     def get_quiz_progress(self, obj):
-        student = self._student()
-        if not student:
-            return {"completed": 0, "total": 0}
-
-        batch_ids = self._enrolled_batch_ids()
-
-        total = obj.module_quizzes.filter(
-            is_active=True,
-            batch_id__in=batch_ids
-        ).count()
-
-        completed = QuizAttempt.objects.filter(
-            student=student,
-            quiz__module=obj,
-            quiz__batch_id__in=batch_ids,
-            status="submitted"
-        ).values("quiz").distinct().count()
-
-        return {"completed": completed, "total": total}
+        return self._summary(obj)["quiz_progress"]
 
     def get_overall_progress(self, obj):
-        lc = self.get_live_class_progress(obj)
-        a = self.get_assignment_progress(obj)
-        q = self.get_quiz_progress(obj)
-
-        total_items = lc["total"] + a["total"] + q["total"]
-        completed_items = lc["completed"] + a["completed"] + q["completed"]
-
-        if total_items == 0:
-            return 0
-
-        return round((completed_items / total_items) * 100)
-
-
-
-
+        return self._summary(obj)["overall_progress"]
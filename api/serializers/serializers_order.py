@@ -9,6 +9,7 @@ from rest_framework import serializers
 from api.models.models_course import Course
 from api.models.models_order import Enrollment, Order, OrderInstallment, OrderItem
 from api.models.models_pricing import Coupon
+from api.utils.cart_pricing import course_pricing, unit_price
 
 # ========== OrderInstallment Serializers ==========
 
@@ -144,6 +145,9 @@ class OrderItemSerializer(serializers.ModelSerializer):
 class OrderItemCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating order items."""
 
+    # Pricing is joined in so price validation doesn't query per item
+    course = serializers.PrimaryKeyRelatedField(queryset=Course.objects.select_related("pricing"))
+
     class Meta:
         model = OrderItem
         fields = ["course", "batch", "price", "discount", "currency"]
@@ -159,9 +163,9 @@ class OrderItemCreateSerializer(serializers.ModelSerializer):
         if course.status != "published":
             raise serializers.ValidationError("This course is not yet published.")
 
-        # Validate price matches course pricing
-        if hasattr(course, "pricing"):
-            expected_price = course.pricing.get_discounted_price()
+        # Validate price matches course pricing (same figure the cart shows)
+        if course_pricing(course) is not None:
+            expected_price = unit_price(course)
             provided_price = attrs.get("price")
 
             if abs(expected_price - provided_price) > Decimal("0.01"):
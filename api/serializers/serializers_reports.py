@@ -0,0 +1,54 @@
+"""
+Report job serializers
+
+Request and status representations for the background report endpoints.
+"""
+
+from django.urls import reverse
+
+from rest_framework import serializers
+
+from api.models.models_reports import ReportJob
+from api.utils.report_jobs import REPORTS
+
+
+class ReportJobRequestSerializer(serializers.Serializer):
+    """Report type plus its query parameters (same names as the sync export endpoints)."""
+
+    report_type = serializers.ChoiceField(choices=sorted(REPORTS))
+    params = serializers.DictField(child=serializers.CharField(allow_blank=True), required=False, default=dict)
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    """Job status with polling and download links."""
+
+    status_url = serializers.SerializerMethodField()
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportJob
+        fields = (
+            "id",
+            "report_type",
+            "params",
+            "status",
+            "error",
+            "filename",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "status_url",
+            "download_url",
+        )
+
+    def _absolute(self, url):
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
+
+    def get_status_url(self, obj):
+        return self._absolute(reverse("report-job-detail", args=[obj.pk]))
+
+    def get_download_url(self, obj):
+        if obj.status != ReportJob.Status.DONE:
+            return None
+        return self._absolute(reverse("report-job-download", args=[obj.pk]))
@@ -1,21 +1,28 @@
-"""Signal handlers for user profiles and footer cache management.
+"""Signal handlers for user profiles, progress counters, dashboard metrics and footer cache management.
 
-Keep cache in sync when footer/link/social models change and ensure
-profiles are created for new users.
+Keep cache in sync when footer/link/social models change, ensure
+profiles are created for new users, keep CourseProgress counters
+current as students complete work, keep the DailyMetric rollup in
+step with users, enrollments and orders, and invalidate stored accounting
+period totals when their incomes or expenses change.
 """
 
 import logging
-import os
+from functools import partial
 
 from django.conf import settings
 from django.core.cache import cache
-from django.db import models
-from django.db.models.signals import post_delete, post_save, pre_save
+from django.db import models, transaction
+from django.db.models import Subquery
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
+from api.models.models_accounting import Expense, Income
+from api.models.models_auth import CustomUser
 from api.models.models_course import (
     Category,
     Course,
+    CourseBatch,
     CourseContentSection,
     CourseDetail,
     CourseModule,
@@ -27,8 +34,14 @@ from api.models.models_course import (
     WhyEnrol,
 )
 from api.models.models_footer import Footer, LinkGroup, QuickLink, SocialLink
+from api.models.models_module import Assignment, AssignmentSubmission, LiveClass, LiveClassAttendance, Quiz, QuizAttempt
+from api.models.models_order import Enrollment, Order
+from api.models.models_progress import APPROVED_SUBMISSION_STATUSES, CourseProgress, StudentModuleProgress
 from api.models.models_pricing import CoursePrice
+from api.utils.accounting_periods import invalidate_periods
 from api.utils.cache_utils import clear_category_caches, clear_course_caches
+from api.utils.metrics_rollup import apply_change, enrollment_facts, order_facts, previous_state, user_facts
+from api.utils.user_status import invalidate_user_status
 
 from .models import Profile
 
@@ -58,6 +71,192 @@ def save_user_profile(sender, instance, **kwargs):
         Profile.objects.create(user=instance)
 
 
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_user_status_on_change(sender, instance, using, **kwargs):
+    # Disabling, deleting or revoking tokens must reach the middleware as soon as
+    # they commit. Dropping the entry earlier lets a concurrent request cache the
+    # old row again; the pk is bound now because deletes clear it afterwards.
+    transaction.on_commit(partial(invalidate_user_status, instance.pk), using=using)
+
+
+# -----------------------------
+# Enrollment counters
+# -----------------------------
+
+
+@receiver(post_delete, sender=Enrollment)
+def decrement_batch_enrolled_count(sender, instance, **kwargs):
+    # Saves adjust the counter in Enrollment.save(); deletes (including
+    # cascades and queryset deletes) arrive here one instance at a time
+    counted = getattr(instance, "_counted_batch_id", instance.batch_id if instance.is_active else None)
+    CourseBatch.adjust_enrolled_count(counted, -1)
+
+
+# -----------------------------
+# Course progress counters
+# -----------------------------
+
+
+def _value_of(model, pk, path):
+    # Subquery so the progress UPDATE resolves the course (or batch) itself
+    return Subquery(model.objects.filter(pk=pk).values(path)[:1])
+
+
+def _is_approved(status):
+    return status in APPROVED_SUBMISSION_STATUSES
+
+
+def _module_completion_changed(instance, delta):
+    course = _value_of(CourseModule, instance.module_id, "course_id")
+    CourseProgress.adjust_counters(instance.student_id, course, modules_completed=delta)
+
+
+def _quiz_pass_changed(instance, delta):
+    # Only the first passing attempt of a quiz counts
+    others = QuizAttempt.objects.filter(quiz_id=instance.quiz_id, student_id=instance.student_id, passed=True)
+    if not others.exclude(pk=instance.pk).exists():
+        course = _value_of(Quiz, instance.quiz_id, "module__course_id")
+        batch = _value_of(Quiz, instance.quiz_id, "batch_id")
+        CourseProgress.adjust_counters(instance.student_id, course, batch, quizzes_passed=delta)
+
+
+def _assignment_approval_changed(instance, delta):
+    others = AssignmentSubmission.objects.filter(
+        assignment_id=instance.assignment_id, student_id=instance.student_id, status__in=APPROVED_SUBMISSION_STATUSES
+    )
+    if not others.exclude(pk=instance.pk).exists():
+        course = _value_of(Assignment, instance.assignment_id, "module__course_id")
+        batch = _value_of(Assignment, instance.assignment_id, "batch_id")
+        CourseProgress.adjust_counters(instance.student_id, course, batch, assignments_completed=delta)
+
+
+def _attendance_changed(instance, delta):
+    course = _value_of(LiveClass, instance.live_class_id, "module__course_id")
+    batch = _value_of(LiveClass, instance.live_class_id, "batch_id")
+    CourseProgress.adjust_counters(instance.student_id, course, batch, live_classes_attended=delta)
+
+
+# sender -> (tracked field, "is counted" test, counter update)
+PROGRESS_EVENTS = {
+    StudentModuleProgress: ("is_completed", bool, _module_completion_changed),
+    QuizAttempt: ("passed", bool, _quiz_pass_changed),
+    AssignmentSubmission: ("status", _is_approved, _assignment_approval_changed),
+    LiveClassAttendance: ("attended", bool, _attendance_changed),
+}
+
+
+@receiver(post_save, sender=StudentModuleProgress)
+@receiver(post_save, sender=QuizAttempt)
+@receiver(post_save, sender=AssignmentSubmission)
+@receiver(post_save, sender=LiveClassAttendance)
+def count_progress_event(sender, instance, **kwargs):
+    field, counted, apply = PROGRESS_EVENTS[sender]
+    before = counted(instance.loaded_value(field))
+    after = counted(getattr(instance, field))
+    instance.mark_loaded()
+    if after != before:
+        apply(instance, int(after) - int(before))
+
+
+@receiver(post_delete, sender=StudentModuleProgress)
+@receiver(post_delete, sender=QuizAttempt)
+@receiver(post_delete, sender=AssignmentSubmission)
+@receiver(post_delete, sender=LiveClassAttendance)
+def uncount_progress_event(sender, instance, **kwargs):
+    field, counted, apply = PROGRESS_EVENTS[sender]
+    if counted(instance.loaded_value(field, getattr(instance, field))):
+        apply(instance, -1)
+
+
+def _structure_courses(sender, instance):
+    # The course the item is in now and, after a move, the one it left
+    if sender is CourseModule:
+        return {instance.course_id, instance.loaded_value("course_id", instance.course_id)}
+    modules = {instance.module_id, instance.loaded_value("module_id", instance.module_id)}
+    return set(CourseModule.objects.filter(pk__in=modules).values_list("course_id", flat=True))
+
+
+def _rebuild_course_progress(course_ids):
+    CourseProgress.rebuild(CourseProgress.objects.filter(course_id__in=course_ids))
+
+
+@receiver(post_save, sender=CourseModule)
+@receiver(post_save, sender=Quiz)
+@receiver(post_save, sender=Assignment)
+@receiver(post_save, sender=LiveClass)
+def rebuild_progress_on_structure_save(sender, instance, created, using, **kwargs):
+    # Totals depend only on which active items a course (or batch) has; title or schedule edits leave them alone
+    if created or instance.tracked_changes():
+        courses = _structure_courses(sender, instance)
+        transaction.on_commit(partial(_rebuild_course_progress, courses), using=using)
+    instance.mark_loaded()
+
+
+@receiver(post_delete, sender=CourseModule)
+@receiver(post_delete, sender=Quiz)
+@receiver(post_delete, sender=Assignment)
+@receiver(post_delete, sender=LiveClass)
+def rebuild_progress_on_structure_delete(sender, instance, using, **kwargs):
+    # Resolved now: a cascading module delete removes the module before the commit
+    courses = _structure_courses(sender, instance)
+    transaction.on_commit(partial(_rebuild_course_progress, courses), using=using)
+
+
+# -----------------------------
+# Dashboard metrics rollup
+# -----------------------------
+
+METRIC_FACTS = {CustomUser: user_facts, Enrollment: enrollment_facts, Order: order_facts}
+
+
+@receiver(pre_save, sender=CustomUser)
+@receiver(pre_save, sender=Enrollment)
+@receiver(pre_save, sender=Order)
+def load_metric_state(sender, instance, **kwargs):
+    # Instances loaded with only()/defer() need their stored values to diff against
+    instance.load_tracked_values()
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_save, sender=Enrollment)
+@receiver(post_save, sender=Order)
+def update_metrics_on_save(sender, instance, created, **kwargs):
+    if created:
+        apply_change([], METRIC_FACTS[sender](instance))
+    elif instance.tracked_changes():
+        facts = METRIC_FACTS[sender]
+        apply_change(facts(previous_state(instance)), facts(instance))
+    instance.mark_loaded()
+
+
+@receiver(pre_delete, sender=CustomUser)
+@receiver(pre_delete, sender=Enrollment)
+@receiver(pre_delete, sender=Order)
+def update_metrics_on_delete(sender, instance, **kwargs):
+    # pre_delete so a completed order's items are still there to attribute revenue
+    apply_change(METRIC_FACTS[sender](previous_state(instance)), [])
+
+
+# -----------------------------
+# Accounting period summaries
+# -----------------------------
+
+
+@receiver(post_save, sender=Income)
+@receiver(post_save, sender=Expense)
+def invalidate_periods_on_save(sender, instance, using, **kwargs):
+    # Both the month the row was dated in and the month it is dated in now. Mark them
+    # stale only once the change is visible to readers, or they would recompute old totals.
+    transaction.on_commit(partial(invalidate_periods, instance.loaded_value("date"), instance.date), using=using)
+    instance.mark_loaded()
+
+
+@receiver(post_delete, sender=Income)
+@receiver(post_delete, sender=Expense)
+def invalidate_periods_on_delete(sender, instance, using, **kwargs):
+    transaction.on_commit(partial(invalidate_periods, instance.loaded_value("date"), instance.date), using=using)
+
+
 # -----------------------------
 # Footer related signals
 # -----------------------------
@@ -108,55 +307,9 @@ def update_footer_on_footer_change(sender, instance, **kwargs):
 
 
 # ---------------------------
-# Delete old file on update
+# Generic file cleanup lives in api.utils.file_cleanup and is
+# registered per model from ApiConfig.ready().
 # ---------------------------
-# ---------------------------
-# Generic file cleanup
-# ---------------------------
-
-
-def delete_file(path):
-    if path and os.path.isfile(path):
-        os.remove(path)
-
-
-@receiver(pre_save)
-def auto_delete_file_on_change(sender, instance, **kwargs):
-    """
-    Deletes old file from filesystem
-    when a FileField/ImageField is updated.
-    """
-    # Only act on models with FileField/ImageField
-    file_fields = [f for f in sender._meta.get_fields() if isinstance(f, models.FileField)]
-    if not file_fields:
-        return
-
-    if not instance.pk:
-        return  # new instance, nothing to delete
-
-    try:
-        old_instance = sender.objects.get(pk=instance.pk)
-    except sender.DoesNotExist:
-        return
-
-    for field in file_fields:
-        old_file = getattr(old_instance, field.name)
-        new_file = getattr(instance, field.name)
-        if old_file and old_file != new_file:
-            delete_file(old_file.path)
-
-
-@receiver(post_delete)
-def auto_delete_file_on_delete(sender, instance, **kwargs):
-    """
-    Deletes all FileField/ImageField files from filesystem
-    when a model instance is deleted.
-    """
-    file_fields = [f for f in sender._meta.get_fields() if isinstance(f, models.FileField)]
-    for field in file_fields:
-        file = getattr(instance, field.name)
-        if file:
-            delete_file(file.path)
 
 
 # Blacklist outstanding JWT refresh tokens when a user is deleted.
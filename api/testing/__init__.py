@@ -0,0 +1,6 @@
+"""In-process stand-ins for external services.
+
+Used by the test suite and the benchmark management commands so they can
+exercise real client code without the service installed. Application code
+never imports from here.
+"""
@@ -0,0 +1,124 @@
+"""In-process fake SSLCommerz gateway for tests and benchmarks.
+
+Serves the two endpoints ``SSLCommerzPayment`` calls (session init and
+payment validation) over HTTP/1.1 keep-alive on localhost, with knobs for
+latency and failures. It counts accepted TCP connections so tests can
+assert that the pooled client reuses them.
+
+Usage::
+
+    with FakeSSLCommerzServer() as gateway:
+        with override_settings(SSLCOMMERZ_API_URL=gateway.url):
+            SSLCommerzPayment().validate_payment("VAL-1", Decimal("100"))
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class _GatewayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.gateway.lock:
+            self.server.gateway.connections += 1
+
+    def _reply(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self, params):
+        gateway = self.server.gateway
+        with gateway.lock:
+            gateway.requests += 1
+            fail = gateway.fail_next > 0 or gateway.always_fail
+            if gateway.fail_next > 0:
+                gateway.fail_next -= 1
+
+        if gateway.latency:
+            time.sleep(gateway.latency)
+        if fail:
+            return self._reply(gateway.fail_status, {"status": "FAILED", "failedreason": "Service unavailable"})
+
+        path = urlparse(self.path).path
+        if path.endswith("/gwprocess/v4/api.php"):
+            return self._reply(
+                200,
+                {
+                    "status": "SUCCESS",
+                    "sessionkey": f"FAKE-{gateway.requests}",
+                    "GatewayPageURL": f"{gateway.url}/pay/{params.get('tran_id', '')}",
+                },
+            )
+        if path.endswith("/validator/api/validationserverAPI.php"):
+            val_id = params.get("val_id", "")
+            amount = gateway.amounts.get(val_id)
+            if amount is None:
+                return self._reply(200, {"status": "INVALID_TRANSACTION"})
+            return self._reply(200, {"status": "VALID", "val_id": val_id, "amount": amount})
+        return self._reply(404, {"status": "FAILED"})
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        self._handle({key: values[0] for key, values in query.items()})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode())
+        self._handle({key: values[0] for key, values in form.items()})
+
+
+class FakeSSLCommerzServer:
+    """Fake gateway on a background thread bound to localhost.
+
+    ``amounts`` maps ``val_id`` to the amount validation reports (unknown
+    ids validate as ``INVALID_TRANSACTION``). ``latency`` delays every
+    response; ``fail_next`` answers the next N requests with ``fail_status``
+    (503 by default) and ``always_fail`` answers every request with it.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0):
+        self.latency = latency
+        self.amounts = {}
+        self.fail_next = 0
+        self.always_fail = False
+        self.fail_status = 503
+        self.requests = 0
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _GatewayHandler)
+        self._server.daemon_threads = True
+        self._server.gateway = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
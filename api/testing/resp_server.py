@@ -0,0 +1,244 @@
+"""In-process Redis-protocol (RESP2) server for tests and benchmarks.
+
+Implements the subset of Redis commands that Django's ``RedisCache`` and
+``redis-py`` issue, backed by a dict with per-key expiry. It lets tests and
+``manage.py benchmark_cache`` exercise the real shared-cache code path
+(connection pools, serializers, atomic INCR/SET NX) without a Redis server.
+
+Usage::
+
+    with LocalRespServer() as server:
+        CACHES = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache",
+                              "LOCATION": server.url}}
+"""
+
+import socketserver
+import threading
+import time
+
+
+class RespError(Exception):
+    """Error reply sent back to the client as ``-ERR <message>``."""
+
+
+def _encode(value):
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, RespError):
+        return f"-ERR {value}\r\n".encode()
+    if isinstance(value, bool):
+        return b":1\r\n" if value else b":0\r\n"
+    if isinstance(value, int):
+        return f":{value}\r\n".encode()
+    if isinstance(value, str):
+        return f"+{value}\r\n".encode()
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(_encode(v) for v in value)
+    raise TypeError(f"Cannot encode {type(value)!r} as RESP")
+
+
+class RespStore:
+    """Thread-safe key/value store with Redis expiry semantics."""
+
+    def __init__(self):
+        self._data = {}
+        self._expires = {}
+        self._lock = threading.Lock()
+        self.commands = 0
+
+    def _alive(self, key):
+        expires = self._expires.get(key)
+        if expires is not None and expires <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._data
+
+    def _set_expiry(self, key, seconds):
+        if seconds is None:
+            self._expires.pop(key, None)
+        else:
+            self._expires[key] = time.monotonic() + seconds
+
+    def execute(self, args):
+        name = args[0].decode().upper()
+        handler = getattr(self, f"cmd_{name.lower()}", None)
+        if handler is None:
+            return RespError(f"unknown command '{name}'")
+        with self._lock:
+            self.commands += 1
+            try:
+                return handler(*args[1:])
+            except (TypeError, ValueError, IndexError):
+                return RespError(f"wrong arguments for '{name}' command")
+
+    # Connection commands
+
+    def cmd_ping(self, *args):
+        return args[0] if args else "PONG"
+
+    def cmd_select(self, db):
+        return "OK"
+
+    # String commands
+
+    def cmd_get(self, key):
+        return self._data[key] if self._alive(key) else None
+
+    def cmd_mget(self, *keys):
+        return [self.cmd_get(key) for key in keys]
+
+    def cmd_set(self, key, value, *options):
+        opts = [o.decode().upper() if isinstance(o, bytes) else o for o in options]
+        seconds = None
+        if "EX" in opts:
+            seconds = int(opts[opts.index("EX") + 1])
+        elif "PX" in opts:
+            seconds = int(opts[opts.index("PX") + 1]) / 1000
+        exists = self._alive(key)
+        if ("NX" in opts and exists) or ("XX" in opts and not exists):
+            return None
+        self._data[key] = value
+        self._set_expiry(key, seconds)
+        return "OK"
+
+    def cmd_mset(self, *pairs):
+        for key, value in zip(pairs[::2], pairs[1::2]):
+            self._data[key] = value
+            self._set_expiry(key, None)
+        return "OK"
+
+    def cmd_incrby(self, key, delta):
+        current = int(self._data[key]) if self._alive(key) else 0
+        current += int(delta)
+        self._data[key] = str(current).encode()
+        return current
+
+    def cmd_incr(self, key):
+        return self.cmd_incrby(key, 1)
+
+    def cmd_decrby(self, key, delta):
+        return self.cmd_incrby(key, -int(delta))
+
+    # Keyspace commands
+
+    def cmd_del(self, *keys):
+        removed = 0
+        for key in keys:
+            if self._alive(key):
+                del self._data[key]
+                self._expires.pop(key, None)
+                removed += 1
+        return removed
+
+    def cmd_exists(self, *keys):
+        return sum(1 for key in keys if self._alive(key))
+
+    def cmd_expire(self, key, seconds):
+        if not self._alive(key):
+            return 0
+        self._set_expiry(key, int(seconds))
+        return 1
+
+    def cmd_persist(self, key):
+        if not self._alive(key) or key not in self._expires:
+            return 0
+        del self._expires[key]
+        return 1
+
+    def cmd_ttl(self, key):
+        if not self._alive(key):
+            return -2
+        expires = self._expires.get(key)
+        return -1 if expires is None else max(0, round(expires - time.monotonic()))
+
+    def cmd_flushdb(self, *args):
+        self._data.clear()
+        self._expires.clear()
+        return "OK"
+
+    cmd_flushall = cmd_flushdb
+
+    def cmd_dbsize(self):
+        return sum(1 for key in list(self._data) if self._alive(key))
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            # Inline command (e.g. from telnet / redis-cli in inline mode)
+            return line.split()
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        store = self.server.store
+        queued = None
+        while True:
+            try:
+                args = self._read_command()
+            except (ConnectionError, ValueError):
+                return
+            if not args:
+                return
+            name = args[0].decode().upper()
+            if name == "MULTI":
+                queued = []
+                reply = "OK"
+            elif name == "EXEC":
+                reply = [store.execute(cmd) for cmd in (queued or [])]
+                queued = None
+            elif name == "DISCARD":
+                queued = None
+                reply = "OK"
+            elif queued is not None:
+                queued.append(args)
+                reply = "QUEUED"
+            else:
+                reply = store.execute(args)
+            try:
+                self.wfile.write(_encode(reply))
+            except ConnectionError:
+                return
+
+
+class _ThreadedServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class LocalRespServer:
+    """Run a RESP server on a background thread bound to localhost."""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.store = RespStore()
+        self._server = _ThreadedServer((host, port), _RespHandler)
+        self._server.store = self.store
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
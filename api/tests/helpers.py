@@ -0,0 +1,51 @@
+"""Shared helpers for the API test modules."""
+
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+
+from api.models.models_auth import CustomUser
+from api.models.models_course import Category, Course, CourseBatch
+
+
+def queries_on(table, queries):
+    """SQL of the captured ``queries`` (a ``CaptureQueriesContext``) that reference ``table``."""
+    return [q["sql"] for q in queries.captured_queries if f'"{table}"' in q["sql"]]
+
+
+def create_user(name, n=1, role=CustomUser.Role.STUDENT):
+    """User ``<name>-user<n>@example.com``; ``n`` also picks the phone number, so keep it unique per test."""
+    return CustomUser.objects.create_user(
+        email=f"{name}-user{n}@example.com",
+        password="TestPass1!",
+        first_name=name.title(),
+        last_name=str(n),
+        phone=f"0171{n:07d}",
+        role=role,
+    )
+
+
+def create_course(name, prefix):
+    """Course ``<name>-course`` in a category of its own."""
+    category = Category.objects.create(name=f"{name.title()} Cat", slug=f"{name}-cat")
+    return Course.objects.create(
+        title=f"{name.title()} Course",
+        slug=f"{name}-course",
+        course_prefix=prefix,
+        category=category,
+        short_description="Short",
+    )
+
+
+def create_batch(course, number=1, **fields):
+    """Batch ``number`` of ``course``, running for 90 days from today unless ``fields`` say otherwise."""
+    today = date.today()
+    fields.setdefault("start_date", today)
+    fields.setdefault("end_date", fields["start_date"] + timedelta(days=90))
+    return CourseBatch.objects.create(course=course, batch_number=number, **fields)
+
+
+def run_worker():
+    """Drain the outbox once in the foreground."""
+    call_command("run_tasks", "--once", "--concurrency", "1", stdout=StringIO())
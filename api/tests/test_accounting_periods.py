@@ -0,0 +1,147 @@
+"""Tests for the accounting period summary layer behind the accounting dashboard."""
+
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from api.models.models_accounting import (
+    Expense,
+    ExpensePaymentMethod,
+    ExpenseType,
+    Income,
+    IncomeType,
+    IncomeUpdateRequest,
+    PaymentMethod,
+    PeriodSummary,
+)
+from api.models.models_auth import CustomUser
+from api.tests.helpers import queries_on
+from api.utils.accounting_periods import RECOMPUTE_AFTER, compute_months, monthly_totals
+
+URL = "/api/accounting/dashboard/"
+
+
+class AccountingPeriodTests(TestCase):
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(
+            email="periods-admin@example.com",
+            password="PeriodPass1!",
+            first_name="Period",
+            last_name="Admin",
+            phone="01744000001",
+            role=CustomUser.Role.ADMIN,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+        self.income_type = IncomeType.objects.create(code="course-fee", name="Course Fee", prefix="CF")
+        self.method = PaymentMethod.objects.create(code="cash", name="Cash")
+        self.expense_type = ExpenseType.objects.create(code="rent", name="Rent")
+        self.expense_method = ExpensePaymentMethod.objects.create(code="bank", name="Bank")
+
+        self.year = timezone.localdate().year - 1
+        self.income = self.add_income(date(self.year, 3, 10), "1000.00")
+        self.add_income(date(self.year, 3, 20), "500.00")
+        self.add_income(date(self.year, 3, 25), "900.00", approval_status="pending")
+        self.add_expense(date(self.year, 3, 5), "300.00")
+        self.add_expense(date(self.year, 7, 1), "200.00")
+
+    def add_income(self, day, amount, approval_status="approved"):
+        return Income.objects.create(
+            income_type=self.income_type,
+            payment_method=self.method,
+            description="Fee",
+            amount=Decimal(amount),
+            date=day,
+            payer_name="Payer",
+            approval_status=approval_status,
+        )
+
+    def add_expense(self, day, amount):
+        return Expense.objects.create(
+            expense_type=self.expense_type,
+            payment_method=self.expense_method,
+            description="Rent",
+            amount=Decimal(amount),
+            date=day,
+            vendor_name="Vendor",
+        )
+
+    def test_closed_months_are_stored_and_reused(self):
+        totals = monthly_totals([self.year])
+        self.assertEqual(totals[date(self.year, 3, 1)], (Decimal("1500.00"), Decimal("300.00")))
+        self.assertEqual(totals[date(self.year, 7, 1)], (Decimal("0.00"), Decimal("200.00")))
+        self.assertEqual(PeriodSummary.objects.filter(year=self.year).count(), 12)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(monthly_totals([self.year]), totals)
+        self.assertFalse(queries_on("api_income", queries))
+        self.assertFalse(queries_on("api_expense", queries))
+
+    def test_approved_update_request_refreshes_both_months(self):
+        monthly_totals([self.year])
+        request = IncomeUpdateRequest.objects.create(
+            income=self.income,
+            requested_by=self.admin,
+            requested_data={"date": date(self.year, 5, 2).isoformat(), "amount": "1200.00"},
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            request.approve(self.admin)
+            # Stored months are only invalidated once the edit commits
+            self.assertFalse(PeriodSummary.objects.filter(is_stale=True).exists())
+
+        stale = PeriodSummary.objects.filter(year=self.year, is_stale=True)
+        self.assertEqual(sorted(stale.values_list("month", flat=True)), [3, 5])
+
+        totals = monthly_totals([self.year])
+        self.assertEqual(totals[date(self.year, 3, 1)], (Decimal("500.00"), Decimal("300.00")))
+        self.assertEqual(totals[date(self.year, 5, 1)], (Decimal("1200.00"), Decimal("0.00")))
+
+    def test_edit_committed_during_a_read_is_not_overwritten(self):
+        def compute_then_edit(months):
+            totals = compute_months(months)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.income.amount = Decimal("2000.00")
+                self.income.save()
+            return totals
+
+        with mock.patch("api.utils.accounting_periods.compute_months", side_effect=compute_then_edit):
+            stale_read = monthly_totals([self.year])
+        self.assertEqual(stale_read[date(self.year, 3, 1)], (Decimal("1500.00"), Decimal("300.00")))
+        self.assertTrue(PeriodSummary.objects.get(year=self.year, month=3).is_stale)
+
+        totals = monthly_totals([self.year])
+        self.assertEqual(totals[date(self.year, 3, 1)], (Decimal("2500.00"), Decimal("300.00")))
+        self.assertFalse(PeriodSummary.objects.filter(is_stale=True).exists())
+
+    def test_stored_totals_are_recomputed_after_a_while(self):
+        monthly_totals([self.year])
+        Income.objects.filter(pk=self.income.pk).update(amount=Decimal("1100.00"))  # bypasses the signals
+        self.assertEqual(monthly_totals([self.year])[date(self.year, 3, 1)][0], Decimal("1500.00"))
+
+        PeriodSummary.objects.update(computed_at=timezone.now() - RECOMPUTE_AFTER)
+        self.assertEqual(monthly_totals([self.year])[date(self.year, 3, 1)][0], Decimal("1600.00"))
+
+    def test_dashboard_uses_grouped_queries(self):
+        self.add_income(timezone.localdate(), "50.00")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(URL, {"year": self.year})
+        self.assertEqual(response.status_code, 200)
+
+        data = response.data["data"]
+        self.assertEqual(data["summary"]["total_revenue"], 1500.0)
+        self.assertEqual(data["summary"]["total_expenses"], 500.0)
+        self.assertEqual(data["summary"]["balance"], 1050.0)
+        self.assertEqual(data["chart"]["data"][2], {"month": "Mar", "revenue": 1500.0, "expenses": 300.0})
+        self.assertEqual(data["quick_stats"]["avg_monthly_revenue"], 125.0)
+
+        # Year bounds + grouped months; recent transactions/activity/pending counts read the table on their own
+        grouped = [sql for sql in queries_on("api_income", queries) if "SUM" in sql.upper()]
+        self.assertEqual(len(grouped), 1)
@@ -0,0 +1,117 @@
+"""Tests for the shared cache configuration, JSON serializers and RESP stand-in."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from rest_framework.test import APIClient
+
+from api.models.models_course import Category, Course
+from api.testing.resp_server import LocalRespServer
+from api.utils.cache_serializers import CompressedJSONSerializer, JSONSerializer
+from api.utils.cache_utils import CACHE_KEY_COURSE_LIST, generate_cache_key, invalidate_cache_pattern
+
+
+def shared_caches(url):
+    params = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": url,
+        "OPTIONS": {"serializer": "api.utils.cache_serializers.CompressedJSONSerializer"},
+    }
+    return {
+        "default": {**params, "KEY_PREFIX": "test:default"},
+        "sessions": {**params, "KEY_PREFIX": "test:sessions"},
+        "throttle": {**params, "KEY_PREFIX": "test:throttle"},
+    }
+
+
+class JSONSerializerTests(SimpleTestCase):
+    def test_round_trip_without_pickle(self):
+        serializer = JSONSerializer()
+        value = {"price": Decimal("10.50"), "id": uuid4(), "items": [1, "a", None]}
+        data = serializer.dumps(value)
+
+        self.assertTrue(data.startswith(b"j{"))
+        loaded = serializer.loads(data)
+        self.assertEqual(loaded["price"], 10.5)  # same as the DRF JSON renderer
+        self.assertEqual(loaded["id"], str(value["id"]))
+        self.assertEqual(loaded["items"], [1, "a", None])
+
+    def test_integers_stay_raw_for_incr(self):
+        serializer = JSONSerializer()
+        self.assertEqual(serializer.dumps(42), 42)
+        self.assertEqual(serializer.loads(b"42"), 42)
+        self.assertIs(serializer.loads(serializer.dumps(True)), True)
+
+    def test_large_payloads_are_compressed(self):
+        serializer = CompressedJSONSerializer()
+        small = serializer.dumps({"a": "b"})
+        large = serializer.dumps({"text": "x" * 5000})
+
+        self.assertTrue(small.startswith(b"j"))
+        self.assertTrue(large.startswith(b"z"))
+        self.assertLess(len(large), 5000)
+        self.assertEqual(serializer.loads(large), {"text": "x" * 5000})
+
+
+class SharedCacheBackendTests(TestCase):
+    """Run the real RedisCache backend against the in-process RESP server."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = LocalRespServer().start()
+        cls.settings_override = override_settings(CACHES=shared_caches(cls.server.url))
+        cls.settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        cls.server.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_basic_operations(self):
+        cache.set("k", {"a": [1, 2]}, 30)
+        self.assertEqual(cache.get("k"), {"a": [1, 2]})
+        self.assertFalse(cache.add("k", "other"))
+        self.assertTrue(cache.add("counter", 1))
+        self.assertEqual(cache.incr("counter"), 2)
+        cache.delete("k")
+        self.assertIsNone(cache.get("k"))
+
+    def test_namespace_invalidation_is_visible_to_every_worker(self):
+        from django.core.cache.backends.redis import RedisCache
+
+        other_worker = RedisCache(self.server.url, shared_caches(self.server.url)["default"])
+        key_before = generate_cache_key(CACHE_KEY_COURSE_LIST, "/api/courses/")
+
+        invalidate_cache_pattern(f"{CACHE_KEY_COURSE_LIST}:*")
+
+        version_key = f"cache_ns:{CACHE_KEY_COURSE_LIST}"
+        self.assertEqual(other_worker.get(version_key), cache.get(version_key))
+        self.assertNotEqual(generate_cache_key(CACHE_KEY_COURSE_LIST, "/api/courses/"), key_before)
+
+    def test_cache_response_hits_through_shared_backend(self):
+        category = Category.objects.create(name="Cat", slug="cat", is_active=True)
+        Course.objects.create(
+            title="Shared Cache Course",
+            slug="shared-cache-course",
+            course_prefix="SCC",
+            category=category,
+            short_description="Short",
+            is_active=True,
+            status="published",
+        )
+        client = APIClient()
+
+        first = client.get("/api/courses/")
+        second = client.get("/api/courses/")
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.json()["data"], second.json()["data"])
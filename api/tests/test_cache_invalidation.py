@@ -12,7 +12,10 @@ from api.models.models_pricing import CoursePrice
 from api.utils.cache_utils import (
     CACHE_KEY_COURSE_LIST,
     CACHE_KEY_HOME_CATEGORIES,
+    bump_namespace_version,
     generate_cache_key,
+    get_namespace_version,
+    invalidate_cache_pattern,
 )
 
 
@@ -139,3 +142,45 @@ class CacheInvalidationTestCase(TestCase):
 
         if "X-Cache" in response:
             self.assertIn("SKIP", response["X-Cache"])
+
+    def test_course_list_serves_fresh_data_after_course_update(self):
+        """Updating a course bumps the namespace so the list is re-rendered."""
+        cache.clear()
+
+        response1 = self.client.get("/api/courses/")
+        self.assertEqual(response1["X-Cache"], "MISS")
+        response2 = self.client.get("/api/courses/")
+        self.assertEqual(response2["X-Cache"], "HIT")
+
+        self.course.title = "Renamed Course"
+        self.course.save()
+
+        response3 = self.client.get("/api/courses/")
+        self.assertEqual(response3["X-Cache"], "MISS")
+        self.assertIn("Renamed Course", response3.content.decode())
+
+
+class CacheNamespaceTestCase(TestCase):
+    """Test the versioned namespace helpers in cache_utils."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_generate_cache_key_embeds_namespace_version(self):
+        version = get_namespace_version(CACHE_KEY_COURSE_LIST)
+        key = generate_cache_key(CACHE_KEY_COURSE_LIST, "/api/courses/")
+        self.assertEqual(key, f"{CACHE_KEY_COURSE_LIST}:v{version}:/api/courses/")
+
+    def test_invalidate_pattern_changes_keys_for_prefix_only(self):
+        list_key = generate_cache_key(CACHE_KEY_COURSE_LIST, "/api/courses/")
+        home_key = generate_cache_key(CACHE_KEY_HOME_CATEGORIES, "/api/courses/home-categories/")
+
+        invalidate_cache_pattern(f"{CACHE_KEY_COURSE_LIST}:*")
+
+        self.assertNotEqual(generate_cache_key(CACHE_KEY_COURSE_LIST, "/api/courses/"), list_key)
+        self.assertEqual(generate_cache_key(CACHE_KEY_HOME_CATEGORIES, "/api/courses/home-categories/"), home_key)
+
+    def test_bump_recovers_from_evicted_version_key(self):
+        cache.clear()
+        self.assertIsNotNone(bump_namespace_version(CACHE_KEY_COURSE_LIST))
+        self.assertIsNotNone(cache.get(f"cache_ns:{CACHE_KEY_COURSE_LIST}"))
@@ -0,0 +1,170 @@
+"""Tests for the stale-while-revalidate and rendered-bytes modes of cache_response."""
+
+import gzip
+import json
+import time
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase
+
+from api.utils import cache_utils
+from api.utils.cache_utils import cache_response, generate_cache_key, get_cache_stats
+from api.utils.response_utils import api_response
+
+PREFIX = "test_swr"
+
+
+class CountingView:
+    """Minimal stand-in for a viewset whose action counts executions."""
+
+    def __init__(self):
+        self.calls = 0
+
+    @cache_response(timeout=60, key_prefix=PREFIX, miss_wait=0.1)
+    def list(self, request):
+        self.calls += 1
+        return api_response(True, "ok", {"calls": self.calls})
+
+    @cache_response(timeout=60, key_prefix=PREFIX, render=True)
+    def rendered(self, request):
+        self.calls += 1
+        return api_response(True, "ok", {"calls": self.calls, "text": "é" + "x" * 4000})
+
+    @cache_response(timeout=60, key_prefix=PREFIX, early_expiration=1e9)
+    def eager(self, request):
+        self.calls += 1
+        return api_response(True, "ok", {"calls": self.calls})
+
+
+class CacheResponseSWRTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        cache_utils._pending_stats.clear()
+        self.view = CountingView()
+        self.request = RequestFactory().get("/api/swr/")
+        self.request.user = AnonymousUser()
+        self.cache_key = generate_cache_key(PREFIX, "/api/swr/")
+
+    def expire_entry(self):
+        entry = cache.get(self.cache_key)
+        entry["fresh_until"] = time.time() - 1
+        cache.set(self.cache_key, entry, 120)
+
+    def test_miss_then_hit(self):
+        self.assertEqual(self.view.list(self.request)["X-Cache"], "MISS")
+        self.assertEqual(self.view.list(self.request)["X-Cache"], "HIT")
+        self.assertEqual(self.view.calls, 1)
+
+    def test_stale_entry_is_served_while_another_worker_recomputes(self):
+        self.view.list(self.request)
+        self.expire_entry()
+        cache.add(f"{self.cache_key}:lock", 1, 30)  # another worker holds the lock
+
+        response = self.view.list(self.request)
+
+        self.assertEqual(response["X-Cache"], "STALE")
+        self.assertEqual(response.data["data"], {"calls": 1})
+        self.assertEqual(self.view.calls, 1)
+
+    def test_stale_entry_is_recomputed_by_lock_holder(self):
+        self.view.list(self.request)
+        self.expire_entry()
+
+        response = self.view.list(self.request)
+
+        self.assertEqual(response["X-Cache"], "REVALIDATED")
+        self.assertEqual(response.data["data"], {"calls": 2})
+        self.assertIsNone(cache.get(f"{self.cache_key}:lock"))
+        self.assertEqual(self.view.list(self.request)["X-Cache"], "HIT")
+
+    def test_cold_miss_waits_for_lock_holder(self):
+        cache.add(f"{self.cache_key}:lock", 1, 30)
+
+        response = self.view.list(self.request)
+
+        # Lock holder never finished within miss_wait: compute, but keep its lock
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(self.view.calls, 1)
+        self.assertIsNotNone(cache.get(f"{self.cache_key}:lock"))
+
+    def test_probabilistic_early_expiration_refreshes_fresh_entry(self):
+        self.view.eager(self.request)
+        response = self.view.eager(self.request)
+
+        self.assertEqual(response["X-Cache"], "REVALIDATED")
+        self.assertEqual(self.view.calls, 2)
+
+    def test_stats_count_hits_stale_and_recomputes(self):
+        self.view.list(self.request)
+        self.view.list(self.request)
+        self.expire_entry()
+        cache.add(f"{self.cache_key}:lock", 1, 30)
+        self.view.list(self.request)
+
+        stats = get_cache_stats(PREFIX)[PREFIX]
+
+        self.assertEqual(stats["miss"], 1)
+        self.assertEqual(stats["recompute"], 1)
+        self.assertEqual(stats["hit"], 1)
+        self.assertEqual(stats["stale"], 1)
+
+    def test_error_responses_are_not_cached(self):
+        class FailingView:
+            @cache_response(timeout=60, key_prefix=PREFIX)
+            def list(self, request):
+                return api_response(False, "boom", None, 500)
+
+        with patch.object(cache, "set", wraps=cache.set) as cache_set:
+            response = FailingView().list(self.request)
+
+        self.assertEqual(response["X-Cache"], "SKIP-ERROR")
+        cache_set.assert_not_called()
+
+
+class CacheResponseRenderedTests(SimpleTestCase):
+    """cache_response(render=True) stores and serves final JSON bytes."""
+
+    def setUp(self):
+        cache.clear()
+        self.view = CountingView()
+        self.factory = RequestFactory()
+
+    def get(self, **headers):
+        request = self.factory.get("/api/rendered/", **headers)
+        request.user = AnonymousUser()
+        return self.view.rendered(request)
+
+    def test_hit_returns_identical_bytes_without_rendering(self):
+        miss = self.get()
+        with patch("api.utils.cache_utils.JSONRenderer.render") as render:
+            hit = self.get()
+
+        render.assert_not_called()
+        self.assertEqual(miss["X-Cache"], "MISS")
+        self.assertEqual(hit["X-Cache"], "HIT")
+        self.assertEqual(hit.content, miss.content)
+        self.assertEqual(hit["Content-Type"], "application/json")
+        self.assertEqual(json.loads(hit.content)["data"]["calls"], 1)
+
+    def test_gzip_variant_served_when_accepted(self):
+        plain = self.get()
+        compressed = self.get(HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", compressed["Vary"])
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertEqual(compressed["ETag"], plain["ETag"][:-1] + '-gzip"')
+
+        revalidated = self.get(HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=compressed["ETag"])
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_gzip_not_served_when_refused(self):
+        self.get()
+        response = self.get(HTTP_ACCEPT_ENCODING="gzip;q=0")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_rendered_entry_returns_304(self):
+        etag = self.get()["ETag"]
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
@@ -0,0 +1,101 @@
+"""Tests for the single-pass cart pricing engine."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APITestCase
+
+from api.models.models_auth import CustomUser
+from api.models.models_cart import Cart, CartItem
+from api.models.models_course import Category, Course, CourseBatch
+from api.models.models_pricing import CoursePrice
+from api.utils.cart_pricing import price_cart
+
+
+class CartPricingTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            email="pricing@example.com",
+            password="PricingPass1!",
+            first_name="Price",
+            last_name="Check",
+            phone="01711000001",
+            role=CustomUser.Role.STUDENT,
+            is_active=True,
+        )
+        self.category = Category.objects.create(name="Pricing Cat", slug="pricing-cat")
+        self.cart = Cart.objects.create(user=self.user)
+        self.client.force_authenticate(user=self.user)
+
+    def add_course(self, n, *, installments=None, batch_installments=None):
+        course = Course.objects.create(
+            title=f"Priced Course {n}",
+            slug=f"priced-course-{n}",
+            course_prefix=f"PC{n}",
+            category=self.category,
+            short_description="Short",
+        )
+        CoursePrice.objects.create(
+            course=course,
+            base_price=Decimal("3000.00"),
+            discount_percentage=Decimal("10"),
+            installment_available=bool(installments),
+            installment_count=installments,
+        )
+        today = date.today()
+        batch = CourseBatch.objects.create(
+            course=course,
+            batch_number=1,
+            start_date=today + timedelta(days=30),
+            end_date=today + timedelta(days=120),
+            installment_available=True if batch_installments else None,
+            installment_count=batch_installments,
+        )
+        return CartItem.objects.create(cart=self.cart, course=course, batch=batch)
+
+    def get_cart_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/cart/")
+        self.assertEqual(response.status_code, 200)
+        return response, len(ctx.captured_queries)
+
+    def test_cart_detail_query_count_does_not_grow_with_items(self):
+        self.add_course(1, installments=3)
+        _, one_item = self.get_cart_queries()
+
+        for n in range(2, 6):
+            self.add_course(n)
+        response, five_items = self.get_cart_queries()
+
+        self.assertEqual(response.data["item_count"], 5)
+        self.assertEqual(five_items, one_item)
+
+    def test_single_pass_matches_serialized_fields(self):
+        self.add_course(1, installments=3)
+        self.add_course(2, batch_installments=2)
+        self.add_course(3)
+
+        data = self.client.get("/api/cart/").data
+
+        self.assertEqual(Decimal(data["total"]), Decimal("8100.00"))
+        summary = data["payment_summary"]
+        self.assertEqual((summary["installment_items_count"], summary["full_payment_items_count"]), (2, 1))
+        self.assertTrue(summary["has_mixed_payment_methods"])
+
+        batch_plans = {item["course"]["title"]: item["batch_info"]["installment_preview"] for item in data["items"]}
+        self.assertEqual(batch_plans["Priced Course 2"]["count"], 2)
+        self.assertEqual(batch_plans["Priced Course 1"]["count"], 3)
+        self.assertIsNone(batch_plans["Priced Course 3"])
+
+    def test_pricing_is_memoized_until_the_cart_changes(self):
+        self.add_course(1)
+        pricing = price_cart(self.cart)
+
+        with self.assertNumQueries(0):
+            self.assertIs(price_cart(self.cart), pricing)
+
+        self.cart.clear()
+        self.assertEqual(price_cart(self.cart).item_count, 0)
@@ -0,0 +1,73 @@
+"""Tests for ETag / Last-Modified conditional GET on public catalog endpoints."""
+
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from rest_framework.test import APIClient
+
+from api.models.models_course import Category, Course
+from api.models.models_footer import Footer
+from api.models.models_pricing import CoursePrice
+
+
+class ConditionalGetTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.category = Category.objects.create(name="Cat", slug="cat", is_active=True, show_in_megamenu=True)
+        self.course = Course.objects.create(
+            title="Conditional Course",
+            slug="conditional-course",
+            course_prefix="CND",
+            category=self.category,
+            short_description="Short",
+            is_active=True,
+            status="published",
+            show_in_megamenu=True,
+        )
+        CoursePrice.objects.create(course=self.course, base_price=Decimal("100.00"), currency="BDT")
+
+    def assert_revalidates(self, url):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+        self.assertTrue(etag.startswith('"'))
+        self.assertIn("must-revalidate", first["Cache-Control"])
+
+        # Both the freshly computed and the cached copy answer 304
+        for _ in range(2):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response["ETag"], etag)
+            self.assertEqual(response.content, b"")
+
+        stale = self.client.get(url, HTTP_IF_NONE_MATCH='"stale-etag"')
+        self.assertEqual(stale.status_code, 200)
+        return first
+
+    def test_course_list_returns_304_for_matching_etag(self):
+        self.assert_revalidates("/api/courses/")
+
+    def test_course_list_etag_changes_after_update(self):
+        etag = self.client.get("/api/courses/")["ETag"]
+
+        self.course.title = "Changed"
+        self.course.save()
+
+        response = self.client.get("/api/courses/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_course_detail_revalidates_on_etag_only(self):
+        first = self.assert_revalidates(f"/api/courses/{self.course.slug}/")
+        # Modules and nested content carry no timestamps, so a date could miss their changes
+        self.assertNotIn("Last-Modified", first)
+
+    def test_megamenu_returns_304_for_matching_etag(self):
+        self.assert_revalidates("/api/courses/megamenu-nav/")
+
+    def test_footer_returns_304_for_matching_etag(self):
+        Footer.objects.create(copyright_name="Prime Academy")
+        self.assert_revalidates("/api/footer/")
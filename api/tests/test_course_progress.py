@@ -0,0 +1,164 @@
+"""Tests for event-driven CourseProgress counters."""
+
+from decimal import Decimal
+
+from django.contrib import admin
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from api.admin.admin_live_class_assignment_quiz import AssignmentSubmissionAdmin
+from api.models.models_course import CourseModule
+from api.models.models_module import (
+    Assignment,
+    AssignmentSubmission,
+    LiveClass,
+    LiveClassAttendance,
+    Quiz,
+    QuizAttempt,
+)
+from api.models.models_order import Enrollment
+from api.models.models_progress import CourseProgress, StudentModuleProgress
+from api.signals import _rebuild_course_progress
+from api.tests.helpers import create_batch, create_course, create_user
+
+
+class CourseProgressCounterTests(TestCase):
+    def setUp(self):
+        self.student = create_user("progress")
+        self.course = create_course("progress", "PG")
+        self.modules = [
+            CourseModule.objects.create(course=self.course, title=f"Module {n}", slug=f"module-{n}", order=n)
+            for n in range(1, 5)
+        ]
+        self.batch = create_batch(self.course)
+        self.quiz = Quiz.objects.create(module=self.modules[0], batch=self.batch, title="Quiz", total_marks=10)
+        enrollment = Enrollment.objects.create(user=self.student, batch=self.batch)
+        self.progress = CourseProgress.objects.create(student=self.student, course=self.course, enrollment=enrollment)
+        CourseProgress.rebuild(CourseProgress.objects.filter(pk=self.progress.pk))
+
+    def complete(self, module):
+        progress, _ = StudentModuleProgress.objects.get_or_create(student=self.student, module=module)
+        progress.is_completed = True
+        progress.save()
+        return progress
+
+    def test_module_completion_applies_deltas(self):
+        self.complete(self.modules[0])
+        self.progress.refresh_from_db()
+        self.assertEqual((self.progress.modules_completed, self.progress.modules_total), (1, 4))
+        self.assertEqual(self.progress.completion_percentage, Decimal("25.00"))
+
+        # Saving again without a change does not count twice
+        StudentModuleProgress.objects.get(student=self.student, module=self.modules[0]).save()
+        for module in self.modules[1:]:
+            self.complete(module)
+
+        self.progress.refresh_from_db()
+        self.assertEqual(self.progress.modules_completed, 4)
+        self.assertEqual(self.progress.completion_percentage, Decimal("100.00"))
+        self.assertTrue(self.progress.is_completed)
+        self.assertIsNotNone(self.progress.completed_at)
+
+        StudentModuleProgress.objects.filter(student=self.student, module=self.modules[3]).get().delete()
+        self.progress.refresh_from_db()
+        self.assertEqual(self.progress.modules_completed, 3)
+        self.assertFalse(self.progress.is_completed)
+        self.assertIsNone(self.progress.completed_at)
+
+    def test_only_first_passing_attempt_counts(self):
+        first = QuizAttempt.objects.create(quiz=self.quiz, student=self.student, attempt_number=1)
+        first.passed = True
+        first.save()
+        QuizAttempt.objects.create(quiz=self.quiz, student=self.student, attempt_number=2, passed=True)
+
+        self.progress.refresh_from_db()
+        self.assertEqual((self.progress.quizzes_passed, self.progress.quizzes_total), (1, 1))
+
+    def test_work_in_another_batch_is_not_counted(self):
+        other_batch = create_batch(self.course, 2)
+        other_quiz = Quiz.objects.create(module=self.modules[0], batch=other_batch, title="Other quiz", total_marks=10)
+        QuizAttempt.objects.create(quiz=other_quiz, student=self.student, attempt_number=1, passed=True)
+        QuizAttempt.objects.create(quiz=self.quiz, student=self.student, attempt_number=1, passed=True)
+
+        self.progress.refresh_from_db()
+        self.assertEqual((self.progress.quizzes_passed, self.progress.quizzes_total), (1, 1))
+        self.progress.calculate_completion()
+        self.assertEqual((self.progress.quizzes_passed, self.progress.quizzes_total), (1, 1))
+
+    def test_attendance_is_counted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            live_class = LiveClass.objects.create(
+                module=self.modules[0], batch=self.batch, title="Live", scheduled_date=timezone.now(), order=1
+            )
+        LiveClassAttendance.objects.create(live_class=live_class, student=self.student, attended=True)
+
+        self.progress.refresh_from_db()
+        self.assertEqual((self.progress.live_classes_attended, self.progress.live_classes_total), (1, 1))
+
+    def test_structure_changes_rebuild_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.quiz.title = "Renamed quiz"
+            self.quiz.save()
+        self.assertNotIn(_rebuild_course_progress, [callback.func for callback in callbacks])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.quiz.is_active = False
+            self.quiz.save()
+            self.progress.refresh_from_db()
+            self.assertEqual(self.progress.quizzes_total, 1)
+        self.progress.refresh_from_db()
+        self.assertEqual(self.progress.quizzes_total, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.modules[3].delete()
+        self.progress.refresh_from_db()
+        self.assertEqual(self.progress.modules_total, 3)
+
+    def test_next_incomplete_module_is_one_query(self):
+        self.complete(self.modules[0])
+
+        with self.assertNumQueries(1):
+            module = self.progress.get_next_incomplete_module()
+
+        self.assertEqual(module, self.modules[1])
+        self.assertEqual(StudentModuleProgress.objects.filter(student=self.student).count(), 1)
+
+    def test_rebuild_repairs_drift(self):
+        self.complete(self.modules[0])
+        self.complete(self.modules[1])
+        CourseProgress.objects.filter(pk=self.progress.pk).update(modules_completed=0, quizzes_total=7)
+
+        self.assertEqual(self.progress.calculate_completion(), Decimal("50.00"))
+        self.assertEqual((self.progress.modules_completed, self.progress.quizzes_total), (2, 1))
+
+    def test_bulk_grading_actions_refresh_counters(self):
+        assignment = Assignment.objects.create(
+            module=self.modules[0], batch=self.batch, title="Assignment", due_date=timezone.now(), order=1
+        )
+        AssignmentSubmission.objects.create(assignment=assignment, student=self.student, submission_text="Done")
+        model_admin = AssignmentSubmissionAdmin(AssignmentSubmission, admin.site)
+        model_admin.message_user = lambda *args, **kwargs: None
+        request = RequestFactory().post("/admin/")
+        request.user = self.student
+        submissions = AssignmentSubmission.objects.filter(student=self.student)
+
+        model_admin.grade_as_graded(request, submissions)
+        self.progress.refresh_from_db()
+        self.assertEqual((self.progress.assignments_completed, self.progress.assignments_total), (1, 1))
+
+        model_admin.grade_as_pending(request, submissions)
+        self.progress.refresh_from_db()
+        self.assertEqual(self.progress.assignments_completed, 0)
+
+    def test_rebuild_for_after_bulk_uncompletion(self):
+        self.complete(self.modules[0])
+        self.complete(self.modules[1])
+        rows = StudentModuleProgress.objects.filter(student=self.student)
+        pairs = list(rows.values_list("student_id", "module__course_id"))
+        rows.update(is_completed=False, completed_at=None)
+
+        self.assertEqual(CourseProgress.rebuild_for(pairs), 1)
+        self.progress.refresh_from_db()
+        self.assertEqual(self.progress.modules_completed, 0)
+        self.assertEqual(self.progress.completion_percentage, Decimal("0.00"))
+        self.assertEqual(CourseProgress.rebuild_for([]), 0)
@@ -0,0 +1,131 @@
+"""Tests for the DailyMetric rollup and the dashboards reading it."""
+
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+
+from api.models.models_auth import CustomUser
+from api.models.models_metrics import DailyMetric
+from api.models.models_order import Enrollment, Order, OrderItem
+from api.tests.helpers import create_batch, create_course, create_user
+from api.utils.metrics_rollup import Metric, breakdown, totals, window
+
+
+class DailyMetricTests(TestCase):
+    def setUp(self):
+        self.admin = create_user("metric", 0, CustomUser.Role.ADMIN)
+        self.course = create_course("metric", "MET")
+        self.batch = create_batch(self.course)
+
+    def order(self, student, amount="1500.00", method="bkash"):
+        order = Order.objects.create(
+            user=student,
+            subtotal=Decimal(amount),
+            total_amount=Decimal(amount),
+            billing_email=student.email,
+            billing_name="Metric Student",
+            payment_method=method,
+        )
+        OrderItem.objects.create(
+            order=order, course=self.course, batch=self.batch, course_title=self.course.title, price=Decimal(amount)
+        )
+        return order
+
+    def students(self):
+        stats = totals(Metric.STUDENTS, enabled=window(dimension="enabled"), disabled=window(dimension="disabled"))
+        return stats["enabled"]["count"], stats["disabled"]["count"]
+
+    def snapshot(self):
+        return sorted(
+            DailyMetric.objects.exclude(count=0, amount=0).values_list("date", "metric", "dimension", "count", "amount")
+        )
+
+    def test_signups_follow_enabled_state_and_deletes(self):
+        first = create_user("metric", 1)
+        create_user("metric", 2)
+        create_user("metric", 3, CustomUser.Role.TEACHER)
+        self.assertEqual(self.students(), (2, 0))
+        self.assertEqual(totals(Metric.TEACHERS, total=window())["total"]["count"], 1)
+
+        first.is_enabled = False
+        first.save()
+        self.assertEqual(self.students(), (1, 1))
+
+        # Saving without a relevant change writes nothing
+        with CaptureQueriesContext(connection) as queries:
+            CustomUser.objects.get(pk=first.pk).save()
+        self.assertFalse([q for q in queries.captured_queries if "api_dailymetric" in q["sql"]])
+
+        first.delete()
+        self.assertEqual(self.students(), (1, 0))
+
+    def test_enrollments_and_completed_revenue(self):
+        student = create_user("metric", 1)
+        enrollment = Enrollment.objects.create(user=student, batch=self.batch)
+        order = self.order(student)
+        self.assertEqual(breakdown(Metric.ENROLLMENTS), [{"dimension": str(self.course.id), "count": 1, "amount": 0}])
+        self.assertEqual(totals(Metric.REVENUE_BY_METHOD, total=window())["total"]["amount"], 0)
+
+        order.status = "completed"
+        order.save()
+        revenue = breakdown(Metric.REVENUE_BY_METHOD)
+        self.assertEqual(revenue, [{"dimension": "bkash", "count": 1, "amount": Decimal("1500.00")}])
+        self.assertEqual(breakdown(Metric.REVENUE_BY_COURSE)[0]["amount"], Decimal("1500.00"))
+
+        order.status = "refunded"
+        order.save()
+        enrollment.is_active = False
+        enrollment.save()
+        self.assertEqual(breakdown(Metric.REVENUE_BY_METHOD), [])
+        self.assertEqual(breakdown(Metric.ENROLLMENTS), [])
+
+    def test_backfill_rebuilds_the_same_rollup(self):
+        students = [create_user("metric", n) for n in range(1, 4)]
+        for student in students:
+            Enrollment.objects.create(user=student, batch=self.batch)
+            order = self.order(student, method="nagad")
+            order.status = "completed"
+            order.save()
+        expected = self.snapshot()
+
+        DailyMetric.objects.all().delete()
+        out = StringIO()
+        call_command("backfill_daily_metrics", stdout=out)
+
+        self.assertEqual(self.snapshot(), expected)
+        self.assertIn("for all days", out.getvalue())
+
+    def test_dashboards_read_the_rollup(self):
+        for n in range(1, 4):
+            student = create_user("metric", n)
+            Enrollment.objects.create(user=student, batch=self.batch)
+            order = self.order(student)
+            order.status = "completed"
+            order.save()
+
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        with CaptureQueriesContext(connection) as queries:
+            overview = client.get("/api/dashboard/overview/?period=week")
+        self.assertEqual(overview.status_code, 200)
+        tables = " ".join(q["sql"] for q in queries.captured_queries)
+        self.assertNotIn('"api_order"', tables)
+        self.assertNotIn('"api_enrollment"', tables)
+
+        stats = overview.data["data"]["statistics"]
+        self.assertEqual((stats["students"]["total"], stats["students"]["new"]), (3, 3))
+        self.assertEqual(stats["earnings"]["total"], 4500.0)
+        charts = overview.data["data"]["charts"]
+        self.assertEqual(charts["popular_courses"]["labels"], ["Metric Course"])
+        self.assertEqual(charts["enrollment_overview"]["total_enrollments"], 3)
+
+        earnings = client.get("/api/dashboard/earnings/details/").data["data"]
+        self.assertEqual(earnings["by_payment_method"], [{"method": "bkash", "total": 4500.0, "count": 3}])
+        self.assertEqual(earnings["top_earning_courses"][0]["course_title"], "Metric Course")
+        self.assertEqual(earnings["top_earning_courses"][0]["total_orders"], 3)
@@ -0,0 +1,106 @@
+"""Tests for incrementally maintained batch enrollment counters."""
+
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.admin.sites import AdminSite
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.admin.admin_order import EnrollmentAdmin
+from api.models.models_course import CourseBatch
+from api.models.models_order import Enrollment
+from api.tests.helpers import create_batch, create_course, create_user
+
+
+class EnrolledCountTests(TestCase):
+    def setUp(self):
+        self.course = create_course("count", "CNT")
+        start = date.today() + timedelta(days=30)
+        self.batch = create_batch(
+            self.course, start_date=start, enrollment_start_date=date.today() - timedelta(days=1), max_students=2
+        )
+        self.other_batch = create_batch(self.course, 2, start_date=start)
+
+    def counts(self):
+        self.batch.refresh_from_db()
+        self.other_batch.refresh_from_db()
+        return self.batch.enrolled_students, self.other_batch.enrolled_students
+
+    def test_counter_follows_activation_moves_and_deletes(self):
+        enrollment = Enrollment.objects.create(user=create_user("count", 1), batch=self.batch)
+        Enrollment.objects.create(user=create_user("count", 2), batch=self.batch)
+        self.assertEqual(self.counts(), (2, 0))
+
+        enrollment.is_active = False
+        enrollment.save()
+        self.assertEqual(self.counts(), (1, 0))
+
+        enrollment.save()  # no state change, no adjustment
+        self.assertEqual(self.counts(), (1, 0))
+
+        enrollment = Enrollment.objects.get(pk=enrollment.pk)
+        enrollment.is_active = True
+        enrollment.batch = self.other_batch
+        enrollment.save()
+        self.assertEqual(self.counts(), (1, 1))
+
+        enrollment.delete()
+        self.assertEqual(self.counts(), (1, 0))
+
+    def test_enrolling_does_not_recount_the_batch(self):
+        Enrollment.objects.create(user=create_user("count", 1), batch=self.batch)
+        student = create_user("count", 2)
+
+        with CaptureQueriesContext(connection) as ctx:
+            Enrollment.objects.create(user=student, batch=self.batch)
+
+        batch_queries = [q["sql"] for q in ctx.captured_queries if "api_coursebatch" in q["sql"]]
+        self.assertEqual(len(batch_queries), 1)
+        self.assertIn('"enrolled_students" + 1', batch_queries[0])
+        self.assertFalse(any("COUNT(" in q["sql"] for q in ctx.captured_queries))
+
+    def test_enrollment_open_reads_the_counter(self):
+        self.batch.refresh_from_db()
+        self.assertTrue(self.batch.is_enrollment_open)
+
+        Enrollment.objects.create(user=create_user("count", 1), batch=self.batch)
+        Enrollment.objects.create(user=create_user("count", 2), batch=self.batch)
+
+        self.batch.refresh_from_db()
+        self.assertFalse(self.batch.is_enrollment_open)
+        self.assertEqual(self.batch.available_seats, 0)
+
+    def test_status_closes_when_full_and_reopens_when_a_seat_frees(self):
+        enrollments = [Enrollment.objects.create(user=create_user("count", n), batch=self.batch) for n in (1, 2)]
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.status, "upcoming")
+
+        enrollments[0].delete()
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.status, "enrollment_open")
+
+    def test_admin_deactivation_moves_the_counter(self):
+        enrollments = [Enrollment.objects.create(user=create_user("count", n), batch=self.batch) for n in (1, 2)]
+        admin = EnrollmentAdmin(Enrollment, AdminSite())
+        admin.message_user = lambda request, message: None
+
+        admin.deactivate_enrollment(None, Enrollment.objects.filter(pk=enrollments[0].pk))
+        self.assertEqual(self.counts(), (1, 0))
+        self.assertEqual(self.batch.status, "enrollment_open")
+
+    def test_reconcile_repairs_drift(self):
+        Enrollment.objects.create(user=create_user("count", 1), batch=self.batch)
+        Enrollment.objects.create(user=create_user("count", 2), batch=self.batch)
+        Enrollment.objects.filter(batch=self.batch).update(is_active=False)  # bypasses save()
+        CourseBatch.objects.filter(pk=self.other_batch.pk).update(enrolled_students=7)
+
+        out = StringIO()
+        call_command("reconcile_enrollment_counts", "--dry-run", stdout=out)
+        self.assertIn("Would fix 2", out.getvalue())
+        self.assertEqual(self.counts(), (2, 7))
+
+        call_command("reconcile_enrollment_counts", stdout=StringIO())
+        self.assertEqual(self.counts(), (0, 0))
@@ -0,0 +1,106 @@
+"""Tests for the streaming CSV exports."""
+
+import csv
+import io
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+
+from api.models.models_auth import CustomUser
+from api.models.models_course import Category, Course, CourseBatch
+from api.models.models_order import Enrollment
+from api.utils.export_utils import CSVExporter
+
+
+class StudentCSVExportTests(TestCase):
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(
+            email="export-admin@example.com",
+            password="AdminPass1!",
+            first_name="Export",
+            last_name="Admin",
+            phone="01700000500",
+            role=CustomUser.Role.ADMIN,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+        category = Category.objects.create(name="Export Cat", slug="export-cat")
+        course = Course.objects.create(
+            title="Export Course",
+            slug="export-course",
+            course_prefix="EXP",
+            category=category,
+            short_description="Short",
+        )
+        today = date.today()
+        self.batch = CourseBatch.objects.create(
+            course=course,
+            batch_number=1,
+            start_date=today,
+            end_date=today + timedelta(days=90),
+        )
+
+    def add_student(self, n, progress=None):
+        student = CustomUser.objects.create_user(
+            email=f"export-student{n}@example.com",
+            password="StudentPass1!",
+            first_name="Student",
+            last_name=str(n),
+            phone=f"0171000{n:04d}",
+            role=CustomUser.Role.STUDENT,
+        )
+        if progress is not None:
+            Enrollment.objects.create(user=student, batch=self.batch, progress_percentage=progress)
+        return student
+
+    def fetch_rows(self):
+        response = self.client.get("/api/export/students/csv/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        body = b"".join(response.streaming_content).decode()
+        return list(csv.reader(io.StringIO(body)))
+
+    def test_counts_come_from_annotations(self):
+        self.add_student(1, progress=Decimal("100.00"))
+        self.add_student(2, progress=Decimal("40.00"))
+        self.add_student(3)
+
+        rows = self.fetch_rows()
+
+        self.assertEqual(rows[0][5:7], ["Enrolled Courses", "Completed Courses"])
+        counts = {row[2]: row[5:7] for row in rows[1:]}
+        self.assertEqual(counts["export-student1@example.com"], ["1", "1"])
+        self.assertEqual(counts["export-student2@example.com"], ["1", "0"])
+        self.assertEqual(counts["export-student3@example.com"], ["0", "0"])
+
+    def test_query_count_does_not_grow_with_students(self):
+        def count_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                self.fetch_rows()
+            return len(ctx.captured_queries)
+
+        self.add_student(1, progress=Decimal("10.00"))
+        baseline = count_queries()
+        for n in range(2, 8):
+            self.add_student(n, progress=Decimal("100.00"))
+
+        self.assertEqual(count_queries(), baseline)
+
+
+class StreamCSVTests(TestCase):
+    def test_rows_are_buffered_into_chunks(self):
+        rows = ([i, "x" * 100] for i in range(2000))
+        response = CSVExporter.stream_csv("big.csv", ["n", "text"], rows)
+
+        chunks = list(response.streaming_content)
+
+        self.assertEqual(chunks[0], b"n,text\r\n")
+        self.assertLess(len(chunks), 10)
+        self.assertEqual(b"".join(chunks).count(b"\r\n"), 2001)
+        self.assertIn("big.csv", response["Content-Disposition"])
@@ -0,0 +1,77 @@
+"""Tests for the per-model file cleanup registry."""
+
+import io
+import os
+import shutil
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from PIL import Image
+
+from api.models.models_footer import Footer
+from api.models.models_order import Order
+from api.utils.file_cleanup import get_file_fields
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_png(name="logo.png", size=(200, 200)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class FileCleanupTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def create_footer(self):
+        footer = Footer(copyright_name="Prime Academy", logo=make_png())
+        footer.save(skip_validation=True)
+        return Footer.objects.get(pk=footer.pk)
+
+    def test_registry_only_tracks_models_with_file_fields(self):
+        self.assertEqual(get_file_fields(Footer), ("logo",))
+        self.assertEqual(get_file_fields(Order), ())
+
+    def test_replaced_file_deleted_after_commit(self):
+        footer = self.create_footer()
+        old_path = footer.logo.path
+
+        footer.logo = make_png("new-logo.png")
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            footer.save(skip_validation=True)
+
+        # Still on disk until the transaction commits
+        self.assertTrue(os.path.exists(old_path))
+        for callback in callbacks:
+            callback()
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.exists(footer.logo.path))
+
+    def test_unchanged_file_save_does_not_refetch_row(self):
+        footer = self.create_footer()
+        footer.description = "Updated"
+
+        # A single UPDATE: the original file name was recorded at load time
+        with self.assertNumQueries(1):
+            footer.save(skip_validation=True, update_fields=["description"])
+        with self.captureOnCommitCallbacks() as callbacks:
+            footer.save(skip_validation=True)
+
+        self.assertEqual(callbacks, [])
+        self.assertTrue(os.path.exists(footer.logo.path))
+
+    def test_files_deleted_after_instance_delete(self):
+        footer = self.create_footer()
+        path = footer.logo.path
+
+        with self.captureOnCommitCallbacks(execute=True):
+            footer.delete()
+
+        self.assertFalse(os.path.exists(path))
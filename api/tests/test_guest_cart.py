@@ -0,0 +1,103 @@
+"""Tests for cookie-backed guest carts."""
+
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api.models.models_auth import CustomUser
+from api.models.models_cart import Cart, CartItem
+from api.models.models_course import Category, Course
+from api.models.models_pricing import CoursePrice
+
+
+class GuestCartTests(APITestCase):
+    def setUp(self):
+        category = Category.objects.create(name="Guest Cat", slug="guest-cat")
+        self.course = Course.objects.create(
+            title="Guest Course",
+            slug="guest-course",
+            course_prefix="GST",
+            category=category,
+            short_description="Short",
+        )
+        CoursePrice.objects.create(course=self.course, base_price=Decimal("120.00"), currency="BDT")
+
+    def add(self):
+        return self.client.post("/api/cart/add/", {"course_id": str(self.course.id)}, format="json")
+
+    def test_viewing_and_filling_a_guest_cart_writes_no_rows(self):
+        response = self.client.get("/api/cart/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["item_count"], 0)
+
+        response = self.add()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["cart"]["item_count"], 1)
+        self.assertEqual(Decimal(str(response.data["cart"]["total"])), Decimal("120.00"))
+
+        self.assertFalse(Cart.objects.exists())
+        self.assertFalse(CartItem.objects.exists())
+        self.assertFalse(Session.objects.exists())
+
+    def test_cookie_round_trip_and_remove(self):
+        self.add()
+        self.assertEqual(self.add().status_code, status.HTTP_200_OK)  # already in cart
+
+        response = self.client.get("/api/cart/")
+        self.assertEqual(response.data["item_count"], 1)
+        item_id = response.data["items"][0]["id"]
+
+        response = self.client.delete(f"/api/cart/remove/{item_id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["cart"]["item_count"], 0)
+        self.assertEqual(self.client.get("/api/cart/").data["item_count"], 0)
+
+    def test_tampered_cookie_is_ignored(self):
+        self.add()
+        cookie = self.client.cookies["guest_cart"]
+        cookie.set(cookie.key, cookie.value + "x", cookie.coded_value + "x")
+
+        self.assertEqual(self.client.get("/api/cart/").data["item_count"], 0)
+
+    def test_login_merges_cookie_cart(self):
+        user = CustomUser.objects.create_user(
+            email="guest-buyer@example.com",
+            password="GuestPass1!",
+            first_name="Guest",
+            last_name="Buyer",
+            phone="01710000999",
+            role=CustomUser.Role.STUDENT,
+            is_active=True,
+        )
+        self.add()
+
+        response = self.client.post(
+            reverse("student-login"), {"email": user.email, "password": "GuestPass1!"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["cart_items_merged"], 1)
+        self.assertEqual(list(Cart.objects.get(user=user).items.values_list("course_id", flat=True)), [self.course.id])
+        self.assertEqual(self.client.cookies["guest_cart"].value, "")
+
+    def test_purge_deletes_only_stale_guest_carts(self):
+        stale = Cart.objects.create(session_key="stale-session")
+        CartItem.objects.create(cart=stale, course=self.course)
+        Cart.objects.filter(pk=stale.pk).update(updated_at=timezone.now() - timedelta(days=45))
+        fresh = Cart.objects.create(session_key="fresh-session")
+
+        out = StringIO()
+        call_command("purge_guest_carts", "--dry-run", stdout=out)
+        self.assertIn("Would delete 1", out.getvalue())
+
+        call_command("purge_guest_carts", stdout=StringIO())
+        self.assertEqual(list(Cart.objects.values_list("pk", flat=True)), [fresh.pk])
+        self.assertFalse(CartItem.objects.exists())
@@ -0,0 +1,87 @@
+"""Tests for opt-in keyset (cursor) pagination on the large admin lists."""
+
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+
+from api.models.models_auth import CustomUser
+from api.models.models_order import Order
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.admin = self.user(0, CustomUser.Role.ADMIN)
+        self.students = [self.user(n) for n in range(1, 6)]
+        for student in self.students:
+            Order.objects.create(
+                user=student,
+                subtotal=Decimal("100.00"),
+                total_amount=Decimal("100.00"),
+                billing_email=student.email,
+                billing_name="Keyset Student",
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def user(self, n, role=CustomUser.Role.STUDENT):
+        return CustomUser.objects.create_user(
+            email=f"keyset-user{n}@example.com",
+            password="KeysetPass1!",
+            first_name="Keyset",
+            last_name=str(n),
+            phone=f"0174500{n:04d}",
+            role=role,
+        )
+
+    def walk(self, url, **params):
+        seen, cursor, counts = [], "", []
+        while cursor is not None:
+            data = self.client.get(url, {"page_size": 2, "cursor": cursor, **params}).data["data"]
+            seen += [row["id"] for row in data["results"]]
+            counts.append(data["count"])
+            cursor = data["next_cursor"]
+        return seen, counts
+
+    def test_cursor_walks_orders_newest_first(self):
+        seen, counts = self.walk("/api/orders/")
+        expected = [str(pk) for pk in Order.objects.order_by("-created_at", "-id").values_list("pk", flat=True)]
+        self.assertEqual(seen, expected)
+        self.assertEqual(counts, [5, 5, 5])
+
+    def test_students_are_keyed_on_date_joined(self):
+        seen, _ = self.walk("/api/admin/students/")
+        expected = [str(student.pk) for student in reversed(self.students)]
+        self.assertEqual(seen, expected)
+
+    def test_deep_page_has_no_offset_and_count_can_be_skipped(self):
+        first = self.client.get("/api/orders/", {"page_size": 2, "cursor": ""}).data["data"]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                "/api/orders/", {"page_size": 2, "cursor": first["next_cursor"], "count": "false"}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data["data"]["count"])
+        orders = [q["sql"] for q in queries.captured_queries if 'FROM "api_order"' in q["sql"]]
+        self.assertEqual(len(orders), 1)
+        self.assertNotIn("OFFSET", orders[0])
+        self.assertNotIn("COUNT(", orders[0])
+
+    def test_count_is_cached_between_pages(self):
+        self.client.get("/api/orders/", {"cursor": ""})
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get("/api/orders/", {"cursor": ""}).data["data"]
+        self.assertEqual(data["count"], 5)
+        self.assertFalse([q for q in queries.captured_queries if "COUNT(" in q["sql"] and "api_order" in q["sql"]])
+
+    def test_page_numbers_without_cursor_and_invalid_cursor(self):
+        data = self.client.get("/api/orders/", {"page": 2, "page_size": 2}).data["data"]
+        self.assertEqual(data["count"], 5)
+        self.assertEqual(len(data["results"]), 2)
+        self.assertNotIn("next_cursor", data)
+
+        response = self.client.get("/api/orders/", {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
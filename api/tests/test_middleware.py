@@ -1,13 +1,19 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
 from django.urls import reverse
 
 from rest_framework.test import APIClient
 
+from api.middleware import RejectDisabledUserMiddleware
 from api.models.models_auth import CustomUser
+from api.utils.user_status import clear_local_user_status, get_user_status
 
 
 class MiddlewareTokenRevocationTests(TestCase):
     def setUp(self):
+        cache.clear()
+        clear_local_user_status()
         self.client = APIClient()
         self.login_url = reverse("student-login")
         self.profile_url = reverse("my-profile")
@@ -38,7 +44,8 @@ class MiddlewareTokenRevocationTests(TestCase):
         self.assertEqual(r.status_code, 200)
 
         # Delete user (this should trigger pre_delete signal which blacklists refresh tokens)
-        user.delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
 
         # Using same access token should now be rejected by middleware (user not found)
         r2 = self.client.get(self.profile_url, HTTP_AUTHORIZATION=f"Bearer {access}")
@@ -54,9 +61,60 @@ class MiddlewareTokenRevocationTests(TestCase):
 
         # Disable user without deleting
         user.is_active = False
-        user.save(update_fields=["is_active"])
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save(update_fields=["is_active"])
 
         # Using same access token should now be rejected by middleware (disabled)
         r2 = self.client.get(self.profile_url, HTTP_AUTHORIZATION=f"Bearer {access}")
         # middleware returns 403 for disabled
         self.assertEqual(r2.status_code, 403)
+
+    def test_access_blocked_after_tokens_revoked(self):
+        user, access = self._create_and_login(email="mwrevoke@example.com")
+
+        r = self.client.get(self.profile_url, HTTP_AUTHORIZATION=f"Bearer {access}")
+        self.assertEqual(r.status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.revoke_tokens()
+
+        r2 = self.client.get(self.profile_url, HTTP_AUTHORIZATION=f"Bearer {access}")
+        self.assertEqual(r2.status_code, 401)
+
+    def test_middleware_reads_cached_status_without_queries(self):
+        user, access = self._create_and_login(email="mwquery@example.com")
+        middleware = RejectDisabledUserMiddleware(lambda request: HttpResponse("ok"))
+        factory = RequestFactory()
+
+        def call():
+            request = factory.get(self.profile_url, HTTP_AUTHORIZATION=f"Bearer {access}")
+            return middleware(request)
+
+        self.assertEqual(call().status_code, 200)
+
+        # Warm in-process and shared entries: the user row is not read again
+        with self.assertNumQueries(0):
+            self.assertEqual(call().status_code, 200)
+
+        clear_local_user_status()
+        with self.assertNumQueries(0):
+            self.assertEqual(call().status_code, 200)
+
+    def test_status_registry_invalidated_on_save(self):
+        user = CustomUser.objects.create_user(
+            email="mwstatus@example.com",
+            password="MwPass1!",
+            first_name="Mw",
+            last_name="Status",
+            phone="01700000124",
+        )
+        self.assertTrue(get_user_status(user.pk).is_enabled)
+
+        user.is_enabled = False
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            user.save(update_fields=["is_enabled"])
+            # Invalidated only once the change commits, so nobody re-caches the old row
+            self.assertTrue(get_user_status(user.pk).is_enabled)
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(get_user_status(user.pk).is_enabled)
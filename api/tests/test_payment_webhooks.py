@@ -0,0 +1,122 @@
+"""Tests for the SSLCommerz IPN inbox."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIClient
+
+from api.models.models_auth import CustomUser
+from api.models.models_order import Order, PaymentWebhookEvent
+from api.models.models_tasks import OutboxTask
+from api.tests.helpers import run_worker
+
+VALIDATE = "api.utils.payment_webhooks.SSLCommerzPayment.validate_payment"
+
+
+class PaymentWebhookTests(TestCase):
+    def setUp(self):
+        self.student = CustomUser.objects.create_user(
+            email="ipn-student@example.com",
+            password="StudentPass1!",
+            first_name="Ipn",
+            last_name="Student",
+            phone="01700000700",
+            role=CustomUser.Role.STUDENT,
+        )
+        self.order = Order.objects.create(
+            user=self.student,
+            subtotal=Decimal("1000.00"),
+            total_amount=Decimal("1000.00"),
+            currency="BDT",
+            status="processing",
+        )
+        self.client = APIClient()
+
+    def post_ipn(self, val_id="VAL-1", amount="1000.00", status="VALID"):
+        # Eager processing starts once the event insert commits
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                "/api/payment/webhook/",
+                {"tran_id": self.order.order_number, "val_id": val_id, "amount": amount, "status": status},
+                format="json",
+            )
+
+    @patch(VALIDATE, return_value=(True, {"status": "VALID"}))
+    def test_eager_ipn_completes_order_and_duplicates_are_absorbed(self, validate):
+        first = self.post_ipn()
+        second = self.post_ipn()
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data["message"], "Webhook already received")
+        self.assertEqual(validate.call_count, 1)
+
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "completed")
+        self.assertEqual(self.order.payment_id, "VAL-1")
+        self.assertEqual(PaymentWebhookEvent.objects.get().status, PaymentWebhookEvent.Status.PROCESSED)
+
+    @override_settings(TASKS_EAGER=False)
+    @patch(VALIDATE, return_value=(True, {"status": "VALID"}))
+    def test_ipn_is_only_recorded_until_the_worker_runs(self, validate):
+        response = self.post_ipn()
+
+        self.assertEqual(response.data["data"]["status"], PaymentWebhookEvent.Status.RECEIVED)
+        validate.assert_not_called()
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "processing")
+        self.assertEqual(OutboxTask.objects.count(), 1)
+
+        run_worker()
+
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "completed")
+
+    @override_settings(TASKS_EAGER=False)
+    @patch(VALIDATE, return_value=(False, {"error": "SSLCommerz validation timeout"}))
+    def test_gateway_timeout_is_retried_without_failing_the_order(self, validate):
+        self.post_ipn()
+
+        run_worker()
+
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "processing")
+        self.assertEqual(PaymentWebhookEvent.objects.get().status, PaymentWebhookEvent.Status.RECEIVED)
+        queued = OutboxTask.objects.get()
+        self.assertEqual(queued.status, OutboxTask.Status.PENDING)
+        self.assertIn("GatewayUnavailable", queued.last_error)
+
+    @patch(VALIDATE, return_value=(False, {"error": "SSLCommerz validation timeout"}))
+    def test_eager_gateway_failure_keeps_the_event(self, validate):
+        response = self.post_ipn()
+
+        self.assertEqual(response.status_code, 200)
+        validate.assert_called_once()
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "processing")
+        self.assertEqual(PaymentWebhookEvent.objects.get().status, PaymentWebhookEvent.Status.RECEIVED)
+
+    @patch(VALIDATE, return_value=(False, {"status": "INVALID_TRANSACTION"}))
+    def test_invalid_payment_fails_order(self, validate):
+        self.post_ipn()
+
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "failed")
+        self.assertEqual(PaymentWebhookEvent.objects.get().status, PaymentWebhookEvent.Status.INVALID)
+
+    @patch(VALIDATE)
+    def test_amount_mismatch_is_ignored_without_calling_gateway(self, validate):
+        self.post_ipn(amount="10.00")
+
+        validate.assert_not_called()
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "processing")
+        self.assertEqual(PaymentWebhookEvent.objects.get().result, "Amount mismatch")
+
+    def test_missing_parameters_are_rejected(self):
+        response = self.client.post("/api/payment/webhook/", {"tran_id": "x"}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(PaymentWebhookEvent.objects.exists())
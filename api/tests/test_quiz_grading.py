@@ -0,0 +1,90 @@
+"""Tests for set-based quiz submission grading."""
+
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APITestCase
+
+from api.models.models_course import CourseModule
+from api.models.models_module import Quiz, QuizAnswer, QuizAttempt, QuizQuestion, QuizQuestionOption
+from api.tests.helpers import create_batch, create_course, create_user
+
+
+class QuizGradingTests(APITestCase):
+    def setUp(self):
+        self.student = create_user("quiz")
+        self.course = create_course("quiz", "QZ")
+        self.module = CourseModule.objects.create(course=self.course, title="Module", slug="module", order=1)
+        self.batch = create_batch(self.course)
+        self.client.force_authenticate(user=self.student)
+
+    def make_quiz(self, size):
+        quiz = Quiz.objects.create(
+            module=self.module, batch=self.batch, title=f"Quiz {size}", total_marks=size, passing_marks=size // 2
+        )
+        questions = QuizQuestion.objects.bulk_create(
+            QuizQuestion(quiz=quiz, question_text=f"Q{n}", order=n, question_type="mcq" if n % 2 else "multiple")
+            for n in range(1, size + 1)
+        )
+        options = QuizQuestionOption.objects.bulk_create(
+            QuizQuestionOption(question=q, option_text=str(i), is_correct=i == 0 or (q.question_type == "multiple" and i == 1), order=i)
+            for q in questions
+            for i in range(3)
+        )
+        correct = {}
+        for option in options:
+            if option.is_correct:
+                correct.setdefault(str(option.question_id), []).append(str(option.id))
+        wrong = {str(o.question_id): [str(o.id)] for o in options if o.order == 2}
+        attempt = QuizAttempt.objects.create(quiz=quiz, student=self.student)
+        return attempt, questions, correct, wrong
+
+    def submit(self, attempt, answers):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(f"/api/quiz-attempts/{attempt.id}/submit/", {"answers": answers}, format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+        return response, len(ctx.captured_queries)
+
+    def test_scores_match_selected_options(self):
+        attempt, questions, correct, wrong = self.make_quiz(4)
+        QuizAnswer.objects.create(attempt=attempt, question=questions[3]).selected_options.add(
+            *QuizQuestionOption.objects.filter(question=questions[3])
+        )
+        answers = [
+            {"question_id": str(questions[0].id), "selected_options": correct[str(questions[0].id)]},
+            {"question_id": str(questions[1].id), "selected_options": correct[str(questions[1].id)]},
+            {"question_id": str(questions[2].id), "selected_options": wrong[str(questions[2].id)]},
+            {"question_id": str(questions[3].id), "selected_options": correct[str(questions[3].id)][:1]},
+            {"question_id": "00000000-0000-0000-0000-000000000000", "selected_options": []},
+        ]
+
+        response, _ = self.submit(attempt, answers)
+
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.marks_obtained, Decimal("2.00"))
+        self.assertEqual(attempt.percentage, Decimal("50.00"))
+        self.assertTrue(attempt.passed)
+        self.assertEqual(len(response.data["data"]["answers"]), 4)
+
+        updated = QuizAnswer.objects.get(attempt=attempt, question=questions[3])
+        self.assertFalse(updated.is_correct)
+        self.assertEqual(
+            {str(o) for o in updated.selected_options.values_list("id", flat=True)},
+            set(correct[str(questions[3].id)][:1]),
+        )
+
+    def test_submission_query_count_is_constant(self):
+        counts = []
+        for size in (5, 60):
+            attempt, questions, correct, _ = self.make_quiz(size)
+            answers = [{"question_id": str(q.id), "selected_options": correct[str(q.id)]} for q in questions]
+
+            _, queries = self.submit(attempt, answers)
+
+            attempt.refresh_from_db()
+            self.assertEqual(attempt.marks_obtained, size)
+            counts.append(queries)
+
+        self.assertEqual(counts[0], counts[1])
@@ -0,0 +1,77 @@
+"""Tests for compiled quiz papers and seeded question order."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APITestCase
+
+from api.models.models_course import CourseModule
+from api.models.models_module import Quiz, QuizAttempt, QuizQuestion, QuizQuestionOption
+from api.models.models_order import Enrollment
+from api.tests.helpers import create_batch, create_course, create_user
+from api.utils.quiz_papers import order_questions
+
+
+class QuizPaperTests(APITestCase):
+    def setUp(self):
+        course = create_course("paper", "PP")
+        module = CourseModule.objects.create(course=course, title="Module", slug="module", order=1)
+        self.batch = create_batch(course)
+        self.quiz = Quiz.objects.create(
+            module=module, batch=self.batch, title="Paper Quiz", total_marks=30, randomize_questions=True, max_attempts=3
+        )
+        self.questions = [
+            QuizQuestion.objects.create(quiz=self.quiz, question_text=f"Q{n}", order=n) for n in range(1, 11)
+        ]
+        for question in self.questions:
+            for i in range(2):
+                QuizQuestionOption.objects.create(question=question, option_text=f"{question.order}-{i}", order=i)
+
+    def student(self, n):
+        user = create_user("paper", n)
+        Enrollment.objects.create(user=user, batch=self.batch)
+        return user
+
+    def start(self, user):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(f"/api/quizzes/{self.quiz.id}/start/")
+        self.assertIn(response.status_code, (200, 201), response.data)
+        question_queries = [q["sql"] for q in ctx.captured_queries if 'FROM "api_quizquestion' in q["sql"]]
+        return response.data["data"], question_queries
+
+    def test_resumed_attempt_keeps_its_order(self):
+        user = self.student(1)
+        started, _ = self.start(user)
+        resumed, question_queries = self.start(user)
+
+        self.assertEqual([q["id"] for q in resumed["questions"]], [q["id"] for q in started["questions"]])
+        self.assertEqual(question_queries, [])
+        self.assertEqual(len(started["questions"]), 10)
+        self.assertEqual(started["questions"][0]["points"], 3.0)
+        self.assertEqual(len(started["questions"][0]["options"]), 2)
+
+        attempt = QuizAttempt.objects.get(pk=started["attempt_id"])
+        self.assertIsNotNone(attempt.question_seed)
+
+    def test_paper_is_compiled_once_and_recompiled_after_edits(self):
+        _, first_queries = self.start(self.student(1))
+        _, second_queries = self.start(self.student(2))
+        self.assertTrue(first_queries)
+        self.assertEqual(second_queries, [])
+
+        self.questions[0].question_text = "Edited"
+        self.questions[0].save()
+        started, third_queries = self.start(self.student(3))
+
+        self.assertTrue(third_queries)
+        self.assertIn("Edited", [q["question_text"] for q in started["questions"]])
+
+    def test_seeded_order_is_stable(self):
+        paper = tuple({"id": str(q.id)} for q in self.questions)
+
+        self.assertEqual(order_questions(paper, 1234), order_questions(paper, 1234))
+        self.assertEqual(order_questions(paper, None), list(paper))
+        self.assertEqual(
+            [q for q in order_questions(paper, 1234) if q != paper[-1]], order_questions(paper[:-1], 1234)
+        )
@@ -0,0 +1,105 @@
+"""Tests for background report jobs (create, dedupe, worker, status, download)."""
+
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIClient
+
+from api.models.models_auth import CustomUser
+from api.models.models_reports import ReportJob
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, TASKS_EAGER=False)
+class ReportJobTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(
+            email="report-admin@example.com",
+            password="AdminPass1!",
+            first_name="Report",
+            last_name="Admin",
+            phone="01700000600",
+            role=CustomUser.Role.ADMIN,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def create_job(self, params=None, report_type="students_pdf"):
+        return self.client.post("/api/reports/", {"report_type": report_type, "params": params or {}}, format="json")
+
+    def test_job_is_queued_rendered_by_worker_and_downloadable(self):
+        response = self.create_job({"is_enabled": "true"})
+        self.assertEqual(response.status_code, 202)
+        job_id = response.data["data"]["id"]
+        self.assertEqual(response.data["data"]["status"], "queued")
+        self.assertIsNone(response.data["data"]["download_url"])
+
+        not_ready = self.client.get(f"/api/reports/{job_id}/download/")
+        self.assertEqual(not_ready.status_code, 409)
+
+        call_command("run_report_jobs", "--once", "--processes", "0", stdout=StringIO())
+
+        detail = self.client.get(f"/api/reports/{job_id}/")
+        self.assertEqual(detail.data["data"]["status"], "done")
+        self.assertTrue(detail.data["data"]["download_url"].endswith(f"/api/reports/{job_id}/download/"))
+
+        download = self.client.get(f"/api/reports/{job_id}/download/")
+        self.assertEqual(download.status_code, 200)
+        self.assertEqual(download["Content-Type"], "application/pdf")
+        self.assertTrue(b"".join(download.streaming_content).startswith(b"%PDF"))
+
+    def test_identical_requests_share_one_job(self):
+        first = self.create_job({"is_enabled": "true", "start_date": ""})
+        second = self.create_job({"is_enabled": "true"})
+        other = self.create_job({"is_enabled": "false"})
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.data["data"]["id"], second.data["data"]["id"])
+        self.assertNotEqual(first.data["data"]["id"], other.data["data"]["id"])
+        self.assertEqual(ReportJob.objects.count(), 2)
+
+    def test_failed_job_is_not_reused(self):
+        first = self.create_job()
+        ReportJob.objects.filter(pk=first.data["data"]["id"]).update(status=ReportJob.Status.FAILED)
+
+        second = self.create_job()
+
+        self.assertEqual(second.status_code, 202)
+        self.assertNotEqual(first.data["data"]["id"], second.data["data"]["id"])
+
+    def test_invalid_date_is_rejected(self):
+        response = self.create_job({"start_date": "01-02-2025"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_report_permissions_follow_report_type(self):
+        student = CustomUser.objects.create_user(
+            email="report-student@example.com",
+            password="StudentPass1!",
+            first_name="Report",
+            last_name="Student",
+            phone="01700000601",
+            role=CustomUser.Role.STUDENT,
+        )
+        job_id = self.create_job().data["data"]["id"]
+
+        self.client.force_authenticate(student)
+
+        self.assertEqual(self.create_job().status_code, 403)
+        self.assertEqual(self.client.get(f"/api/reports/{job_id}/").status_code, 403)
+
+    @override_settings(TASKS_EAGER=True)
+    def test_eager_mode_renders_inline(self):
+        response = self.create_job(report_type="transactions_pdf")
+
+        self.assertEqual(response.data["data"]["status"], "done")
+        self.assertEqual(response.data["data"]["filename"], "transactions.pdf")
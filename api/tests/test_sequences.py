@@ -0,0 +1,93 @@
+"""Tests for the hi-lo sequence service and the ID generators using it."""
+
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from api.models.models_accounting import TransactionCounter
+from api.models.models_auth import CustomUser
+from api.models.models_order import Order
+from api.utils.sequences import clear_cached_blocks, next_value, scramble_base36
+
+
+class SequenceServiceTests(TestCase):
+    def setUp(self):
+        clear_cached_blocks()
+        self.addCleanup(clear_cached_blocks)
+
+    def test_values_increase_per_key(self):
+        self.assertEqual([next_value("income", "A"), next_value("income", "A")], [1, 2])
+        self.assertEqual(next_value("income", "B"), 1)
+
+    def test_seed_is_used_only_when_counter_row_is_missing(self):
+        self.assertEqual(next_value("income", "SEEDED", seed=lambda: 41), 42)
+        self.assertEqual(next_value("income", "SEEDED", seed=lambda: 1000), 43)
+
+    @override_settings(SEQUENCE_BLOCK_SIZES={"bench": 5})
+    def test_committed_block_is_served_from_memory(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            first = next_value("bench", "BLOCK")
+
+        with self.assertNumQueries(0):
+            rest = [next_value("bench", "BLOCK") for _ in range(4)]
+
+        self.assertEqual([first] + rest, [1, 2, 3, 4, 5])
+        self.assertEqual(TransactionCounter.objects.get(prefix="BLOCK").counter, 5)
+        self.assertEqual(next_value("bench", "BLOCK"), 6)
+
+    @override_settings(SEQUENCE_BLOCK_SIZES={"bench": 5})
+    def test_rolled_back_block_is_discarded(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    next_value("bench", "ROLLBACK")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertEqual(callbacks, [])
+        self.assertFalse(TransactionCounter.objects.filter(prefix="ROLLBACK").exists())
+        self.assertEqual(next_value("bench", "ROLLBACK"), 1)
+
+    def test_scramble_is_a_permutation(self):
+        codes = {scramble_base36(n, 2) for n in range(36**2)}
+        self.assertEqual(len(codes), 36**2)
+
+
+class GeneratorTests(TestCase):
+    def setUp(self):
+        clear_cached_blocks()
+        self.addCleanup(clear_cached_blocks)
+
+    def create_student(self, n):
+        return CustomUser.objects.create_user(
+            email=f"seq-student{n}@example.com",
+            password="StudentPass1!",
+            first_name="Seq",
+            last_name=str(n),
+            phone=f"0172000{n:04d}",
+            role=CustomUser.Role.STUDENT,
+        )
+
+    def test_student_ids_continue_after_existing_ids(self):
+        year = timezone.now().year
+        legacy = self.create_student(1)
+        TransactionCounter.objects.filter(prefix=f"PA-{year}").delete()
+        clear_cached_blocks()
+        CustomUser.objects.filter(pk=legacy.pk).update(student_id=f"PA-{year}-041")
+
+        student = self.create_student(2)
+
+        self.assertEqual(student.student_id, f"PA-{year}-042")
+
+    def test_order_numbers_keep_format_and_are_unique(self):
+        user = self.create_student(3)
+        numbers = {
+            Order.objects.create(user=user, subtotal=100, total_amount=100, billing_email=user.email).order_number
+            for _ in range(5)
+        }
+
+        self.assertEqual(len(numbers), 5)
+        date_str = timezone.now().strftime("%Y%m%d")
+        for number in numbers:
+            self.assertRegex(number, rf"^ORD-{date_str}-[0-9A-Z]{{5}}$")
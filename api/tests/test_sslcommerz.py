@@ -0,0 +1,167 @@
+"""Tests for the pooled SSLCommerz client, retries and circuit breaker."""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, override_settings
+
+from api.testing.fake_sslcommerz import FakeSSLCommerzServer
+from api.utils import sslcommerz
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = sslcommerz.CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=self.clock)
+
+    def test_opens_after_threshold_and_probes_once_when_half_open(self):
+        for _ in range(3):
+            self.assertTrue(self.breaker.allow())
+            self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, "open")
+        self.assertFalse(self.breaker.allow())
+
+        self.clock.now = 10
+        self.assertEqual(self.breaker.state, "half_open")
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())  # only one probe in flight
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, "closed")
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_probe_reopens(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now = 10
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, "open")
+        self.assertFalse(self.breaker.allow())
+
+
+class PooledGatewayClientTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.gateway = FakeSSLCommerzServer().start()
+        cls.gateway.amounts["VAL-1"] = "500.00"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.gateway.stop()
+        sslcommerz.reset_session()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.gateway.fail_next = 0
+        self.gateway.always_fail = False
+        self.gateway.fail_status = 503
+        self.gateway.requests = 0
+        self.gateway.connections = 0
+        sslcommerz.reset_session()
+        sslcommerz.breaker.reset()
+        sslcommerz.gateway_metrics.reset()
+        settings = override_settings(
+            SSLCOMMERZ_API_URL=self.gateway.url, SSLCOMMERZ_RETRY_BACKOFF=0, SSLCOMMERZ_MAX_RETRIES=2
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(sslcommerz.breaker.reset)
+        self.client = sslcommerz.SSLCommerzPayment()
+
+    def test_connections_are_reused(self):
+        for _ in range(5):
+            is_valid, result = self.client.validate_payment("VAL-1", Decimal("500.00"))
+            self.assertTrue(is_valid)
+
+        self.assertEqual(self.gateway.requests, 5)
+        self.assertEqual(self.gateway.connections, 1)
+        metrics = sslcommerz.gateway_metrics.snapshot()["validate_payment"]
+        self.assertEqual(metrics["calls"], 5)
+        self.assertEqual(metrics["errors"], 0)
+
+    def test_transient_errors_are_retried(self):
+        self.gateway.fail_next = 2
+
+        is_valid, _ = self.client.validate_payment("VAL-1", Decimal("500.00"))
+
+        self.assertTrue(is_valid)
+        self.assertEqual(self.gateway.requests, 3)
+        self.assertEqual(sslcommerz.gateway_metrics.snapshot()["validate_payment"]["errors"], 2)
+
+    def test_retries_are_bounded(self):
+        self.gateway.always_fail = True
+
+        is_valid, result = self.client.validate_payment("VAL-1", Decimal("500.00"))
+
+        self.assertFalse(is_valid)
+        self.assertIn("error", result)
+        self.assertEqual(self.gateway.requests, 3)
+
+    def test_internal_errors_count_against_the_breaker_without_retry(self):
+        self.gateway.always_fail = True
+        self.gateway.fail_status = 500
+        self.addCleanup(setattr, sslcommerz.breaker, "failure_threshold", sslcommerz.breaker.failure_threshold)
+        sslcommerz.breaker.failure_threshold = 2
+
+        for _ in range(2):
+            is_valid, result = self.client.validate_payment("VAL-1", Decimal("500.00"))
+            self.assertFalse(is_valid)
+            self.assertIn("500", result["error"])
+
+        self.assertEqual(self.gateway.requests, 2)
+        self.assertEqual(sslcommerz.breaker.state, sslcommerz.CircuitBreaker.OPEN)
+
+    def test_open_circuit_stops_calling_the_gateway(self):
+        self.gateway.always_fail = True
+        self.addCleanup(setattr, sslcommerz.breaker, "failure_threshold", sslcommerz.breaker.failure_threshold)
+        sslcommerz.breaker.failure_threshold = 3
+
+        self.client.validate_payment("VAL-1", Decimal("500.00"))
+        is_valid, result = self.client.validate_payment("VAL-1", Decimal("500.00"))
+
+        self.assertFalse(is_valid)
+        self.assertIn("circuit open", result["error"])
+        self.assertEqual(self.gateway.requests, 3)
+        self.assertEqual(sslcommerz.gateway_metrics.snapshot()["validate_payment"]["short_circuited"], 1)
+
+    def test_session_init_is_not_retried_after_gateway_error(self):
+        self.gateway.fail_next = 1
+
+        with self.assertRaises(sslcommerz.SSLCommerzError):
+            self.client.init_payment(self._order(), amount=Decimal("500.00"))
+
+        self.assertEqual(self.gateway.requests, 1)
+        session = self.client.init_payment(self._order(), amount=Decimal("500.00"))
+        self.assertEqual(session["status"], "SUCCESS")
+
+    def _order(self):
+        user = SimpleNamespace(id=1, email="buyer@example.com", get_full_name=lambda: "Buyer")
+        return SimpleNamespace(
+            id="order-1",
+            user=user,
+            order_number="ORD-TEST-1",
+            total_amount=Decimal("500.00"),
+            currency="BDT",
+            is_installment=False,
+            billing_name="",
+            billing_email="",
+            billing_phone="",
+            billing_address="",
+            billing_city="",
+            billing_country="",
+            billing_postcode="",
+            get_total_items=lambda: 1,
+        )
@@ -0,0 +1,70 @@
+"""Tests for single-query statistics endpoints (StatisticsBuilder)."""
+
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+
+from api.models.models_auth import CustomUser
+from api.models.models_order import Enrollment, Order
+from api.tests.helpers import create_batch, create_course, create_user, queries_on
+from api.utils.statistics import StatisticsBuilder
+
+
+class StatisticsTests(TestCase):
+    def setUp(self):
+        self.admin = create_user("stats", 0, CustomUser.Role.ADMIN)
+        self.course = create_course("stats", "STA")
+        self.batch = create_batch(self.course)
+        for n, (status, amount) in enumerate(
+            [("completed", "1000.00"), ("completed", "2000.00"), ("pending", "500.00"), ("failed", "700.00")], start=1
+        ):
+            student = create_user("stats", n)
+            Order.objects.create(
+                user=student,
+                subtotal=Decimal(amount),
+                total_amount=Decimal(amount),
+                billing_email=student.email,
+                billing_name="Stats Student",
+                status=status,
+            )
+            Enrollment.objects.create(user=student, batch=self.batch, certificate_issued=n == 1)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_order_statistics_in_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/orders/statistics/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries_on("api_order", queries)), 1)
+
+        stats = response.data["data"]
+        self.assertEqual((stats["total_orders"], stats["completed_orders"], stats["pending_orders"]), (4, 2, 1))
+        self.assertEqual(stats["total_revenue"], Decimal("3000.00"))
+        self.assertEqual(stats["average_order_value"], Decimal("1500.00"))
+        self.assertEqual(stats["orders_by_status"]["failed"], 1)
+        self.assertEqual(stats["orders_by_status"]["refunded"], 0)
+
+    def test_enrollment_statistics_in_two_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/enrollments/statistics/")
+        self.assertEqual(response.status_code, 200)
+        # Totals aggregate + top courses grouping
+        self.assertEqual(len(queries_on("api_enrollment", queries)), 2)
+
+        stats = response.data["data"]
+        self.assertEqual((stats["total_enrollments"], stats["active_enrollments"], stats["certificates_issued"]), (4, 4, 1))
+        self.assertEqual(list(stats["enrollments_by_course"]), [{"course__title": "Stats Course", "count": 4}])
+
+    def test_builder_defaults_on_empty_querysets(self):
+        stats = (
+            StatisticsBuilder(Order.objects.filter(status="refunded"))
+            .count("orders")
+            .sum("revenue", "total_amount", default=Decimal("0.00"))
+            .avg("average", "total_amount")
+            .build()
+        )
+        self.assertEqual(stats, {"orders": 0, "revenue": Decimal("0.00"), "average": 0})
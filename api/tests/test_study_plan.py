@@ -0,0 +1,140 @@
+"""Tests for the cached study-plan aggregates behind the module study plan view."""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from rest_framework.test import APITestCase
+
+from api.models.models_course import CourseModule
+from api.models.models_module import (
+    Assignment,
+    AssignmentSubmission,
+    CourseResource,
+    LiveClass,
+    LiveClassAttendance,
+    Quiz,
+    QuizAttempt,
+    QuizQuestion,
+)
+from api.models.models_order import Enrollment
+from api.tests.helpers import create_batch, create_course, create_user
+from api.utils.cache_serializers import JSONSerializer
+from api.utils.study_plan import StudyPlan, build_study_plan
+
+
+class StudyPlanTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.student = create_user("plan")
+        self.course = create_course("plan", "PN")
+        self.batch = create_batch(self.course)
+        other_batch = create_batch(self.course, 2)
+        self.module = self.add_module(1, size=1)
+        self.large_module = self.add_module(2, size=6)
+        # Content for another batch is never counted or listed
+        LiveClass.objects.create(
+            module=self.module, batch=other_batch, title="Other", scheduled_date=timezone.now(), order=99
+        )
+        Enrollment.objects.create(user=self.student, batch=self.batch)
+        self.client.force_authenticate(user=self.student)
+
+    def add_module(self, n, size):
+        module = CourseModule.objects.create(course=self.course, title=f"Module {n}", slug=f"module-{n}", order=n)
+        for i in range(size):
+            LiveClass.objects.create(
+                module=module,
+                batch=self.batch,
+                title=f"Live {i}",
+                scheduled_date=timezone.now() - timedelta(days=1),
+                order=i,
+            )
+            Assignment.objects.create(
+                module=module, batch=self.batch, title=f"Assignment {i}", due_date=timezone.now(), order=i
+            )
+            quiz = Quiz.objects.create(module=module, batch=self.batch, title=f"Quiz {i}", total_marks=10)
+            QuizQuestion.objects.create(quiz=quiz, question_text="Q", order=1)
+            CourseResource.objects.create(
+                module=module, batch=self.batch, title=f"Resource {i}", external_url="https://example.com", order=i
+            )
+        # A quiz without active questions counts towards progress but is not listed
+        Quiz.objects.create(module=module, batch=self.batch, title="Empty quiz", total_marks=10)
+        return module
+
+    def get_plan(self, module):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f"/api/courses/{self.course.slug}/study-plan/{module.slug}/")
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data["data"], len(ctx.captured_queries)
+
+    def test_counts_and_progress(self):
+        live_class = self.module.live_classes.get(batch=self.batch)
+        LiveClassAttendance.objects.create(live_class=live_class, student=self.student, attended=True)
+        assignment = self.module.module_assignments.get()
+        AssignmentSubmission.objects.create(assignment=assignment, student=self.student, submission_text="Done")
+        quiz = self.module.module_quizzes.get(title="Quiz 0")
+        QuizAttempt.objects.create(quiz=quiz, student=self.student, status="submitted", marks_obtained=8)
+
+        data, _ = self.get_plan(self.module)
+
+        counts = [data[f"{name}_count"] for name in ("live_class", "assignment", "quiz", "resource")]
+        self.assertEqual(counts, [1, 1, 1, 1])
+        self.assertEqual(data["live_class_progress"], {"completed": 1, "total": 1})
+        self.assertEqual(data["assignment_progress"], {"completed": 1, "total": 1})
+        self.assertEqual(data["quiz_progress"], {"completed": 1, "total": 2})
+        self.assertEqual(data["overall_progress"], 75)
+        self.assertTrue(data["live_classes"][0]["is_attended"])
+        self.assertEqual(data["assignments"][0]["submission_status"], "submitted")
+        self.assertEqual((data["quizzes"][0]["attempts_used"], data["quizzes"][0]["best_score"]), (1, 8.0))
+
+    def test_query_count_does_not_grow_with_content(self):
+        _, small = self.get_plan(self.module)
+        cache.clear()
+        data, large = self.get_plan(self.large_module)
+
+        self.assertEqual(data["quiz_count"], 6)
+        self.assertEqual(large, small)
+
+        # The cached plan skips the aggregate queries entirely
+        _, cached = self.get_plan(self.large_module)
+        self.assertLess(cached, large)
+
+    def test_student_activity_refreshes_the_cached_plan(self):
+        data, _ = self.get_plan(self.module)
+        self.assertEqual(data["assignment_progress"]["completed"], 0)
+
+        assignment = self.module.module_assignments.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            AssignmentSubmission.objects.create(assignment=assignment, student=self.student, submission_text="Done")
+            # The cached plan is only dropped once the submission commits
+            data, _ = self.get_plan(self.module)
+            self.assertEqual(data["assignment_progress"]["completed"], 0)
+        data, _ = self.get_plan(self.module)
+        self.assertEqual(data["assignment_progress"]["completed"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Assignment.objects.create(module=self.module, batch=self.batch, title="New", due_date=timezone.now(), order=5)
+        data, _ = self.get_plan(self.module)
+        self.assertEqual(data["assignment_count"], 2)
+
+    def test_plan_round_trips_through_the_json_cache_serializer(self):
+        live_class = self.module.live_classes.get(batch=self.batch)
+        LiveClassAttendance.objects.create(live_class=live_class, student=self.student, attended=True)
+        assignment = self.module.module_assignments.get()
+        AssignmentSubmission.objects.create(assignment=assignment, student=self.student, submission_text="Done")
+        quiz = self.module.module_quizzes.get(title="Quiz 0")
+        QuizAttempt.objects.create(quiz=quiz, student=self.student, status="submitted", marks_obtained=8)
+
+        plan = build_study_plan(self.student.id, self.course.id)
+        serializer = JSONSerializer()
+        loaded = StudyPlan.from_cache(serializer.loads(serializer.dumps(plan.to_cache())))
+
+        self.assertEqual(loaded.batch_ids, [str(self.batch.id)])
+        self.assertEqual(loaded.module(self.module.id), plan.module(self.module.id))
+        self.assertTrue(loaded.attended(live_class.id))
+        self.assertEqual(loaded.submission(assignment.id).status, "submitted")
+        self.assertEqual(loaded.attempts(quiz.id), (1, 8.0))
+        self.assertEqual(loaded.question_count(quiz.id), 1)
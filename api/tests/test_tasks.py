@@ -0,0 +1,110 @@
+"""Tests for the outbox task queue and queued email delivery."""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from api.models.models_tasks import OutboxTask
+from api.tests.helpers import run_worker
+from api.utils.email_utils import send_system_email
+from api.utils.tasks import claim_tasks, enqueue, run_task, task
+
+CALLS = []
+
+
+@task
+def flaky(fail_times=0):
+    CALLS.append(fail_times)
+    if len(CALLS) <= fail_times:
+        raise RuntimeError("temporary failure")
+
+
+@override_settings(TASKS_EAGER=False, EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class OutboxTaskTests(TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_email_is_queued_then_delivered_by_worker(self):
+        send_system_email(subject="Hello", message="Body", recipient_list=["student@example.com"])
+
+        self.assertEqual(len(mail.outbox), 0)
+        queued = OutboxTask.objects.get()
+        self.assertEqual(queued.status, OutboxTask.Status.PENDING)
+
+        run_worker()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, "Hello")
+        self.assertEqual(mail.outbox[0].to, ["student@example.com"])
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, OutboxTask.Status.DONE)
+
+    def test_failed_task_is_retried_with_backoff(self):
+        queued = enqueue(flaky, fail_times=1)
+
+        run_worker()
+
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, OutboxTask.Status.PENDING)
+        self.assertEqual(queued.attempts, 1)
+        self.assertGreater(queued.run_after, timezone.now())
+        self.assertIn("temporary failure", queued.last_error)
+
+        OutboxTask.objects.filter(pk=queued.pk).update(run_after=timezone.now())
+        run_worker()
+
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, OutboxTask.Status.DONE)
+        self.assertEqual(queued.attempts, 2)
+
+    def test_task_is_dead_lettered_after_max_attempts(self):
+        queued = enqueue(flaky, max_attempts=2, fail_times=5)
+
+        for _ in range(2):
+            OutboxTask.objects.filter(pk=queued.pk).update(run_after=timezone.now())
+            run_worker()
+
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, OutboxTask.Status.DEAD)
+        self.assertEqual(len(CALLS), 2)
+
+        call_command("run_tasks", "--requeue-dead", stdout=StringIO())
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, OutboxTask.Status.PENDING)
+        self.assertEqual(queued.attempts, 0)
+
+    def test_claimed_task_is_not_claimed_twice(self):
+        enqueue(flaky)
+
+        self.assertEqual(len(claim_tasks(10)), 1)
+        self.assertEqual(claim_tasks(10), [])
+
+    def test_expired_lease_is_reclaimed(self):
+        queued = enqueue(flaky)
+        claimed = claim_tasks(10)
+        OutboxTask.objects.filter(pk=queued.pk).update(locked_at=timezone.now() - timedelta(hours=1))
+
+        reclaimed = claim_tasks(10, lease=60)
+
+        self.assertEqual([t.pk for t in reclaimed], [queued.pk])
+        # The original worker's late result is discarded
+        run_task(claimed[0])
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, OutboxTask.Status.RUNNING)
+
+    def test_unregistered_function_cannot_be_queued(self):
+        with self.assertRaises(ValueError):
+            enqueue(print, value="x")
+
+
+@override_settings(TASKS_EAGER=True, EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class EagerTaskTests(TestCase):
+    def test_eager_mode_sends_inline(self):
+        send_system_email(subject="Inline", message="Body", recipient_list=["student@example.com"])
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(OutboxTask.objects.exists())
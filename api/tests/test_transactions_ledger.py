@@ -0,0 +1,113 @@
+"""Tests for the combined income/expense transactions ledger (UNION ALL + keyset pagination)."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+
+from api.models.models_accounting import (
+    Expense,
+    ExpensePaymentMethod,
+    ExpenseType,
+    Income,
+    IncomeType,
+    PaymentMethod,
+)
+from api.models.models_auth import CustomUser
+from api.utils.pagination import encode_cursor
+
+URL = "/api/accounting/transactions/"
+
+
+class TransactionsLedgerTests(TestCase):
+    def setUp(self):
+        admin = CustomUser.objects.create_user(
+            email="ledger-admin@example.com",
+            password="LedgerPass1!",
+            first_name="Ledger",
+            last_name="Admin",
+            phone="01743000001",
+            role=CustomUser.Role.ADMIN,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+        income_type = IncomeType.objects.create(code="course-fee", name="Course Fee", prefix="CF")
+        method = PaymentMethod.objects.create(code="cash", name="Cash")
+        expense_type = ExpenseType.objects.create(code="rent", name="Rent")
+        expense_method = ExpensePaymentMethod.objects.create(code="bank", name="Bank")
+
+        today = date.today()
+        # Two rows per day on alternating sides, so pages cross both tables and share dates
+        for n in range(5):
+            day = today - timedelta(days=n)
+            Income.objects.create(
+                income_type=income_type,
+                payment_method=method,
+                description=f"Fee {n}",
+                amount=Decimal("100.00") + n,
+                date=day,
+                payer_name=f"Payer {n}",
+            )
+            Expense.objects.create(
+                expense_type=expense_type,
+                payment_method=expense_method,
+                description=f"Rent {n}",
+                amount=Decimal("40.00") + n,
+                date=day,
+                vendor_name=f"Vendor {n}",
+            )
+
+    def expected(self):
+        rows = [(i.date, i.transaction_id, float(i.amount)) for i in Income.objects.all()]
+        rows += [(e.date, e.reference_id, -float(e.amount)) for e in Expense.objects.all()]
+        return sorted(rows, reverse=True)
+
+    def test_cursor_pages_walk_the_whole_ledger_in_order(self):
+        seen, cursor = [], None
+        while True:
+            params = {"page_size": 3, **({"cursor": cursor} if cursor else {})}
+            data = self.client.get(URL, params).data["data"]
+            self.assertEqual(data["count"], 10)
+            seen += [(date.fromisoformat(str(r["date"])), r["id"], r["amount"]) for r in data["results"]]
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+        self.assertEqual(seen, self.expected())
+
+    def test_page_number_mode_and_type_filter(self):
+        data = self.client.get(URL, {"page": 2, "page_size": 4}).data["data"]
+        self.assertEqual([r["id"] for r in data["results"]], [row[1] for row in self.expected()[4:8]])
+
+        expenses = self.client.get(URL, {"type": "expense"}).data["data"]
+        self.assertEqual(expenses["count"], 5)
+        self.assertTrue(all(r["type"] == "Expense" and r["amount"] < 0 for r in expenses["results"]))
+
+    def test_page_is_one_union_query_plus_one_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(URL, {"page_size": 3})
+        self.assertEqual(response.status_code, 200)
+        ledger = [q["sql"] for q in queries.captured_queries if '"api_income"' in q["sql"]]
+        self.assertEqual(len(ledger), 2)
+        self.assertTrue(all("UNION ALL" in sql for sql in ledger))
+        self.assertIn("LIMIT 4", ledger[1])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(URL, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+        # Well-formed cursors holding values that are not a (date, id) position
+        for values in (["x", "y"], ["2025-02-30", "PRIME-1"], ["2025-01-01", 5]):
+            response = self.client.get(URL, {"cursor": encode_cursor(values)})
+            self.assertEqual(response.status_code, 400, values)
+
+    def test_csv_export_streams_the_same_rows(self):
+        response = self.client.get(URL, {"export": "csv"})
+        self.assertTrue(response.streaming)
+        lines = b"".join(response.streaming_content).decode().strip().splitlines()
+        self.assertEqual(len(lines), 11)
+        self.assertEqual(lines[1].split(",")[0], self.expected()[0][1])
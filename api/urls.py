@@ -106,6 +106,7 @@ from api.views.views_payment import (
     verify_payment,
 )
 from api.views.views_policy import PolicyPageViewSet
+from api.views.views_reports import ReportJobCreateView, ReportJobDetailView, ReportJobDownloadView
 from api.views.views_seo import PageSEOViewSet
 from api.views.views_service import ContentSectionViewSet, PageServiceViewSet
 
@@ -421,6 +422,10 @@ urlpatterns = router.urls + [
     # Student exports
     path("export/students/csv/", export_students_csv, name="export-students-csv"),
     path("export/students/pdf/", export_students_pdf, name="export-students-pdf"),
+    # Background report jobs (heavy PDFs rendered by `manage.py run_report_jobs`)
+    path("reports/", ReportJobCreateView.as_view(), name="report-job-create"),
+    path("reports/<uuid:job_id>/", ReportJobDetailView.as_view(), name="report-job-detail"),
+    path("reports/<uuid:job_id>/download/", ReportJobDownloadView.as_view(), name="report-job-download"),
     # Employee exports
     # path("export/employees/csv/", export_employees_csv, name="export-employees-csv"),
     # path("export/employees/pdf/", export_employees_pdf, name="export-employees-pdf"),
@@ -0,0 +1,143 @@
+"""Monthly revenue/expense totals for the accounting dashboard.
+
+Revenue is approved, completed income; expenses are paid expenses. Totals
+of closed months (before the current one) are stored in ``PeriodSummary``
+the first time they are read and served from there afterwards. Open months
+are computed live with one ``TruncMonth`` grouped query per table, so a
+dashboard request costs a handful of queries instead of one per month.
+
+A stored month is invalidated when an income or expense dated in it
+(before or after the change) is saved or deleted -- in practice an approved
+``IncomeUpdateRequest`` / ``ExpenseUpdateRequest`` or an admin edit. The row
+is kept as a stale marker with a bumped ``version`` rather than deleted, so a
+reader that computed the month before the change committed can neither
+insert nor overwrite it with the old totals. Stored totals are also
+recomputed after ``RECOMPUTE_AFTER`` as a backstop for changes that bypass
+the model signals.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db.models import F, Max, Min, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+ZERO = Decimal("0.00")
+RECOMPUTE_AFTER = timedelta(days=30)
+
+REVENUE_FILTER = Q(status="completed", approval_status="approved")
+EXPENSE_FILTER = Q(status="paid")
+
+
+def _next_month(start):
+    return date(start.year + start.month // 12, start.month % 12 + 1, 1)
+
+
+def _is_closed(start):
+    return start < timezone.localdate().replace(day=1)
+
+
+def _month_spans(months):
+    """Merge sorted month starts into ``[start, end)`` date ranges of consecutive months."""
+    spans = []
+    for start in months:
+        if spans and spans[-1][1] == start:
+            spans[-1][1] = _next_month(start)
+        else:
+            spans.append([start, _next_month(start)])
+    return spans
+
+
+def _grouped_totals(model, condition, months):
+    spans = _month_spans(months)
+    in_spans = Q()
+    for start, end in spans:
+        in_spans |= Q(date__gte=start, date__lt=end)
+    rows = (
+        model.objects.filter(condition, in_spans)
+        .annotate(month=TruncMonth("date"))
+        .values("month")
+        .annotate(total=Sum("amount"))
+        .order_by()
+    )
+    return {row["month"]: row["total"] for row in rows}
+
+
+def compute_months(months):
+    """``{month_start: (revenue, expenses)}`` for ``months`` straight from the base tables (two queries)."""
+    from api.models.models_accounting import Expense, Income
+
+    months = sorted(set(months))
+    if not months:
+        return {}
+    revenue = _grouped_totals(Income, REVENUE_FILTER, months)
+    expenses = _grouped_totals(Expense, EXPENSE_FILTER, months)
+    return {month: (revenue.get(month) or ZERO, expenses.get(month) or ZERO) for month in months}
+
+
+def recorded_years():
+    """Years from the earliest to the latest dated income or expense (empty when there are none)."""
+    from api.models.models_accounting import Expense, Income
+
+    bounds = [
+        model.objects.aggregate(first=Min("date__year"), last=Max("date__year")) for model in (Income, Expense)
+    ]
+    firsts = [b["first"] for b in bounds if b["first"] is not None]
+    lasts = [b["last"] for b in bounds if b["last"] is not None]
+    return set(range(min(firsts), max(lasts) + 1)) if firsts else set()
+
+
+def monthly_totals(years):
+    """``{month_start: (revenue, expenses)}`` for every month of ``years``.
+
+    Closed months come from ``PeriodSummary`` (and are stored there when
+    missing or stale); the remaining months are computed in one pass.
+    """
+    from api.models.models_accounting import PeriodSummary
+
+    now = timezone.now()
+    months = [date(year, month, 1) for year in sorted(set(years)) for month in range(1, 13)]
+    summaries = {
+        date(s.year, s.month, 1): s for s in PeriodSummary.objects.filter(year__in={m.year for m in months})
+    }
+    stored = {
+        m: (s.revenue, s.expenses)
+        for m, s in summaries.items()
+        if _is_closed(m) and not s.is_stale and s.computed_at > now - RECOMPUTE_AFTER
+    }
+    live = compute_months(m for m in months if m not in stored)
+
+    closed = {m: totals for m, totals in live.items() if _is_closed(m)}
+    PeriodSummary.objects.bulk_create(
+        [
+            PeriodSummary(year=m.year, month=m.month, revenue=revenue, expenses=expenses)
+            for m, (revenue, expenses) in closed.items()
+            if m not in summaries
+        ],
+        ignore_conflicts=True,
+    )
+    for m, (revenue, expenses) in closed.items():
+        if m in summaries:
+            # Only if no invalidation landed since the row was read
+            PeriodSummary.objects.filter(pk=summaries[m].pk, version=summaries[m].version).update(
+                revenue=revenue, expenses=expenses, is_stale=False, computed_at=now
+            )
+    return {m: stored.get(m) or live[m] for m in months}
+
+
+def invalidate_periods(*days):
+    """Mark stored totals for the closed months containing ``days`` stale (``None`` entries are ignored)."""
+    from api.models.models_accounting import PeriodSummary
+
+    closed = {(day.year, day.month) for day in days if day and _is_closed(day.replace(day=1))}
+    if not closed:
+        return
+    # Marker rows first, so a reader that computed the month earlier cannot insert it afterwards
+    PeriodSummary.objects.bulk_create(
+        [PeriodSummary(year=year, month=month, is_stale=True) for year, month in closed], ignore_conflicts=True
+    )
+    condition = Q()
+    for year, month in closed:
+        condition |= Q(year=year, month=month)
+    PeriodSummary.objects.filter(condition).update(is_stale=True, version=F("version") + 1)
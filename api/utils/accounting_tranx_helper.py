@@ -1,12 +1,13 @@
 from datetime import date, timedelta
 from django.utils import timezone
-import csv
+from django.utils.dateparse import parse_date
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.platypus import (
     SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 )
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
+from django.db.models import CharField, F, Q, Value
 from django.http import HttpResponse
 from reportlab.platypus import Image
 from django.conf import settings
@@ -16,6 +17,10 @@ from io import BytesIO
 from reportlab.platypus import Paragraph
 from reportlab.lib.styles import ParagraphStyle
 
+from api.models.models_accounting import Expense, Income
+from api.utils.export_utils import CSVExporter
+from api.utils.pagination import decode_cursor
+
 cell_style = ParagraphStyle(
     name="Cell",
     fontSize=9,
@@ -56,24 +61,158 @@ def resolve_date_range(range_key):
     return start, end
 
 
+# Columns of the combined ledger; both sides of the UNION project them in this order
+LEDGER_FIELDS = (
+    "tx_date",
+    "tx_id",
+    "tx_description",
+    "tx_category",
+    "tx_reference",
+    "tx_type",
+    "tx_status",
+    "tx_amount",
+)
+
+# Ledger order, newest first. Income IDs (PRIME-...) and expense IDs (EXP-...)
+# never collide, so (date, id) identifies a row and works as a keyset.
+LEDGER_ORDERING = ("-tx_date", "-tx_id")
+
+
+def _ledger_side(queryset, id_field, category_field, reference_field, label, amount, after):
+    if after:
+        day, tx_id = after
+        queryset = queryset.filter(Q(date__lt=day) | Q(date=day, **{f"{id_field}__lt": tx_id}))
+    return (
+        queryset.order_by()
+        .annotate(
+            tx_date=F("date"),
+            tx_id=F(id_field),
+            tx_description=F("description"),
+            tx_category=F(category_field),
+            tx_reference=F(reference_field),
+            tx_type=Value(label, output_field=CharField()),
+            tx_status=F("status"),
+            tx_amount=amount,
+        )
+        .values(*LEDGER_FIELDS)
+    )
+
+
+def transactions_queryset(params, after=None):
+    """The filtered ledger as one ``UNION ALL`` query of value rows, newest first.
+
+    ``params`` is a mapping with the TransactionsAPIView query parameters:
+    search, type, status, range, date_from and date_to. ``after`` is an
+    optional ``(date, id)`` keyset position; only older rows are returned.
+    """
+    search = params.get("search")
+    tx_type = params.get("type")
+    status = params.get("status")
+    range_key = params.get("range")
+
+    date_from = params.get("date_from")
+    date_to = params.get("date_to")
+
+    start, end = resolve_date_range(range_key)
+
+    incomes = Income.objects.all()
+    expenses = Expense.objects.all()
+
+    # --------------------
+    # Filters
+    # --------------------
+    if status:
+        incomes = incomes.filter(status=status)
+        expenses = expenses.filter(status=status)
+
+    if start and end:
+        incomes = incomes.filter(date__range=(start, end))
+        expenses = expenses.filter(date__range=(start, end))
+
+    if date_from and date_to:
+        incomes = incomes.filter(date__range=(date_from, date_to))
+        expenses = expenses.filter(date__range=(date_from, date_to))
+
+    if search:
+        incomes = incomes.filter(
+            Q(transaction_id__icontains=search) |
+            Q(description__icontains=search) |
+            Q(payer_name__icontains=search)
+        )
+        expenses = expenses.filter(
+            Q(reference_id__icontains=search) |
+            Q(description__icontains=search) |
+            Q(vendor_name__icontains=search)
+        )
+
+    sides = []
+
+    if tx_type in (None, "income"):
+        sides.append(
+            _ledger_side(incomes, "transaction_id", "income_type__name", "payer_name", "Income", F("amount"), after)
+        )
+
+    if tx_type in (None, "expense"):
+        sides.append(
+            _ledger_side(expenses, "reference_id", "expense_type__name", "vendor_name", "Expense", -F("amount"), after)
+        )
+
+    if not sides:
+        return Income.objects.none().values(*LEDGER_FIELDS)
+
+    ledger = sides[0].union(*sides[1:], all=True) if len(sides) > 1 else sides[0]
+    return ledger.order_by(*LEDGER_ORDERING)
+
+
+def ledger_row(values):
+    """Turn one ledger value row into the report/API row dict."""
+    return {
+        "id": values["tx_id"],
+        "description": values["tx_description"],
+        "category": values["tx_category"],
+        "reference": values["tx_reference"],
+        "date": values["tx_date"],
+        "type": values["tx_type"],
+        "status": values["tx_status"],
+        "amount": float(values["tx_amount"]),
+    }
+
+
+def ledger_cursor(values):
+    """Keyset position of a ledger value row, for ``transactions_queryset(after=...)``."""
+    return [values["tx_date"], values["tx_id"]]
+
+
+def parse_ledger_cursor(cursor):
+    """Decode a cursor made from ``ledger_cursor`` into ``(date, id)``; raises ValueError if invalid."""
+    day, tx_id = decode_cursor(cursor, 2)
+    if not isinstance(day, str) or not isinstance(tx_id, str):
+        raise ValueError("Invalid cursor")
+    day = parse_date(day)  # None when malformed, ValueError when not a real date
+    if day is None:
+        raise ValueError("Invalid cursor")
+    return day, tx_id
+
+
+def build_transaction_rows(params, chunk_size=2000):
+    """Iterate merged income/expense rows (newest first) for the transactions report.
+
+    Rows are streamed from the database in chunks, so exports of any size
+    use flat memory.
+    """
+    return (ledger_row(values) for values in transactions_queryset(params).iterator(chunk_size=chunk_size))
+
+
 # -------------------------
 # Export Functions for CSV
 # -------------------------
 
 def export_transactions_csv(rows):
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="transactions.csv"'
-
-    writer = csv.writer(response)
-    writer.writerow([
-        "Transaction ID", "Description", "Category",
-        "Reference", "Date", "Type", "Status", "Amount"
-    ])
-
-    for r in rows:
-        writer.writerow(r.values())
-
-    return response
+    return CSVExporter.stream_csv(
+        "transactions.csv",
+        ["Transaction ID", "Description", "Category", "Reference", "Date", "Type", "Status", "Amount"],
+        (r.values() for r in rows),
+    )
 
 
 # -------------------------
@@ -82,9 +221,14 @@ def export_transactions_csv(rows):
 def export_transactions_pdf(rows):
     response = HttpResponse(content_type="application/pdf")
     response["Content-Disposition"] = 'attachment; filename="transactions.pdf"'
+    render_transactions_pdf(rows, response)
+    return response
 
+
+def render_transactions_pdf(rows, output):
+    """Render the transactions report into ``output`` (a path or writable binary file)."""
     doc = SimpleDocTemplate(
-        response,
+        output,
         pagesize=landscape(A4),
         rightMargin=20,
         leftMargin=20,
@@ -99,7 +243,6 @@ def export_transactions_pdf(rows):
     # HEADER (LOGO + TITLE)
     # ======================================================
     logo_path = os.path.join(settings.STATIC_ROOT, "default_images/prime-academy-logo.png")
-    print(logo_path)
     header_table_data = []
 
     if os.path.exists(logo_path):
@@ -176,4 +319,3 @@ def export_transactions_pdf(rows):
     elements.append(table)
 
     doc.build(elements)
-    return response
@@ -0,0 +1,63 @@
+"""Pickle-free serializers for the Redis cache backend.
+
+Django's ``RedisCache`` pickles every value by default. These serializers
+store JSON instead (optionally zlib-compressed), so cached payloads are
+readable by any client and a poisoned cache entry can never execute code.
+
+Configure through the cache ``OPTIONS``::
+
+    "OPTIONS": {"serializer": "api.utils.cache_serializers.CompressedJSONSerializer"}
+"""
+
+import json
+import zlib
+
+from rest_framework.utils.encoders import JSONEncoder
+
+JSON_MARKER = b"j"
+ZLIB_MARKER = b"z"
+BYTES_MARKER = b"b"
+
+
+class JSONSerializer:
+    """Serialize cache values as JSON using DRF's encoder.
+
+    DRF's encoder is the same one the JSON renderer uses, so a value served
+    from the cache renders exactly like the freshly computed one (Decimal,
+    UUID, datetime and lazy strings included). Tuples come back as lists.
+    Top-level ``bytes`` values (pre-rendered responses) are stored as-is.
+    """
+
+    def dumps(self, obj):
+        # Keep plain integers raw so Redis INCR/DECR keep working on them
+        if type(obj) is int:
+            return obj
+        if isinstance(obj, (bytes, bytearray)):
+            return BYTES_MARKER + bytes(obj)
+        return JSON_MARKER + json.dumps(obj, cls=JSONEncoder, separators=(",", ":")).encode()
+
+    def loads(self, data):
+        try:
+            return int(data)
+        except ValueError:
+            pass
+        marker, payload = data[:1], data[1:]
+        if marker == BYTES_MARKER:
+            return payload
+        if marker == ZLIB_MARKER:
+            payload = zlib.decompress(payload)
+        return json.loads(payload)
+
+
+class CompressedJSONSerializer(JSONSerializer):
+    """JSON serializer that zlib-compresses payloads above a size threshold."""
+
+    min_compress_bytes = 1024
+    compress_level = 6
+
+    def dumps(self, obj):
+        data = super().dumps(obj)
+        # Raw bytes are usually pre-compressed already; leave them alone
+        if type(data) is int or data[:1] == BYTES_MARKER or len(data) < self.min_compress_bytes:
+            return data
+        return ZLIB_MARKER + zlib.compress(data[1:], self.compress_level)
@@ -5,18 +5,72 @@ Provides safe caching that:
 - Only caches public/anonymous requests
 - Automatically invalidates on model updates
 - Includes cache hit/miss headers for debugging
+
+Invalidation uses versioned namespaces: every key generated for a prefix
+embeds that prefix's current version number, and invalidating the prefix
+is a single atomic ``incr`` of the version. Old entries are never looked
+up again and simply expire, so this works on every cache backend
+(LocMem, Redis, Memcached, database) without key scans.
 """
 
+import gzip
 import hashlib
+import json
+import math
+import random
+import struct
+import threading
+import time
+from collections import Counter
 from functools import wraps
 
 from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
 from django.utils.encoding import force_str
+from django.utils.http import parse_http_date_safe
+
+from rest_framework.renderers import JSONRenderer
+
+from api.utils.conditional_utils import conditional_response, is_not_modified, make_etag, not_modified_response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+NAMESPACE_VERSION_KEY = "cache_ns:{prefix}"
+
+
+def _namespace_version_key(prefix):
+    return NAMESPACE_VERSION_KEY.format(prefix=prefix)
+
+
+def get_namespace_version(prefix):
+    """Return the current version number of a cache key namespace.
+
+    The version is seeded from the current timestamp so that a version key
+    evicted by the backend never falls back to a value that was already
+    used for entries that may still be alive.
+    """
+    return cache.get_or_set(_namespace_version_key(prefix), lambda: int(time.time()), timeout=None)
+
+
+def bump_namespace_version(prefix):
+    """Invalidate every key in a namespace by incrementing its version."""
+    key = _namespace_version_key(prefix)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Version key missing (never read or evicted): start a fresh one
+        version = int(time.time())
+        cache.set(key, version, timeout=None)
+        return version
 
 
 def generate_cache_key(prefix, *args, **kwargs):
-    """Generate a consistent cache key from arguments."""
-    key_parts = [prefix]
+    """Generate a consistent, namespace-versioned cache key from arguments."""
+    key_parts = [prefix, f"v{get_namespace_version(prefix)}"]
     key_parts.extend([force_str(arg) for arg in args])
     key_parts.extend([f"{k}={force_str(v)}" for k, v in sorted(kwargs.items())])
 
@@ -25,25 +79,220 @@ def generate_cache_key(prefix, *args, **kwargs):
     # Hash if key is too long
     if len(key_string) > 200:
         key_hash = hashlib.md5(key_string.encode()).hexdigest()
-        return f"{prefix}:{key_hash}"
+        return f"{key_parts[0]}:{key_parts[1]}:{key_hash}"
 
     return key_string
 
 
-def cache_response(timeout=300, key_prefix="view", cache_anonymous_only=True):
+# In-process counters for cache_response outcomes. They are flushed into the
+# shared cache periodically so `get_cache_stats()` sees every worker.
+CACHE_STATS_EVENTS = ("hit", "stale", "miss", "recompute", "lock_wait")
+CACHE_STATS_KEY = "cache_stats:{prefix}:{event}"
+CACHE_STATS_FLUSH_INTERVAL = 10  # seconds
+
+_stats_lock = threading.Lock()
+_pending_stats = Counter()
+_last_stats_flush = time.monotonic()
+
+
+def _record_cache_event(prefix, event):
+    global _last_stats_flush
+
+    with _stats_lock:
+        _pending_stats[(prefix, event)] += 1
+        if time.monotonic() - _last_stats_flush < CACHE_STATS_FLUSH_INTERVAL:
+            return
+        pending = dict(_pending_stats)
+        _pending_stats.clear()
+        _last_stats_flush = time.monotonic()
+
+    flush_cache_stats(pending)
+
+
+def flush_cache_stats(pending=None):
+    """Add buffered in-process cache_response counters to the shared counters."""
+    if pending is None:
+        with _stats_lock:
+            pending = dict(_pending_stats)
+            _pending_stats.clear()
+
+    for (prefix, event), count in pending.items():
+        key = CACHE_STATS_KEY.format(prefix=prefix, event=event)
+        try:
+            if not cache.add(key, count, timeout=None):
+                cache.incr(key, count)
+        except Exception:
+            # Stats are best-effort only
+            pass
+
+
+def get_cache_stats(*prefixes):
+    """Return ``{prefix: {event: count}}`` for the given cache_response prefixes."""
+    flush_cache_stats()
+    keys = {
+        CACHE_STATS_KEY.format(prefix=prefix, event=event): (prefix, event)
+        for prefix in prefixes
+        for event in CACHE_STATS_EVENTS
+    }
+    values = cache.get_many(list(keys))
+    stats = {prefix: dict.fromkeys(CACHE_STATS_EVENTS, 0) for prefix in prefixes}
+    for key, (prefix, event) in keys.items():
+        stats[prefix][event] = values.get(key, 0)
+    return stats
+
+
+def _should_refresh_early(entry, beta):
+    """Probabilistic early expiration ("XFetch").
+
+    Returns True with a probability that grows as the soft expiry approaches,
+    scaled by how long the value took to compute, so one request refreshes a
+    hot key shortly before it goes stale instead of many at the same moment.
+    """
+    if not beta:
+        return False
+    delta = entry.get("compute_time", 0) or 0.001
+    return time.time() - delta * beta * math.log(1.0 - random.random()) >= entry["fresh_until"]
+
+
+# ---------------------------------------------------------------------------
+# Rendered-bytes entries
+# ---------------------------------------------------------------------------
+# With ``render=True`` an entry holds the final JSON bytes (plus optional
+# gzip/brotli variants) instead of a Python dict, so a hit is returned
+# verbatim without re-running api_response and the JSON renderer. The entry
+# is packed into one bytes blob: a marker, a length-prefixed JSON header and
+# the concatenated bodies.
+
+RENDERED_ENTRY_MARKER = b"RC1"
+PRECOMPRESS_MIN_BYTES = 1024
+
+
+def _pack_rendered_entry(entry, bodies):
+    meta = {**entry, "parts": [[name, len(body)] for name, body in bodies.items()]}
+    header = json.dumps(meta, separators=(",", ":")).encode()
+    return RENDERED_ENTRY_MARKER + struct.pack(">I", len(header)) + header + b"".join(bodies.values())
+
+
+def _unpack_rendered_entry(blob):
+    offset = len(RENDERED_ENTRY_MARKER)
+    (header_len,) = struct.unpack_from(">I", blob, offset)
+    offset += 4
+    entry = json.loads(blob[offset : offset + header_len])
+    offset += header_len
+    bodies = {}
+    for name, length in entry.pop("parts"):
+        bodies[name] = blob[offset : offset + length]
+        offset += length
+    entry["bodies"] = bodies
+    return entry
+
+
+def _load_entry(raw):
+    """Return a cache_response entry dict from a raw cache value, or None."""
+    if isinstance(raw, (bytes, bytearray)) and raw.startswith(RENDERED_ENTRY_MARKER):
+        try:
+            return _unpack_rendered_entry(bytes(raw))
+        except (ValueError, struct.error):
+            return None
+    if isinstance(raw, dict) and "fresh_until" in raw:
+        return raw
+    return None
+
+
+def _compress_variants(body, precompress):
+    bodies = {"identity": body}
+    if not precompress or len(body) < PRECOMPRESS_MIN_BYTES:
+        return bodies
+    bodies["gzip"] = gzip.compress(body, compresslevel=6, mtime=0)
+    if brotli is not None:
+        bodies["br"] = brotli.compress(body)
+    return bodies
+
+
+def _accepted_encodings(request):
+    accepted = set()
+    for part in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        name, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+
+def _variant_etag(etag, encoding):
+    """Strong ETags must differ per content-coding: append it like Apache does."""
+    if not etag or not encoding or encoding == "identity":
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _rendered_response(request, entry):
+    """Build an HttpResponse straight from cached bytes (no rendering)."""
+    bodies = entry["bodies"]
+    accepted = _accepted_encodings(request)
+    encoding = next((name for name in ("br", "gzip") if name in bodies and name in accepted), None)
+
+    response = HttpResponse(
+        bodies[encoding or "identity"],
+        content_type=entry.get("content_type", "application/json"),
+        status=entry.get("status_code", 200),
+    )
+    if encoding:
+        response["Content-Encoding"] = encoding
+    if len(bodies) > 1:
+        patch_vary_headers(response, ["Accept-Encoding"])
+    return response
+
+
+def cache_response(
+    timeout=300,
+    key_prefix="view",
+    cache_anonymous_only=True,
+    stale_ttl=None,
+    lock_timeout=30,
+    early_expiration=0.0,
+    miss_wait=2.0,
+    render=False,
+    precompress=True,
+):
     """
     Cache decorator for DRF views with automatic invalidation.
 
+    Entries have a soft TTL (``timeout``) and a hard TTL (``timeout +
+    stale_ttl``). Once the soft TTL passes, the stale entry keeps being
+    served while exactly one worker, holding a short cache lock, recomputes
+    it. On a cold miss, concurrent requests wait briefly for the lock holder
+    instead of all running the view at once.
+
     Args:
-        timeout: Cache TTL in seconds (default: 5 minutes)
+        timeout: Soft cache TTL in seconds (default: 5 minutes)
         key_prefix: Prefix for cache key
         cache_anonymous_only: Only cache for anonymous users (default: True)
+        stale_ttl: Seconds a stale entry may still be served while it is
+            recomputed (default: same as ``timeout``; 0 disables)
+        lock_timeout: Lifetime of the recompute lock in seconds
+        early_expiration: Beta for probabilistic early recomputation
+            (0 disables; 1.0 is the usual setting)
+        miss_wait: Max seconds a cold miss waits for another worker's
+            recompute before computing itself
+        render: Store the final rendered JSON bytes and serve hits verbatim
+            (always ``application/json``, no browsable API)
+        precompress: With ``render``, also store gzip (and brotli, when
+            installed) variants and serve them per ``Accept-Encoding``
+
+    The ``X-Cache`` header reports HIT, STALE, MISS or REVALIDATED; counts
+    are available through ``get_cache_stats(key_prefix)``. Cached responses
+    carry a strong ``ETag`` of their payload and requests with a matching
+    ``If-None-Match`` get a 304 without a body. A ``Last-Modified`` header
+    set by the view is kept with the entry.
 
     Usage:
         @cache_response(timeout=600, key_prefix='course_list')
         def list(self, request):
             ...
     """
+    if stale_ttl is None:
+        stale_ttl = timeout
 
     def decorator(view_func):
         @wraps(view_func)
@@ -72,45 +321,119 @@ def cache_response(timeout=300, key_prefix="view", cache_anonymous_only=True):
             # Generate cache key from request
             query_params = sorted(request.GET.items())
             cache_key = generate_cache_key(key_prefix, request.path, *[f"{k}={v}" for k, v in query_params])
+            lock_key = f"{cache_key}:lock"
+
+            def build_response(entry):
+                if "bodies" in entry:
+                    return _rendered_response(request, entry)
 
-            # Try to get from cache
-            cached_data = cache.get(cache_key)
-            if cached_data is not None:
-                # Return cached response
                 from rest_framework import status
 
                 from api.utils.response_utils import api_response
 
-                response = api_response(
+                cached_data = entry["payload"]
+                return api_response(
                     cached_data["success"],
                     cached_data["message"],
                     cached_data["data"],
                     cached_data.get("status_code", status.HTTP_200_OK),
                 )
-                response["X-Cache"] = "HIT"
+
+            def finish(response, entry, state):
+                response = conditional_response(
+                    request,
+                    response,
+                    etag=_variant_etag(entry.get("etag"), response.get("Content-Encoding")),
+                    last_modified=entry.get("last_modified"),
+                )
+                response["X-Cache"] = state
                 response["X-Cache-Key"] = cache_key[:50]  # Truncate for header
                 return response
 
-            # Call the actual view
-            response = view_func(self, request, *args, **kwargs)
-
-            # Cache successful responses only
-            if hasattr(response, "data") and hasattr(response, "status_code") and response.status_code == 200:
-                cache_data = {
-                    "success": response.data.get("success", True),
-                    "message": response.data.get("message", ""),
-                    "data": response.data.get("data", {}),
-                    "status_code": response.status_code,
-                }
-                cache.set(cache_key, cache_data, timeout)
-                if hasattr(response, "__setitem__"):
-                    response["X-Cache"] = "MISS"
+            def cached_response(entry, state):
+                _record_cache_event(key_prefix, state.lower())
+                # The client may hold any content-coding of this entry
+                etags = [_variant_etag(entry.get("etag"), encoding) for encoding in entry.get("bodies", ["identity"])]
+                matched = next((etag for etag in etags if is_not_modified(request, etag)), None)
+                if matched:
+                    # Client already holds this payload: skip building a body
+                    response = not_modified_response(matched)
+                    response["X-Cache"] = state
                     response["X-Cache-Key"] = cache_key[:50]
-            else:
-                if hasattr(response, "__setitem__"):
-                    response["X-Cache"] = "SKIP-ERROR"
+                    return response
+                return finish(build_response(entry), entry, state)
+
+            def recompute(state, holds_lock=True):
+                started = time.time()
+                try:
+                    response = view_func(self, request, *args, **kwargs)
+                    compute_time = time.time() - started
+
+                    # Cache successful responses only
+                    if not (hasattr(response, "data") and hasattr(response, "status_code") and response.status_code == 200):
+                        if hasattr(response, "__setitem__"):
+                            response["X-Cache"] = "SKIP-ERROR"
+                        return response
+
+                    entry = {
+                        "fresh_until": time.time() + timeout,
+                        "compute_time": compute_time,
+                        "status_code": response.status_code,
+                        "last_modified": parse_http_date_safe(response.get("Last-Modified", "")),
+                    }
+                    if render:
+                        body = JSONRenderer().render(response.data)
+                        entry["etag"] = f'"{hashlib.sha1(body).hexdigest()}"'
+                        entry["content_type"] = JSONRenderer.media_type
+                        bodies = _compress_variants(body, precompress)
+                        cache.set(cache_key, _pack_rendered_entry(entry, bodies), timeout + stale_ttl)
+                        entry["bodies"] = bodies
+                    else:
+                        payload = {
+                            "success": response.data.get("success", True),
+                            "message": response.data.get("message", ""),
+                            "data": response.data.get("data", {}),
+                            "status_code": response.status_code,
+                        }
+                        entry["payload"] = payload
+                        entry["etag"] = make_etag(payload)
+                        cache.set(cache_key, entry, timeout + stale_ttl)
+                    _record_cache_event(key_prefix, "recompute")
+
+                    # Serve the miss from the entry too, so hits and misses
+                    # are byte-for-byte identical.
+                    return finish(build_response(entry) if render else response, entry, state)
+                finally:
+                    if holds_lock:
+                        cache.delete(lock_key)
 
-            return response
+            # Try to get from cache
+            entry = _load_entry(cache.get(cache_key))
+            if entry is not None:
+                is_fresh = time.time() < entry["fresh_until"]
+                if is_fresh and not _should_refresh_early(entry, early_expiration):
+                    return cached_response(entry, "HIT")
+
+                # Stale (or chosen for early refresh): one worker recomputes,
+                # everyone else keeps getting the cached copy.
+                if cache.add(lock_key, 1, lock_timeout):
+                    return recompute("REVALIDATED")
+                return cached_response(entry, "HIT" if is_fresh else "STALE")
+
+            # Cold miss: if another worker is already computing this key,
+            # wait for it briefly rather than stampeding the database.
+            _record_cache_event(key_prefix, "miss")
+            if not cache.add(lock_key, 1, lock_timeout):
+                _record_cache_event(key_prefix, "lock_wait")
+                deadline = time.monotonic() + miss_wait
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    entry = _load_entry(cache.get(cache_key))
+                    if entry is not None:
+                        return cached_response(entry, "HIT")
+                return recompute("MISS", holds_lock=False)
+
+            return recompute("MISS")
 
         return wrapper
 
@@ -119,28 +442,21 @@ def cache_response(timeout=300, key_prefix="view", cache_anonymous_only=True):
 
 def invalidate_cache_pattern(pattern):
     """
-    Invalidate all cache keys matching a pattern.
+    Invalidate all cache keys matching a prefix pattern.
 
     Args:
         pattern: Cache key pattern (e.g., 'course_list:*')
 
-    Note: Requires Redis backend for pattern matching.
-    For other backends, this will silently fail.
+    Only prefix patterns are supported: the namespace in front of the first
+    ``:`` is bumped, which makes every key generated for it unreachable.
     """
+    prefix = pattern.split(":", 1)[0].rstrip("*")
+    if not prefix:
+        return
     try:
-        from django.core.cache.backends.redis import RedisCache
-
-        if isinstance(cache, RedisCache):
-            # Redis supports pattern deletion
-            keys = cache.keys(pattern)
-            if keys:
-                cache.delete_many(keys)
-        else:
-            # For other backends, we need to track keys manually
-            # This is a fallback - not as efficient
-            pass
+        bump_namespace_version(prefix)
     except Exception:
-        # Silently fail - caching is not critical
+        # Caching is not critical; never break the write path over it
         pass
 
 
@@ -161,21 +477,27 @@ CACHE_KEY_BLOG_DETAIL = "blog_detail"
 CACHE_KEY_FAQ_LIST = "faq_list"
 CACHE_KEY_ACADEMY_OVERVIEW = "academy_overview"
 CACHE_KEY_MEGAMENU = "megamenu_nav"
+CACHE_KEY_QUIZ_PAPER = "quiz_paper"
+CACHE_KEY_STUDY_PLAN = "study_plan"
 
 
 def clear_course_caches():
     """Clear all course-related caches."""
     invalidate_cache_pattern(f"{CACHE_KEY_COURSE_LIST}:*")
     invalidate_cache_pattern(f"{CACHE_KEY_COURSE_DETAIL}:*")
-    cache.delete(CACHE_KEY_COURSE_FEATURED)
+    invalidate_cache_pattern(f"{CACHE_KEY_COURSE_FEATURED}:*")
     invalidate_cache_pattern(f"{CACHE_KEY_HOME_CATEGORIES}:*")
     cache.delete(CACHE_KEY_MEGAMENU)
 
 
 def clear_course_detail_cache(slug):
-    """Clear cache for specific course."""
-    cache_key = generate_cache_key(CACHE_KEY_COURSE_DETAIL, slug)
-    cache.delete(cache_key)
+    """Clear cache for specific course.
+
+    Detail entries are keyed by request path and query string, so a single
+    course cannot be addressed on its own; the whole detail namespace is
+    bumped instead (still a single ``incr``).
+    """
+    invalidate_cache_pattern(f"{CACHE_KEY_COURSE_DETAIL}:*")
 
 
 def clear_category_caches():
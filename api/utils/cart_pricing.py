@@ -0,0 +1,177 @@
+"""Single-pass cart pricing.
+
+``CartSerializer`` used to re-query ``cart.items`` for the total, the
+item count, the payment summary and the installment preview, and each
+item then lazily loaded its course pricing and batch. ``price_cart``
+loads the items with course, pricing and batch in one query, walks them
+once, and memoizes the result on the cart instance so every field of a
+response reads the same numbers. ``Cart.add_item``/``remove_item``/``clear``
+drop the memo.
+
+``unit_price`` is the per-course price used by both the cart and
+``OrderItemCreateSerializer``, so checkout validates against the same
+figure the cart showed.
+"""
+
+from decimal import Decimal
+
+ITEM_RELATIONS = ("course__pricing", "batch")
+
+
+def course_pricing(course):
+    """Return the course's ``CoursePrice`` or ``None`` (no query when select_related)."""
+    return getattr(course, "pricing", None)
+
+
+def unit_price(course):
+    """Price charged for one seat in ``course`` (discount applied)."""
+    pricing = course_pricing(course)
+    if pricing is None:
+        return Decimal("0.00")
+    return Decimal(str(pricing.get_discounted_price()))
+
+
+def _installment_preview(count, total):
+    per_installment = total / count
+    return {
+        "available": True,
+        "count": count,
+        "amount": float(per_installment),
+        "total": float(total),
+        "description": f"Pay in {count} installments of ৳{per_installment:,.2f}",
+    }
+
+
+class CartLine:
+    """Price and installment details for one cart item."""
+
+    __slots__ = ("item", "subtotal", "has_installment", "installment_preview")
+
+    def __init__(self, item):
+        self.item = item
+        self.subtotal = unit_price(item.course)
+        self.has_installment = False
+        self.installment_preview = None
+
+        batch = item.batch
+        if batch is None:
+            return
+
+        # Batch setting overrides course setting
+        pricing = course_pricing(item.course)
+        if batch.installment_available is not None:
+            if batch.installment_available and batch.installment_count:
+                self.has_installment = True
+                total = batch.custom_price or (pricing.get_discounted_price() if pricing else None)
+                if total:
+                    self.installment_preview = _installment_preview(batch.installment_count, total)
+        elif pricing and pricing.installment_available and pricing.installment_count:
+            self.has_installment = True
+            total = batch.custom_price or pricing.get_discounted_price()
+            self.installment_preview = _installment_preview(pricing.installment_count, total)
+
+    def batch_info(self):
+        batch = self.item.batch
+        if batch is None:
+            return None
+        return {
+            "id": str(batch.id),
+            "batch_number": batch.batch_number,
+            "batch_name": batch.batch_name,
+            "display_name": batch.get_display_name(),
+            "slug": batch.slug,
+            "start_date": batch.start_date,
+            "end_date": batch.end_date,
+            "has_installment": self.has_installment,
+            "installment_preview": self.installment_preview,
+        }
+
+
+class CartPricing:
+    """Totals, payment grouping and installment plan for a list of cart items."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.total = Decimal("0.00")
+        self.installment_items = []
+        self.full_payment_items = []
+
+        for item in self.items:
+            line = item.pricing_line = CartLine(item)
+            self.total += line.subtotal
+
+            item_data = {
+                "item_id": str(item.id),
+                "course_title": item.course.title,
+                "batch_name": item.batch.get_display_name() if item.batch else None,
+                "subtotal": float(line.subtotal),
+            }
+            if line.has_installment:
+                self.installment_items.append(item_data)
+            else:
+                self.full_payment_items.append(item_data)
+
+    @property
+    def item_count(self):
+        return len(self.items)
+
+    def payment_summary(self):
+        if not self.items:
+            return {
+                "has_mixed_payment_methods": False,
+                "installment_items": [],
+                "full_payment_items": [],
+                "can_checkout_together": True,
+            }
+
+        has_mixed = bool(self.installment_items) and bool(self.full_payment_items)
+        return {
+            "has_mixed_payment_methods": has_mixed,
+            "installment_items_count": len(self.installment_items),
+            "full_payment_items_count": len(self.full_payment_items),
+            "installment_items": self.installment_items,
+            "full_payment_items": self.full_payment_items,
+            "can_checkout_together": not has_mixed,
+            "message": (
+                "Your cart has courses with different payment methods. Please checkout one payment type at a time."
+                if has_mixed
+                else "All items can be checked out together."
+            ),
+        }
+
+    def installment_preview(self):
+        """Installment plan from the first item's course pricing (carts hold a single course)."""
+        if not self.items:
+            return None
+
+        pricing = course_pricing(self.items[0].course)
+        if pricing and pricing.installment_available and pricing.installment_count:
+            amount = pricing.get_installment_amount()
+            return {
+                "available": True,
+                "count": pricing.installment_count,
+                "amount": float(amount),
+                "total": float(pricing.get_discounted_price()),
+                "description": f"Pay in {pricing.installment_count} installments of ৳{amount:,.2f}",
+            }
+        return None
+
+
+def load_cart_items(cart):
+    """Cart items with course, pricing and batch joined in (one query)."""
+    items = cart.items
+    if isinstance(items, list):  # GuestCart already loaded them
+        return items
+    return items.select_related(*ITEM_RELATIONS)
+
+
+def price_cart(cart):
+    """Return the memoized ``CartPricing`` for ``cart``, computing it on first use."""
+    pricing = getattr(cart, "_pricing", None)
+    if pricing is None:
+        pricing = cart._pricing = CartPricing(load_cart_items(cart))
+    return pricing
+
+
+def invalidate_cart_pricing(cart):
+    cart.__dict__.pop("_pricing", None)
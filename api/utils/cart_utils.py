@@ -4,53 +4,55 @@ Cart utility functions for merging guest carts with user carts.
 
 from api.models.models_cart import Cart, CartItem
 from api.models.models_order import Enrollment
+from api.utils.guest_cart import GuestCart
 
 
-def merge_guest_cart_to_user(user, session_key):
+def merge_guest_cart_to_user(user, session_key, guest_items=None):
     """
-    Merge guest cart (session-based) with user's cart after login/registration.
+    Merge guest cart with user's cart after login/registration.
 
     This function:
-    1. Finds the guest cart by session_key
+    1. Collects guest items from the signed guest cart cookie and any legacy
+       session-based guest cart
     2. Gets or creates the user's cart
-    3. Transfers all items from guest cart to user cart (avoiding duplicates)
-    4. Deletes the guest cart
+    3. Transfers the first valid item to the user cart (avoiding enrolled courses)
+    4. Deletes the legacy guest cart
 
     Args:
         user: Authenticated user object
-        session_key: Session key from the request
+        session_key: Session key from the request (legacy DB guest carts)
+        guest_items: ``(course_id, batch_id)`` pairs from ``read_guest_cart_ids``
 
     Returns:
         tuple: (user_cart, items_merged_count)
     """
-    if not session_key:
-        # No session key, just get or create user cart
-        user_cart, _ = Cart.objects.get_or_create(user=user)
-        return user_cart, 0
-
-    try:
-        # Find guest cart
-        guest_cart = Cart.objects.get(session_key=session_key, user__isnull=True)
-    except Cart.DoesNotExist:
-        # No guest cart exists
-        user_cart, _ = Cart.objects.get_or_create(user=user)
-        return user_cart, 0
+    guest_cart = None
+    if session_key:
+        guest_cart = Cart.objects.filter(session_key=session_key, user__isnull=True).first()
 
     # Get or create user cart
     user_cart, _ = Cart.objects.get_or_create(user=user)
 
+    if guest_cart is None and not guest_items:
+        return user_cart, 0
+
+    candidates = GuestCart(guest_items or ()).items
+    if guest_cart is not None:
+        candidates += list(guest_cart.items.select_related("course", "batch"))
+
     # SINGLE COURSE RESTRICTION: Only merge the first valid item
     # Check if user cart already has items
     if user_cart.items.exists():
         # User cart already has items, don't merge any guest items
-        guest_cart.delete()
+        if guest_cart is not None:
+            guest_cart.delete()
         return user_cart, 0
 
     # Transfer items from guest cart to user cart
     items_merged = 0
     skipped_enrolled = 0
 
-    for guest_item in guest_cart.items.all():
+    for guest_item in candidates:
         # SINGLE COURSE RESTRICTION: Only allow merging ONE course
         if items_merged >= 1:
             break
@@ -72,6 +74,7 @@ def merge_guest_cart_to_user(user, session_key):
         items_merged += 1
 
     # Delete guest cart and its items
-    guest_cart.delete()
+    if guest_cart is not None:
+        guest_cart.delete()
 
     return user_cart, items_merged
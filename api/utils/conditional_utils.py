@@ -0,0 +1,79 @@
+"""HTTP conditional GET helpers (ETag / Last-Modified / 304).
+
+Used by the public catalog endpoints so clients and CDNs can revalidate a
+payload they already hold instead of downloading it again. ETags are
+strong validators derived from the response payload.
+"""
+
+import hashlib
+import json
+
+from django.http import HttpResponseNotModified
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def make_etag(payload):
+    """Return a quoted strong ETag for a JSON-serializable payload."""
+    canonical = json.dumps(payload, cls=JSONEncoder, sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha1(canonical.encode()).hexdigest()}"'
+
+
+def _patch_revalidation_headers(response):
+    # Shared caches may store the payload but must revalidate it; responses
+    # differ for authenticated users, so keep them apart.
+    patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+    patch_vary_headers(response, ["Authorization"])
+
+
+def conditional_response(request, response, etag=None, last_modified=None):
+    """Attach validators to a public response and answer 304 when they match.
+
+    Args:
+        request: The incoming request (If-None-Match / If-Modified-Since)
+        response: The full 200 response that would otherwise be sent
+        etag: Quoted ETag for the payload (see ``make_etag``)
+        last_modified: ``datetime`` (or epoch seconds) the payload was last changed
+
+    Returns the original response with ``ETag``/``Last-Modified`` and
+    revalidation headers set, or an ``HttpResponseNotModified``.
+    """
+    if request.method not in ("GET", "HEAD") or response.status_code != 200:
+        return response
+
+    timestamp = int(last_modified.timestamp()) if hasattr(last_modified, "timestamp") else last_modified
+    if etag:
+        response["ETag"] = etag
+    if timestamp is not None:
+        response["Last-Modified"] = http_date(timestamp)
+
+    _patch_revalidation_headers(response)
+
+    return get_conditional_response(request, etag=etag, last_modified=timestamp, response=response)
+
+
+def is_not_modified(request, etag):
+    """Cheap pre-check: True if the client already holds ``etag``.
+
+    Lets cache hits answer 304 before building a response body at all.
+    """
+    if not etag or request.method not in ("GET", "HEAD"):
+        return False
+    header = request.META.get("HTTP_IF_NONE_MATCH", "")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def not_modified_response(etag):
+    """Build a 304 for a client that already holds ``etag``."""
+    response = HttpResponseNotModified()
+    response["ETag"] = etag
+    _patch_revalidation_headers(response)
+    return response
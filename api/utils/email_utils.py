@@ -3,12 +3,16 @@
 
 Provides a thin wrapper around Django's email APIs to render templates
 and send multipart HTML/text messages used by registration and password flows.
+Messages are rendered in the request and delivered by the task worker
+(see ``api.utils.tasks``), so a slow SMTP server never blocks a request.
 """
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 
+from api.utils.tasks import enqueue, task
+
 
 def send_system_email(
     subject,
@@ -22,6 +26,9 @@ def send_system_email(
 ):
     """
     Generic utility to send emails with optional HTML + TXT templates.
+
+    Templates are rendered immediately; delivery is queued on the task
+    outbox (or happens inline when ``settings.TASKS_EAGER`` is set).
     """
     from_email = from_email or getattr(settings, "DEFAULT_FROM_EMAIL", "Prime Academy <no-reply@primeacademy.org>")
 
@@ -30,6 +37,20 @@ def send_system_email(
         message = render_to_string(f"{template_name}.txt", context)
         html_message = render_to_string(f"{template_name}.html", context)
 
+    enqueue(
+        deliver_email,
+        subject=str(subject),
+        message=message,
+        recipient_list=list(recipient_list or []),
+        from_email=from_email,
+        fail_silently=fail_silently,
+        html_message=html_message,
+    )
+
+
+@task
+def deliver_email(subject, message, recipient_list, from_email, fail_silently=False, html_message=None):
+    """Send an already rendered message over the configured email backend."""
     if html_message:
         email = EmailMultiAlternatives(subject, message, from_email, recipient_list)
         email.attach_alternative(html_message, "text/html")
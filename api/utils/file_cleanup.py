@@ -0,0 +1,121 @@
+"""Delete stored files when the model field pointing at them changes or the row goes away.
+
+The registry is built once in ``ApiConfig.ready``: every installed model is
+inspected a single time, and save/delete receivers are connected only for
+models that actually declare a ``FileField``/``ImageField``. Saves of other
+models (orders, enrollments, progress rows...) never reach this module.
+
+The file names an instance was loaded with are recorded by
+``FileTrackingModel.from_db`` (see ``api/utils/helper_models.py``), so
+detecting a replaced file costs no extra query. Physical deletion runs in
+``transaction.on_commit``: a rolled back save never loses the old file.
+"""
+
+import logging
+from functools import partial
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+logger = logging.getLogger(__name__)
+
+# model class -> tuple of file field names
+_FILE_FIELDS = {}
+
+
+def get_file_fields(model):
+    """Return the names of ``model``'s file fields (empty for unregistered models)."""
+    return _FILE_FIELDS.get(model, ())
+
+
+def _current_names(instance, field_names):
+    names = {}
+    for name in field_names:
+        value = getattr(instance, name)
+        names[name] = value.name if value else None
+    return names
+
+
+def original_file_names(instance):
+    """Return ``{field: stored file name}`` as last loaded from / saved to the database.
+
+    Uses the names recorded at load time; instances built by hand with an
+    existing pk fall back to a single query for the file columns.
+    """
+    loaded = getattr(instance, "_loaded_file_names", None)
+    if loaded is None:
+        field_names = get_file_fields(type(instance))
+        row = type(instance)._base_manager.filter(pk=instance.pk).values(*field_names).first() if field_names else None
+        loaded = {name: (row or {}).get(name) or None for name in field_names}
+        instance._loaded_file_names = loaded
+    return loaded
+
+
+def _delete_stored_files(files):
+    for storage, name in files:
+        try:
+            storage.delete(name)
+        except Exception:
+            logger.exception("Failed to delete file %s", name)
+
+
+def _collect_replaced_files(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance._state.adding:
+        return
+
+    field_names = get_file_fields(sender)
+    if update_fields is not None:
+        field_names = [name for name in field_names if name in update_fields]
+    if not field_names:
+        return
+
+    original = original_file_names(instance)
+    current = _current_names(instance, field_names)
+    replaced = [
+        (getattr(instance, name).storage, original[name])
+        for name in field_names
+        if original.get(name) and original[name] != current[name]
+    ]
+    if replaced:
+        instance._replaced_files = replaced
+
+
+def _delete_replaced_files(sender, instance, raw=False, using=None, update_fields=None, **kwargs):
+    replaced = instance.__dict__.pop("_replaced_files", None)
+    if replaced:
+        transaction.on_commit(partial(_delete_stored_files, replaced), using=using)
+    if raw:
+        return
+
+    # What is now in the database becomes the baseline for the next save
+    field_names = get_file_fields(sender)
+    if update_fields is not None:
+        field_names = [name for name in field_names if name in update_fields]
+    loaded = dict(getattr(instance, "_loaded_file_names", None) or {})
+    loaded.update(_current_names(instance, field_names))
+    instance._loaded_file_names = loaded
+
+
+def _delete_files_on_delete(sender, instance, using=None, **kwargs):
+    files = []
+    for name in get_file_fields(sender):
+        value = getattr(instance, name)
+        if value:
+            files.append((value.storage, value.name))
+    if files:
+        transaction.on_commit(partial(_delete_stored_files, files), using=using)
+
+
+def register_file_cleanup():
+    """Build the per-model registry and connect receivers for models with file fields."""
+    for model in apps.get_models():
+        field_names = tuple(f.name for f in model._meta.concrete_fields if isinstance(f, models.FileField))
+        if not field_names:
+            continue
+
+        _FILE_FIELDS[model] = field_names
+        uid = model._meta.label_lower
+        pre_save.connect(_collect_replaced_files, sender=model, dispatch_uid=f"file_cleanup_pre_save:{uid}")
+        post_save.connect(_delete_replaced_files, sender=model, dispatch_uid=f"file_cleanup_post_save:{uid}")
+        post_delete.connect(_delete_files_on_delete, sender=model, dispatch_uid=f"file_cleanup_post_delete:{uid}")
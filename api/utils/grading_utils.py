@@ -17,3 +17,85 @@ def apply_late_penalty(marks, penalty_percentage):
         (marks - penalty_amount).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
         Decimal('0.00')
     )
+
+
+def grade_quiz_submission(attempt, answers_data):
+    """Grade submitted quiz answers with a fixed number of queries.
+
+    Questions, options and the attempt's existing answers are loaded once;
+    scores are computed in memory, answers are written with one
+    ``bulk_create`` and one ``bulk_update``, and the selected-option rows
+    are replaced with one delete and one ``bulk_create`` on the through
+    table. Returns the total marks awarded.
+    """
+    from django.utils import timezone
+
+    from api.models.models_module import QuizAnswer, QuizQuestion, QuizQuestionOption
+
+    quiz = attempt.quiz
+    questions = {
+        str(q["id"]): q for q in QuizQuestion.objects.filter(quiz=quiz).values("id", "question_type", "is_active")
+    }
+    total_questions = sum(1 for q in questions.values() if q["is_active"])
+    marks_per_question = quiz.total_marks / total_questions if total_questions else 0
+
+    # Any option of the quiz may be selected; correctness compares against the question's own set
+    option_ids = {}
+    correct_ids = {}
+    for option_id, question_id, is_correct in QuizQuestionOption.objects.filter(question__quiz=quiz).values_list(
+        "id", "question_id", "is_correct"
+    ):
+        option_ids[str(option_id)] = option_id
+        if is_correct:
+            correct_ids.setdefault(question_id, set()).add(option_id)
+
+    # Last entry wins when a question is submitted twice
+    submitted = {}
+    for item in answers_data:
+        question = questions.get(str(item.get("question_id")))
+        if question:
+            submitted[question["id"]] = (question, item)
+
+    if not submitted:
+        return 0
+
+    existing = {a.question_id: a for a in QuizAnswer.objects.filter(attempt=attempt, question_id__in=submitted)}
+    now = timezone.now()
+    to_create, to_update, through_rows = [], [], []
+    Through = QuizAnswer.selected_options.through
+    total_marks = 0
+
+    for question_id, (question, item) in submitted.items():
+        quiz_answer = existing.get(question_id)
+        if quiz_answer is None:
+            quiz_answer = QuizAnswer(attempt=attempt, question_id=question_id)
+            to_create.append(quiz_answer)
+        else:
+            quiz_answer.updated_at = now
+            to_update.append(quiz_answer)
+
+        if question["question_type"] in ["mcq", "multiple"]:
+            selected_ids = item.get("selected_options", [])
+            if not isinstance(selected_ids, list):
+                selected_ids = [selected_ids]
+
+            chosen_ids = {option_ids[str(o)] for o in selected_ids if str(o) in option_ids}
+            through_rows.extend(
+                Through(quizanswer_id=quiz_answer.id, quizquestionoption_id=option_id) for option_id in chosen_ids
+            )
+
+            if correct_ids.get(question_id, set()) == chosen_ids:
+                quiz_answer.marks_awarded = marks_per_question
+                quiz_answer.is_correct = True
+                total_marks += marks_per_question
+            else:
+                quiz_answer.marks_awarded = 0
+                quiz_answer.is_correct = False
+
+    QuizAnswer.objects.bulk_create(to_create)
+    if to_update:
+        QuizAnswer.objects.bulk_update(to_update, ["is_correct", "marks_awarded", "updated_at"])
+        Through.objects.filter(quizanswer_id__in=[a.id for a in to_update]).delete()
+    Through.objects.bulk_create(through_rows)
+
+    return total_marks
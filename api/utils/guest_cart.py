@@ -0,0 +1,175 @@
+"""Cookie-backed carts for anonymous visitors.
+
+Guest carts used to be ``Cart`` rows keyed by a freshly saved session, so
+every anonymous ``GET /api/cart/`` wrote a session row and a cart row.
+A guest cart now lives only in a signed cookie holding ``course:batch``
+ID pairs. The first DB rows are written when the visitor logs in and
+``merge_guest_cart_to_user`` copies the pairs into the user's ``Cart``.
+
+``GuestCart`` offers the parts of the ``Cart`` interface the cart views
+and ``CartSerializer`` use (``items.all()``, ``get_total``, ``add_item``,
+...). Changes are written back with ``write(response)``.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core import signing
+
+from api.utils.cart_pricing import invalidate_cart_pricing, price_cart
+
+GUEST_CART_SALT = "api.guest_cart"
+
+
+def _cookie_name():
+    return getattr(settings, "GUEST_CART_COOKIE_NAME", "guest_cart")
+
+
+def _max_age():
+    return getattr(settings, "GUEST_CART_MAX_AGE", 30 * 24 * 3600)
+
+
+def read_guest_cart_ids(request):
+    """Return the ``[(course_id, batch_id_or_None), ...]`` pairs stored in the request's cookie."""
+    try:
+        raw = request.get_signed_cookie(_cookie_name(), default="", salt=GUEST_CART_SALT, max_age=_max_age())
+    except signing.BadSignature:
+        return []
+
+    pairs = []
+    for entry in raw.split("|") if raw else []:
+        course_id, _, batch_id = entry.partition(":")
+        try:
+            pairs.append((uuid.UUID(course_id), uuid.UUID(batch_id) if batch_id else None))
+        except ValueError:
+            continue
+    return pairs[: getattr(settings, "GUEST_CART_MAX_ITEMS", 10)]
+
+
+def delete_guest_cart_cookie(response):
+    response.delete_cookie(_cookie_name(), samesite=settings.SESSION_COOKIE_SAMESITE)
+
+
+class GuestCartItems(list):
+    """List of unsaved ``CartItem`` objects with the queryset methods the serializers call."""
+
+    def all(self):
+        return self
+
+    def exists(self):
+        return bool(self)
+
+    def first(self):
+        return self[0] if self else None
+
+    def count(self):
+        return len(self)
+
+
+class GuestCart:
+    """In-memory cart for an anonymous visitor, persisted in a signed cookie."""
+
+    id = None
+    user = None
+    session_key = None
+    created_at = None
+    updated_at = None
+
+    def __init__(self, pairs=()):
+        self.items = GuestCartItems()
+        self.changed = False
+        self._load(pairs)
+
+    @classmethod
+    def from_request(cls, request):
+        return cls(read_guest_cart_ids(request))
+
+    @staticmethod
+    def item_id(course_id, batch_id):
+        # Stable per course/batch so remove-by-item-id works across requests
+        return uuid.uuid5(uuid.NAMESPACE_URL, f"guest-cart:{course_id}:{batch_id or ''}")
+
+    def _make_item(self, course, batch):
+        from api.models.models_cart import CartItem
+
+        return CartItem(id=self.item_id(course.id, batch.id if batch else None), course=course, batch=batch)
+
+    def _load(self, pairs):
+        from api.models.models_course import Course, CourseBatch
+
+        if not pairs:
+            return
+        courses = Course.objects.filter(id__in={c for c, _ in pairs}, is_active=True).select_related("pricing")
+        courses = {course.id: course for course in courses}
+        batch_ids = {b for _, b in pairs if b}
+        batches = {batch.id: batch for batch in CourseBatch.objects.filter(id__in=batch_ids)} if batch_ids else {}
+
+        for course_id, batch_id in pairs:
+            course = courses.get(course_id)
+            if course is None or (batch_id and batch_id not in batches):
+                self.changed = True  # drop items whose course/batch disappeared
+                continue
+            self.items.append(self._make_item(course, batches.get(batch_id)))
+
+    # ----- Cart interface -----
+
+    def get_total(self):
+        return price_cart(self).total
+
+    def get_item_count(self):
+        return len(self.items)
+
+    @property
+    def priced_items(self):
+        return price_cart(self).items
+
+    def add_item(self, course, batch=None):
+        """Return ``(item, created)`` like ``CartItem.objects.get_or_create``."""
+        item_id = self.item_id(course.id, batch.id if batch else None)
+        for item in self.items:
+            if item.id == item_id:
+                return item, False
+        item = self._make_item(course, batch)
+        self.items.insert(0, item)
+        self.changed = True
+        invalidate_cart_pricing(self)
+        return item, True
+
+    def remove_item(self, item_id):
+        """Remove and return the item with ``item_id``, or ``None``."""
+        for item in self.items:
+            if str(item.id) == str(item_id):
+                self.items.remove(item)
+                self.changed = True
+                invalidate_cart_pricing(self)
+                return item
+        return None
+
+    def clear(self):
+        if self.items:
+            self.items.clear()
+            self.changed = True
+            invalidate_cart_pricing(self)
+
+    def pairs(self):
+        return [(item.course_id, item.batch_id) for item in self.items]
+
+    def write(self, response):
+        """Store the cart on ``response`` if it changed; an empty cart deletes the cookie."""
+        if not self.changed:
+            return response
+        if not self.items:
+            delete_guest_cart_cookie(response)
+            return response
+
+        value = "|".join(f"{course_id.hex}:{batch_id.hex if batch_id else ''}" for course_id, batch_id in self.pairs())
+        response.set_signed_cookie(
+            _cookie_name(),
+            value,
+            salt=GUEST_CART_SALT,
+            max_age=_max_age(),
+            httponly=True,
+            secure=settings.SESSION_COOKIE_SECURE,
+            samesite=settings.SESSION_COOKIE_SAMESITE,
+        )
+        return response
@@ -1,10 +1,14 @@
 """Small reusable model mixins and helpers.
 
-Contains a TimeStampedModel used across multiple app models.
+Contains a TimeStampedModel used across multiple app models,
+FileTrackingModel for models with file fields and FieldTrackingModel for
+models whose saves react to a field changing.
 """
 
 from django.db import models
 
+from api.utils.file_cleanup import get_file_fields
+
 
 class TimeStampedModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -12,3 +16,63 @@ class TimeStampedModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class FileTrackingModel(models.Model):
+    """Remember the stored file names an instance was loaded with.
+
+    ``api.utils.file_cleanup`` compares them on save to find replaced files
+    without re-reading the row.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        file_fields = get_file_fields(cls)
+        if file_fields:
+            loaded = dict(zip(field_names, values))
+            # Deferred file columns are left out and fetched on demand
+            if all(name in loaded for name in file_fields):
+                instance._loaded_file_names = {name: loaded[name] or None for name in file_fields}
+        return instance
+
+
+class FieldTrackingModel(models.Model):
+    """Remember the values of ``tracked_fields`` an instance was loaded with.
+
+    Signal receivers use ``loaded_value()`` to see what a save changed
+    without re-reading the row, and ``mark_loaded()`` once they have acted.
+    """
+
+    tracked_fields = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        instance._loaded_values = {name: loaded[name] for name in cls.tracked_fields if name in loaded}
+        return instance
+
+    def loaded_value(self, name, default=None):
+        return getattr(self, "_loaded_values", {}).get(name, default)
+
+    def tracked_changes(self):
+        """Names of tracked fields whose value differs from the loaded one."""
+        return [name for name in self.tracked_fields if self.loaded_value(name) != getattr(self, name)]
+
+    def mark_loaded(self):
+        self._loaded_values = {name: getattr(self, name) for name in self.tracked_fields}
+
+    def load_tracked_values(self):
+        """Read stored values for tracked fields the instance was loaded without (e.g. ``only()``)."""
+        loaded = getattr(self, "_loaded_values", {})
+        missing = [name for name in self.tracked_fields if name not in loaded]
+        if missing and not self._state.adding:
+            stored = type(self)._base_manager.filter(pk=self.pk).values(*missing).first() or {}
+            self._loaded_values = {**loaded, **stored}
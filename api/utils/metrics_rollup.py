@@ -0,0 +1,211 @@
+"""Maintain and read the ``DailyMetric`` rollup behind the admin dashboards.
+
+Each source row (a user, an enrollment, a completed order) contributes
+"facts" to the rollup: ``(metric, day, dimension, count, amount)`` tuples
+derived from its current state. Signals (see ``api.signals``) compare the
+facts of a row as loaded with its facts after a save or before a delete and
+apply the difference as atomic increments, so a save that changes nothing
+relevant writes nothing.
+
+``rebuild()`` (``manage.py backfill_daily_metrics``) recomputes the table
+from the base tables with a few grouped queries. It repairs drift from
+queryset ``update()`` calls and raw SQL, which bypass the signals.
+
+Readers use ``totals()``, ``breakdown()`` and ``series()``. Days are local
+calendar days (``TIME_ZONE``); a window starting at ``since`` covers the
+days after ``since``'s date up to and including today.
+"""
+
+import copy
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+
+from api.models.models_metrics import DailyMetric
+from api.utils.statistics import StatisticsBuilder
+
+Metric = DailyMetric.Metric
+
+# Matches the role filter the dashboards have always used for "teachers"
+TEACHER_ROLES = ("teacher", "staff")
+
+ZERO = Decimal("0.00")
+
+
+def _day(value):
+    return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+
+
+# ----- Facts per source row -----
+
+
+def user_facts(user):
+    if user.role == "student":
+        metric = Metric.STUDENTS
+    elif user.role in TEACHER_ROLES:
+        metric = Metric.TEACHERS
+    else:
+        return []
+    state = "enabled" if user.is_enabled else "disabled"
+    return [(metric, _day(user.date_joined), state, 1, ZERO)]
+
+
+def enrollment_facts(enrollment):
+    if not enrollment.is_active:
+        return []
+    return [(Metric.ENROLLMENTS, _day(enrollment.created_at), str(enrollment.course_id), 1, ZERO)]
+
+
+def order_facts(order):
+    if order.status != "completed":
+        return []
+    day = _day(order.created_at)
+    facts = [(Metric.REVENUE_BY_METHOD, day, order.payment_method or "", 1, order.total_amount or ZERO)]
+    items = order.items.values_list("course_id").annotate(revenue=Sum(F("price") - F("discount"))).order_by()
+    facts += [(Metric.REVENUE_BY_COURSE, day, str(course_id), 1, revenue or ZERO) for course_id, revenue in items]
+    return facts
+
+
+def previous_state(instance):
+    """A copy of ``instance`` with its tracked fields as they were loaded from the database."""
+    previous = copy.copy(instance)
+    for name, value in getattr(instance, "_loaded_values", {}).items():
+        setattr(previous, name, value)
+    return previous
+
+
+# ----- Writing -----
+
+
+def _add(metric, day, dimension, count, amount):
+    rows = DailyMetric.objects.filter(metric=metric, date=day, dimension=dimension)
+    changes = {"count": F("count") + count, "amount": F("amount") + amount}
+    if rows.update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            DailyMetric.objects.create(metric=metric, date=day, dimension=dimension, count=count, amount=amount)
+    except IntegrityError:
+        # Another request created the row first
+        rows.update(**changes)
+
+
+def apply_change(before, after):
+    """Move the rollup from the ``before`` facts to the ``after`` facts."""
+    net = defaultdict(lambda: [0, ZERO])
+    for sign, facts in ((-1, before), (1, after)):
+        for metric, day, dimension, count, amount in facts:
+            entry = net[(metric, day, dimension)]
+            entry[0] += sign * count
+            entry[1] += sign * amount
+    for (metric, day, dimension), (count, amount) in net.items():
+        if count or amount:
+            _add(metric, day, dimension, count, amount)
+
+
+def rebuild(since=None):
+    """Recompute the rollup (all days, or days from ``since``) with grouped queries; returns rows written."""
+    from api.models.models_auth import CustomUser
+    from api.models.models_order import Enrollment, Order, OrderItem
+
+    def by_day(queryset, field):
+        if since is not None:
+            queryset = queryset.filter(**{f"{field}__date__gte": since})
+        return queryset.annotate(day=TruncDate(field))
+
+    rows = []
+    users = by_day(CustomUser.objects.filter(role__in=("student", *TEACHER_ROLES)), "date_joined")
+    for day, role, is_enabled, n in users.values_list("day", "role", "is_enabled").annotate(n=Count("id")).order_by():
+        metric = Metric.STUDENTS if role == "student" else Metric.TEACHERS
+        rows.append(DailyMetric(date=day, metric=metric, dimension="enabled" if is_enabled else "disabled", count=n))
+
+    enrollments = by_day(Enrollment.objects.filter(is_active=True), "created_at")
+    for day, course_id, n in enrollments.values_list("day", "course_id").annotate(n=Count("id")).order_by():
+        rows.append(DailyMetric(date=day, metric=Metric.ENROLLMENTS, dimension=str(course_id), count=n))
+
+    orders = by_day(Order.objects.filter(status="completed"), "created_at")
+    for day, method, n, total in (
+        orders.values_list("day", "payment_method").annotate(n=Count("id"), total=Sum("total_amount")).order_by()
+    ):
+        rows.append(
+            DailyMetric(date=day, metric=Metric.REVENUE_BY_METHOD, dimension=method or "", count=n, amount=total or ZERO)
+        )
+
+    items = by_day(OrderItem.objects.filter(order__status="completed"), "order__created_at")
+    for day, course_id, n, total in (
+        items.values_list("day", "course_id")
+        .annotate(n=Count("order", distinct=True), total=Sum(F("price") - F("discount")))
+        .order_by()
+    ):
+        rows.append(
+            DailyMetric(date=day, metric=Metric.REVENUE_BY_COURSE, dimension=str(course_id), count=n, amount=total or ZERO)
+        )
+
+    with transaction.atomic():
+        stale = DailyMetric.objects.all()
+        if since is not None:
+            stale = stale.filter(date__gte=since)
+        stale.delete()
+        DailyMetric.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+# ----- Reading -----
+
+
+def window(since=None, until=None, dimension=None):
+    """Filter for the days after ``since`` up to ``until`` (datetimes), optionally one dimension."""
+    q = Q()
+    if since is not None:
+        q &= Q(date__gt=_day(since))
+    if until is not None:
+        q &= Q(date__lte=_day(until))
+    if dimension is not None:
+        q &= Q(dimension=dimension)
+    return q
+
+
+def totals(metric, **windows):
+    """Sum ``metric`` over each named ``window()`` in one query.
+
+    ``totals(Metric.STUDENTS, total=window(), new=window(since=start))``
+    returns ``{"total": {"count": ..., "amount": ...}, "new": {...}}``.
+    """
+    stats = StatisticsBuilder(DailyMetric.objects.filter(metric=metric))
+    for name, q in windows.items():
+        stats.sum(f"{name}_count", "count", q)
+        stats.sum(f"{name}_amount", "amount", q, default=ZERO)
+    row = stats.build()
+    return {name: {"count": row[f"{name}_count"], "amount": row[f"{name}_amount"]} for name in windows}
+
+
+def breakdown(metric, since=None, order_by="-total_count", limit=None):
+    """Per-dimension ``count``/``amount`` of ``metric`` since ``since``, largest first."""
+    rows = (
+        DailyMetric.objects.filter(window(since), metric=metric)
+        .values("dimension")
+        .annotate(total_count=Sum("count"), total_amount=Sum("amount"))
+        .exclude(total_count=0, total_amount=0)
+        .order_by(order_by, "dimension")
+    )
+    if limit is not None:
+        rows = rows[:limit]
+    return [{"dimension": row["dimension"], "count": row["total_count"], "amount": row["total_amount"]} for row in rows]
+
+
+def series(metric, since=None, period="day"):
+    """``count``/``amount`` of ``metric`` per day or per month since ``since``, oldest first."""
+    bucket = TruncMonth("date") if period == "month" else F("date")
+    rows = (
+        DailyMetric.objects.filter(window(since), metric=metric)
+        .annotate(period=bucket)
+        .values("period")
+        .annotate(total_count=Sum("count"), total_amount=Sum("amount"))
+        .exclude(total_count=0, total_amount=0)
+        .order_by("period")
+    )
+    return [{"period": row["period"], "count": row["total_count"], "amount": row["total_amount"]} for row in rows]
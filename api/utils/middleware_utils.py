@@ -12,19 +12,13 @@ These wrap the logic from the middleware so other parts of the app can reuse it.
 from typing import Optional, Tuple
 
 from django.conf import settings
-from django.contrib.auth import get_user_model
-from django.core.cache import caches
 
 try:
     from rest_framework_simplejwt.tokens import AccessToken
 except Exception:
     AccessToken = None
 
-CACHE_KEY_PREFIX = "middleware:user_status:"
-
-
-def _cache_key(user_id: str) -> str:
-    return f"{CACHE_KEY_PREFIX}{user_id}"
+from api.utils import user_status
 
 
 def get_user_status(user_id: str, ttl: Optional[int] = None) -> Tuple[bool, Optional[str]]:
@@ -33,47 +27,15 @@ def get_user_status(user_id: str, ttl: Optional[int] = None) -> Tuple[bool, Opti
     ok == True means user exists and is active and enabled.
     reason is 'not_found' or 'disabled' for negative results.
 
-    This function uses the Django cache (default) to cache negative results for ttl seconds.
+    Reads the shared user status registry (see ``api.utils.user_status``),
+    which is invalidated on every user save/delete; ``ttl`` is accepted for
+    backwards compatibility and ignored.
     """
-    if ttl is None:
-        ttl = getattr(settings, "API_MIDDLEWARE_USER_CACHE_TTL_SECONDS", 5)
-
-    cache = None
-    try:
-        cache = caches["default"]
-    except Exception:
-        cache = None
-
-    key = _cache_key(user_id)
-    if cache is not None:
-        try:
-            cached = cache.get(key)
-            if cached is not None:
-                return cached
-        except Exception:
-            pass
-
-    User = get_user_model()
-    try:
-        fresh = User.objects.get(pk=user_id)
-    except User.DoesNotExist:
-        result = (False, "not_found")
-        if cache is not None:
-            try:
-                cache.set(key, result, timeout=ttl)
-            except Exception:
-                pass
-        return result
-
-    if not getattr(fresh, "is_active", True) or not getattr(fresh, "is_enabled", True):
-        result = (False, "disabled")
-        if cache is not None:
-            try:
-                cache.set(key, result, timeout=ttl)
-            except Exception:
-                pass
-        return result
-
+    status = user_status.get_user_status(user_id)
+    if status is None:
+        return (False, "not_found")
+    if not status.is_active or not status.is_enabled:
+        return (False, "disabled")
     return (True, None)
 
 
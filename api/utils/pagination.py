@@ -1,11 +1,44 @@
 """Pagination helpers used across API views and viewsets.
 
-Defines a standard PageNumberPagination subclass and an optional mixin
-for reuse in GenericAPIView-based views.
+Defines a standard PageNumberPagination subclass, an opt-in keyset
+(seek) pagination class for large admin lists, an optional mixin for
+reuse in GenericAPIView-based views and opaque cursor encoding.
 """
 
+import base64
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from api.utils.cache_utils import generate_cache_key
+
+CACHE_KEY_LIST_COUNT = "list_count"
+
+
+def encode_cursor(values):
+    """Opaque, URL-safe cursor for a keyset position (a list of JSON-able values)."""
+    return base64.urlsafe_b64encode(json.dumps(values, cls=DjangoJSONEncoder).encode()).decode()
+
+
+def decode_cursor(cursor, size):
+    """Inverse of ``encode_cursor``; raises ValueError unless it holds ``size`` values."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError as exc:  # bad base64, bad UTF-8 and bad JSON are all ValueErrors
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
 
 
 # Standard Pagination for ViewSets and Generic Views
@@ -39,6 +72,135 @@ class StandardResultsSetPagination(PageNumberPagination):
         )
 
 
+def estimated_count(queryset, timeout=60):
+    """Row count of ``queryset`` without an exact ``COUNT(*)`` on every request.
+
+    On PostgreSQL this is the planner's row estimate (``EXPLAIN``), which
+    costs no scan. Elsewhere the exact count is cached for ``timeout``
+    seconds per distinct query.
+    """
+    queryset = queryset.order_by()
+    connection = connections[queryset.db]
+    sql, params = queryset.query.sql_with_params()
+
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    key = generate_cache_key(CACHE_KEY_LIST_COUNT, hashlib.md5(f"{sql}{params}".encode()).hexdigest())
+    return cache.get_or_set(key, queryset.count, timeout)
+
+
+class KeysetPagination(StandardResultsSetPagination):
+    """Opt-in keyset pagination for large lists, newest first.
+
+    Requests with ``?cursor=`` (empty for the first page) get seek pages
+    keyed on ``keyset_fields`` -- ``(created_at, id)`` unless the view sets
+    its own -- so deep pages cost the same as the first. ``count`` is an
+    estimate (see ``estimated_count``) and ``?count=false`` skips it.
+    Pages only go forward and ``?ordering`` is ignored in this mode.
+
+    Requests without ``?cursor`` get the usual numbered pages.
+    """
+
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    keyset_fields = ("created_at", "id")
+    count_cache_timeout = 60
+    page_number_fallback = True
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            if not self.page_number_fallback:
+                return None
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        fields = getattr(view, "keyset_fields", self.keyset_fields)
+        page_size = self.get_page_size(request)
+
+        with_count = request.query_params.get(self.count_query_param, "true").lower() not in ("false", "0", "no")
+        self.count = estimated_count(queryset, self.count_cache_timeout) if with_count else None
+
+        cursor = request.query_params[self.cursor_query_param]
+        if cursor:
+            queryset = queryset.filter(self.after(queryset.model, fields, cursor))
+
+        rows = list(queryset.order_by(*[f"-{field}" for field in fields])[: page_size + 1])
+        self.next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.next_cursor = encode_cursor([self.cursor_value(getattr(rows[-1], field)) for field in fields])
+        return rows
+
+    def after(self, model, fields, cursor):
+        """Condition selecting rows that come after the ``cursor`` position (descending order)."""
+        try:
+            values = decode_cursor(cursor, len(fields))
+            position = [model._meta.get_field(field).to_python(value) for field, value in zip(fields, values)]
+        except (DjangoValidationError, TypeError, ValueError):
+            raise ValidationError({self.cursor_query_param: "Invalid cursor"})
+
+        condition = Q()
+        for i, field in enumerate(fields):
+            condition |= Q(**dict(zip(fields[:i], position[:i])), **{f"{field}__lt": position[i]})
+        return condition
+
+    @staticmethod
+    def cursor_value(value):
+        # Full-precision ISO strings; DjangoJSONEncoder would cut datetimes to milliseconds
+        return value.isoformat() if hasattr(value, "isoformat") else value
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response(
+            {
+                "count": self.count,
+                "next": self.get_next_link(),
+                "previous": None,
+                "next_cursor": self.next_cursor,
+                "results": data,
+            }
+        )
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Keyset cursor from next_cursor; pass it empty for the first page.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "With a cursor, set to false to skip the estimated count.",
+                "schema": {"type": "boolean"},
+            },
+        ]
+
+
+class OptionalKeysetPagination(KeysetPagination):
+    """Keyset pages with ``?cursor=``; the full, unpaginated list otherwise."""
+
+    page_number_fallback = False
+
+
 # Generic Mixin for Pagination where use APIView or GenericAPIView
 class PaginatedListMixin:
     """
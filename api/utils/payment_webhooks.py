@@ -0,0 +1,179 @@
+"""SSLCommerz IPN inbox.
+
+The webhook endpoint calls ``record_webhook`` which inserts one
+``PaymentWebhookEvent`` per ``val_id`` and queues ``process_payment_webhook``
+on the task outbox, then returns immediately (with ``TASKS_EAGER`` the
+event is processed right after its insert commits). Repeated IPN deliveries
+for the same ``val_id`` are absorbed by the unique constraint.
+
+Processing validates the payment with the gateway *without* holding any
+row lock, then locks the order only for the short state transition and
+re-checks that nothing changed in between. A gateway network error raises
+``GatewayUnavailable`` so the outbox retries the task with backoff instead
+of failing the order.
+"""
+
+import logging
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from api.models.models_order import Order, PaymentWebhookEvent
+from api.utils.sslcommerz import SSLCommerzPayment
+from api.utils.tasks import enqueue, task
+
+logger = logging.getLogger(__name__)
+
+VALID_STATUSES = ("VALID", "VALIDATED")
+
+
+class GatewayUnavailable(Exception):
+    """The validation API could not be reached; the event should be retried."""
+
+
+def record_webhook(data):
+    """Store an IPN call and queue its processing. Returns ``(event, created)``."""
+    val_id = data.get("val_id")
+    fields = {
+        "tran_id": data.get("tran_id"),
+        "amount": str(data.get("amount")),
+        "gateway_status": data.get("status") or "",
+        "payload": {key: data.get(key) for key in data.keys()},
+    }
+
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                event = PaymentWebhookEvent.objects.create(val_id=val_id, **fields)
+        except IntegrityError:
+            # Duplicate delivery: the first insert already queued processing
+            return PaymentWebhookEvent.objects.get(val_id=val_id), False
+
+        def process():
+            enqueue(process_payment_webhook, event_id=str(event.pk))
+
+        if getattr(settings, "TASKS_EAGER", False):
+            # Inline processing calls the gateway: run it once the event is stored, so a
+            # gateway failure leaves the event RECEIVED (reprocessable) instead of rolling it back
+            transaction.on_commit(process, robust=True)
+        else:
+            # Same transaction as the insert: the event is never stored without its task
+            process()
+    return event, True
+
+
+def _finish(event, status, result, response=None):
+    event.status = status
+    event.result = result
+    event.validation_response = response or {}
+    event.processed_at = timezone.now()
+    event.save(update_fields=["status", "result", "validation_response", "processed_at", "updated_at"])
+    return event.status
+
+
+def _pending_installment(order):
+    return order.installment_payments.filter(status="pending").order_by("installment_number").first()
+
+
+@task
+def process_payment_webhook(event_id):
+    """Validate one inbox event with the gateway and apply it to its order."""
+    event = PaymentWebhookEvent.objects.get(pk=event_id)
+    if event.status != PaymentWebhookEvent.Status.RECEIVED:
+        return event.status
+
+    order = Order.objects.filter(order_number=event.tran_id).first()
+    if order is None:
+        return _finish(event, PaymentWebhookEvent.Status.IGNORED, "Order not found")
+
+    try:
+        amount = Decimal(event.amount)
+    except InvalidOperation:
+        return _finish(event, PaymentWebhookEvent.Status.IGNORED, "Malformed amount")
+
+    # ----- Unlocked pre-checks: cheap rejections before calling the gateway -----
+    if order.is_installment:
+        installment = _pending_installment(order)
+        if installment is None:
+            return _finish(event, PaymentWebhookEvent.Status.IGNORED, "All installments already processed")
+        expected_amount = installment.amount
+    else:
+        if order.status == "completed":
+            return _finish(event, PaymentWebhookEvent.Status.IGNORED, "Payment already processed")
+        expected_amount = order.total_amount
+
+    if amount != expected_amount:
+        return _finish(event, PaymentWebhookEvent.Status.IGNORED, "Amount mismatch")
+
+    # ----- Gateway call: no transaction, no row lock -----
+    is_valid, response = SSLCommerzPayment().validate_payment(event.val_id, expected_amount)
+    if not is_valid and "error" in response:
+        raise GatewayUnavailable(response["error"])
+    is_valid = is_valid and event.gateway_status in VALID_STATUSES
+
+    # ----- Short locked transition, re-checking state that may have moved -----
+    with transaction.atomic():
+        order = Order.objects.select_for_update().get(pk=order.pk)
+
+        if order.is_installment:
+            return _apply_installment(event, order, expected_amount, is_valid, response)
+        return _apply_full_payment(event, order, is_valid, response)
+
+
+def _apply_installment(event, order, expected_amount, is_valid, response):
+    if order.installment_payments.filter(payment_id=event.val_id).exists():
+        return _finish(event, PaymentWebhookEvent.Status.IGNORED, "Installment already paid", response)
+
+    installment = _pending_installment(order)
+    if installment is None or installment.amount != expected_amount:
+        return _finish(event, PaymentWebhookEvent.Status.IGNORED, "Installment changed during validation", response)
+
+    if not is_valid:
+        return _finish(event, PaymentWebhookEvent.Status.INVALID, "Invalid installment payment", response)
+
+    installment.mark_as_paid(
+        payment_id=event.val_id,
+        payment_method="ssl_commerce",
+        gateway_transaction_id=event.tran_id,
+    )
+
+    # Refresh fields updated via F()
+    order.refresh_from_db(fields=["installments_paid", "payment_status", "status"])
+
+    if order.installments_paid == 1:
+        order.ensure_enrollments_created()
+
+    if order.is_fully_paid():
+        order.payment_method = "ssl_commerce"
+        order.payment_id = event.val_id
+        order.completed_at = timezone.now()
+        order.save(update_fields=["payment_method", "payment_id", "completed_at"])
+        order.mark_as_completed()
+    else:
+        order.status = "processing"
+        order.payment_status = "partial"
+        order.save(update_fields=["status", "payment_status"])
+
+    return _finish(event, PaymentWebhookEvent.Status.PROCESSED, "Installment processed", response)
+
+
+def _apply_full_payment(event, order, is_valid, response):
+    if order.status == "completed":
+        return _finish(event, PaymentWebhookEvent.Status.IGNORED, "Payment already processed", response)
+
+    if not is_valid:
+        if order.status != "failed":
+            order.status = "failed"
+            order.payment_status = "failed"
+            order.save(update_fields=["status", "payment_status"])
+        return _finish(event, PaymentWebhookEvent.Status.INVALID, "Invalid payment", response)
+
+    order.payment_method = "ssl_commerce"
+    order.payment_id = event.val_id
+    order.completed_at = timezone.now()
+    order.save(update_fields=["payment_method", "payment_id", "completed_at"])
+    order.mark_as_completed()
+
+    return _finish(event, PaymentWebhookEvent.Status.PROCESSED, "Full payment completed", response)
@@ -0,0 +1,83 @@
+"""Compiled, cached quiz papers.
+
+Starting a quiz used to query the active questions, count them, and load
+options per question, with ``order_by("?")`` for randomized quizzes; a
+whole batch starting an exam together repeated all of it per student.
+
+``get_quiz_paper`` returns a compiled snapshot of a quiz's active
+questions and options, built with two queries and cached under a
+per-quiz versioned namespace. Edits to the quiz, its questions or their
+options bump that version (see ``api.cache_invalidation``), so a paper is
+never modified in place. Randomized quizzes are ordered per attempt in
+Python from ``QuizAttempt.question_seed``; a resumed attempt rebuilds the
+same order from the cached paper.
+"""
+
+import hashlib
+import random
+
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from api.utils.cache_utils import CACHE_KEY_QUIZ_PAPER, bump_namespace_version, generate_cache_key
+
+QUIZ_PAPER_TIMEOUT = 60 * 60 * 24
+
+
+def _namespace(quiz_id):
+    return f"{CACHE_KEY_QUIZ_PAPER}:{quiz_id}"
+
+
+def compile_quiz_paper(quiz):
+    """Build the paper for ``quiz``: questions in display order with their options."""
+    from api.models.models_module import QuizQuestionOption
+
+    questions = list(
+        quiz.questions.filter(is_active=True)
+        .order_by("order")
+        .prefetch_related(Prefetch("options", queryset=QuizQuestionOption.objects.order_by("order")))
+    )
+    marks_per_question = quiz.total_marks / len(questions) if questions else 0
+
+    paper = []
+    for q in questions:
+        data = {
+            "id": str(q.id),
+            "question_text": q.question_text,
+            "question_type": q.question_type,
+            "points": round(marks_per_question, 2),
+        }
+        if q.question_type in ["mcq", "multiple"]:
+            data["options"] = [{"id": str(o.id), "option_text": o.option_text} for o in q.options.all()]
+        paper.append(data)
+    return tuple(paper)
+
+
+def get_quiz_paper(quiz):
+    """Return the cached paper for ``quiz``, compiling it on a miss."""
+    key = generate_cache_key(_namespace(quiz.pk))
+    return cache.get_or_set(key, lambda: compile_quiz_paper(quiz), timeout=QUIZ_PAPER_TIMEOUT)
+
+
+def invalidate_quiz_paper(quiz_id):
+    try:
+        bump_namespace_version(_namespace(quiz_id))
+    except Exception:
+        # Caching is not critical; never break the write path over it
+        pass
+
+
+def new_question_seed():
+    return random.SystemRandom().randrange(1, 2**31)
+
+
+def order_questions(paper, seed):
+    """Questions of ``paper`` in the attempt's order.
+
+    Each question is ranked by a hash of ``seed`` and its ID, so the order
+    is reproducible from the seed alone and questions added later slot in
+    without reshuffling the rest.
+    """
+    if not seed:
+        return list(paper)
+    return sorted(paper, key=lambda q: hashlib.sha256(f"{seed}:{q['id']}".encode()).digest())
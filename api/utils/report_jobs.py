@@ -0,0 +1,228 @@
+"""Report job registry and execution.
+
+Each report type registers a renderer that writes a PDF into a file-like
+object. The synchronous export endpoints call the renderers directly; the
+report job endpoints queue a ``ReportJob`` that the ``run_report_jobs``
+worker renders to storage in a process pool, away from request workers.
+
+Requests with the same report type and parameters made within
+``REPORT_JOB_DEDUPE_SECONDS`` share one job instead of rendering again.
+"""
+
+import hashlib
+import json
+import logging
+import tempfile
+import traceback
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.platypus import Paragraph, Spacer
+
+from api.models.models_auth import CustomUser
+from api.models.models_reports import ReportJob
+from api.permissions import IsAdmin, IsAdminOrAccountant
+from api.utils.accounting_tranx_helper import build_transaction_rows, render_transactions_pdf
+from api.utils.date_utils import uk_report_title
+from api.utils.export_utils import PDFExporter
+
+logger = logging.getLogger(__name__)
+
+REPORT_JOB_DEDUPE_SECONDS = getattr(settings, "REPORT_JOB_DEDUPE_SECONDS", 300)
+REPORT_JOB_LEASE_SECONDS = getattr(settings, "REPORT_JOB_LEASE_SECONDS", 900)
+
+
+# ============================================================================
+# RENDERERS
+# ============================================================================
+
+
+def _parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+
+
+def render_students_pdf(params, output):
+    """Student list (landscape, branded, UK date style). Returns the download file name."""
+    queryset = (
+        CustomUser.objects.filter(role="student")
+        .annotate(enrolled_count=Count("enrollments"))
+        .order_by("-date_joined")
+    )
+
+    is_enabled = params.get("is_enabled")
+    if is_enabled is not None:
+        queryset = queryset.filter(is_enabled=is_enabled.lower() == "true")
+
+    title = uk_report_title(
+        base_title="Student List",
+        start_date=_parse_date(params.get("start_date")),
+        end_date=_parse_date(params.get("end_date")),
+    )
+    exporter = PDFExporter(title=title, pagesize=landscape(A4))
+
+    headers = ["ID", "Name", "Email", "Phone", "Courses", "Status", "Registered"]
+    data = [
+        [
+            student.student_id or "N/A",
+            student.get_full_name or "N/A",
+            student.email,
+            student.phone or "N/A",
+            student.enrolled_count,
+            "Active" if student.is_enabled else "Disabled",
+            student.date_joined.strftime("%d %B %Y"),
+        ]
+        for student in queryset.iterator(chunk_size=2000)
+    ]
+
+    totals = queryset.aggregate(
+        total=Count("id", distinct=True),
+        active=Count("id", filter=Q(is_enabled=True), distinct=True),
+        disabled=Count("id", filter=Q(is_enabled=False), distinct=True),
+    )
+    content = [
+        Paragraph(
+            f"<b>Total Students:</b> {totals['total']}<br/>"
+            f"Active: <b>{totals['active']}</b> | "
+            f"Disabled: <b>{totals['disabled']}</b>",
+            exporter.styles["CustomBody"],
+        ),
+        Spacer(1, 14),
+        exporter.create_table(headers=headers, data=data, col_widths=[70, 140, 180, 110, 80, 90, 100]),
+    ]
+
+    exporter.build(content, output)
+    return exporter.filename
+
+
+def render_transactions_report(params, output):
+    """Accounting transactions report. Returns the download file name."""
+    render_transactions_pdf(build_transaction_rows(params), output)
+    return "transactions.pdf"
+
+
+Report = namedtuple("Report", ["render", "permission", "params", "date_params"])
+
+REPORTS = {
+    "students_pdf": Report(
+        render=render_students_pdf,
+        permission=IsAdmin,
+        params=("is_enabled", "start_date", "end_date"),
+        date_params=("start_date", "end_date"),
+    ),
+    "transactions_pdf": Report(
+        render=render_transactions_report,
+        permission=IsAdminOrAccountant,
+        params=("search", "type", "status", "range", "date_from", "date_to"),
+        date_params=("date_from", "date_to"),
+    ),
+}
+
+
+# ============================================================================
+# JOBS
+# ============================================================================
+
+
+def normalize_params(report_type, params):
+    """Keep the parameters ``report_type`` understands, as non-empty strings.
+
+    Raises ``ValueError`` for unknown report types or malformed dates.
+    """
+    report = REPORTS.get(report_type)
+    if report is None:
+        raise ValueError(f"Unknown report type: {report_type}")
+
+    cleaned = {}
+    for key in report.params:
+        value = params.get(key)
+        if value is None or str(value).strip() == "":
+            continue
+        cleaned[key] = str(value).strip()
+
+    for key in report.date_params:
+        if key in cleaned:
+            try:
+                _parse_date(cleaned[key])
+            except ValueError:
+                raise ValueError(f"Invalid {key}. Use YYYY-MM-DD")
+    return cleaned
+
+
+def params_hash(report_type, params):
+    canonical = json.dumps({"type": report_type, "params": params}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+
+def request_report(report_type, params, user=None):
+    """Return ``(job, created)`` for a report, reusing a recent identical job.
+
+    With ``settings.TASKS_EAGER`` the new job is rendered before returning.
+    """
+    params = normalize_params(report_type, params)
+    digest = params_hash(report_type, params)
+
+    since = timezone.now() - timedelta(seconds=REPORT_JOB_DEDUPE_SECONDS)
+    existing = (
+        ReportJob.objects.filter(params_hash=digest, created_at__gte=since)
+        .exclude(status=ReportJob.Status.FAILED)
+        .order_by("-created_at")
+        .first()
+    )
+    if existing:
+        return existing, False
+
+    job = ReportJob.objects.create(report_type=report_type, params=params, params_hash=digest, requested_by=user)
+    if getattr(settings, "TASKS_EAGER", False):
+        render_report_job(job.pk)
+        job.refresh_from_db()
+    return job, True
+
+
+def claim_report_jobs(limit, lease=None):
+    """Mark up to ``limit`` queued (or abandoned running) jobs as running and return their ids."""
+    lease = lease or REPORT_JOB_LEASE_SECONDS
+    now = timezone.now()
+    due = Q(status=ReportJob.Status.QUEUED) | Q(
+        status=ReportJob.Status.RUNNING, started_at__lt=now - timedelta(seconds=lease)
+    )
+
+    claimed = []
+    for job_id in ReportJob.objects.filter(due).order_by("created_at").values_list("id", flat=True)[:limit]:
+        # Conditional update: only one worker wins each job
+        if ReportJob.objects.filter(due, pk=job_id).update(status=ReportJob.Status.RUNNING, started_at=now):
+            claimed.append(job_id)
+    return claimed
+
+
+def render_report_job(job_id):
+    """Render one job to storage. Safe to run in a worker process."""
+    job = ReportJob.objects.get(pk=job_id)
+    report = REPORTS[job.report_type]
+
+    if job.status != ReportJob.Status.RUNNING:
+        job.status = ReportJob.Status.RUNNING
+        job.started_at = timezone.now()
+        job.save(update_fields=["status", "started_at", "updated_at"])
+
+    try:
+        with tempfile.TemporaryFile() as tmp:
+            filename = report.render(job.params, tmp)
+            tmp.seek(0)
+            job.file.save(f"{job.report_type}_{job.pk}.pdf", File(tmp), save=False)
+        job.filename = filename
+        job.status = ReportJob.Status.DONE
+        job.error = ""
+    except Exception as exc:
+        logger.error("Report job %s (%s) failed: %s", job.pk, job.report_type, exc)
+        job.status = ReportJob.Status.FAILED
+        job.error = traceback.format_exc()[-4000:]
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=["file", "filename", "status", "error", "finished_at", "updated_at"])
+    return job.status
@@ -0,0 +1,149 @@
+"""Sequence service for human-readable IDs (order numbers, student IDs, ...).
+
+Every sequence key (e.g. ``PA-2026`` or ``ENR-CSE-2026``) has one
+``TransactionCounter`` row holding the highest value handed out so far.
+Instead of counting or probing existing rows, callers get the next value
+with ``next_value``. It uses hi-lo block allocation:
+
+- one short ``UPDATE counter = counter + N`` reserves a block of N values;
+- the process then serves the block from memory until it runs out.
+
+Cost per ID therefore stays flat however many orders or enrollments exist.
+Two workers only touch the same row when both need a new block.
+
+Block sizes are set per sequence family through ``SEQUENCE_BLOCK_SIZES``:
+
+- Values left in a block are lost when a process exits, so a family with
+  a block size above 1 has gaps.
+- A family with a block size of 1 has no gaps. Accounting transaction IDs
+  use a block size of 1.
+
+A block reserved inside a transaction is only kept for later calls once
+that transaction commits. A rolled-back reservation is never reused.
+"""
+
+import hashlib
+import os
+import threading
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+DEFAULT_BLOCK_SIZES = {
+    "order": 50,
+    "enrollment": 10,
+    "student": 10,
+    "income": 1,
+}
+
+_blocks = {}  # key -> list of [next, last] ranges ready to hand out
+_lock = threading.Lock()
+_pid = os.getpid()
+
+
+def block_size(family):
+    sizes = getattr(settings, "SEQUENCE_BLOCK_SIZES", {})
+    return max(1, int(sizes.get(family, DEFAULT_BLOCK_SIZES.get(family, 10))))
+
+
+def _take_cached(key):
+    global _pid
+    if _pid != os.getpid():
+        # Forked child: blocks belong to the parent
+        _blocks.clear()
+        _pid = os.getpid()
+
+    ranges = _blocks.get(key)
+    while ranges:
+        current = ranges[0]
+        if current[0] <= current[1]:
+            value = current[0]
+            current[0] += 1
+            return value
+        ranges.pop(0)
+    return None
+
+
+def _keep(key, start, end):
+    if start > end:
+        return
+    with _lock:
+        _blocks.setdefault(key, []).append([start, end])
+
+
+def _reserve(key, size, seed):
+    """Advance the counter row for ``key`` by ``size``; return the reserved (start, end)."""
+    from api.models.models_accounting import TransactionCounter
+
+    with transaction.atomic():
+        if not TransactionCounter.objects.filter(prefix=key).update(counter=F("counter") + size):
+            start_after = seed() if seed else 0
+            try:
+                with transaction.atomic():
+                    TransactionCounter.objects.create(prefix=key, counter=start_after + size)
+            except IntegrityError:
+                # Another worker created the row first
+                TransactionCounter.objects.filter(prefix=key).update(counter=F("counter") + size)
+        end = TransactionCounter.objects.filter(prefix=key).values_list("counter", flat=True).get()
+    return end - size + 1, end
+
+
+def next_value(family, key, seed=None):
+    """Return the next value of sequence ``key``.
+
+    ``family`` selects the block size. ``seed`` is called once, when the
+    counter row for ``key`` does not exist yet. It should return the
+    highest value already in use, so that IDs issued before this service
+    existed are never repeated.
+    """
+    with _lock:
+        value = _take_cached(key)
+    if value is not None:
+        return value
+
+    size = block_size(family)
+    start, end = _reserve(key, size, seed)
+
+    if transaction.get_connection().in_atomic_block:
+        # Keep the rest of the block only if the reservation survives
+        transaction.on_commit(lambda: _keep(key, start + 1, end))
+    else:
+        _keep(key, start + 1, end)
+    return start
+
+
+def max_suffix(values, prefix):
+    """Largest integer suffix after ``prefix`` in ``values`` (0 if none); used as a seed."""
+    highest = 0
+    for value in values:
+        suffix = value[len(prefix):] if value else ""
+        if suffix.isdigit():
+            highest = max(highest, int(suffix))
+    return highest
+
+
+def clear_cached_blocks():
+    """Forget every in-memory block (tests)."""
+    with _lock:
+        _blocks.clear()
+
+
+_BASE36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SCRAMBLE_MULTIPLIER = 40503301  # coprime with 36**n, so the mapping is a permutation
+
+
+def scramble_base36(value, width):
+    """Map ``value`` to a fixed-width base36 code, unique for values below ``36 ** width``.
+
+    Used where consecutive IDs should not look consecutive (order numbers
+    are shown to customers and sent to the payment gateway).
+    """
+    space = 36**width
+    offset = int(hashlib.sha256(settings.SECRET_KEY.encode()).hexdigest(), 16) % space
+    n = (value * _SCRAMBLE_MULTIPLIER + offset) % space
+    chars = []
+    for _ in range(width):
+        n, digit = divmod(n, 36)
+        chars.append(_BASE36[digit])
+    return "".join(reversed(chars))
@@ -1,14 +1,30 @@
 """
 SSLCommerz Payment Gateway Integration
 SAFE + PRODUCTION READY
+
+All gateway calls go through one ``requests.Session`` per process, so TLS
+connections are pooled and kept alive between checkouts and validations.
+Calls are guarded by a circuit breaker: after repeated failures the gateway
+is not contacted for ``SSLCOMMERZ_BREAKER_RESET_SECONDS``, then a single
+half-open probe decides whether to close the circuit again. Transient
+network errors are retried a bounded number of times with jittered backoff,
+and every call's latency is recorded in ``gateway_metrics``.
 """
 
 import hashlib
+import logging
+import os
+import random
+import threading
+import time
 from decimal import Decimal
 from typing import Dict, Tuple
 
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
 
 
 class SSLCommerzError(Exception):
@@ -16,6 +32,205 @@ class SSLCommerzError(Exception):
     pass
 
 
+class CircuitOpenError(SSLCommerzError):
+    """The breaker is open; the gateway was not contacted."""
+    pass
+
+
+# ======================================================
+# CONNECTION POOL
+# ======================================================
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return this process's pooled session (recreated after a fork)."""
+    global _session, _session_pid
+
+    if _session is None or _session_pid != os.getpid():
+        with _session_lock:
+            if _session is None or _session_pid != os.getpid():
+                pool_size = getattr(settings, "SSLCOMMERZ_POOL_SIZE", 10)
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session, _session_pid = session, os.getpid()
+    return _session
+
+
+def reset_session():
+    """Drop the pooled session (tests, or after changing gateway settings)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+# ======================================================
+# CIRCUIT BREAKER
+# ======================================================
+class CircuitBreaker:
+    """Thread-safe closed -> open -> half-open breaker.
+
+    ``failure_threshold`` consecutive failures open the circuit. Once
+    ``reset_timeout`` seconds have passed, one caller is let through as a
+    probe: success closes the circuit, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self):
+        """Return True if a call may go out now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+            # Half-open: exactly one probe at a time
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def reset(self):
+        self.record_success()
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning("SSLCommerz circuit opened after %s failure(s)", self._failures)
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+            self._probing = False
+
+
+breaker = CircuitBreaker(
+    failure_threshold=getattr(settings, "SSLCOMMERZ_BREAKER_THRESHOLD", 5),
+    reset_timeout=getattr(settings, "SSLCOMMERZ_BREAKER_RESET_SECONDS", 30),
+)
+
+
+# ======================================================
+# LATENCY METRICS
+# ======================================================
+class GatewayMetrics:
+    """Per-process call counters and latency totals, keyed by operation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, operation, seconds, outcome):
+        with self._lock:
+            stats = self._stats.setdefault(
+                operation, {"calls": 0, "errors": 0, "short_circuited": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            if outcome == "short_circuited":
+                stats["short_circuited"] += 1
+                return
+            elapsed_ms = seconds * 1000
+            stats["calls"] += 1
+            stats["errors"] += outcome == "error"
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                operation: dict(stats, avg_ms=stats["total_ms"] / stats["calls"] if stats["calls"] else 0.0)
+                for operation, stats in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+gateway_metrics = GatewayMetrics()
+
+RETRYABLE_STATUS = {502, 503, 504}
+
+
+def gateway_request(operation, method, url, retry_read_errors, **kwargs):
+    """Send one gateway request through the pool, breaker and retry policy.
+
+    Connection failures are always retried (the request never reached the
+    gateway). Read timeouts and 502/503/504 are retried only when
+    ``retry_read_errors`` is set, i.e. for idempotent calls. Every 5xx
+    counts as a breaker failure, retried or not. Raises
+    ``CircuitOpenError`` when the breaker refuses the call, otherwise the
+    last ``requests`` exception.
+    """
+    max_retries = getattr(settings, "SSLCOMMERZ_MAX_RETRIES", 2)
+    backoff = getattr(settings, "SSLCOMMERZ_RETRY_BACKOFF", 0.2)
+    kwargs.setdefault("timeout", getattr(settings, "SSLCOMMERZ_TIMEOUT", 15))
+
+    attempt = 0
+    while True:
+        if not breaker.allow():
+            gateway_metrics.record(operation, 0, "short_circuited")
+            raise CircuitOpenError("SSLCommerz is unavailable (circuit open)")
+
+        started = time.perf_counter()
+        try:
+            response = get_session().request(method, url, **kwargs)
+            if response.status_code >= 500:
+                response.raise_for_status()
+        except requests.RequestException as exc:
+            gateway_metrics.record(operation, time.perf_counter() - started, "error")
+            breaker.record_failure()
+
+            if isinstance(exc, requests.HTTPError):
+                retryable = retry_read_errors and exc.response.status_code in RETRYABLE_STATUS
+            else:
+                retryable = retry_read_errors or isinstance(exc, requests.ConnectionError)
+            if attempt >= max_retries or not retryable:
+                raise
+            attempt += 1
+            # Full jitter keeps workers from retrying in lock-step
+            time.sleep(random.uniform(0, backoff * 2 ** attempt))
+            continue
+
+        elapsed = time.perf_counter() - started
+        gateway_metrics.record(operation, elapsed, "ok")
+        breaker.record_success()
+        logger.debug("SSLCommerz %s took %.0fms", operation, elapsed * 1000)
+        return response
+
+
 class SSLCommerzPayment:
     """
     SSLCommerz payment gateway integration.
@@ -26,12 +241,12 @@ class SSLCommerzPayment:
         self.store_password = settings.SSLCOMMERZ_STORE_PASSWORD
         self.is_sandbox = settings.SSLCOMMERZ_IS_SANDBOX
 
-        if self.is_sandbox:
-            self.session_url = "https://sandbox.sslcommerz.com/gwprocess/v4/api.php"
-            self.validation_url = "https://sandbox.sslcommerz.com/validator/api/validationserverAPI.php"
-        else:
-            self.session_url = "https://securepay.sslcommerz.com/gwprocess/v4/api.php"
-            self.validation_url = "https://securepay.sslcommerz.com/validator/api/validationserverAPI.php"
+        # SSLCOMMERZ_API_URL points the client elsewhere (e.g. the local fake gateway)
+        base_url = getattr(settings, "SSLCOMMERZ_API_URL", "") or (
+            "https://sandbox.sslcommerz.com" if self.is_sandbox else "https://securepay.sslcommerz.com"
+        )
+        self.session_url = f"{base_url.rstrip('/')}/gwprocess/v4/api.php"
+        self.validation_url = f"{base_url.rstrip('/')}/validator/api/validationserverAPI.php"
 
     # ======================================================
     # INITIATE PAYMENT
@@ -97,11 +312,8 @@ class SSLCommerzPayment:
         }
 
         try:
-            response = requests.post(
-                self.session_url,
-                data=post_data,
-                timeout=15,  # 🔥 REQUIRED
-            )
+            # Not idempotent: only retried when the connection was never made
+            response = gateway_request("init_payment", "POST", self.session_url, False, data=post_data)
             response.raise_for_status()
 
             try:
@@ -116,6 +328,8 @@ class SSLCommerzPayment:
                 result.get("failedreason", "Payment initialization failed")
             )
 
+        except CircuitOpenError:
+            raise
         except requests.Timeout:
             raise SSLCommerzError("SSLCommerz session timeout")
         except requests.RequestException as e:
@@ -140,11 +354,7 @@ class SSLCommerzPayment:
         }
 
         try:
-            response = requests.get(
-                self.validation_url,
-                params=params,
-                timeout=15,  # 🔥 REQUIRED
-            )
+            response = gateway_request("validate_payment", "GET", self.validation_url, True, params=params)
             response.raise_for_status()
 
             try:
@@ -158,6 +368,8 @@ class SSLCommerzPayment:
 
             return False, result
 
+        except CircuitOpenError as e:
+            return False, {"error": str(e)}
         except requests.Timeout:
             return False, {"error": "SSLCommerz validation timeout"}
         except requests.RequestException as e:
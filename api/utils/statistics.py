@@ -0,0 +1,65 @@
+"""Build statistics payloads with a single conditional ``aggregate()``.
+
+Statistics endpoints used to run one ``count()`` or ``aggregate()`` per
+number (and one per status choice). ``StatisticsBuilder`` collects the
+numbers as aggregates with ``filter=Q(...)`` and evaluates them all in one
+query::
+
+    stats = (
+        StatisticsBuilder(Order.objects.all())
+        .count("total_orders")
+        .count("completed_orders", Q(status="completed"))
+        .sum("total_revenue", "total_amount", Q(status="completed"))
+        .count_each("orders_by_status", "status", [value for value, _ in Order.STATUS_CHOICES])
+        .build()
+    )
+
+Values come back in the order they were declared; an aggregate over no
+rows returns its ``default`` instead of ``None``.
+"""
+
+from django.db.models import Avg, Count, Q, Sum
+
+
+class StatisticsBuilder:
+    """Declare counts, sums and averages over ``queryset``, then ``build()`` them in one query."""
+
+    def __init__(self, queryset):
+        self.queryset = queryset
+        self._aggregates = {}
+        self._defaults = {}
+        self._outputs = {}  # name -> alias, or {key: alias} for count_each()
+
+    def _add(self, aggregate, default):
+        alias = f"stat_{len(self._aggregates)}"
+        self._aggregates[alias] = aggregate
+        self._defaults[alias] = default
+        return alias
+
+    def count(self, name, condition=None):
+        self._outputs[name] = self._add(Count("pk", filter=condition or None), 0)
+        return self
+
+    def sum(self, name, field, condition=None, default=0):
+        self._outputs[name] = self._add(Sum(field, filter=condition or None), default)
+        return self
+
+    def avg(self, name, field, condition=None, default=0):
+        self._outputs[name] = self._add(Avg(field, filter=condition or None), default)
+        return self
+
+    def count_each(self, name, field, values):
+        """``{value: count}`` of rows whose ``field`` equals each of ``values``."""
+        self._outputs[name] = {value: self._add(Count("pk", filter=Q(**{field: value})), 0) for value in values}
+        return self
+
+    def build(self):
+        row = self.queryset.order_by().aggregate(**self._aggregates) if self._aggregates else {}
+
+        def value(alias):
+            return self._defaults[alias] if row[alias] is None else row[alias]
+
+        return {
+            name: {key: value(alias) for key, alias in output.items()} if isinstance(output, dict) else value(output)
+            for name, output in self._outputs.items()
+        }
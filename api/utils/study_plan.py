@@ -0,0 +1,224 @@
+"""Cached study-plan aggregates for a student's course.
+
+The study-plan serializer used to count live classes, assignments, quizzes
+and resources per module, query the student's attendance, submissions and
+attempts per module and per item, and re-derive the enrolled batches for
+every one of those lookups.
+
+``get_study_plan`` computes all of it for every module of a course with a
+handful of grouped queries and caches the result per (student, course).
+Two versioned namespaces keep it fresh (see ``api.cache_invalidation``):
+content edits bump the course's namespace, and the student's own activity
+(attendance, submissions, quiz attempts, enrollments) bumps theirs.
+"""
+
+from collections import defaultdict, namedtuple
+
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+
+from api.utils.cache_utils import (
+    CACHE_KEY_STUDY_PLAN,
+    bump_namespace_version,
+    generate_cache_key,
+    get_namespace_version,
+)
+
+STUDY_PLAN_TIMEOUT = 60 * 60
+
+Submission = namedtuple("Submission", ["status", "submitted_at", "marks_obtained"])
+QuizAttempts = namedtuple("QuizAttempts", ["attempts_used", "best_score"])
+
+
+def _course_namespace(course_id):
+    return f"{CACHE_KEY_STUDY_PLAN}:course:{course_id}"
+
+
+def _student_namespace(student_id):
+    return f"{CACHE_KEY_STUDY_PLAN}:student:{student_id}"
+
+
+def _progress(completed, total):
+    return {"completed": completed, "total": total}
+
+
+class StudyPlan:
+    """Per-module counts and progress plus per-item state for one student and course.
+
+    Lookups are keyed by the string form of the ids, so the plan survives a
+    round trip through the JSON cache serializers (``to_cache`` / ``from_cache``).
+    """
+
+    def __init__(self, batch_ids, modules, attended_live_class_ids, submissions, quiz_attempts, question_counts):
+        self.batch_ids = [str(pk) for pk in batch_ids]
+        self.modules = {str(pk): summary for pk, summary in modules.items()}
+        self.attended_live_class_ids = {str(pk) for pk in attended_live_class_ids}
+        self.submissions = {str(pk): submission for pk, submission in submissions.items()}
+        self.quiz_attempts = {str(pk): attempts for pk, attempts in quiz_attempts.items()}
+        self.question_counts = {str(pk): count for pk, count in question_counts.items()}
+
+    def to_cache(self):
+        """JSON-safe form: string keys, lists and plain dicts only."""
+        return {
+            "batch_ids": self.batch_ids,
+            "modules": self.modules,
+            "attended_live_class_ids": sorted(self.attended_live_class_ids),
+            "submissions": {pk: submission._asdict() for pk, submission in self.submissions.items()},
+            "quiz_attempts": {pk: attempts._asdict() for pk, attempts in self.quiz_attempts.items()},
+            "question_counts": self.question_counts,
+        }
+
+    @classmethod
+    def from_cache(cls, data):
+        return cls(
+            data["batch_ids"],
+            data["modules"],
+            data["attended_live_class_ids"],
+            {pk: Submission(**submission) for pk, submission in data["submissions"].items()},
+            {pk: QuizAttempts(**attempts) for pk, attempts in data["quiz_attempts"].items()},
+            data["question_counts"],
+        )
+
+    def module(self, module_id):
+        """Counts and progress for one module (zeros for a module with no content)."""
+        return self.modules.get(str(module_id)) or _module_summary({}, {})
+
+    def attended(self, live_class_id):
+        return str(live_class_id) in self.attended_live_class_ids
+
+    def submission(self, assignment_id):
+        return self.submissions.get(str(assignment_id))
+
+    def attempts(self, quiz_id):
+        return self.quiz_attempts.get(str(quiz_id), QuizAttempts(0, None))
+
+    def question_count(self, quiz_id):
+        return self.question_counts.get(str(quiz_id), 0)
+
+
+def _module_summary(counts, completed):
+    live_class = _progress(completed.get("live_class", 0), counts.get("live_class", 0))
+    assignment = _progress(completed.get("assignment", 0), counts.get("assignment", 0))
+    quiz = _progress(completed.get("quiz", 0), counts.get("quiz", 0))
+
+    total_items = live_class["total"] + assignment["total"] + quiz["total"]
+    completed_items = live_class["completed"] + assignment["completed"] + quiz["completed"]
+
+    return {
+        "live_class_count": counts.get("live_class", 0),
+        "assignment_count": counts.get("assignment", 0),
+        # Quizzes are only listed once they have active questions
+        "quiz_count": counts.get("listed_quiz", 0),
+        "resource_count": counts.get("resource", 0),
+        "live_class_progress": live_class,
+        "assignment_progress": assignment,
+        "quiz_progress": quiz,
+        "overall_progress": round((completed_items / total_items) * 100) if total_items else 0,
+    }
+
+
+def build_study_plan(student_id, course_id):
+    """Compute the study plan for every module of ``course_id`` with grouped queries."""
+    from api.models.models_module import (
+        Assignment,
+        AssignmentSubmission,
+        CourseResource,
+        LiveClass,
+        LiveClassAttendance,
+        Quiz,
+        QuizAttempt,
+    )
+    from api.models.models_order import Enrollment
+
+    batch_ids = list(Enrollment.objects.filter(user_id=student_id, is_active=True).values_list("batch_id", flat=True))
+    in_course = {"module__course_id": course_id, "batch_id__in": batch_ids}
+
+    counts = defaultdict(dict)
+    completed = defaultdict(lambda: defaultdict(int))
+
+    for name, model in (("live_class", LiveClass), ("assignment", Assignment), ("resource", CourseResource)):
+        rows = model.objects.filter(is_active=True, **in_course).values_list("module_id").annotate(n=Count("id"))
+        for module_id, n in rows.order_by():
+            counts[module_id][name] = n
+
+    question_counts = {}
+    quizzes = (
+        Quiz.objects.filter(is_active=True, **in_course)
+        .annotate(active_questions=Count("questions", filter=Q(questions__is_active=True)))
+        .values_list("id", "module_id", "active_questions")
+    )
+    for quiz_id, module_id, active_questions in quizzes.order_by():
+        module = counts[module_id]
+        module["quiz"] = module.get("quiz", 0) + 1
+        if active_questions:
+            module["listed_quiz"] = module.get("listed_quiz", 0) + 1
+        question_counts[quiz_id] = active_questions
+
+    attended_live_class_ids = set()
+    attendances = LiveClassAttendance.objects.filter(
+        student_id=student_id,
+        attended=True,
+        live_class__module__course_id=course_id,
+        live_class__batch_id__in=batch_ids,
+    ).values_list("live_class_id", "live_class__module_id")
+    for live_class_id, module_id in attendances:
+        attended_live_class_ids.add(live_class_id)
+        completed[module_id]["live_class"] += 1
+
+    submissions = {}
+    rows = AssignmentSubmission.objects.filter(
+        student_id=student_id,
+        assignment__module__course_id=course_id,
+        assignment__batch_id__in=batch_ids,
+    ).values_list("assignment_id", "assignment__module_id", "status", "submitted_at", "marks_obtained")
+    for assignment_id, module_id, status, submitted_at, marks_obtained in rows:
+        submissions[assignment_id] = Submission(status, submitted_at, marks_obtained)
+        completed[module_id]["assignment"] += 1
+
+    quiz_attempts = {}
+    rows = (
+        QuizAttempt.objects.filter(
+            student_id=student_id,
+            quiz__module__course_id=course_id,
+            quiz__batch_id__in=batch_ids,
+            status="submitted",
+        )
+        .values_list("quiz_id", "quiz__module_id")
+        .annotate(used=Count("id"), best=Max("marks_obtained"))
+    )
+    for quiz_id, module_id, used, best in rows.order_by():
+        quiz_attempts[quiz_id] = QuizAttempts(used, float(best) if best is not None else None)
+        completed[module_id]["quiz"] += 1
+
+    modules = {
+        module_id: _module_summary(counts.get(module_id, {}), completed.get(module_id, {}))
+        for module_id in set(counts) | set(completed)
+    }
+    return StudyPlan(batch_ids, modules, attended_live_class_ids, submissions, quiz_attempts, question_counts)
+
+
+def get_study_plan(student_id, course_id):
+    """Return the cached study plan for (student, course), building it on a miss."""
+    key = generate_cache_key(
+        _course_namespace(course_id), student_id, student_version=get_namespace_version(_student_namespace(student_id))
+    )
+    # The cache holds the JSON-safe form so it works with the JSON serializers of the Redis backend
+    data = cache.get_or_set(
+        key, lambda: build_study_plan(student_id, course_id).to_cache(), timeout=STUDY_PLAN_TIMEOUT
+    )
+    return StudyPlan.from_cache(data)
+
+
+def invalidate_course_study_plans(course_id):
+    try:
+        bump_namespace_version(_course_namespace(course_id))
+    except Exception:
+        # Caching is not critical; never break the write path over it
+        pass
+
+
+def invalidate_student_study_plans(student_id):
+    try:
+        bump_namespace_version(_student_namespace(student_id))
+    except Exception:
+        pass
@@ -0,0 +1,140 @@
+"""Lightweight database-backed task queue (transactional outbox).
+
+Slow side effects such as SMTP delivery must not run inside a request.
+Functions decorated with ``@task`` can be queued with ``enqueue``::
+
+    @task
+    def deliver_email(subject, message, recipient_list, ...):
+        ...
+
+    enqueue(deliver_email, subject="Hi", message="...", recipient_list=[...])
+
+``enqueue`` inserts an ``OutboxTask`` row inside the caller's transaction,
+so the worker only ever sees it once that transaction commits (and never if
+it rolls back). ``python manage.py run_tasks`` claims due rows, runs them
+on a thread pool, retries failures with exponential backoff and moves rows
+that exhaust ``max_attempts`` to the ``dead`` status.
+
+With ``settings.TASKS_EAGER`` the function is called inline instead.
+"""
+
+import logging
+import random
+import traceback
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+def task(func):
+    """Mark ``func`` as runnable by the worker; only marked functions can be queued."""
+    func.task_name = f"{func.__module__}.{func.__qualname__}"
+    return func
+
+
+def enqueue(func, max_attempts=None, delay=0, **payload):
+    """Queue ``func(**payload)``; ``payload`` must be JSON serializable.
+
+    Returns the ``OutboxTask`` row, or ``None`` when tasks run eagerly.
+    """
+    from api.models.models_tasks import OutboxTask
+
+    if not hasattr(func, "task_name"):
+        raise ValueError(f"{func!r} is not registered with @task")
+
+    if getattr(settings, "TASKS_EAGER", False):
+        func(**payload)
+        return None
+
+    return OutboxTask.objects.create(
+        name=func.task_name,
+        payload=payload,
+        max_attempts=max_attempts or getattr(settings, "TASKS_MAX_ATTEMPTS", 5),
+        run_after=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def retry_delay(attempts):
+    """Seconds to wait before retry number ``attempts`` (exponential, capped, jittered)."""
+    base = getattr(settings, "TASKS_RETRY_BASE_SECONDS", 30)
+    cap = getattr(settings, "TASKS_RETRY_MAX_SECONDS", 3600)
+    delay = min(cap, base * 2 ** max(attempts - 1, 0))
+    # Spread retries of a burst of failures so they don't all fire together
+    return delay * random.uniform(0.8, 1.2)
+
+
+def claim_tasks(limit, lease=None):
+    """Atomically claim up to ``limit`` due tasks for this worker and return them.
+
+    Due tasks are pending rows whose ``run_after`` has passed, plus running
+    rows whose lease expired (their worker died mid-task).
+    """
+    from api.models.models_tasks import OutboxTask
+
+    lease = lease or getattr(settings, "TASKS_LEASE_SECONDS", 300)
+    now = timezone.now()
+    due = Q(status=OutboxTask.Status.PENDING, run_after__lte=now) | Q(
+        status=OutboxTask.Status.RUNNING, locked_at__lt=now - timedelta(seconds=lease)
+    )
+    token = uuid.uuid4().hex
+
+    with transaction.atomic():
+        candidates = OutboxTask.objects.filter(due).order_by("run_after")
+        if transaction.get_connection().features.has_select_for_update_skip_locked:
+            candidates = candidates.select_for_update(skip_locked=True)
+        ids = list(candidates.values_list("id", flat=True)[:limit])
+        # Re-check ``due`` so two workers racing on a database without
+        # SKIP LOCKED can never both claim the same row.
+        OutboxTask.objects.filter(due, id__in=ids).update(
+            status=OutboxTask.Status.RUNNING,
+            locked_by=token,
+            locked_at=now,
+            attempts=F("attempts") + 1,
+        )
+
+    return list(OutboxTask.objects.filter(locked_by=token, status=OutboxTask.Status.RUNNING))
+
+
+def run_task(outbox_task):
+    """Execute one claimed task and record success, retry or dead-lettering."""
+    from api.models.models_tasks import OutboxTask
+
+    now = timezone.now
+    try:
+        func = import_string(outbox_task.name)
+        if not hasattr(func, "task_name"):
+            raise ValueError(f"{outbox_task.name} is not registered with @task")
+        func(**outbox_task.payload)
+    except Exception as exc:
+        outbox_task.last_error = traceback.format_exc()[-4000:]
+        if outbox_task.attempts >= outbox_task.max_attempts:
+            outbox_task.status = OutboxTask.Status.DEAD
+            outbox_task.finished_at = now()
+            logger.error("Task %s (%s) dead after %s attempts: %s", outbox_task.pk, outbox_task.name, outbox_task.attempts, exc)
+        else:
+            outbox_task.status = OutboxTask.Status.PENDING
+            outbox_task.run_after = now() + timedelta(seconds=retry_delay(outbox_task.attempts))
+            logger.warning("Task %s (%s) failed, retrying at %s: %s", outbox_task.pk, outbox_task.name, outbox_task.run_after, exc)
+    else:
+        outbox_task.status = OutboxTask.Status.DONE
+        outbox_task.finished_at = now()
+        outbox_task.last_error = ""
+
+    # Only write back if our claim still stands (the lease may have been taken over)
+    OutboxTask.objects.filter(pk=outbox_task.pk, locked_by=outbox_task.locked_by).update(
+        status=outbox_task.status,
+        run_after=outbox_task.run_after,
+        finished_at=outbox_task.finished_at,
+        last_error=outbox_task.last_error,
+        locked_by="",
+        locked_at=None,
+        updated_at=now(),
+    )
+    return outbox_task.status
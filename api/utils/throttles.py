@@ -1,9 +1,30 @@
 """Throttling utilities for the API.
 
-Includes login throttles and other rate-limiting helpers.
+Includes login throttles and other rate-limiting helpers. All throttles
+here keep their request history in the dedicated ``throttle`` cache alias
+(``settings.THROTTLE_CACHE_ALIAS``) so limits are enforced across workers
+and never evict response-cache entries.
 """
 
-from rest_framework.throttling import SimpleRateThrottle
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+
+from rest_framework.throttling import AnonRateThrottle, ScopedRateThrottle, SimpleRateThrottle
+
+throttle_cache = ConnectionProxy(caches, getattr(settings, "THROTTLE_CACHE_ALIAS", "default"))
+
+
+class SharedAnonRateThrottle(AnonRateThrottle):
+    """AnonRateThrottle backed by the shared throttle cache."""
+
+    cache = throttle_cache
+
+
+class SharedScopedRateThrottle(ScopedRateThrottle):
+    """ScopedRateThrottle backed by the shared throttle cache."""
+
+    cache = throttle_cache
 
 
 class LoginRateThrottle(SimpleRateThrottle):
@@ -13,6 +34,7 @@ class LoginRateThrottle(SimpleRateThrottle):
     """
 
     scope = "login"
+    cache = throttle_cache
 
     def get_cache_key(self, request, view):
         """
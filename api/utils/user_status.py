@@ -0,0 +1,131 @@
+"""User status registry used to reject disabled or revoked accounts cheaply.
+
+Every Bearer request is checked by ``RejectDisabledUserMiddleware`` before
+DRF authenticates it. Rather than loading the user row each time, the
+middleware reads a small ``(is_active, is_enabled, token_version)`` tuple:
+
+1. from an in-process LRU (a couple of seconds TTL, no network hop)
+2. from the shared cache (until the user row changes)
+3. from the database, and only then
+
+``post_save``/``post_delete`` on the user model call ``invalidate_user_status``
+(see ``api/signals.py``), so disabling an account or bumping its
+``token_version`` takes effect on the next request. Other processes may keep
+serving their local copy for at most ``USER_STATUS_LOCAL_TTL`` seconds.
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+USER_STATUS_KEY_PREFIX = "user_status:"
+USER_STATUS_TTL = getattr(settings, "USER_STATUS_CACHE_TTL", 60 * 60)
+USER_STATUS_LOCAL_TTL = getattr(settings, "USER_STATUS_LOCAL_TTL", 2)
+USER_STATUS_LOCAL_SIZE = getattr(settings, "USER_STATUS_LOCAL_SIZE", 10000)
+
+# JWT claim carrying the user's token_version at issue time
+TOKEN_VERSION_CLAIM = "ver"
+
+# Cached in place of a status tuple for ids that no longer exist
+_NOT_FOUND = "missing"
+
+UserStatus = namedtuple("UserStatus", ["is_active", "is_enabled", "token_version"])
+
+
+class _LocalLRU:
+    """Small thread-safe LRU whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_local = _LocalLRU(USER_STATUS_LOCAL_SIZE, USER_STATUS_LOCAL_TTL)
+
+
+def _cache_key(user_id):
+    return f"{USER_STATUS_KEY_PREFIX}{user_id}"
+
+
+def _load_status(user_id):
+    User = get_user_model()
+    row = User.objects.filter(pk=user_id).values_list("is_active", "is_enabled", "token_version").first()
+    return _NOT_FOUND if row is None else list(row)
+
+
+def get_user_status(user_id):
+    """Return the ``UserStatus`` for ``user_id``, or ``None`` if the user does not exist."""
+    key = _cache_key(user_id)
+
+    value = _local.get(key)
+    if value is None:
+        value = cache.get(key)
+        if value is None:
+            value = _load_status(user_id)
+            cache.set(key, value, USER_STATUS_TTL)
+        _local.set(key, value)
+
+    if value == _NOT_FOUND:
+        return None
+    return UserStatus(*value)
+
+
+def invalidate_user_status(user_id):
+    """Forget the cached status for ``user_id`` (locally and in the shared cache)."""
+    key = _cache_key(user_id)
+    _local.pop(key)
+    cache.delete(key)
+
+
+def clear_local_user_status():
+    """Drop every in-process entry (tests and long-running workers)."""
+    _local.clear()
+
+
+class VersionedRefreshToken(RefreshToken):
+    """Refresh token stamped with the user's ``token_version``.
+
+    The claim is copied to every access token derived from it, so bumping
+    ``CustomUser.token_version`` revokes all outstanding tokens at once.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[TOKEN_VERSION_CLAIM] = getattr(user, "token_version", 0)
+        return token
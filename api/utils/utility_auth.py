@@ -9,18 +9,22 @@ from django.forms import ValidationError
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from ..models.models_auth import CustomUser
+from ..utils.guest_cart import GuestCart, delete_guest_cart_cookie, read_guest_cart_ids
 from ..utils.response_utils import api_response
 from ..utils.throttles import LoginRateThrottle
+from ..utils.user_status import VersionedRefreshToken
 
 
-def merge_guest_cart_to_user(user, session_key):
+def merge_guest_cart_to_user(user, session_key, guest_items=None):
     """
     Merge guest cart into user cart after login.
     Called automatically when a guest with items in cart logs in.
 
+    ``guest_items`` are the ``(course_id, batch_id)`` pairs from the signed
+    guest cart cookie; ``session_key`` finds a legacy session-based guest cart.
+
     Returns:
         tuple: (user_cart, merged_count) - User's cart object and number of items merged
     """
@@ -29,24 +33,34 @@ def merge_guest_cart_to_user(user, session_key):
     # Get or create user cart first
     user_cart, _ = Cart.objects.get_or_create(user=user)
 
-    if not session_key:
+    if not session_key and not guest_items:
         return user_cart, 0
 
     try:
+        merged_count = 0
+        in_cart = set(user_cart.items.values_list("course_id", flat=True))
+
+        # Cookie-backed guest cart: create rows for courses not yet in the cart
+        for guest_item in GuestCart(guest_items or ()).items:
+            if guest_item.course_id not in in_cart:
+                CartItem.objects.create(cart=user_cart, course=guest_item.course, batch=guest_item.batch)
+                in_cart.add(guest_item.course_id)
+                merged_count += 1
+
         # Get guest cart by session key
-        guest_cart = Cart.objects.filter(session_key=session_key, user__isnull=True).first()
+        guest_cart = Cart.objects.filter(session_key=session_key, user__isnull=True).first() if session_key else None
 
         if not guest_cart or not guest_cart.items.exists():
-            return user_cart, 0  # No guest cart or empty cart
+            return user_cart, merged_count  # No guest cart or empty cart
 
         # Move items from guest cart to user cart
-        merged_count = 0
         for guest_item in guest_cart.items.all():
             # Check if course already in user cart
-            if not user_cart.items.filter(course=guest_item.course).exists():
+            if guest_item.course_id not in in_cart:
                 # Move item to user cart
                 guest_item.cart = user_cart
                 guest_item.save()
+                in_cart.add(guest_item.course_id)
                 merged_count += 1
             else:
                 # Course already in user cart, just delete the duplicate
@@ -87,13 +101,14 @@ class SecureLoginView(APIView):
         if self.role_allowed and user.role != self.role_allowed:
             return api_response(False, "User does not have permission to login here.", {}, status.HTTP_401_UNAUTHORIZED)
 
-        # Merge guest cart to user cart if session has items
+        # Merge guest cart to user cart if the cookie or session has items
         session_key = request.session.session_key
+        guest_items = read_guest_cart_ids(request)
         merged_items = 0
-        if session_key:
-            _, merged_items = merge_guest_cart_to_user(user, session_key)
+        if session_key or guest_items:
+            _, merged_items = merge_guest_cart_to_user(user, session_key, guest_items)
 
-        refresh = RefreshToken.for_user(user)
+        refresh = VersionedRefreshToken.for_user(user)
         token = {
             "access": str(refresh.access_token),
             "refresh": str(refresh),
@@ -113,4 +128,7 @@ class SecureLoginView(APIView):
             response_data["cart_merged"] = True
             response_data["cart_items_merged"] = merged_items
 
-        return api_response(True, "Login successful", response_data, status.HTTP_200_OK)
+        response = api_response(True, "Login successful", response_data, status.HTTP_200_OK)
+        if guest_items:
+            delete_guest_cart_cookie(response)
+        return response
@@ -1,4 +1,5 @@
 import calendar
+from datetime import date
 from decimal import Decimal
 
 from django.db.models import Prefetch, Exists, OuterRef
@@ -26,9 +27,18 @@ from api.serializers.serializers_accounting import (
     ExpenseUpdateRequestReadSerializer, ExpenseUpdateRequestCreateSerializer, ExpenseApprovalActionSerializer,
     IncomeTypeSerializer, PaymentMethodSerializer, ExpenseTypeSerializer, ExpensePaymentMethodSerializer
 )
-from api.utils.accounting_tranx_helper import resolve_date_range, export_transactions_pdf, export_transactions_csv
+from api.utils.accounting_periods import monthly_totals, recorded_years
+from api.utils.accounting_tranx_helper import (
+    build_transaction_rows,
+    export_transactions_csv,
+    export_transactions_pdf,
+    ledger_cursor,
+    ledger_row,
+    parse_ledger_cursor,
+    transactions_queryset,
+)
 from api.utils.approval_utils import handle_update_with_approval
-from api.utils.pagination import StandardResultsSetPagination
+from api.utils.pagination import StandardResultsSetPagination, encode_cursor
 from api.utils.response_utils import api_response
 from django.utils import timezone
 from django.db.models import Min
@@ -991,50 +1001,28 @@ class AccountingDashboardAPIView(APIView):
 
     def get(self, request):
         year = int(request.query_params.get("year", timezone.now().year))
+        totals = monthly_totals(recorded_years() | {year})
 
         return api_response(
             success=True,
             message="Accounting dashboard data fetched successfully",
             data={
-                "summary": self.get_summary(year),
-                "chart": self.get_revenue_vs_expense_chart(year),
+                "summary": self.get_summary(year, totals),
+                "chart": self.get_revenue_vs_expense_chart(year, totals),
                 "recent_transactions": self.get_recent_transactions(),
-                "quick_stats": self.get_quick_stats(year),
+                "quick_stats": self.get_quick_stats(year, totals),
                 "recent_activity": self.get_recent_activity(),
             },
         )
 
-    def get_summary(self, year):
-        revenue = (
-                Income.objects.filter(
-                    date__year=year,
-                    status="completed",
-                    approval_status="approved",
-                ).aggregate(total=Sum("amount"))["total"]
-                or Decimal("0.00")
-        )
-
-        expenses = (
-                Expense.objects.filter(
-                    date__year=year,
-                    status="paid",
-                ).aggregate(total=Sum("amount"))["total"]
-                or Decimal("0.00")
-        )
+    def get_summary(self, year, totals):
+        # ``totals`` covers every month with recorded activity, so it also yields the balance
+        revenue = sum((r for month, (r, _) in totals.items() if month.year == year), Decimal("0.00"))
+        expenses = sum((e for month, (_, e) in totals.items() if month.year == year), Decimal("0.00"))
 
         net_income = revenue - expenses
 
-        balance = (
-                          Income.objects.filter(
-                              status="completed",
-                              approval_status="approved",
-                          ).aggregate(total=Sum("amount"))["total"]
-                          or Decimal("0.00")
-                  ) - (
-                          Expense.objects.filter(status="paid")
-                          .aggregate(total=Sum("amount"))["total"]
-                          or Decimal("0.00")
-                  )
+        balance = sum((r - e for r, e in totals.values()), Decimal("0.00"))
 
         return {
             "total_revenue": float(revenue),
@@ -1043,28 +1031,11 @@ class AccountingDashboardAPIView(APIView):
             "balance": float(balance),
         }
 
-    def get_revenue_vs_expense_chart(self, year):
+    def get_revenue_vs_expense_chart(self, year, totals):
         months = []
 
         for month in range(1, 13):
-            revenue = (
-                    Income.objects.filter(
-                        date__year=year,
-                        date__month=month,
-                        status="completed",
-                        approval_status="approved",
-                    ).aggregate(total=Sum("amount"))["total"]
-                    or Decimal("0.00")
-            )
-
-            expense = (
-                    Expense.objects.filter(
-                        date__year=year,
-                        date__month=month,
-                        status="paid",
-                    ).aggregate(total=Sum("amount"))["total"]
-                    or Decimal("0.00")
-            )
+            revenue, expense = totals[date(year, month, 1)]
 
             months.append({
                 "month": calendar.month_abbr[month],
@@ -1121,7 +1092,7 @@ class AccountingDashboardAPIView(APIView):
 
         return data[:10]
 
-    def get_quick_stats(self, year):
+    def get_quick_stats(self, year, totals):
         active_students = CustomUser.objects.filter(
             role="student",
             is_active=True,
@@ -1132,14 +1103,9 @@ class AccountingDashboardAPIView(APIView):
             is_active=True,
         ).count()
 
-        avg_monthly_revenue = (
-                Income.objects.filter(
-                    date__year=year,
-                    status="completed",
-                    approval_status="approved",
-                ).aggregate(avg=Sum("amount") / 12)["avg"]
-                or Decimal("0.00")
-        )
+        avg_monthly_revenue = sum(
+            (revenue for month, (revenue, _) in totals.items() if month.year == year), Decimal("0.00")
+        ) / 12
 
         pending_incomes = Income.objects.filter(
             approval_status="pending"
@@ -1293,114 +1259,62 @@ class AccountingDashboardAPIView(APIView):
             description="Number of records per page for pagination",
             required=False,
         ),
+        OpenApiParameter(
+            name="cursor",
+            type=str,
+            description="Keyset cursor from a previous response's next_cursor (takes precedence over page)",
+            required=False,
+        ),
     ],
 )
 class TransactionsAPIView(APIView):
     permission_classes = [IsAdminOrAccountant]
 
     def get(self, request):
-        search = request.query_params.get("search")
-        tx_type = request.query_params.get("type")
-        status = request.query_params.get("status")
-        range_key = request.query_params.get("range")
-        export = request.query_params.get("export")
-
-        date_from = request.query_params.get("date_from")
-        date_to = request.query_params.get("date_to")
-
-        start, end = resolve_date_range(range_key)
-
-        incomes = Income.objects.select_related(
-            "income_type"
-        )
-
-        expenses = Expense.objects.select_related(
-            "expense_type"
-        )
+        params = request.query_params
+        export = params.get("export")
 
         # --------------------
-        # Filters
-        # --------------------
-        if status:
-            incomes = incomes.filter(status=status)
-            expenses = expenses.filter(status=status)
-
-        if start and end:
-            incomes = incomes.filter(date__range=(start, end))
-            expenses = expenses.filter(date__range=(start, end))
-
-        if date_from and date_to:
-            incomes = incomes.filter(date__range=(date_from, date_to))
-            expenses = expenses.filter(date__range=(date_from, date_to))
-
-        if search:
-            incomes = incomes.filter(
-                Q(transaction_id__icontains=search) |
-                Q(description__icontains=search) |
-                Q(payer_name__icontains=search)
-            )
-            expenses = expenses.filter(
-                Q(reference_id__icontains=search) |
-                Q(description__icontains=search) |
-                Q(vendor_name__icontains=search)
-            )
-
-        rows = []
-
-        if tx_type in (None, "income"):
-            for i in incomes:
-                rows.append({
-                    "id": i.transaction_id,
-                    "description": i.description,
-                    "category": i.income_type.name,
-                    "reference": i.payer_name,
-                    "date": i.date,
-                    "type": "Income",
-                    "status": i.status,
-                    "amount": float(i.amount),
-                })
-
-        if tx_type in (None, "expense"):
-            for e in expenses:
-                rows.append({
-                    "id": e.reference_id,
-                    "description": e.description,
-                    "category": e.expense_type.name,
-                    "reference": e.vendor_name,
-                    "date": e.date,
-                    "type": "Expense",
-                    "status": e.status,
-                    "amount": -float(e.amount),
-                })
-
-        rows.sort(key=lambda x: x["date"], reverse=True)
-
-        # --------------------
-        # EXPORTS
+        # EXPORTS (streamed from the same UNION ALL query)
         # --------------------
         if export == "csv":
-            return export_transactions_csv(rows)
+            return export_transactions_csv(build_transaction_rows(params))
 
         if export == "pdf":
-            return export_transactions_pdf(rows)
+            return export_transactions_pdf(build_transaction_rows(params))
 
         # --------------------
         # PAGINATION
         # --------------------
-        page = int(request.query_params.get("page", 1))
-        size = int(request.query_params.get("page_size", 20))
-
-        start_idx = (page - 1) * size
-        end_idx = start_idx + size
+        size = int(params.get("page_size", 20))
+        cursor = params.get("cursor")
+        count = transactions_queryset(params).count()
+
+        if cursor:
+            # Keyset: seek past the last row of the previous page instead of OFFSET
+            try:
+                after = parse_ledger_cursor(cursor)
+            except ValueError:
+                return api_response(False, "Invalid cursor", {}, status.HTTP_400_BAD_REQUEST)
+            page = None
+            values = list(transactions_queryset(params, after=after)[: size + 1])
+        else:
+            page = int(params.get("page", 1))
+            start_idx = (page - 1) * size
+            values = list(transactions_queryset(params)[start_idx: start_idx + size + 1])
+
+        has_more = len(values) > size
+        values = values[:size]
 
         return api_response(
             success=True,
             message="Transactions fetched successfully",
             data={
-                "count": len(rows),
+                "count": count,
                 "page": page,
                 "page_size": size,
-                "results": rows[start_idx:end_idx],
+                "next_cursor": encode_cursor(ledger_cursor(values[-1])) if has_more else None,
+                "results": [ledger_row(row) for row in values],
             },
         )
 
@@ -24,7 +24,6 @@ from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import OpenApiExample, extend_schema, extend_schema_view
 from rest_framework import filters, generics, permissions, status
 from rest_framework.generics import CreateAPIView, GenericAPIView
-from rest_framework.throttling import AnonRateThrottle, ScopedRateThrottle
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import TokenError
@@ -50,10 +49,12 @@ from api.serializers.serializers_auth import (
 )
 from api.utils.email_utils import send_system_email
 from api.utils.filters_utils import UserFilter
-from api.utils.pagination import StandardResultsSetPagination
+from api.utils.pagination import KeysetPagination, StandardResultsSetPagination
 from api.utils.response_utils import api_response
 from api.utils.resposne_return import APIResponseSerializer
+from api.utils.throttles import SharedAnonRateThrottle, SharedScopedRateThrottle
 from api.utils.url_utils import build_full_url
+from api.utils.user_status import VersionedRefreshToken
 from api.utils.utility_auth import SecureLoginView
 from api.views.views_base import BaseAdminViewSet
 
@@ -75,7 +76,7 @@ class StudentRegisterView(CreateAPIView):
 
     permission_classes = [permissions.AllowAny]
     serializer_class = StudentRegistrationSerializer
-    throttle_classes = [AnonRateThrottle]
+    throttle_classes = [SharedAnonRateThrottle]
 
     def create(self, request, *args, **kwargs):
         response = super().create(request, *args, **kwargs)
@@ -274,7 +275,8 @@ class CurrentUserProfileView(generics.RetrieveUpdateAPIView):
 class AdminStudentViewSet(BaseAdminViewSet):
     """Admin viewset for managing students."""
 
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetPagination
+    keyset_fields = ("date_joined", "id")
     queryset = CustomUser.objects.filter(role=CustomUser.Role.STUDENT).order_by("-date_joined")
 
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -474,14 +476,16 @@ class VerifyEmailView(GenericAPIView):
 
             # Merge guest cart to user cart if session has items
             from api.utils.cart_utils import merge_guest_cart_to_user
+            from api.utils.guest_cart import delete_guest_cart_cookie, read_guest_cart_ids
 
             session_key = request.session.session_key
+            guest_items = read_guest_cart_ids(request)
             merged_items = 0
-            if session_key:
-                _, merged_items = merge_guest_cart_to_user(user, session_key)
+            if session_key or guest_items:
+                _, merged_items = merge_guest_cart_to_user(user, session_key, guest_items)
 
             # Generate JWT tokens for auto-login
-            refresh = RefreshToken.for_user(user)
+            refresh = VersionedRefreshToken.for_user(user)
             tokens = {
                 "access": str(refresh.access_token),
                 "refresh": str(refresh),
@@ -502,12 +506,15 @@ class VerifyEmailView(GenericAPIView):
                 response_data["cart_merged"] = True
                 response_data["cart_items_merged"] = merged_items
 
-            return api_response(
+            response = api_response(
                 True,
                 "Account activated and logged in successfully.",
                 response_data,
                 status.HTTP_200_OK,
             )
+            if guest_items:
+                delete_guest_cart_cookie(response)
+            return response
 
         except SignatureExpired:
             # Allow client to know they can request a resend
@@ -538,7 +545,7 @@ class ResendVerificationEmailView(GenericAPIView):
 
     serializer_class = ResendVerificationEmailSerializer
     permission_classes = [permissions.AllowAny]
-    throttle_classes = [ScopedRateThrottle]
+    throttle_classes = [SharedScopedRateThrottle]
     throttle_scope = "resend"
 
     def post(self, request, *args, **kwargs):
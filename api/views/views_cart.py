@@ -11,6 +11,7 @@ from rest_framework.response import Response
 from api.models.models_cart import Cart, CartItem, Wishlist
 from api.models.models_course import Course
 from api.models.models_order import Enrollment
+from api.utils.guest_cart import GuestCart
 from api.serializers.serializers_cart import (
     AddToCartSerializer,
     AddToWishlistSerializer,
@@ -22,24 +23,27 @@ from api.serializers.serializers_cart import (
 
 
 def get_or_create_cart(request):
-    """Get or create cart for authenticated or guest user"""
+    """Get or create cart for authenticated user, or the cookie-backed cart for a guest.
+
+    Guest carts are never stored in the database; views that change them
+    must return through ``cart_response`` so the cookie is updated.
+    """
     if request.user.is_authenticated:
         cart, created = Cart.objects.get_or_create(user=request.user)
         return cart
-    else:
-        # For guest users, use session
-        session_key = request.session.session_key
-        if not session_key:
-            request.session.save()
-            session_key = request.session.session_key
+    return GuestCart.from_request(request)
 
-        cart, created = Cart.objects.get_or_create(session_key=session_key)
-        return cart
+
+def cart_response(cart, data, status_code=status.HTTP_200_OK):
+    response = Response(data, status=status_code)
+    if isinstance(cart, GuestCart):
+        cart.write(response)
+    return response
 
 
 @extend_schema(
     summary="Get Shopping Cart",
-    description="Retrieve the current user's shopping cart. Works for both authenticated and guest users (session-based).",
+    description="Retrieve the current user's shopping cart. Works for both authenticated and guest users (guest carts are kept in a signed cookie).",
     responses={
         200: OpenApiResponse(
             response=CartSerializer,
@@ -95,7 +99,7 @@ def cart_detail(request):
     """Get current user's cart"""
     cart = get_or_create_cart(request)
     serializer = CartSerializer(cart, context={"request": request})
-    return Response(serializer.data)
+    return cart_response(cart, serializer.data)
 
 
 @extend_schema(
@@ -204,9 +208,9 @@ def add_to_cart(request):
     cart = get_or_create_cart(request)
 
     # SINGLE COURSE RESTRICTION: Only allow one course in cart at a time
-    existing_items = cart.items.all()
-    if existing_items.exists():
-        existing_item = existing_items.first()
+    existing_items = cart.priced_items
+    if existing_items:
+        existing_item = existing_items[0]
         # Check if trying to add a different course
         if existing_item.course.id != course_id or (existing_item.batch and existing_item.batch.id != batch_id):
             return Response(
@@ -223,7 +227,7 @@ def add_to_cart(request):
             )
 
     # Check if this course+batch combination already in cart
-    cart_item, created = CartItem.objects.get_or_create(cart=cart, course=course, batch=batch)
+    cart_item, created = cart.add_item(course, batch)
 
     if created:
         message = f"{course.title} added to cart"
@@ -231,8 +235,8 @@ def add_to_cart(request):
         message = f"{course.title} is already in your cart"
 
     cart_serializer = CartSerializer(cart, context={"request": request})
-    return Response(
-        {"message": message, "cart": cart_serializer.data}, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+    return cart_response(
+        cart, {"message": message, "cart": cart_serializer.data}, status.HTTP_201_CREATED if created else status.HTTP_200_OK
     )
 
 
@@ -272,16 +276,13 @@ def remove_from_cart(request, item_id):
     """Remove an item from cart"""
     cart = get_or_create_cart(request)
 
-    try:
-        cart_item = CartItem.objects.get(id=item_id, cart=cart)
-        course_title = cart_item.course.title
-        cart_item.delete()
-
-        cart_serializer = CartSerializer(cart, context={"request": request})
-        return Response({"message": f"{course_title} removed from cart", "cart": cart_serializer.data})
-    except CartItem.DoesNotExist:
+    cart_item = cart.remove_item(item_id)
+    if cart_item is None:
         return Response({"error": "Cart item not found"}, status=status.HTTP_404_NOT_FOUND)
 
+    cart_serializer = CartSerializer(cart, context={"request": request})
+    return cart_response(cart, {"message": f"{cart_item.course.title} removed from cart", "cart": cart_serializer.data})
+
 
 @extend_schema(
     summary="Clear Shopping Cart",
@@ -319,7 +320,7 @@ def clear_cart(request):
     cart.clear()
 
     cart_serializer = CartSerializer(cart, context={"request": request})
-    return Response({"message": "Cart cleared successfully", "cart": cart_serializer.data})
+    return cart_response(cart, {"message": "Cart cleared successfully", "cart": cart_serializer.data})
 
 
 @extend_schema(
@@ -578,7 +579,7 @@ def move_to_cart(request, course_id):
 
     # Add to cart (without batch, user will select batch at checkout)
     cart = get_or_create_cart(request)
-    cart_item, created = CartItem.objects.get_or_create(cart=cart, course=course, batch=None)  # User can select batch later
+    cart_item, created = cart.add_item(course)  # User can select batch later
 
     cart_serializer = CartSerializer(cart, context={"request": request})
     wishlist_serializer = WishlistSerializer(wishlist, context={"request": request})
@@ -1,7 +1,7 @@
 """Course API views."""
 
 from django.core.cache import cache
-from django.db.models import Count, Exists, OuterRef, Prefetch, Q
+from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q
 
 import django_filters
 from django_filters.rest_framework import DjangoFilterBackend
@@ -79,7 +79,12 @@ from api.utils.cache_utils import (
     CACHE_KEY_HOME_CATEGORIES,
     CACHE_KEY_MEGAMENU,
     cache_response,
-    generate_cache_key,
+)
+from api.utils.conditional_utils import (
+    conditional_response,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
 )
 from api.utils.pagination import StandardResultsSetPagination
 from api.utils.response_utils import api_response
@@ -374,7 +379,7 @@ class CourseViewSet(BaseAdminViewSet):
         """Public users only see published and active courses."""
         return queryset.filter(is_active=True, status="published")
 
-    @cache_response(timeout=600, key_prefix=CACHE_KEY_COURSE_LIST)
+    @cache_response(timeout=600, key_prefix=CACHE_KEY_COURSE_LIST, render=True)
     def list(self, request, *args, **kwargs):
         """List courses - cached for 10 minutes."""
         return super().list(request, *args, **kwargs)
@@ -389,18 +394,16 @@ class CourseViewSet(BaseAdminViewSet):
           otherwise treat as anonymous (show sample)
         """
 
-        # Determine the course instance early so we can check enrollment
-        instance = self.get_object()
-
-        # Determine if requester should see full list
+        # Determine if requester should see full list. The enrollment check
+        # goes by slug so cache hits never load the (heavily prefetched) course.
         user = getattr(request, "user", None)
         is_staff_user = self.is_staff_user(user)
         is_purchased = False
         if user and user.is_authenticated and not is_staff_user:
             try:
-                from api.models.models_order import Enrollment
-
-                is_purchased = Enrollment.objects.filter(user=user, course=instance, is_active=True).exists()
+                is_purchased = Enrollment.objects.filter(
+                    user=user, course__slug=kwargs.get(self.lookup_url_kwarg), is_active=True
+                ).exists()
             except Exception:
                 is_purchased = False
 
@@ -413,39 +416,15 @@ class CourseViewSet(BaseAdminViewSet):
                 return response
             return api_response(True, f"{self.get_model_name()} retrieved successfully", response.data)
 
-        # Anonymous/guest path: use cache
-        # Build cache key consistent with cache_utils.generate_cache_key
-        query_params = sorted(request.GET.items())
-        cache_key = generate_cache_key(
-            CACHE_KEY_COURSE_DETAIL,
-            request.path,
-            *[f"{k}={v}" for k, v in query_params],
-        )
+        # Anonymous/guest path: cached rendered bytes
+        return self._cached_retrieve(request, *args, **kwargs)
 
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return api_response(
-                cached_data["success"],
-                cached_data["message"],
-                cached_data["data"],
-            )
-
-        # Not cached: call view and store
-        response = super().retrieve(request, *args, **kwargs)
-        if hasattr(response, "data") and hasattr(response, "status_code") and response.status_code == 200:
-            cache_data = {
-                "success": response.data.get("success", True),
-                "message": response.data.get("message", ""),
-                "data": response.data.get("data", {}),
-                "status_code": response.status_code,
-            }
-            cache.set(cache_key, cache_data, 1800)
-
-        # Avoid wrapping an already-formatted api_response payload again.
-        if isinstance(response.data, dict) and "success" in response.data and "data" in response.data:
-            return response
-
-        return api_response(True, f"{self.get_model_name()} retrieved successfully", response.data)
+    @cache_response(timeout=1800, key_prefix=CACHE_KEY_COURSE_DETAIL, cache_anonymous_only=False, render=True)
+    def _cached_retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        # No Last-Modified: the payload nests modules and content without timestamps, so only the ETag is reliable
+        return api_response(True, f"{self.get_model_name()} retrieved successfully", serializer.data)
 
     @extend_schema(
         summary="Get courses by category",
@@ -505,7 +484,7 @@ class CourseViewSet(BaseAdminViewSet):
         responses={200: CourseListSerializer},
         tags=["Course - Main"],
     )
-    @cache_response(timeout=1800, key_prefix=CACHE_KEY_COURSE_FEATURED)
+    @cache_response(timeout=1800, key_prefix=CACHE_KEY_COURSE_FEATURED, render=True)
     @action(detail=False, methods=["get"], permission_classes=[permissions.AllowAny])
     def featured(self, request):
         """Retrieve the latest 6 published courses."""
@@ -534,7 +513,7 @@ class CourseViewSet(BaseAdminViewSet):
         responses={200: OpenApiParameter},
         tags=["Course - Main"],
     )
-    @cache_response(timeout=900, key_prefix=CACHE_KEY_HOME_CATEGORIES)
+    @cache_response(timeout=900, key_prefix=CACHE_KEY_HOME_CATEGORIES, render=True)
     @action(
         detail=False,
         methods=["get"],
@@ -607,7 +586,11 @@ class CourseViewSet(BaseAdminViewSet):
                 data = cached["results"]
             else:
                 data = cached
-            return api_response(True, "Megamenu nav retrieved (cached)", data)
+            etag = make_etag(data)
+            if is_not_modified(request, etag):
+                return not_modified_response(etag)
+            response = api_response(True, "Megamenu nav retrieved (cached)", data)
+            return conditional_response(request, response, etag=etag)
 
         # Optimize: Prefetch courses for each category to avoid N+1
         megamenu_courses_qs = (
@@ -640,7 +623,8 @@ class CourseViewSet(BaseAdminViewSet):
         # Return plain list (frontend expects array directly for .map())
         payload = result
         cache.set(CACHE_KEY_MEGAMENU, payload, MEGAMENU_CACHE_TTL)
-        return api_response(True, "Megamenu nav retrieved", payload)
+        response = api_response(True, "Megamenu nav retrieved", payload)
+        return conditional_response(request, response, etag=make_etag(payload))
 
     @extend_schema(
         summary="List modules for a course",
@@ -2155,6 +2139,7 @@ class CourseBatchViewSet(BaseAdminViewSet):
             self.queryset.filter(
                 is_active=True,
                 status__in=["enrollment_open", "upcoming"],
+                enrolled_students__lt=F("max_students"),
             )
             .exclude(status="cancelled")
             .exclude(status="completed")
@@ -8,6 +8,7 @@ from rest_framework.decorators import action
 from api.models.models_custom_payment import CustomPayment
 from api.permissions import IsStaff
 from api.serializers.serializers_custom_payment import CustomPaymentSerializer
+from api.utils.pagination import OptionalKeysetPagination
 from api.utils.response_utils import api_response
 from api.views.views_base import BaseAdminViewSet
 
@@ -49,6 +50,7 @@ class CustomPaymentViewSet(BaseAdminViewSet):
 
     queryset = CustomPayment.objects.select_related("student", "course", "created_by", "enrollment").all()
     serializer_class = CustomPaymentSerializer
+    pagination_class = OptionalKeysetPagination
     permission_classes = [IsStaff]  # Base permission, overridden in get_permissions
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ["status", "payment_method", "student", "course", "created_by"]
@@ -1,9 +1,13 @@
-"""Dashboard API views for admin analytics and statistics."""
+"""Dashboard API views for admin analytics and statistics.
+
+Signups, enrollments and revenue are read from the DailyMetric rollup
+(``api.utils.metrics_rollup``), so the cost of a dashboard load depends on
+the number of days covered rather than on the size of the base tables.
+"""
 
 from datetime import datetime, timedelta
 
-from django.db.models import Count, F, Q, Sum
-from django.db.models.functions import TruncDate, TruncMonth
+from django.db.models import Q
 from django.utils import timezone
 
 from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema
@@ -13,9 +17,11 @@ from rest_framework.response import Response
 
 from api.models.models_auth import CustomUser
 from api.models.models_course import Course
-from api.models.models_order import Enrollment, Order
+from api.models.models_metrics import DailyMetric
 from api.permissions import IsAdmin
+from api.utils.metrics_rollup import Metric, breakdown, series, totals, window
 from api.utils.response_utils import api_response
+from api.utils.statistics import StatisticsBuilder
 
 
 def get_date_range(period):
@@ -51,6 +57,12 @@ def get_date_range(period):
     return now - delta
 
 
+def _course_titles(course_ids):
+    """Map course id strings (rollup dimensions) to course titles."""
+    courses = Course.objects.filter(id__in=list(course_ids)).values_list("id", "title")
+    return {str(course_id): title for course_id, title in courses}
+
+
 def get_previous_period_date(current_start_date, period):
     """Calculate the start date for the previous period for comparison."""
     if current_start_date is None:
@@ -104,75 +116,64 @@ def dashboard_overview(request):
     start_date = get_date_range(period)
     previous_start_date = get_previous_period_date(start_date, period) if start_date else None
 
-    # Build base filters
+    # Course counts come from the (small) course table; everything else from the daily rollup
     current_filter = Q()
-    current_filter_users = Q()
     previous_filter = Q()
-    previous_filter_users = Q()
 
     if start_date:
         current_filter = Q(created_at__gte=start_date)
-        current_filter_users = Q(date_joined__gte=start_date)
         if previous_start_date:
             previous_filter = Q(created_at__gte=previous_start_date, created_at__lt=start_date)
-            previous_filter_users = Q(date_joined__gte=previous_start_date, date_joined__lt=start_date)
-
-    # ========== STATISTICS CARDS ==========
 
-    # 1. Total Students
-    total_students = CustomUser.objects.filter(role="student", is_enabled=True).count()
-    new_students = CustomUser.objects.filter(role="student", is_enabled=True).filter(current_filter_users).count()
+    windows = {
+        "total": window(),
+        "current": window(since=start_date),
+        "previous": window(since=previous_start_date, until=start_date),
+    }
 
-    prev_students = (
-        CustomUser.objects.filter(role="student", is_enabled=True).filter(previous_filter_users).count()
-        if previous_start_date
-        else 0
+    # Students, teachers and earnings for every window in one query over the rollup
+    rollup = StatisticsBuilder(DailyMetric.objects.all())
+    for name, q in windows.items():
+        rollup.sum(f"students_{name}", "count", Q(metric=Metric.STUDENTS, dimension="enabled") & q)
+        rollup.sum(f"teachers_{name}", "count", Q(metric=Metric.TEACHERS, dimension="enabled") & q)
+        rollup.sum(f"earnings_{name}", "amount", Q(metric=Metric.REVENUE_BY_METHOD) & q)
+    rollup = rollup.build()
+
+    courses = (
+        StatisticsBuilder(Course.objects.filter(is_active=True))
+        .count("total")
+        .count("new", current_filter)
+        .count("previous", previous_filter)
+        .build()
     )
 
+    # ========== STATISTICS CARDS ==========
+
+    # 1. Total Students (enabled accounts)
+    total_students = rollup["students_total"]
+    new_students = rollup["students_current"]
+    prev_students = rollup["students_previous"] if previous_start_date else 0
+
     student_growth = new_students - prev_students if prev_students > 0 else new_students
     student_growth_percentage = (student_growth / prev_students * 100) if prev_students > 0 else 0
 
     # 2. Total Courses
-    total_courses = Course.objects.filter(is_active=True).count()
-    new_courses = Course.objects.filter(is_active=True).filter(current_filter).count()
+    total_courses = courses["total"]
+    new_courses = courses["new"]
 
-    prev_courses = Course.objects.filter(is_active=True).filter(previous_filter).count() if previous_start_date else 0
+    prev_courses = courses["previous"] if previous_start_date else 0
     course_growth = new_courses - prev_courses if prev_courses > 0 else new_courses
 
-    # 3. Total Teachers
-    total_teachers = CustomUser.objects.filter(role__in=["teacher", "staff"], is_enabled=True).count()
-    new_teachers = (
-        CustomUser.objects.filter(role__in=["teacher", "staff"], is_enabled=True).filter(current_filter_users).count()
-    )
-
-    prev_teachers = (
-        CustomUser.objects.filter(role__in=["teacher", "staff"], is_enabled=True).filter(previous_filter_users).count()
-        if previous_start_date
-        else 0
-    )
+    # 3. Total Teachers (enabled accounts)
+    total_teachers = rollup["teachers_total"]
+    new_teachers = rollup["teachers_current"]
+    prev_teachers = rollup["teachers_previous"] if previous_start_date else 0
     teacher_growth = new_teachers - prev_teachers if prev_teachers > 0 else new_teachers
 
     # 4. Total Earnings (Only completed orders - paid and verified)
-    total_earnings = (
-        Order.objects.filter(status="completed").aggregate(total=Sum("total_amount"))["total"]  # Only count completed orders
-        or 0
-    )
-
-    period_earnings = (
-        Order.objects.filter(status="completed")  # Only count completed orders
-        .filter(current_filter)
-        .aggregate(total=Sum("total_amount"))["total"]
-        or 0
-    )
-
-    prev_earnings = (
-        Order.objects.filter(status="completed")  # Only count completed orders
-        .filter(previous_filter)
-        .aggregate(total=Sum("total_amount"))["total"]
-        or 0
-        if previous_start_date
-        else 0
-    )
+    total_earnings = rollup["earnings_total"]
+    period_earnings = rollup["earnings_current"]
+    prev_earnings = rollup["earnings_previous"] if previous_start_date else 0
 
     earnings_growth = period_earnings - prev_earnings if prev_earnings > 0 else period_earnings
     earnings_growth_percentage = (earnings_growth / prev_earnings * 100) if prev_earnings > 0 else 0
@@ -181,36 +182,26 @@ def dashboard_overview(request):
 
     # Chart 1: Enrollment Overview - Last 12 Months (Bar Chart)
     twelve_months_ago = timezone.now() - timedelta(days=365)
-    enrollments_by_month = (
-        Enrollment.objects.filter(created_at__gte=twelve_months_ago, is_active=True)
-        .annotate(month=TruncMonth("created_at"))
-        .values("month")
-        .annotate(count=Count("id"))
-        .order_by("month")
-    )
+    enrollments_by_month = series(Metric.ENROLLMENTS, since=twelve_months_ago, period="month")
 
     # Format for chart
     enrollment_chart = {"labels": [], "data": []}
 
     for item in enrollments_by_month:
-        month_name = item["month"].strftime("%b %Y")
+        month_name = item["period"].strftime("%b %Y")
         enrollment_chart["labels"].append(month_name)
         enrollment_chart["data"].append(item["count"])
 
     # Chart 2: Top 5 Popular Courses (Pie Chart)
-    popular_courses = (
-        Enrollment.objects.filter(is_active=True)
-        .values("course__id", "course__title")
-        .annotate(enrollment_count=Count("id"))
-        .order_by("-enrollment_count")[:5]
-    )
+    popular_courses = breakdown(Metric.ENROLLMENTS, limit=5)
+    course_titles = _course_titles(item["dimension"] for item in popular_courses)
 
     popular_courses_chart = {"labels": [], "data": [], "course_ids": []}
 
     for course in popular_courses:
-        popular_courses_chart["labels"].append(course["course__title"])
-        popular_courses_chart["data"].append(course["enrollment_count"])
-        popular_courses_chart["course_ids"].append(str(course["course__id"]))
+        popular_courses_chart["labels"].append(course_titles.get(course["dimension"]))
+        popular_courses_chart["data"].append(course["count"])
+        popular_courses_chart["course_ids"].append(course["dimension"])
 
     # ========== BUILD RESPONSE ==========
 
@@ -311,33 +302,30 @@ def student_details(request):
     period = request.query_params.get("period", "month")
     start_date = get_date_range(period)
 
-    # Build filter
-    date_filter = Q(date_joined__gte=start_date) if start_date else Q()
-
     # Basic stats
-    total_students = CustomUser.objects.filter(role="student", is_enabled=True).count()
-    inactive_students = CustomUser.objects.filter(role="student", is_enabled=False).count()
-    new_students = CustomUser.objects.filter(role="student").filter(date_filter).count()
+    students = totals(
+        Metric.STUDENTS,
+        total=window(dimension="enabled"),
+        inactive=window(dimension="disabled"),
+        new=window(since=start_date),
+    )
+    total_students = students["total"]["count"]
+    inactive_students = students["inactive"]["count"]
+    new_students = students["new"]["count"]
 
-    # Students with enrollments
+    # Students with enrollments (per-student, so not part of the daily rollup)
     enrolled_students = (
         CustomUser.objects.filter(role="student", is_enabled=True, enrollments__is_active=True).distinct().count()
     )
 
     # Daily registration trend (last 30 days)
     thirty_days_ago = timezone.now() - timedelta(days=30)
-    daily_registrations = (
-        CustomUser.objects.filter(role="student", date_joined__gte=thirty_days_ago)
-        .annotate(date=TruncDate("date_joined"))
-        .values("date")
-        .annotate(count=Count("id"))
-        .order_by("date")
-    )
+    daily_registrations = series(Metric.STUDENTS, since=thirty_days_ago)
 
     registration_trend = {"labels": [], "data": []}
 
     for item in daily_registrations:
-        registration_trend["labels"].append(item["date"].strftime("%Y-%m-%d"))
+        registration_trend["labels"].append(item["period"].strftime("%Y-%m-%d"))
         registration_trend["data"].append(item["count"])
 
     data = {
@@ -392,13 +380,15 @@ def course_details(request):
     draft_courses = Course.objects.filter(is_active=True, status="draft").count()
     new_courses = Course.objects.filter(date_filter).count()
 
-    # Enrollment stats per course
-    course_enrollment_stats = (
-        Course.objects.filter(is_active=True)
-        .annotate(total_enrollments=Count("enrollments", filter=Q(enrollments__is_active=True)))
-        .values("id", "title", "total_enrollments")
-        .order_by("-total_enrollments")[:10]
-    )
+    # Enrollment stats per course (active enrollments from the daily rollup)
+    enrollment_counts = {item["dimension"]: item["count"] for item in breakdown(Metric.ENROLLMENTS)}
+    course_enrollment_stats = sorted(
+        (
+            {"id": course["id"], "title": course["title"], "total_enrollments": enrollment_counts.get(str(course["id"]), 0)}
+            for course in Course.objects.filter(is_active=True).values("id", "title")
+        ),
+        key=lambda course: -course["total_enrollments"],
+    )[:10]
 
     data = {
         "period": period,
@@ -408,7 +398,7 @@ def course_details(request):
             "draft_courses": draft_courses,
             "new_courses": new_courses,
         },
-        "top_courses": list(course_enrollment_stats),
+        "top_courses": course_enrollment_stats,
     }
 
     return api_response(True, "Course details retrieved successfully", data)
@@ -438,68 +428,41 @@ def earnings_details(request):
     period = request.query_params.get("period", "month")
     start_date = get_date_range(period)
 
-    date_filter = Q(created_at__gte=start_date) if start_date else Q()
-
-    # Total earnings (Only completed orders)
-    total_earnings = (
-        Order.objects.filter(status="completed").aggregate(total=Sum("total_amount"))["total"]  # Only count completed orders
-        or 0
-    )
-
-    # Period earnings (Only completed orders)
-    period_earnings = (
-        Order.objects.filter(status="completed")  # Only count completed orders
-        .filter(date_filter)
-        .aggregate(total=Sum("total_amount"))["total"]
-        or 0
-    )
+    # Total and period earnings (Only completed orders)
+    earnings = totals(Metric.REVENUE_BY_METHOD, total=window(), period=window(since=start_date))
+    total_earnings = earnings["total"]["amount"]
+    period_earnings = earnings["period"]["amount"]
 
     # Earnings by payment method (Only completed orders)
-    earnings_by_method = (
-        Order.objects.filter(status="completed")  # Only count completed orders
-        .filter(date_filter)
-        .values("payment_method")
-        .annotate(total=Sum("total_amount"), count=Count("id"))
-    )
+    earnings_by_method = breakdown(Metric.REVENUE_BY_METHOD, since=start_date)
 
     # Earnings by course (top 10, Only completed orders)
-    earnings_by_course = (
-        Order.objects.filter(status="completed")  # Only count completed orders
-        .filter(date_filter)
-        .values("items__course__id", "items__course__title")
-        .annotate(total_revenue=Sum(F("items__price") - F("items__discount")), total_orders=Count("id", distinct=True))
-        .order_by("-total_revenue")[:10]
-    )
+    earnings_by_course = breakdown(Metric.REVENUE_BY_COURSE, since=start_date, order_by="-total_amount", limit=10)
+    course_titles = _course_titles(item["dimension"] for item in earnings_by_course)
 
     # Monthly earnings trend (last 12 months, Only completed orders)
     twelve_months_ago = timezone.now() - timedelta(days=365)
-    monthly_earnings = (
-        Order.objects.filter(status="completed", created_at__gte=twelve_months_ago)  # Only count completed orders
-        .annotate(month=TruncMonth("created_at"))
-        .values("month")
-        .annotate(total=Sum("total_amount"))
-        .order_by("month")
-    )
+    monthly_earnings = series(Metric.REVENUE_BY_METHOD, since=twelve_months_ago, period="month")
 
     earnings_trend = {"labels": [], "data": []}
 
     for item in monthly_earnings:
-        earnings_trend["labels"].append(item["month"].strftime("%b %Y"))
-        earnings_trend["data"].append(float(item["total"]))
+        earnings_trend["labels"].append(item["period"].strftime("%b %Y"))
+        earnings_trend["data"].append(float(item["amount"]))
 
     data = {
         "period": period,
         "summary": {"total_earnings": float(total_earnings), "period_earnings": float(period_earnings), "currency": "BDT"},
         "by_payment_method": [
-            {"method": item["payment_method"], "total": float(item["total"]), "count": item["count"]}
+            {"method": item["dimension"], "total": float(item["amount"]), "count": item["count"]}
             for item in earnings_by_method
         ],
         "top_earning_courses": [
             {
-                "course_id": str(item["items__course__id"]) if item["items__course__id"] else None,
-                "course_title": item["items__course__title"],
-                "total_revenue": float(item["total_revenue"] or 0),
-                "total_orders": item["total_orders"],
+                "course_id": item["dimension"],
+                "course_title": course_titles.get(item["dimension"]),
+                "total_revenue": float(item["amount"] or 0),
+                "total_orders": item["count"],
             }
             for item in earnings_by_course
         ],
@@ -2,8 +2,9 @@
 import csv
 from datetime import datetime, timedelta
 from decimal import Decimal
+from io import BytesIO
 
-from django.db.models import Avg, Count, F, Sum
+from django.db.models import Avg, Count, F, Q, Sum
 from django.http import HttpResponse
 from django.utils import timezone
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, OpenApiTypes, extend_schema
@@ -17,6 +18,7 @@ from api.models.models_employee import Employee
 from api.models.models_order import Enrollment, Order
 from api.permissions import IsAdmin
 from api.utils.export_utils import CSVExporter, PDFExporter
+from api.utils.report_jobs import render_students_pdf
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.lib import colors
 
@@ -96,11 +98,14 @@ def validate_and_parse_date_range(request, max_range_days=365):
 @api_view(["GET"])
 @permission_classes([IsAuthenticated, IsAdmin])
 def export_students_csv(request):
-    """Export students list as CSV."""
+    """Export students list as CSV (streamed)."""
     queryset = (
         CustomUser.objects
         .filter(role="student")
-        .prefetch_related("enrollments")
+        .annotate(
+            enrolled_count=Count("enrollments"),
+            completed_count=Count("enrollments", filter=Q(enrollments__progress_percentage=100)),
+        )
         .order_by("-date_joined")
     )
 
@@ -120,25 +125,21 @@ def export_students_csv(request):
         "Last Login",
     ]
 
-    data = []
-    for student in queryset:
-        enrollments = student.enrollments.all()
-        completed_count = enrollments.filter(progress_percentage=100).count()
-
-        data.append([
+    def row(student):
+        return [
             student.student_id or "N/A",
             student.get_full_name or "N/A",
             student.email,
             student.phone or "N/A",
             "Active" if student.is_enabled else "Disabled",
-            enrollments.count(),
-            completed_count,
+            student.enrolled_count,
+            student.completed_count,
             student.date_joined.strftime("%Y-%m-%d"),
             student.last_login.strftime("%Y-%m-%d %H:%M") if student.last_login else "Never",
-        ])
+        ]
 
     filename = f"students_{timezone.now().strftime('%Y%m%d_%H%M%S')}.csv"
-    return CSVExporter.export_to_csv(filename, headers, data)
+    return CSVExporter.stream_queryset(filename, headers, queryset, row)
 
 
 
@@ -155,102 +156,17 @@ def export_students_csv(request):
 @api_view(["GET"])
 @permission_classes([IsAuthenticated, IsAdmin])
 def export_students_pdf(request):
-    """Export students list as PDF (Landscape, branded, UK date style)."""
+    """Export students list as PDF (Landscape, branded, UK date style).
 
-    # =========================
-    # QUERYSET
-    # =========================
-    queryset = (
-        CustomUser.objects
-        .filter(role="student")
-        .prefetch_related("enrollments")
-        .order_by("-date_joined")
-    )
+    Renders in the request; large lists should go through the report job
+    endpoints (``POST /api/reports/`` with ``report_type=students_pdf``).
+    """
+    buffer = BytesIO()
+    filename = render_students_pdf(request.query_params, buffer)
 
-    is_enabled = request.query_params.get("is_enabled")
-    if is_enabled is not None:
-        queryset = queryset.filter(is_enabled=is_enabled.lower() == "true")
-
-    # =========================
-    # DATE RANGE (OPTIONAL)
-    # =========================
-    start_date = request.query_params.get("start_date")
-    end_date = request.query_params.get("end_date")
-
-    start_date = (
-        datetime.strptime(start_date, "%Y-%m-%d").date()
-        if start_date else None
-    )
-    end_date = (
-        datetime.strptime(end_date, "%Y-%m-%d").date()
-        if end_date else None
-    )
-
-    # =========================
-    # UK STYLE TITLE
-    # =========================
-    title = uk_report_title(
-        base_title="Student List",
-        start_date=start_date,
-        end_date=end_date,
-    )
-
-    exporter = PDFExporter(
-        title=title,
-        pagesize=landscape(A4),
-    )
-
-    # =========================
-    # TABLE DATA
-    # =========================
-    headers = [
-        "ID",
-        "Name",
-        "Email",
-        "Phone",
-        "Courses",
-        "Status",
-        "Registered",
-    ]
-
-    data = [
-        [
-            student.student_id or "N/A",
-            student.get_full_name or "N/A",
-            student.email,
-            student.phone or "N/A",
-            student.enrollments.count(),
-            "Active" if student.is_enabled else "Disabled",
-            student.date_joined.strftime("%d %B %Y"),
-        ]
-        for student in queryset
-    ]
-
-    # =========================
-    # CONTENT
-    # =========================
-    content = []
-
-    content.append(
-        Paragraph(
-            f"<b>Total Students:</b> {queryset.count()}<br/>"
-            f"Active: <b>{queryset.filter(is_enabled=True).count()}</b> | "
-            f"Disabled: <b>{queryset.filter(is_enabled=False).count()}</b>",
-            exporter.styles["CustomBody"],
-        )
-    )
-
-    content.append(Spacer(1, 14))
-
-    table = exporter.create_table(
-        headers=headers,
-        data=data,
-        col_widths=[70, 140, 180, 110, 80, 90, 100],
-    )
-
-    content.append(table)
-
-    return exporter.create_pdf(content)
+    response = HttpResponse(buffer.getvalue(), content_type="application/pdf")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
 
 
@@ -357,7 +273,11 @@ def export_students_pdf(request):
 # @permission_classes([IsAuthenticated, IsAdmin])
 # def export_orders_csv(request):
 #     """Export orders list as CSV."""
-#     queryset = Order.objects.select_related("user", "coupon").prefetch_related("items").order_by("-created_at")
+#     queryset = (
+#         Order.objects.select_related("user", "coupon")
+#         .annotate(items_count=Count("items"))
+#         .order_by("-created_at")
+#     )
 #
 #     payment_status = request.query_params.get("payment_status")
 #     if payment_status:
@@ -377,14 +297,13 @@ def export_students_pdf(request):
 #         "Due Amount", "Payment Status", "Payment Method", "Coupon Code", "Order Date"
 #     ]
 #
-#     data = []
-#     for order in queryset:
-#         data.append([
+#     def row(order):
+#         return [
 #             order.order_number,
 #             order.billing_name,
 #             order.billing_email,
 #             order.billing_phone,
-#             order.items.count(),
+#             order.items_count,
 #             f"{order.subtotal:.2f}",
 #             f"{order.discount_amount:.2f}",
 #             f"{order.total_amount:.2f}",
@@ -394,10 +313,10 @@ def export_students_pdf(request):
 #             order.payment_method or "N/A",
 #             order.coupon.code if order.coupon else "N/A",
 #             order.created_at.strftime("%Y-%m-%d %H:%M"),
-#         ])
+#         ]
 #
 #     filename = f'orders_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv'
-#     return CSVExporter.export_to_csv(filename, headers, data)
+#     return CSVExporter.stream_queryset(filename, headers, queryset, row)
 #
 #
 # @extend_schema(
@@ -694,10 +613,9 @@ def export_students_pdf(request):
 #         "Payment Status", "Payment Method", "Transaction ID"
 #     ]
 #
-#     data = []
-#     for order in queryset.order_by("-created_at"):
+#     def row(order):
 #         courses = ", ".join([item.course.title for item in order.items.all()])
-#         data.append([
+#         return [
 #             order.created_at.strftime("%Y-%m-%d %H:%M"),
 #             order.order_number,
 #             order.billing_name,
@@ -712,10 +630,11 @@ def export_students_pdf(request):
 #             order.get_payment_status_display(),
 #             order.payment_method or "N/A",
 #             order.transaction_id or "N/A",
-#         ])
+#         ]
 #
 #     filename = f"revenue_analytics_{start_date}_to_{end_date}.csv"
-#     return CSVExporter.export_to_csv(filename, headers, data)
+#     # Prefetching still works per chunk of the streamed iterator
+#     return CSVExporter.stream_queryset(filename, headers, queryset.order_by("-created_at"), row)
 #
 #
 # @extend_schema(
@@ -12,6 +12,7 @@ from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from api.models.models_footer import Footer
 from api.permissions import IsAdmin
 from api.serializers.serializers_footer import FooterSerializer
+from api.utils.conditional_utils import conditional_response, is_not_modified, make_etag, not_modified_response
 from api.utils.response_utils import api_response
 from api.utils.resposne_return import APIResponseSerializer
 
@@ -32,22 +33,25 @@ class FooterPublicView(RetrieveAPIView):
     permission_classes = [permissions.AllowAny]
 
     def get_object(self):
-        cached = cache.get(CACHE_KEY)
-        if cached:
-            return cached
-
-        footer = Footer.objects.prefetch_related("link_groups__links", "social_links").first()
-        if footer:
-            cache.set(CACHE_KEY, footer, CACHE_TIMEOUT)
-        return footer
+        return Footer.objects.prefetch_related("link_groups__links", "social_links").first()
 
     def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        if not instance:
-            return api_response(False, "No footer found", {}, status.HTTP_404_NOT_FOUND)
-
-        serializer = self.get_serializer(instance, context={"request": request})
-        return api_response(True, "Footer retrieved successfully", serializer.data, status.HTTP_200_OK)
+        # Cache the serialized payload (not the model instance) so it can be
+        # stored in a shared, JSON-serialized cache backend.
+        data = cache.get(CACHE_KEY)
+        if data is None:
+            instance = self.get_object()
+            if not instance:
+                return api_response(False, "No footer found", {}, status.HTTP_404_NOT_FOUND)
+
+            data = self.get_serializer(instance, context={"request": request}).data
+            cache.set(CACHE_KEY, data, CACHE_TIMEOUT)
+
+        etag = make_etag(data)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        response = api_response(True, "Footer retrieved successfully", data, status.HTTP_200_OK)
+        return conditional_response(request, response, etag=etag)
 
 
 @extend_schema_view(
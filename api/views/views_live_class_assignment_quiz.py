@@ -9,7 +9,7 @@ import uuid
 from decimal import Decimal
 
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count, Q, prefetch_related_objects
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema, extend_schema_view
@@ -27,7 +27,6 @@ from api.models.models_module import (
     QuizAnswer,
     QuizAttempt,
     QuizQuestion,
-    QuizQuestionOption,
 )
 from api.permissions import IsTeacherOrAdmin
 from api.serializers.serializers_module import (
@@ -45,7 +44,9 @@ from api.serializers.serializers_module import (
     QuizQuestionCreateUpdateSerializer,
 )
 from api.utils.enrollment_filters import filter_queryset_for_student
-from api.utils.grading_utils import apply_late_penalty
+from api.utils.grading_utils import apply_late_penalty, grade_quiz_submission
+from api.utils.pagination import OptionalKeysetPagination
+from api.utils.quiz_papers import get_quiz_paper, new_question_seed, order_questions
 from api.utils.response_utils import api_response
 from api.views.views_base import BaseAdminViewSet
 from api.models.models_order import Enrollment
@@ -769,6 +770,7 @@ class AssignmentSubmissionViewSet(BaseAdminViewSet):
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptionalKeysetPagination
 
     queryset = AssignmentSubmission.objects.select_related(
         'assignment',
@@ -1062,6 +1064,10 @@ class QuizViewSet(BaseAdminViewSet):
         queryset = super().get_queryset()
         user = self.request.user
 
+        if self.action == "start":
+            # Questions come from the compiled quiz paper cache
+            queryset = queryset.prefetch_related(None)
+
         # Admin / Teacher → full access
         if user.role in ["admin", "superadmin", "teacher"]:
             return queryset
@@ -1106,18 +1112,11 @@ class QuizViewSet(BaseAdminViewSet):
 
     @action(detail=True, methods=["post"])
     def start(self, request, pk=None):
+        # get_object() is scoped by get_queryset(), so students only reach their enrolled quizzes
         quiz = self.get_object()
         student = request.user
         now = timezone.now()
 
-        if not self.get_queryset().filter(id=quiz.id).exists():
-            return api_response(
-                False,
-                "You don't have permission to start this quiz",
-                None,
-                status.HTTP_403_FORBIDDEN,
-            )
-
         if quiz.available_from and now < quiz.available_from:
             return api_response(False, "Quiz not yet available", None, status.HTTP_400_BAD_REQUEST)
 
@@ -1147,6 +1146,7 @@ class QuizViewSet(BaseAdminViewSet):
                     "attempt_id": str(existing_attempt.id),
                     "started_at": existing_attempt.started_at,
                     "time_limit_minutes": quiz.duration_minutes,
+                    "questions": order_questions(get_quiz_paper(quiz), existing_attempt.question_seed),
                 },
             )
 
@@ -1156,29 +1156,11 @@ class QuizViewSet(BaseAdminViewSet):
             attempt_number=attempt_count + 1,
             started_at=now,
             status="in_progress",
+            question_seed=new_question_seed() if quiz.randomize_questions else None,
         )
 
-        questions = quiz.questions.filter(is_active=True)
-        questions = questions.order_by("?") if quiz.randomize_questions else questions.order_by("order")
-
-        marks_per_question = quiz.total_marks / questions.count() if questions.exists() else 0
-
-        questions_data = []
-        for q in questions:
-            data = {
-                "id": str(q.id),
-                "question_text": q.question_text,
-                "question_type": q.question_type,
-                "points": round(marks_per_question, 2),
-            }
-
-            if q.question_type in ["mcq", "multiple"]:
-                data["options"] = [
-                    {"id": str(o.id), "option_text": o.option_text}
-                    for o in q.options.all().order_by("order")
-                ]
-
-            questions_data.append(data)
+        # Compiled once per quiz version and shared by every attempt
+        questions_data = order_questions(get_quiz_paper(quiz), attempt.question_seed)
 
         return api_response(
             True,
@@ -1312,45 +1294,7 @@ class QuizAttemptViewSet(viewsets.ReadOnlyModelViewSet):
         if answers_data is None:
             answers_data = []
 
-        total_questions = attempt.quiz.questions.filter(is_active=True).count()
-        marks_per_question = attempt.quiz.total_marks / total_questions if total_questions else 0
-
-        options_map = {str(o.id): o for o in QuizQuestionOption.objects.filter(question__quiz=attempt.quiz)}
-
-        total_marks = 0
-
-        for item in answers_data:
-            question = QuizQuestion.objects.filter(id=item.get("question_id"), quiz=attempt.quiz).first()
-            if not question:
-                continue
-
-            quiz_answer, _ = QuizAnswer.objects.get_or_create(attempt=attempt, question=question)
-
-            if question.question_type in ["mcq", "multiple"]:
-                # selected_ids = item.get("answer", [])
-                selected_ids = item.get("selected_options", [])
-                if not isinstance(selected_ids, list):
-                    selected_ids = [selected_ids]
-
-                quiz_answer.selected_options.clear()
-                for opt_id in selected_ids:
-                    option = options_map.get(str(opt_id))
-                    if option:
-                        quiz_answer.selected_options.add(option)
-
-                correct_ids = set(question.options.filter(is_correct=True).values_list("id", flat=True))
-                chosen_ids = set(quiz_answer.selected_options.values_list("id", flat=True))
-
-                if correct_ids == chosen_ids:
-                    quiz_answer.marks_awarded = marks_per_question
-                    quiz_answer.is_correct = True
-                    total_marks += marks_per_question
-                else:
-                    quiz_answer.marks_awarded = 0
-                    quiz_answer.is_correct = False
-
-
-            quiz_answer.save()
+        total_marks = grade_quiz_submission(attempt, answers_data)
 
         attempt.submitted_at = timezone.now()
         attempt.marks_obtained = total_marks
@@ -1359,6 +1303,10 @@ class QuizAttemptViewSet(viewsets.ReadOnlyModelViewSet):
         attempt.status = "submitted"
         attempt.save()
 
+        # Answers were prefetched before grading; reload them for the response
+        attempt._prefetched_objects_cache = {}
+        prefetch_related_objects([attempt], "answers__question__options", "answers__selected_options")
+
         return api_response(
             True,
             "Quiz submitted successfully",
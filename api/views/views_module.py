@@ -8,11 +8,12 @@ from rest_framework import permissions
 from rest_framework.views import APIView
 
 from api.models.models_course import Course, CourseModule
-from api.models.models_module import Assignment, CourseResource, LiveClass, Quiz
+from api.models.models_module import Assignment, CourseResource, LiveClass, Quiz, QuizQuestion
 from api.models.models_order import Enrollment
 from api.permissions import IsStudent
 from api.serializers.serializers_module import CourseModuleStudentStudyPlanSerializer
 from api.utils.response_utils import api_response
+from api.utils.study_plan import get_study_plan
 
 
 @extend_schema(
@@ -66,17 +67,20 @@ class CourseModuleStudyPlanView(APIView):
             is_active=True,
         )
 
-        enrollment = get_object_or_404(
+        # Student must be enrolled in the course
+        get_object_or_404(
             Enrollment,
             user=user,
             course=course,
             is_active=True,
         )
 
-        student_batch = enrollment.batch
+        # Counts, progress and the enrolled batches come from the cached study plan
+        plan = get_study_plan(user.id, course.id)
+        batch_ids = plan.batch_ids
 
         # Accept either module UUID (id) or slug in the URL segment `module_slug`
-        base_qs = CourseModule.objects.filter(course=course, is_active=True)
+        base_qs = CourseModule.objects.filter(course=course, is_active=True).select_related("course")
 
         try:
             # If module_slug is a UUID string, filter by id
@@ -90,37 +94,46 @@ class CourseModuleStudyPlanView(APIView):
                 Prefetch(
                     "live_classes",
                     queryset=LiveClass.objects.filter(
-                        batch=student_batch,
+                        batch_id__in=batch_ids,
                         is_active=True,
-                    ).order_by("order"),
+                    )
+                    .select_related("batch", "instructor")
+                    .order_by("scheduled_date"),
                 ),
                 Prefetch(
                     "module_assignments",
                     queryset=Assignment.objects.filter(
-                        batch=student_batch,
+                        batch_id__in=batch_ids,
                         is_active=True,
                     ).order_by("order"),
                 ),
                 Prefetch(
                     "module_quizzes",
                     queryset=Quiz.objects.filter(
-                        batch=student_batch,
+                        batch_id__in=batch_ids,
                         is_active=True,
-                    ).order_by("title"),
+                    )
+                    .select_related("batch", "created_by")
+                    .prefetch_related(
+                        Prefetch("questions", queryset=QuizQuestion.objects.prefetch_related("options")),
+                    ),
                 ),
                 Prefetch(
                     "resources",
                     queryset=CourseResource.objects.filter(
-                        batch=student_batch,
+                        batch_id__in=batch_ids,
                         is_active=True,
-                    ).order_by("order"),
+                    )
+                    .select_related("batch")
+                    .prefetch_related("files")
+                    .order_by("order"),
                 ),
             )
         )
 
         serializer = CourseModuleStudentStudyPlanSerializer(
             module,
-            context={"request": request},
+            context={"request": request, "study_plan": plan},
         )
 
         return api_response(
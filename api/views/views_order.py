@@ -1,5 +1,6 @@
 """Order, OrderItem, and Enrollment API views."""
 
+from django.db.models import Count, Q
 from django.utils import timezone
 
 from django_filters.rest_framework import DjangoFilterBackend
@@ -22,8 +23,9 @@ from api.serializers.serializers_order import (
     OrderListSerializer,
     OrderUpdateSerializer,
 )
-from api.utils.pagination import StandardResultsSetPagination
+from api.utils.pagination import KeysetPagination, StandardResultsSetPagination
 from api.utils.response_utils import api_response
+from api.utils.statistics import StatisticsBuilder
 from api.views.views_base import BaseAdminViewSet
 
 # ========== Order ViewSet ==========
@@ -77,7 +79,7 @@ class OrderViewSet(BaseAdminViewSet):
     queryset = Order.objects.select_related("user", "coupon").prefetch_related("items__course").all()
 
     serializer_class = OrderListSerializer
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetPagination
 
     filter_backends = [
         DjangoFilterBackend,
@@ -256,20 +258,19 @@ class OrderViewSet(BaseAdminViewSet):
     @action(detail=False, methods=["get"], permission_classes=[IsStaff])
     def statistics(self, request):
         """Get order statistics (staff only)."""
-        from django.db.models import Avg, Count, Sum
-
-        queryset = self.get_queryset()
-
-        stats = {
-            "total_orders": queryset.count(),
-            "completed_orders": queryset.filter(status="completed").count(),
-            "pending_orders": queryset.filter(status="pending").count(),
-            "total_revenue": queryset.filter(status="completed").aggregate(total=Sum("total_amount"))["total"] or 0,
-            "average_order_value": queryset.filter(status="completed").aggregate(avg=Avg("total_amount"))["avg"] or 0,
-            "orders_by_status": {
-                status_choice[0]: queryset.filter(status=status_choice[0]).count() for status_choice in Order.STATUS_CHOICES
-            },
-        }
+        completed = Q(status="completed")
+
+        # One conditional aggregate instead of a query per number
+        stats = (
+            StatisticsBuilder(self.get_queryset())
+            .count("total_orders")
+            .count("completed_orders", completed)
+            .count("pending_orders", Q(status="pending"))
+            .sum("total_revenue", "total_amount", completed)
+            .avg("average_order_value", "total_amount", completed)
+            .count_each("orders_by_status", "status", [status_choice[0] for status_choice in Order.STATUS_CHOICES])
+            .build()
+        )
 
         return api_response(True, "Order statistics retrieved successfully", stats)
 
@@ -389,7 +390,7 @@ class EnrollmentViewSet(BaseAdminViewSet):
 
     serializer_class = EnrollmentSerializer
     permission_classes = [IsStudent | IsStaff]  # Students and staff can access
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetPagination
 
     filter_backends = [
         DjangoFilterBackend,
@@ -582,17 +583,20 @@ class EnrollmentViewSet(BaseAdminViewSet):
     @action(detail=False, methods=["get"], permission_classes=[IsStaff])
     def statistics(self, request):
         """Get enrollment statistics (staff only)."""
-        from django.db.models import Avg, Count
-
         queryset = self.get_queryset()
 
-        stats = {
-            "total_enrollments": queryset.count(),
-            "active_enrollments": queryset.filter(is_active=True).count(),
-            "completed_enrollments": queryset.filter(progress_percentage=100).count(),
-            "certificates_issued": queryset.filter(certificate_issued=True).count(),
-            "average_progress": queryset.aggregate(avg=Avg("progress_percentage"))["avg"] or 0,
-            "enrollments_by_course": queryset.values("course__title").annotate(count=Count("id")).order_by("-count")[:10],
-        }
+        # One conditional aggregate for the totals, one grouped query for the per-course list
+        stats = (
+            StatisticsBuilder(queryset)
+            .count("total_enrollments")
+            .count("active_enrollments", Q(is_active=True))
+            .count("completed_enrollments", Q(progress_percentage=100))
+            .count("certificates_issued", Q(certificate_issued=True))
+            .avg("average_progress", "progress_percentage")
+            .build()
+        )
+        stats["enrollments_by_course"] = (
+            queryset.order_by().values("course__title").annotate(count=Count("id")).order_by("-count")[:10]
+        )
 
         return api_response(True, "Enrollment statistics retrieved successfully", stats)
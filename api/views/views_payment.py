@@ -1,7 +1,4 @@
-from decimal import Decimal
-
 from django.conf import settings
-from django.db import transaction
 from django.views.decorators.csrf import csrf_exempt
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiParameter
@@ -12,9 +9,9 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 
 from api.models.models_order import Order, PaymentTransaction
+from api.utils.payment_webhooks import record_webhook
 from api.utils.response_utils import api_response
 from api.utils.sslcommerz import SSLCommerzPayment
-from django.utils import timezone
 
 @extend_schema(
     summary="Initiate payment",
@@ -93,122 +90,35 @@ class PaymentInitiateView(APIView):
 
 
 @extend_schema(
-    summary="SSLCommerz webhook (IPN) – IDEMPOTENT",
-    description="Processes payment confirmation from SSLCommerz safely",
+    summary="SSLCommerz webhook (IPN)",
+    description=(
+        "Records the payment notification in the webhook inbox and returns immediately. "
+        "Validation with SSLCommerz and the order update run in a background task; "
+        "repeated notifications for the same val_id are ignored."
+    ),
     tags=["Payment"],
 )
 @csrf_exempt
 @api_view(["POST"])
 @permission_classes([AllowAny])
-@transaction.atomic
 def payment_webhook(request):
     tran_id = request.data.get("tran_id")
     val_id = request.data.get("val_id")
     amount = request.data.get("amount")
-    status_raw = request.data.get("status")
 
     if not tran_id or not val_id or not amount:
         return api_response(False, "Missing parameters", {}, 400)
 
-    try:
-        order = Order.objects.select_for_update().get(order_number=tran_id)
-    except Order.DoesNotExist:
-        return api_response(True, "Order not found (ignored)", {}, 200)
-
-    gateway = SSLCommerzPayment()
-
-    # ==================================================
-    # 🔥 INSTALLMENT PAYMENT FLOW
-    # ==================================================
-    if order.is_installment:
-        installment = (
-            order.installment_payments
-            .filter(status="pending")
-            .order_by("installment_number")
-            .first()
-        )
-
-        if not installment:
-            return api_response(True, "All installments already processed", {}, 200)
-
-        # 🔒 Idempotency guard
-        if installment.payment_id == val_id:
-            return api_response(True, "Installment already paid", {}, 200)
-
-        expected_amount = installment.amount
-
-        if Decimal(amount) != expected_amount:
-            return api_response(True, "Amount mismatch", {}, 200)
-
-        is_valid, _ = gateway.validate_payment(val_id, expected_amount)
-        if not is_valid or status_raw not in ("VALID", "VALIDATED"):
-            return api_response(True, "Invalid installment payment", {}, 200)
-
-        # ✅ CORE ACTION
-        installment.mark_as_paid(
-            payment_id=val_id,
-            payment_method="ssl_commerce",
-            gateway_transaction_id=tran_id,
-        )
-
-        # 🔥 CRITICAL: refresh fields updated via F()
-        order.refresh_from_db(fields=["installments_paid", "payment_status", "status"])
-
-        # 🧑‍🎓 ENROLL AFTER FIRST INSTALLMENT
-        if order.installments_paid == 1:
-            order.ensure_enrollments_created()
-
-        # 🏁 FINAL INSTALLMENT
-        if order.is_fully_paid():
-            order.payment_method = "ssl_commerce"
-            order.payment_id = val_id
-            order.completed_at = timezone.now()
-            order.save(update_fields=["payment_method", "payment_id", "completed_at"])
-            order.mark_as_completed()
-        else:
-            order.status = "processing"
-            order.payment_status = "partial"
-            order.save(update_fields=["status", "payment_status"])
-
-        return api_response(True, "Installment processed", {}, 200)
-
-    # ==================================================
-    # 🔥 FULL PAYMENT FLOW (NON-INSTALLMENT)
-    # ==================================================
-    if order.status == "completed":
-        return api_response(True, "Payment already processed", {}, 200)
-
-    expected_amount = order.total_amount
-
-    if Decimal(amount) != expected_amount:
-        return api_response(True, "Amount mismatch", {}, 200)
-
-    is_valid, _ = gateway.validate_payment(val_id, expected_amount)
-    if not is_valid or status_raw not in ("VALID", "VALIDATED"):
-        if order.status not in ("completed", "failed"):
-            order.status = "failed"
-            order.payment_status = "failed"
-            order.save(update_fields=["status", "payment_status"])
-        return api_response(True, "Invalid payment", {}, 200)
-
-    # ✅ SUCCESS
-    order.payment_method = "ssl_commerce"
-    order.payment_id = val_id
-    order.completed_at = timezone.now()
-    order.save(update_fields=["payment_method", "payment_id", "completed_at"])
-
-    order.mark_as_completed()
+    event, created = record_webhook(request.data)
 
     return api_response(
         True,
-        "Full payment completed",
-        {"order_number": order.order_number},
+        "Webhook received" if created else "Webhook already received",
+        {"event_id": str(event.id), "status": event.status},
         200,
     )
 
 
-
-
 @csrf_exempt
 def payment_success_redirect(request):
     from django.http import HttpResponseRedirect
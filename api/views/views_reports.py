@@ -0,0 +1,90 @@
+"""Background report job endpoints: create, poll status, download."""
+
+from django.http import FileResponse
+from django.shortcuts import get_object_or_404
+
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework import permissions, status
+from rest_framework.views import APIView
+
+from api.models.models_reports import ReportJob
+from api.serializers.serializers_reports import ReportJobRequestSerializer, ReportJobSerializer
+from api.utils.report_jobs import REPORTS, request_report
+from api.utils.response_utils import api_response
+
+
+def _has_report_permission(request, view, report_type):
+    return REPORTS[report_type].permission().has_permission(request, view)
+
+
+class ReportJobMixin:
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_job(self, request, job_id):
+        job = get_object_or_404(ReportJob, pk=job_id)
+        if not _has_report_permission(request, self, job.report_type):
+            self.permission_denied(request)
+        return job
+
+
+@extend_schema(
+    tags=["Data Export"],
+    summary="Queue a report for background rendering",
+    description=(
+        "Creates (or reuses a recent identical) report job. Poll `status_url` until the "
+        "status is `done`, then fetch `download_url`."
+    ),
+    request=ReportJobRequestSerializer,
+    responses={202: ReportJobSerializer, 200: ReportJobSerializer},
+)
+class ReportJobCreateView(ReportJobMixin, APIView):
+    def post(self, request):
+        serializer = ReportJobRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        report_type = serializer.validated_data["report_type"]
+
+        if not _has_report_permission(request, self, report_type):
+            self.permission_denied(request)
+
+        try:
+            job, created = request_report(report_type, serializer.validated_data["params"], user=request.user)
+        except ValueError as exc:
+            return api_response(False, str(exc), {}, status.HTTP_400_BAD_REQUEST)
+
+        data = ReportJobSerializer(job, context={"request": request}).data
+        if created:
+            return api_response(True, "Report queued", data, status.HTTP_202_ACCEPTED)
+        return api_response(True, "Matching report already requested", data)
+
+
+@extend_schema(
+    tags=["Data Export"],
+    summary="Get report job status",
+    responses=ReportJobSerializer,
+)
+class ReportJobDetailView(ReportJobMixin, APIView):
+    def get(self, request, job_id):
+        job = self.get_job(request, job_id)
+        return api_response(True, "Report job retrieved", ReportJobSerializer(job, context={"request": request}).data)
+
+
+@extend_schema(
+    tags=["Data Export"],
+    summary="Download a finished report",
+    responses={
+        200: OpenApiResponse(description="PDF file"),
+        409: OpenApiResponse(description="Report not ready"),
+    },
+)
+class ReportJobDownloadView(ReportJobMixin, APIView):
+    def get(self, request, job_id):
+        job = self.get_job(request, job_id)
+        if job.status != ReportJob.Status.DONE or not job.file:
+            return api_response(False, f"Report is {job.status}", {"status": job.status}, status.HTTP_409_CONFLICT)
+
+        return FileResponse(
+            job.file.open("rb"),
+            as_attachment=True,
+            filename=job.filename or f"{job.report_type}.pdf",
+            content_type="application/pdf",
+        )
@@ -108,6 +108,58 @@ else:
     DATABASES = {"default": dj_database_url.config(default=os.getenv("DATABASE_URL"))}
 
 
+# --------------------------------------------------------------------------
+# CACHE CONFIGURATION
+# --------------------------------------------------------------------------
+# Set CACHE_URL (e.g. redis://127.0.0.1:6379/0) to share caches between all
+# gunicorn workers. CACHE_SESSIONS_URL / CACHE_THROTTLE_URL override the URL
+# per alias and fall back to CACHE_URL. Without a URL each alias is a
+# per-process LocMem cache (fine for development and tests).
+# Values are stored as JSON (zlib-compressed above 1 KB), never pickled.
+
+CACHE_URL = os.getenv("CACHE_URL", "")
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "prime")
+CACHE_COMPRESS = os.getenv("CACHE_COMPRESS", "True") == "True"
+CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", 300))
+
+
+def _cache_alias(alias, url, timeout=CACHE_DEFAULT_TIMEOUT):
+    if not url:
+        return {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": f"{CACHE_KEY_PREFIX}-{alias}",
+            "TIMEOUT": timeout,
+        }
+    serializer = "CompressedJSONSerializer" if CACHE_COMPRESS else "JSONSerializer"
+    return {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": url,
+        "KEY_PREFIX": f"{CACHE_KEY_PREFIX}:{alias}",
+        "TIMEOUT": timeout,
+        "OPTIONS": {
+            "serializer": f"api.utils.cache_serializers.{serializer}",
+            "socket_connect_timeout": 1,
+            "socket_timeout": 1,
+        },
+    }
+
+
+CACHES = {
+    "default": _cache_alias("default", CACHE_URL),
+    "sessions": _cache_alias("sessions", os.getenv("CACHE_SESSIONS_URL", CACHE_URL), timeout=None),
+    "throttle": _cache_alias("throttle", os.getenv("CACHE_THROTTLE_URL", CACHE_URL)),
+}
+
+# Cache-backed sessions only make sense when the cache is shared; a
+# per-process LocMem session cache would serve stale sessions across workers.
+if os.getenv("CACHE_SESSIONS_URL", CACHE_URL):
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+    SESSION_CACHE_ALIAS = "sessions"
+
+# Cache alias used by the API rate throttles (see api.utils.throttles)
+THROTTLE_CACHE_ALIAS = "throttle"
+
+
 # --------------------------------------------------------------------------
 # AUTHENTICATION & CUSTOM USER MODEL
 # --------------------------------------------------------------------------
@@ -297,6 +349,11 @@ SESSION_COOKIE_SECURE = False  # Required for HTTP
 SESSION_COOKIE_HTTPONLY = True  # Recommended True for security (False if JS needs access)
 SESSION_COOKIE_AGE = 1209600
 
+# Guest carts live in a signed cookie (course:batch pairs) until login
+GUEST_CART_COOKIE_NAME = os.getenv("GUEST_CART_COOKIE_NAME", "guest_cart")
+GUEST_CART_MAX_AGE = int(os.getenv("GUEST_CART_MAX_AGE", str(30 * 24 * 3600)))
+GUEST_CART_MAX_ITEMS = int(os.getenv("GUEST_CART_MAX_ITEMS", "10"))
+
 CSRF_COOKIE_SAMESITE = "Lax"  # Changed from 'None'
 CSRF_COOKIE_SECURE = False  # Required for HTTP
 CSRF_COOKIE_NAME = "csrftoken"
@@ -324,6 +381,30 @@ else:
     EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
     DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "no-reply@primeacademy.org")
 
+# Background tasks (outbox table + `python manage.py run_tasks` worker)
+# Email and other slow side effects are written to the outbox and delivered
+# by the worker. With TASKS_EAGER they run inline instead (development and
+# tests, where no worker is running).
+TASKS_EAGER = os.getenv("TASKS_EAGER", str(os.getenv("ENVIRONMENT", "development") == "development")) == "True"
+TASKS_MAX_ATTEMPTS = int(os.getenv("TASKS_MAX_ATTEMPTS", 5))
+TASKS_RETRY_BASE_SECONDS = int(os.getenv("TASKS_RETRY_BASE_SECONDS", 30))
+TASKS_RETRY_MAX_SECONDS = int(os.getenv("TASKS_RETRY_MAX_SECONDS", 3600))
+TASKS_LEASE_SECONDS = int(os.getenv("TASKS_LEASE_SECONDS", 300))
+
+# Background PDF reports (`python manage.py run_report_jobs`)
+REPORT_JOB_DEDUPE_SECONDS = int(os.getenv("REPORT_JOB_DEDUPE_SECONDS", 300))
+REPORT_JOB_LEASE_SECONDS = int(os.getenv("REPORT_JOB_LEASE_SECONDS", 900))
+REPORT_JOB_RETENTION_HOURS = int(os.getenv("REPORT_JOB_RETENTION_HOURS", 24))
+
+# ID sequences (api.utils.sequences): values each process reserves per counter
+# round-trip. Unused values are skipped on restart; 1 means gap-free.
+SEQUENCE_BLOCK_SIZES = {
+    "order": int(os.getenv("SEQUENCE_BLOCK_ORDER", 50)),
+    "enrollment": int(os.getenv("SEQUENCE_BLOCK_ENROLLMENT", 10)),
+    "student": int(os.getenv("SEQUENCE_BLOCK_STUDENT", 10)),
+    "income": 1,  # accounting transaction IDs must stay gap-free
+}
+
 
 # --------------------------------------------------------------------------
 # SECURITY (Uncomment and configure for Production)
@@ -363,6 +444,13 @@ BACKEND_URL = os.getenv("BACKEND_URL", SITE_BASE_URL)
 SSLCOMMERZ_STORE_ID = os.getenv("SSLCOMMERZ_STORE_ID", "")
 SSLCOMMERZ_STORE_PASSWORD = os.getenv("SSLCOMMERZ_STORE_PASSWORD", "")
 SSLCOMMERZ_IS_SANDBOX = os.getenv("SSLCOMMERZ_IS_SANDBOX", "True") == "True"
+SSLCOMMERZ_API_URL = os.getenv("SSLCOMMERZ_API_URL", "")  # Overrides the sandbox/live host (e.g. a fake gateway)
+SSLCOMMERZ_TIMEOUT = float(os.getenv("SSLCOMMERZ_TIMEOUT", 15))
+SSLCOMMERZ_POOL_SIZE = int(os.getenv("SSLCOMMERZ_POOL_SIZE", 10))  # Keep-alive connections per process
+SSLCOMMERZ_MAX_RETRIES = int(os.getenv("SSLCOMMERZ_MAX_RETRIES", 2))
+SSLCOMMERZ_RETRY_BACKOFF = float(os.getenv("SSLCOMMERZ_RETRY_BACKOFF", 0.2))  # Seconds, doubled per retry, jittered
+SSLCOMMERZ_BREAKER_THRESHOLD = int(os.getenv("SSLCOMMERZ_BREAKER_THRESHOLD", 5))  # Consecutive failures to open
+SSLCOMMERZ_BREAKER_RESET_SECONDS = float(os.getenv("SSLCOMMERZ_BREAKER_RESET_SECONDS", 30))
 
 # Payment token TTL (seconds) used for signed verify tokens
 PAYMENT_TOKEN_TTL = int(os.getenv("PAYMENT_TOKEN_TTL", 900))  # 15 minutes